@@ -34,7 +34,7 @@ from rubik_cube_solver.cube import Cube
 from rubik_cube_solver.cube_rotation.algorithm import Algorithm
 from rubik_cube_solver.cube_rotation.rotator import Rotator
 from rubik_cube_solver.scramble.scrambler import Scrambler
-from rubik_cube_solver.solve.solver import create_solver
+from rubik_cube_solver.solve import solve_async
 from rubik_cube_websocket_client.client import WebSocketClient
 from rubik_cube_websocket_client.messages import apply_moves, cube_state, disconnect
 
@@ -132,7 +132,8 @@ async def run_demo() -> None:
     await asyncio.sleep(STEP_DELAY)
 
     announce("Solving the cube")
-    solution = create_solver(cube).solve()
+    # Solved in a worker process, so the client keeps receiving and pinging while it runs
+    solution = await solve_async(cube)
     print(f"Solution ({len(solution.moves)} moves): {solution}")
     print(f"Solved {CUBE_SIZE}x{CUBE_SIZE}:")
     print(cube)
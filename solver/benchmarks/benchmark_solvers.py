@@ -0,0 +1,248 @@
+r"""
+Benchmark of the human solvers over a fixed, seeded corpus of scrambles.
+
+For the 2x2 and the 3x3 it generates the same scrambles on every run, with `Scrambler` and a seeded
+random number generator, solves each of them, and reports:
+
+- the solves per second and the p50 and p99 latency of a solve, validation included when the cube
+  is not trusted
+- the average and the largest amount of moves in a solution
+- the average amount of moves every step adds, rotations included, before the solution is simplified,
+  as a `StepRecorder` attached to the solver reports them
+
+The results are printed, written to a JSON file if one is given, and compared with a baseline, by
+default the committed `benchmarks/baseline.json`. A move count that grows at all is a regression,
+since the corpus is the same on every run. A timing is a regression once it is worse than the baseline by more than the
+tolerance, since timings vary from run to run and from machine to machine. The script exits with 1
+if there is any regression, and with 0 otherwise.
+
+Run it from the `solver/` directory with:
+
+    python benchmarks/benchmark_solvers.py
+
+Write the results to a file of their own with `--output results.json`, and record them as the new
+baseline with:
+
+    python benchmarks/benchmark_solvers.py --update-baseline
+"""
+
+# Python imports
+import argparse
+import hashlib
+import json
+import math
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.rotator import Rotator
+from rubik_cube_solver.scramble.scrambler import Scrambler
+from rubik_cube_solver.solve.observer import StepRecorder
+from rubik_cube_solver.solve.solver import create_solver
+
+# The version of the layout of the results, which a baseline must share to be compared with
+RESULTS_FORMAT_VERSION = 1
+
+BENCHMARK_DIRECTORY = Path(__file__).resolve().parent
+DEFAULT_BASELINE = BENCHMARK_DIRECTORY / "baseline.json"
+
+CUBE_SIZES = (2, 3)
+DEFAULT_COUNT = 200
+DEFAULT_SEED = 2024
+DEFAULT_TOLERANCE = 0.25
+
+# The steps every solve reports besides those of the solver, which are left out of the step move counts
+SOLVE_STEPS = ("validate", "simplify")
+
+# The timings, and whether a higher value is better, which are compared with the tolerance
+TIMINGS = {
+    "solves_per_second": True,
+    "latency_p50_ms": False,
+    "latency_p99_ms": False,
+}
+
+
+def generate_corpus(cube_size: int, count: int, seed: int) -> list[str]:
+    """
+    Generates the scrambles of a cube size, the same ones for the same seed.
+
+    :param cube_size: The cube size
+    :param count: The amount of scrambles
+    :param seed: The seed of the random number generator
+    :return: The scrambles in notation
+    """
+
+    scrambler = Scrambler(random.Random(f"{seed}-{cube_size}"))
+    return [str(Algorithm(scrambler.generate_scramble(cube_size))) for _ in range(count)]
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """
+    Returns a percentile of some values, by the nearest rank.
+
+    :param values: The values, sorted
+    :param fraction: The percentile, as a fraction
+    :return: The smallest value that at least that fraction of the values is no larger than
+    """
+
+    return values[max(0, math.ceil(fraction * len(values)) - 1)]
+
+
+def benchmark(cube_size: int, corpus: list[str]) -> dict[str, Any]:
+    """
+    Solves every scramble of a corpus and measures the solves.
+
+    :param cube_size: The cube size
+    :param corpus: The scrambles
+    :return: The results
+    """
+
+    latencies = []
+    lengths = []
+    step_totals: dict[str, int] = {}
+    for scramble in corpus:
+        cube = Cube(cube_size)
+        Rotator(cube).apply(Algorithm.from_str(scramble))
+
+        solver = create_solver(cube)
+        recorder = StepRecorder()
+        solver.observer = recorder
+
+        start = time.perf_counter()
+        solution = solver.solve()
+        latencies.append(time.perf_counter() - start)
+
+        lengths.append(len(solution.moves))
+        for event in recorder.events:
+            if event.step not in SOLVE_STEPS:
+                step_totals[event.step] = step_totals.get(event.step, 0) + event.moves_added
+
+    latencies.sort()
+    return {
+        "corpus": hashlib.sha256("\n".join(corpus).encode()).hexdigest(),
+        "solves_per_second": round(len(corpus) / sum(latencies), 1),
+        "latency_p50_ms": round(percentile(latencies, 0.5) * 1000, 3),
+        "latency_p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "average_moves": round(sum(lengths) / len(lengths), 2),
+        "max_moves": max(lengths),
+        "step_moves": {name: round(total / len(corpus), 2) for name, total in step_totals.items()},
+    }
+
+
+def run(count: int, seed: int) -> dict[str, Any]:
+    """
+    Benchmarks every cube size.
+
+    :param count: The amount of scrambles per cube size
+    :param seed: The seed of the corpus
+    :return: The results
+    """
+
+    return {
+        "format": RESULTS_FORMAT_VERSION,
+        "count": count,
+        "seed": seed,
+        "results": {f"{size}x{size}": benchmark(size, generate_corpus(size, count, seed)) for size in CUBE_SIZES},
+    }
+
+
+def move_counts(result: dict[str, Any]) -> dict[str, float]:
+    """
+    Returns the move counts of the results of a cube size, the step ones included.
+
+    :param result: The results of a cube size
+    :return: Every move count, by its name
+    """
+
+    counts = {"average_moves": result["average_moves"], "max_moves": result["max_moves"]}
+    counts.update({f"step_moves.{step}": moves for step, moves in result["step_moves"].items()})
+    return counts
+
+
+def find_regressions(results: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """
+    Compares results with a baseline.
+
+    :param results: The results
+    :param baseline: The baseline
+    :param tolerance: How much worse than the baseline a timing may be, as a fraction
+    :return: A description of every regression
+    """
+
+    if baseline.get("format") != RESULTS_FORMAT_VERSION:
+        return [f"The baseline has format {baseline.get('format')}, not {RESULTS_FORMAT_VERSION}"]
+
+    regressions = []
+    for size, current in results["results"].items():
+        previous = baseline["results"].get(size)
+        if previous is None:
+            continue
+        if previous["corpus"] != current["corpus"]:
+            regressions.append(f"{size}: the corpus differs from the baseline, so it cannot be compared")
+            continue
+
+        for name, higher_is_better in TIMINGS.items():
+            limit = previous[name] * (1 - tolerance if higher_is_better else 1 + tolerance)
+            if current[name] < limit if higher_is_better else current[name] > limit:
+                regressions.append(f"{size}: {name} is {current[name]}, the baseline is {previous[name]}")
+
+        previous_moves = move_counts(previous)
+        for name, value in move_counts(current).items():
+            if value > previous_moves.get(name, value):
+                regressions.append(f"{size}: {name} is {value}, the baseline is {previous_moves[name]}")
+
+    return regressions
+
+
+def main(arguments: list[str] | None = None) -> int:
+    """
+    Entry point of the benchmark.
+
+    :param arguments: The command line arguments, those of the process if None
+    :return: The exit code, 1 if there is any regression
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmark the solvers over a seeded corpus of scrambles.")
+    parser.add_argument("--count", type=int, default=DEFAULT_COUNT, help="scrambles per cube size")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="seed of the corpus")
+    parser.add_argument("--output", type=Path, help="file the results are written to")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE, help="baseline to compare with")
+    parser.add_argument(
+        "--tolerance", type=float, default=DEFAULT_TOLERANCE, help="how much worse a timing may be, as a fraction"
+    )
+    parser.add_argument("--update-baseline", action="store_true", help="write the results to the baseline")
+    options = parser.parse_args(arguments)
+
+    results = run(options.count, options.seed)
+    for size, result in results["results"].items():
+        print(f"{size}: {json.dumps(result)}")
+
+    output = options.baseline if options.update_baseline else options.output
+    if output is not None:
+        output.write_text(json.dumps(results, indent=4) + "\n")
+        print(f"Results written to {output}")
+
+    if options.update_baseline or not options.baseline.exists():
+        return 0
+
+    baseline = json.loads(options.baseline.read_text())
+    if baseline.get("count") != options.count or baseline.get("seed") != options.seed:
+        print("The baseline was run with another count or seed, so it is not compared")
+        return 0
+
+    regressions = find_regressions(results, baseline, options.tolerance)
+    for regression in regressions:
+        print(f"Regression: {regression}")
+    if not regressions:
+        print(f"No regressions against {options.baseline}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
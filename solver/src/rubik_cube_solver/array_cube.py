@@ -0,0 +1,512 @@
+# Python imports
+from typing import Iterable, Iterator, MutableMapping, MutableSequence, Sequence
+
+# Third-party imports
+import numpy as np
+
+# Project imports
+from rubik_cube_solver.cube import COLOR_CODES, COLORS, IDENTITY_FRAME, Cube
+from rubik_cube_solver.enums.Color import Color
+from rubik_cube_solver.enums.Layer import Layer
+
+INDEX_ARRAY_CACHE_SIZE = 1024
+
+# The index array of every tuple converted so far, keyed by the identity of the tuple, along with the
+# tuple itself, which keeps it alive so its identity is not reused while it is cached
+INDEX_ARRAYS: dict[int, tuple[tuple[int, ...], np.ndarray]] = {}
+
+
+def get_index_array(permutation: Sequence[int]) -> np.ndarray:
+    """
+    Returns a permutation as an index array, converting it on first use.
+
+    The move table and compiled algorithms hand out the same tuple every time, so the permutations in
+    use are converted only once. They are looked up by identity rather than by value, since hashing a
+    tuple of 6 * N^2 indices on every turn would cost about as much as the gather itself. The cache is
+    bounded and drops the oldest permutation first, since every distinct algorithm compiles to a
+    permutation of its own. Only tuples are kept, as any other sequence may be edited after it was
+    converted.
+
+    :param permutation: The flat source index of every flat sticker
+    :return: The permutation as a read-only index array
+    """
+
+    cached = INDEX_ARRAYS.get(id(permutation))
+    if cached is not None:
+        return cached[1]
+
+    index_array = np.array(permutation, dtype=np.intp)
+    index_array.flags.writeable = False
+    if not isinstance(permutation, tuple):
+        return index_array
+
+    if len(INDEX_ARRAYS) >= INDEX_ARRAY_CACHE_SIZE:
+        del INDEX_ARRAYS[next(iter(INDEX_ARRAYS))]
+    INDEX_ARRAYS[id(permutation)] = (permutation, index_array)
+    return index_array
+
+
+class FaceView(MutableSequence[Color]):
+    """
+    The stickers of a face of an `ArrayCube` as a sequence of colors, read from and written to the
+    sticker array of the cube.
+
+    The view holds the cube rather than an array, so it always shows the current stickers, also after
+    the cube is turned. Writing a sticker writes its code into the array and counts as a change to the
+    stickers, so a trusted cube is trusted no more. A face has a fixed amount of stickers, so nothing can
+    be inserted or removed, and a slice is read as a list.
+    """
+
+    __slots__ = ("__cube", "__position", "__face_colors")
+
+    def __init__(self, cube: "ArrayCube", position: int, face_colors: list[tuple[Color, ...] | None]) -> None:
+        """
+        Constructor for the `FaceView` class.
+
+        :param cube: The cube
+        :param position: The position of the face in `Layer` order
+        :param face_colors: The colors of every face the cube has decoded, which it keeps up to date
+        :return: None
+        """
+
+        self.__cube = cube
+        self.__position = position
+        self.__face_colors = face_colors
+
+    def __len__(self) -> int:
+        """
+        Returns the amount of stickers of the face.
+
+        :return: The amount of stickers
+        """
+
+        return self.__cube.size * self.__cube.size
+
+    def __getitem__(self, index: int | slice) -> Color | list[Color]:
+        """
+        Returns a sticker, or a list of the stickers of a slice.
+
+        :param index: The index of the sticker, or a slice
+        :return: The color of the sticker, or the colors of the stickers
+        """
+
+        colors = self.__face_colors[self.__position] or self.__cube._face_colors(self.__position)
+        if isinstance(index, slice):
+            return list(colors[index])
+
+        return colors[index]
+
+    def __setitem__(self, index: int | slice, value: Color | Iterable[Color]) -> None:
+        """
+        Writes a sticker, or the stickers of a slice, which must be as many as the slice holds.
+
+        :param index: The index of the sticker, or a slice
+        :param value: The color of the sticker, or the colors of the stickers
+        :return: None
+        """
+
+        if isinstance(index, slice):
+            codes = [COLOR_CODES[color] for color in value]
+        else:
+            codes = COLOR_CODES[value]
+
+        self.__cube._writable_face_codes(self.__position)[index] = codes
+
+    def __delitem__(self, index: int | slice) -> None:
+        """
+        Refuses to remove stickers, since a face has a fixed amount of them.
+
+        :param index: The index of the sticker, or a slice
+        :return: None
+        """
+
+        raise TypeError("The stickers of a face cannot be removed")
+
+    def insert(self, index: int, value: Color) -> None:
+        """
+        Refuses to insert a sticker, since a face has a fixed amount of them.
+
+        :param index: The index to insert at
+        :param value: The color of the sticker
+        :return: None
+        """
+
+        raise TypeError("A sticker cannot be inserted into a face")
+
+    def __iter__(self) -> Iterator[Color]:
+        """
+        Iterates over the stickers of the face, read at once.
+
+        :return: An iterator over the colors of the stickers
+        """
+
+        return iter(self.__face_colors[self.__position] or self.__cube._face_colors(self.__position))
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compares the stickers of the face with any sequence, like a list of colors.
+
+        :param other: The sequence to compare with
+        :return: Whether the sequence holds the same colors in the same order
+        """
+
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+
+        return self[:] == list(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of the stickers, the same as the one of a list of them.
+
+        :return: The representation
+        """
+
+        return repr(self[:])
+
+
+class LayersView(MutableMapping[Layer, FaceView]):
+    """
+    The faces of an `ArrayCube` by their layer, as views of its sticker array. Assigning a face writes
+    every sticker of it, and the faces cannot be removed.
+    """
+
+    __slots__ = ("__faces",)
+
+    def __init__(self, cube: "ArrayCube", face_colors: list[tuple[Color, ...] | None]) -> None:
+        """
+        Constructor for the `LayersView` class.
+
+        :param cube: The cube
+        :param face_colors: The colors of every face the cube has decoded, which it keeps up to date
+        :return: None
+        """
+
+        self.__faces = {layer: FaceView(cube, position, face_colors) for position, layer in enumerate(Layer)}
+
+    def __getitem__(self, layer: Layer) -> FaceView:
+        """
+        Returns the view of a face.
+
+        :param layer: The layer of the face
+        :return: The view of the face
+        """
+
+        return self.__faces[layer]
+
+    def __setitem__(self, layer: Layer, stickers: Iterable[Color]) -> None:
+        """
+        Writes every sticker of a face.
+
+        :param layer: The layer of the face
+        :param stickers: The colors of the stickers, as many as the face has
+        :return: None
+        """
+
+        self.__faces[layer][:] = stickers
+
+    def __delitem__(self, layer: Layer) -> None:
+        """
+        Refuses to remove a face.
+
+        :param layer: The layer of the face
+        :return: None
+        """
+
+        raise TypeError("The faces of a cube cannot be removed")
+
+    def __iter__(self) -> Iterator[Layer]:
+        """
+        Iterates over the layers, in `Layer` order.
+
+        :return: An iterator over the layers
+        """
+
+        return iter(self.__faces)
+
+    def __len__(self) -> int:
+        """
+        Returns the amount of faces.
+
+        :return: The amount of faces
+        """
+
+        return len(self.__faces)
+
+    def __repr__(self) -> str:
+        """
+        Returns the representation of the faces, the same as the one of a dictionary of color lists.
+
+        :return: The representation
+        """
+
+        return repr({layer: face[:] for layer, face in self.__faces.items()})
+
+
+class ArrayCube(Cube):
+    """
+    A cube that keeps all of its stickers in one contiguous `uint8` array of shape (6, N, N).
+
+    Faces are stored in `Layer` order and every sticker as the code of its color in `COLORS`, so a
+    sticker takes one byte instead of a reference to a `Color`. Moves are applied by `permute` as a
+    single gather over the array.
+
+    The array is the state of the cube at all times. `layers` and `read_layers` give a `LayersView` of
+    it, whose faces read and write the array sticker by sticker as colors, and compare equal to lists of
+    the same colors. Reading them converts nothing up front, and writing through them counts as a change
+    to the stickers, so everything written against `Cube` works on an `ArrayCube` unchanged.
+    """
+
+    def __init__(self, size: int, layers: dict[Layer, list[Color]] | None = None) -> None:
+        """
+        Initialize an ArrayCube instance.
+
+        :param size: The size of the cube (e.g., 3 for a 3x3 cube)
+        :param layers: Optional dictionary representing the layers of the cube
+        """
+
+        self.__stickers: np.ndarray | None = None
+        self.__flat_stickers: np.ndarray | None = None
+        # The colors of every face, decoded from the array the first time the face is read after it or the
+        # frame changed, which the face views read directly. They are not kept while the array itself is
+        # handed out, since it can then be edited in place.
+        self.__face_colors: list[tuple[Color, ...] | None] = [None] * len(Layer)
+        self.__handed_out = False
+        # Whether a snapshot holds the array as well, in which case it is copied before it is written
+        self.__shared = False
+        self.__layers_view = LayersView(self, self.__face_colors)
+        super().__init__(size, layers)
+
+    @classmethod
+    def from_cube(cls, cube: Cube) -> "ArrayCube":
+        """
+        Creates an array-backed copy of a cube.
+
+        :param cube: The cube to copy
+        :return: The array-backed cube
+        """
+
+        return cls(cube.size, {layer: list(stickers) for layer, stickers in cube.read_layers().items()})
+
+    def to_cube(self) -> Cube:
+        """
+        Creates a list-backed copy of the cube.
+
+        :return: The list-backed cube
+        """
+
+        return Cube(self.size, {layer: list(stickers) for layer, stickers in self.read_layers().items()})
+
+    @property
+    def layers(self) -> LayersView:
+        """
+        Layers getter
+
+        The faces are views of the sticker array, and every sticker written through them counts as a
+        change, so reading them keeps the cube trusted.
+
+        :return: The layers of the cube
+        """
+
+        return self.read_layers()
+
+    @layers.setter
+    def layers(self, layers: dict[Layer, list[Color]]) -> None:
+        """
+        Layers setter
+
+        :param layers: The layers of the cube
+        """
+
+        self.reorient(IDENTITY_FRAME, None)
+        self.__store(self.__encode(layers))
+        self._storage_replaced()
+
+    def read_layers(self) -> LayersView:
+        """
+        Returns the layers of the cube, as views of the sticker array.
+
+        :return: The layers of the cube
+        """
+
+        self._materialize_frame()
+        return self.__layers_view
+
+    @property
+    def stickers(self) -> np.ndarray:
+        """
+        Stickers getter
+
+        The array can be edited in place, so the cube is no longer trusted until its stickers are set anew.
+
+        :return: The color codes of all stickers, as an array of shape (6, N, N) in `Layer` order
+        """
+
+        self._materialize_frame()
+        self.__unshare()
+        self._storage_exposed()
+        self.__forget_face_colors()
+        self.__handed_out = True
+        return self.__stickers
+
+    @stickers.setter
+    def stickers(self, stickers: np.ndarray) -> None:
+        """
+        Stickers setter
+
+        The array is copied, so the one given stays the caller's own.
+
+        :param stickers: The color codes of all stickers, as an array of shape (6, N, N) in `Layer` order
+        """
+
+        if stickers.shape != (6, self.size, self.size):
+            raise ValueError(f"Expected stickers of shape {(6, self.size, self.size)}, got {stickers.shape}.")
+
+        self.reorient(IDENTITY_FRAME, None)
+        self.__store(np.array(stickers, dtype=np.uint8))
+        self._storage_replaced()
+
+    def _face_colors(self, position: int) -> tuple[Color, ...]:
+        """
+        Returns the colors of the stickers of a face, moving the stickers into the frame first. They are
+        decoded from the array once, and kept until the array changes, unless the array is handed out.
+
+        :param position: The position of the face in `Layer` order
+        :return: The colors of the stickers
+        """
+
+        self._materialize_frame()
+        colors = self.__face_colors[position]
+        if colors is None:
+            colors = tuple(map(COLORS.__getitem__, self.__face_codes(position).tolist()))
+            if not self.__handed_out:
+                self.__face_colors[position] = colors
+
+        return colors
+
+    def _writable_face_codes(self, position: int) -> np.ndarray:
+        """
+        Returns the color codes of the stickers of a face for writing, which counts as a change to the
+        stickers.
+
+        :param position: The position of the face in `Layer` order
+        :return: The color codes, as a flat view of the sticker array
+        """
+
+        self._materialize_frame()
+        self.__unshare()
+        self._stickers_changed()
+        self.__face_colors[position] = None
+        return self.__face_codes(position)
+
+    def __face_codes(self, position: int) -> np.ndarray:
+        """
+        Returns the color codes of the stickers of a face.
+
+        :param position: The position of the face in `Layer` order
+        :return: The color codes, as a flat view of the sticker array
+        """
+
+        face_size = self.size * self.size
+        return self.__flat_stickers[position * face_size : (position + 1) * face_size]
+
+    def __encode(self, layers: dict[Layer, list[Color]]) -> np.ndarray:
+        """
+        Encodes a layers dictionary as a sticker array.
+
+        :param layers: The layers
+        :return: The color codes of all stickers, as an array of shape (6, N, N) in `Layer` order
+        """
+
+        return np.array([[COLOR_CODES[color] for color in layers[layer]] for layer in Layer], dtype=np.uint8).reshape(
+            6, self.size, self.size
+        )
+
+    def __store(self, stickers: np.ndarray, shared: bool = False) -> None:
+        """
+        Makes a sticker array the state of the cube.
+
+        :param stickers: The color codes of all stickers, as a contiguous array of shape (6, N, N)
+        :param shared: Whether a snapshot holds the array as well
+        :return: None
+        """
+
+        self.__stickers = stickers
+        self.__flat_stickers = stickers.reshape(-1)
+        self.__forget_face_colors()
+        self.__handed_out = False
+        self.__shared = shared
+
+    def __forget_face_colors(self) -> None:
+        """
+        Forgets the colors decoded of every face, in place, since the face views hold the same list.
+
+        :return: None
+        """
+
+        self.__face_colors[:] = [None] * len(Layer)
+
+    def __unshare(self) -> None:
+        """
+        Copies the sticker array if a snapshot holds it as well, so that writing it leaves the snapshot
+        as it was.
+
+        :return: None
+        """
+
+        if self.__shared:
+            self.__store(self.__stickers.copy())
+
+    def reorient(self, frame: dict[Layer, Layer], permutation: tuple[int, ...] | None) -> None:
+        """
+        Reorients the whole cube without moving any stickers, like `Cube.reorient`, forgetting the colors
+        decoded of every face unless the frame is reset.
+
+        :param frame: The stored face every face of the cube is read from
+        :param permutation: The permutation that moves the stored stickers into the frame
+        :return: None
+        """
+
+        super().reorient(frame, permutation)
+        if permutation is not None:
+            self.__forget_face_colors()
+
+    def permute_storage(self, permutation: Sequence[int], move: bool = False) -> None:
+        """
+        Rearranges the stored stickers at once, as one gather over the sticker array into a new one.
+
+        :param permutation: The flat source index of every flat sticker of the result
+        :param move: Whether the permutation is a sequence of turns and rotations, which keeps the cube
+            valid
+        :return: None
+        """
+
+        if not move:
+            self._stickers_changed()
+
+        self.__store(self.__flat_stickers[get_index_array(permutation)].reshape(6, self.size, self.size))
+
+    def _snapshot_storage(self) -> np.ndarray:
+        """
+        Returns the sticker array to keep in a snapshot.
+
+        The snapshot holds the array itself rather than a copy. `permute` builds a new array instead of
+        editing it, and the cube copies it before a sticker is written, so the snapshot never changes.
+
+        :return: The color codes of all stickers, as an array of shape (6, N, N) in `Layer` order
+        """
+
+        self.__shared = True
+        return self.__stickers
+
+    def _restore_storage(self, storage: np.ndarray) -> None:
+        """
+        Returns the sticker array to one kept in a snapshot.
+
+        :param storage: The color codes of all stickers, as an array of shape (6, N, N) in `Layer` order
+        :return: None
+        """
+
+        self.__store(storage, shared=True)
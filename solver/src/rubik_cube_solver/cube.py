@@ -1,10 +1,32 @@
 # Python imports
-from typing import Any
+from operator import itemgetter
+from typing import Any, Mapping, Self, Sequence
 
 # Project imports
 from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.Layer import Layer
 
+# The color each face shows on a solved cube, in the standard color scheme.
+SOLVED_COLORS: dict[Layer, Color] = {
+    Layer.UP: Color.WHITE,
+    Layer.DOWN: Color.YELLOW,
+    Layer.LEFT: Color.ORANGE,
+    Layer.RIGHT: Color.RED,
+    Layer.FRONT: Color.GREEN,
+    Layer.BACK: Color.BLUE,
+}
+
+# The colors in the order of their codes, so a sticker with code `c` shows `COLORS[c]`.
+COLORS: tuple[Color, ...] = tuple(Color)
+# The code every color is stored as.
+COLOR_CODES: dict[Color, int] = {color: code for code, color in enumerate(COLORS)}
+# Every code fits in 3 bits, a single octal digit, which is how stickers are packed into bytes.
+COLOR_DIGITS: dict[Color, str] = {color: str(code) for color, code in COLOR_CODES.items()}
+DIGIT_COLORS: dict[str, Color] = {digit: color for color, digit in COLOR_DIGITS.items()}
+
+# The frame of a cube that has not been reoriented: every face is stored as itself.
+IDENTITY_FRAME: dict[Layer, Layer] = {layer: layer for layer in Layer}
+
 
 class Cube:
     def __init__(self, size: int, layers: dict[Layer, list[Color]] | None = None) -> None:
@@ -15,15 +37,18 @@ class Cube:
         :param layers: Optional dictionary representing the layers of the cube
         """
 
-        self.__layers = layers or {
-            Layer.UP: [Color.WHITE] * size * size,
-            Layer.DOWN: [Color.YELLOW] * size * size,
-            Layer.LEFT: [Color.ORANGE] * size * size,
-            Layer.RIGHT: [Color.RED] * size * size,
-            Layer.FRONT: [Color.GREEN] * size * size,
-            Layer.BACK: [Color.BLUE] * size * size,
-        }
         self.__size = size
+        self.__frame = IDENTITY_FRAME
+        self.__frame_permutation: tuple[int, ...] | None = None
+        # Bumped on every change to the stickers other than a move, which is what trust is recorded against
+        self.__version = 0
+        self.__trusted_version: int | None = None
+        # Whether the storage has been handed out to be edited in place, which no version can follow
+        self.__exposed = False
+        self.layers = layers or {layer: [color] * size * size for layer, color in SOLVED_COLORS.items()}
+        # A cube created solved is known to be valid, as long as it is a size that can be validated
+        if layers is None and size >= 2:
+            self.__trusted_version = self.__version
 
     @property
     def size(self) -> int:
@@ -44,26 +69,343 @@ class Cube:
         """
 
         self.__size = cube_size
+        self._stickers_changed()
 
     @property
     def layers(self) -> dict[Layer, list[Color]]:
         """
         Layers getter
 
+        If the cube has been reoriented since the stickers were last read, they are moved into the
+        new orientation first. The face lists are the storage of the cube and can be edited in place,
+        so the cube is no longer trusted until its stickers are set anew. Code that only reads the
+        stickers should use `read_layers` instead.
+
         :return: The layers of the cube
         """
 
-        return self.__layers
+        layers = self.read_layers()
+        self._storage_exposed()
+        return layers
 
     @layers.setter
     def layers(self, layers: dict[Layer, list[Color]]) -> None:
         """
         Layers setter
 
+        The face lists are copied, so the dictionary given stays the caller's own.
+
         :param layers: The layers of the cube
         """
 
-        self.__layers = layers
+        self.reorient(IDENTITY_FRAME, None)
+        self.__layers = {layer: list(stickers) for layer, stickers in layers.items()}
+        self._storage_replaced()
+
+    def read_layers(self) -> Mapping[Layer, Sequence[Color]]:
+        """
+        Returns the layers of the cube for reading only, moving the stickers into the frame first like
+        `layers`.
+
+        The face lists are the storage of the cube itself and must not be edited, which is why reading
+        them keeps the cube trusted.
+
+        :return: The layers of the cube
+        """
+
+        if self.__frame_permutation is not None:
+            self._materialize_frame()
+
+        return self.__layers
+
+    @property
+    def trusted(self) -> bool:
+        """
+        Trusted getter
+
+        A cube is trusted when it is known to be valid: it was created solved or passed validation,
+        and has only been moved by a `Rotator` since. Solving a trusted cube skips its validation.
+        Any other change to the stickers makes the cube untrusted, and so does handing out its storage
+        to be edited in place, through `layers`. Such a cube stays untrusted, even once it passes
+        validation, until its stickers are set anew, since the storage handed out can still change it.
+
+        :return: Whether the cube is known to be valid
+        """
+
+        return not self.__exposed and self.__trusted_version == self.__version
+
+    @trusted.setter
+    def trusted(self, trusted: bool) -> None:
+        """
+        Trusted setter
+
+        A cube whose storage has been handed out is not trusted even so, as the `trusted` getter tells.
+
+        :param trusted: Whether the cube is known to be valid
+        """
+
+        self.__trusted_version = self.__version if trusted else None
+
+    def _stickers_changed(self) -> None:
+        """
+        Records a change to the stickers other than a move, which makes the cube untrusted.
+
+        :return: None
+        """
+
+        self.__version += 1
+
+    def _storage_exposed(self) -> None:
+        """
+        Records that the storage has been handed out to be edited in place, which makes the cube
+        untrusted until it is trusted again.
+
+        :return: None
+        """
+
+        self.__exposed = True
+
+    def _storage_replaced(self) -> None:
+        """
+        Records that the stickers were set anew in storage of the cube's own, which nothing handed out
+        before can edit. Like any change to the stickers other than a move, it makes the cube untrusted.
+
+        :return: None
+        """
+
+        self.__exposed = False
+        self._stickers_changed()
+
+    @property
+    def frame(self) -> dict[Layer, Layer]:
+        """
+        Frame getter
+
+        :return: The stored face every face of the cube is currently read from
+        """
+
+        return self.__frame
+
+    @property
+    def frame_permutation(self) -> tuple[int, ...] | None:
+        """
+        Frame permutation getter
+
+        :return: The permutation that moves the stored stickers into the frame, or None if the frame
+            is the identity
+        """
+
+        return self.__frame_permutation
+
+    def reorient(self, frame: dict[Layer, Layer], permutation: tuple[int, ...] | None) -> None:
+        """
+        Reorients the whole cube without moving any stickers.
+
+        The cube keeps its stickers where they are stored and only records the orientation it is in:
+        the frame names, for every face, the stored face it is read from, and the permutation moves
+        the stored stickers into that orientation. The stickers are moved only once they are read, so
+        any number of whole-cube rotations in a row cost nothing. A turn in the frame is the turn of
+        the stored face the frame names, which `permute_storage` performs without leaving the frame.
+
+        :param frame: The stored face every face of the cube is read from
+        :param permutation: The permutation that moves the stored stickers into the frame
+        :return: None
+        """
+
+        if frame == IDENTITY_FRAME:
+            self.__frame, self.__frame_permutation = IDENTITY_FRAME, None
+        else:
+            self.__frame, self.__frame_permutation = frame, permutation
+
+    def _materialize_frame(self) -> None:
+        """
+        Moves the stored stickers into the frame, which leaves the cube in the identity frame.
+
+        :return: None
+        """
+
+        if self.__frame_permutation is not None:
+            permutation = self.__frame_permutation
+            self.__frame, self.__frame_permutation = IDENTITY_FRAME, None
+            self.permute_storage(permutation, move=True)
+
+    def permute(self, permutation: Sequence[int], move: bool = False) -> None:
+        """
+        Rearranges every sticker of the cube at once.
+
+        The stickers are read as one flat sequence, face by face in `Layer` order, so sticker `index`
+        of the face at position `f` is flat sticker `f * size * size + index`. Flat sticker `i` of the
+        result is taken from flat sticker `permutation[i]` of the current state, which makes applying
+        a whole move a single gather. If the cube has been reoriented, the move into the frame is
+        folded into the same gather.
+
+        The face lists are replaced rather than edited in place, so a list read before the call keeps
+        the stickers it had. Unless the permutation is a move, the cube is no longer trusted.
+
+        :param permutation: The flat source index of every flat sticker of the result
+        :param move: Whether the permutation is a sequence of turns and rotations, which keeps the cube
+            valid
+        :return: None
+        """
+
+        if self.__frame_permutation is not None:
+            permutation = itemgetter(*permutation)(self.__frame_permutation)
+            self.__frame, self.__frame_permutation = IDENTITY_FRAME, None
+
+        self.permute_storage(permutation, move)
+
+    def permute_storage(self, permutation: Sequence[int], move: bool = False) -> None:
+        """
+        Rearranges the stored stickers at once, like `permute`, but leaves the frame as it is.
+
+        :param permutation: The flat source index of every flat sticker of the result
+        :param move: Whether the permutation is a sequence of turns and rotations, which keeps the cube
+            valid
+        :return: None
+        """
+
+        if not move:
+            self._stickers_changed()
+
+        face_size = self.__size * self.__size
+        layers = self.__layers
+        stickers = itemgetter(*permutation)([sticker for layer in Layer for sticker in layers[layer]])
+        for position, layer in enumerate(Layer):
+            layers[layer] = list(stickers[position * face_size : (position + 1) * face_size])
+
+    def snapshot(self) -> Any:
+        """
+        Takes a snapshot of the sticker storage and the frame that `restore` can return the cube to.
+
+        The snapshot is copy-on-write: it shares the face lists with the cube instead of copying
+        them, which is safe because `permute` replaces the face lists rather than editing them. It
+        therefore costs the same on every cube size. A face list edited in place after the snapshot
+        was taken is changed in the snapshot as well.
+
+        :return: The snapshot
+        """
+
+        return self.__frame, self.__frame_permutation, self._snapshot_storage(), self.__version, self.trusted
+
+    def restore(self, snapshot: Any) -> None:
+        """
+        Returns the cube to a snapshot taken by `snapshot`. The same snapshot can be restored any
+        number of times.
+
+        The cube is trusted afterwards only if it was trusted when the snapshot was taken and its
+        stickers have only been moved since, since then the snapshot is a valid state whose storage
+        was never handed out. Otherwise the cube is no longer trusted.
+
+        :param snapshot: The snapshot
+        :return: None
+        """
+
+        frame, frame_permutation, storage, version, trusted = snapshot
+        self._restore_storage(storage)
+        self.reorient(frame, frame_permutation)
+        if not trusted or version != self.__version:
+            self._stickers_changed()
+
+    def _snapshot_storage(self) -> Any:
+        """
+        Returns the sticker storage to keep in a snapshot.
+
+        :return: The storage
+        """
+
+        return dict(self.__layers)
+
+    def _restore_storage(self, storage: Any) -> None:
+        """
+        Returns the sticker storage to one kept in a snapshot.
+
+        :param storage: The storage
+        :return: None
+        """
+
+        self.__layers = dict(storage)
+
+    def to_bytes(self) -> bytes:
+        """
+        Packs the cube into bytes: the size as two big-endian bytes, followed by the code of every
+        sticker in 3 bits, face by face in `Layer` order.
+
+        A 3x3 packs into 23 bytes. The same state always packs into the same bytes, whatever the
+        cube's type.
+
+        :return: The packed cube
+        """
+
+        layers = self.read_layers()
+        digits = "".join([COLOR_DIGITS[color] for layer in Layer for color in layers[layer]])
+        packed_size = (3 * len(digits) + 7) // 8
+
+        # The first sticker goes into the lowest bits, so the digits are read back to front
+        return self.__size.to_bytes(2, "big") + int(digits[::-1], 8).to_bytes(packed_size, "little")
+
+    @classmethod
+    def from_bytes(cls, packed: bytes) -> Self:
+        """
+        Unpacks a cube packed by `to_bytes`.
+
+        :param packed: The packed cube
+        :return: The cube
+        """
+
+        size = int.from_bytes(packed[:2], "big")
+        sticker_count = 6 * size * size
+        if size < 1 or len(packed) != 2 + (3 * sticker_count + 7) // 8:
+            raise ValueError(f"Invalid packed cube of {len(packed)} bytes.")
+
+        digits = format(int.from_bytes(packed[2:], "little"), "o").zfill(sticker_count)[::-1]
+        if len(digits) != sticker_count or not set(digits) <= DIGIT_COLORS.keys():
+            raise ValueError("Invalid packed cube: unknown sticker color.")
+
+        face_size = size * size
+        return cls(
+            size,
+            {
+                layer: [DIGIT_COLORS[digit] for digit in digits[position * face_size : (position + 1) * face_size]]
+                for position, layer in enumerate(Layer)
+            },
+        )
+
+    def __eq__(self, other) -> bool:
+        """
+        Equality comparison for Cube objects. Two cubes are equal when they have the same size and the
+        same sticker on every position, whatever their storage.
+
+        :param other: The other Cube object to compare with
+        :return: True if equal, False otherwise
+        """
+
+        if not isinstance(other, Cube):
+            return False
+
+        if self.size != other.size:
+            return False
+
+        layers, other_layers = self.read_layers(), other.read_layers()
+        return all(list(layers[layer]) == list(other_layers[layer]) for layer in Layer)
+
+    def __hash__(self) -> int:
+        """
+        Hashes the cube by its packed state, so equal cubes hash equally. A cube used as a dictionary
+        key or set member must not be turned while it is one.
+
+        :return: The hash of the cube
+        """
+
+        return hash(self.to_bytes())
+
+    def __reduce__(self) -> tuple[Any, tuple[bytes]]:
+        """
+        Pickles the cube through its packed state instead of its dictionary of color lists.
+
+        :return: The callable that rebuilds the cube, and its arguments
+        """
+
+        return type(self).from_bytes, (self.to_bytes(),)
 
     def __str__(self) -> str:
         """
@@ -82,7 +424,7 @@ class Cube:
         :return: The string representation of the Cube
         """
 
-        def row_str(face: list[Color], r: int) -> str:
+        def row_str(face: Sequence[Color], r: int) -> str:
             """
             Returns a string for one row of a face.
 
@@ -96,23 +438,24 @@ class Cube:
 
         # Dynamic padding to UP and DOWN layers
         pad = " " * (self.size * 2)
+        layers = self.read_layers()
 
         string_representation = ""
 
         # Add UP layer
         for row in range(self.size):
-            string_representation += f"{pad}{row_str(self.layers[Layer.UP], row)}\n"
+            string_representation += f"{pad}{row_str(layers[Layer.UP], row)}\n"
         # Add LEFT, FRONT, RIGHT and BACK layers
         for row in range(self.size):
             string_representation += (
-                f"{row_str(self.layers[Layer.LEFT], row)} "
-                f"{row_str(self.layers[Layer.FRONT], row)} "
-                f"{row_str(self.layers[Layer.RIGHT], row)} "
-                f"{row_str(self.layers[Layer.BACK], row)}\n"
+                f"{row_str(layers[Layer.LEFT], row)} "
+                f"{row_str(layers[Layer.FRONT], row)} "
+                f"{row_str(layers[Layer.RIGHT], row)} "
+                f"{row_str(layers[Layer.BACK], row)}\n"
             )
         # Add DOWN layer
         for row in range(self.size):
-            string_representation += f"{pad}{row_str(self.layers[Layer.DOWN], row)}\n"
+            string_representation += f"{pad}{row_str(layers[Layer.DOWN], row)}\n"
 
         return string_representation
 
@@ -135,14 +478,15 @@ class Cube:
         :return: The current state of the cube
         """
 
+        layers = self.read_layers()
         return {
             "dimensions": self.size,
             "state": {
-                "UP": [color.value for color in self.layers[Layer.UP]],
-                "DOWN": [color.value for color in self.layers[Layer.DOWN]],
-                "LEFT": [color.value for color in self.layers[Layer.LEFT]],
-                "RIGHT": [color.value for color in self.layers[Layer.RIGHT]],
-                "FRONT": [color.value for color in self.layers[Layer.FRONT]],
-                "BACK": [color.value for color in self.layers[Layer.BACK]],
+                "UP": [color.value for color in layers[Layer.UP]],
+                "DOWN": [color.value for color in layers[Layer.DOWN]],
+                "LEFT": [color.value for color in layers[Layer.LEFT]],
+                "RIGHT": [color.value for color in layers[Layer.RIGHT]],
+                "FRONT": [color.value for color in layers[Layer.FRONT]],
+                "BACK": [color.value for color in layers[Layer.BACK]],
             },
         }
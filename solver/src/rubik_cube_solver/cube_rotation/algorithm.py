@@ -1,35 +1,82 @@
 # Python imports
-from typing import Self
+from functools import lru_cache
+from typing import Iterator, Mapping, Self, TypeVar
 
 # Project imports
 from rubik_cube_solver.cube_rotation.cube_rotation import MOVE_TRANSLATION_MAP
-from rubik_cube_solver.cube_rotation.move import Move
-from rubik_cube_solver.cube_rotation.move_cancellation import can_combine, combine
+from rubik_cube_solver.cube_rotation.move import Move, get_move_strings
+from rubik_cube_solver.cube_rotation.move_cancellation import push_move
+from rubik_cube_solver.cube_rotation.move_table import compose_permutations, get_move_table
 from rubik_cube_solver.enums.Layer import Layer
 from rubik_cube_solver.enums.Rotation import Rotation
 
+# The key type of an algorithm table.
+K = TypeVar("K")
+
+
+@lru_cache(maxsize=1024)
+def parse_moves(algorithm_string: str, cube_size: int | None = None) -> tuple[Move, ...]:
+    """
+    Parses a string of moves, remembering the most recent strings parsed.
+
+    Moves are separated by any amount of whitespace. Given a cube size, every move is looked up in the
+    moves that can be performed on a cube of that size, and any other move is rejected. Without one,
+    every move is parsed by `Move.from_str`.
+
+    :param algorithm_string: The string representation of an algorithm
+    :param cube_size: The size of the cube the moves are meant for, if any
+    :return: The moves
+    """
+
+    if cube_size is None:
+        return tuple(Move.from_str(move_string) for move_string in algorithm_string.split())
+
+    move_strings = get_move_strings(cube_size)
+    moves: list[Move] = []
+    for move_string in algorithm_string.split():
+        move = move_strings.get(move_string)
+        if move is None:
+            raise ValueError(f"Couldn't parse move notation for a cube of size {cube_size}: {move_string}")
+        moves.append(move)
+
+    return tuple(moves)
+
 
 class Algorithm:
     """
     Represents an algorithm (a sequence of moves that can be performed on a Rubik's Cube).
+
+    A frozen algorithm holds its moves in a tuple and cannot be changed, so a single instance can be
+    shared, and its compiled permutations reused, by everything that applies it.
+
+    The algorithm remembers how many of its leading moves are already reduced, so that `merge` only
+    has to cancel moves where the other algorithm is joined on. Moves added to or removed from the
+    end of the list in place are noticed on the next merge; replacing moves within the reduced part
+    in place is not, so such a change should go through the setter instead.
     """
 
-    def __init__(self, moves: list[Move]) -> None:
+    def __init__(self, moves: list[Move], frozen: bool = False) -> None:
         """
         Constructor for the `Algorithm` class.
 
         :param moves: The moves of the algorithm
+        :param frozen: Whether the algorithm cannot be changed
         :return: None
         """
 
-        self.__moves = moves
+        self.__moves: list[Move] | tuple[Move, ...] = tuple(moves) if frozen else moves
+        self.__frozen = frozen
+        # The amount of leading moves that are known to be reduced
+        self.__reduced_length = 0
+        # The compiled permutation for every cube size, with the moves it was compiled from
+        self.__compiled: dict[int, tuple[list[Move], tuple[int, ...]]] = {}
 
     @property
-    def moves(self) -> list[Move]:
+    def moves(self) -> list[Move] | tuple[Move, ...]:
         """
         Moves getter.
 
-        :return: The moves
+        :return: The moves, as a tuple if the algorithm is frozen
         """
 
         return self.__moves
@@ -43,7 +90,29 @@ class Algorithm:
         :return: None
         """
 
+        self.__check_not_frozen()
         self.__moves = moves
+        self.__reduced_length = 0
+
+    @property
+    def frozen(self) -> bool:
+        """
+        Frozen getter.
+
+        :return: Whether the algorithm cannot be changed
+        """
+
+        return self.__frozen
+
+    def __check_not_frozen(self) -> None:
+        """
+        Checks that the algorithm can be changed.
+
+        :return: None
+        """
+
+        if self.__frozen:
+            raise ValueError(f"Cannot change the frozen algorithm {self}.")
 
     def __str__(self) -> str:
         """
@@ -65,7 +134,35 @@ class Algorithm:
         if not isinstance(other, Algorithm):
             return False
 
-        return self.moves == other.moves
+        return list(self.__moves) == list(other.moves)
+
+    def compile(self, cube_size: int) -> tuple[int, ...]:
+        """
+        Compiles the whole algorithm into a single permutation of the stickers of a cube of the given
+        size, which `Cube.permute` applies as one gather.
+
+        The permutation of every move is taken from the move table for the size and the permutations
+        are composed in order. The result is kept on the algorithm for each size and reused for as long
+        as the moves are the same, so an algorithm applied over and over is compiled only once.
+
+        A move that cannot be performed on a cube of the size raises a `ValueError`, just like turning
+        it does.
+
+        :param cube_size: The size of the cube
+        :return: The flat source index of every flat sticker after the whole algorithm
+        """
+
+        compiled = self.__compiled.get(cube_size)
+        if compiled is not None and compiled[0] == self.__moves:
+            return compiled[1]
+
+        table = get_move_table(cube_size)
+        permutation = tuple(range(6 * cube_size * cube_size))
+        for move in self.__moves:
+            permutation = compose_permutations(permutation, table.move(move))
+
+        self.__compiled[cube_size] = (self.__moves if self.__frozen else list(self.__moves), permutation)
+        return permutation
 
     def remove_rotations(self) -> None:
         """
@@ -80,6 +177,8 @@ class Algorithm:
         :return: None
         """
 
+        self.__check_not_frozen()
+
         # The layer each move names, expressed in the orientation the algorithm started from
         orientation: dict[Layer, Layer] = {layer: layer for layer in Layer}
         moves: list[Move] = []
@@ -92,57 +191,173 @@ class Algorithm:
                 moves.append(Move(orientation[move.layer], move.direction, move.layer_amount))
 
         self.__moves = moves
+        self.__reduced_length = 0
 
     def cancel_moves(self) -> None:
         """
-        Reduces the algorithm by cancelling and combining adjacent moves that name the same
-        layer (or rotation axis) and, for layer turns, the same layer amount.
+        Reduces the algorithm by cancelling and combining moves that name the same layer (or
+        rotation axis) and, for layer turns, the same layer amount, when only moves around the same
+        axis stand between them. Such moves commute, so each run of them is also put in the
+        canonical order of `push_move`.
 
         Cancellation cascades: once a pair of moves disappears or combines into one, the moves
         that become newly adjacent are considered as well.
 
-        Example: `R U U' R2` becomes `R'`.
+        Example: `R U U' R2` becomes `R'`, `R L R'` becomes `L` and `U D U2 D'` becomes `U'`.
 
         :return: None
         """
 
+        self.__check_not_frozen()
         moves: list[Move] = []
 
         for move in self.__moves:
-            current: Move | None = move
-            while moves and current is not None and can_combine(moves[-1], current):
-                current = combine(moves.pop(), current)
-            if current is not None:
-                moves.append(current)
+            push_move(moves, move)
 
         self.__moves = moves
+        self.__reduced_length = len(moves)
+
+    def simplify(self) -> None:
+        """
+        Removes all whole-cube rotations from the algorithm and cancels its moves, in a single pass.
+
+        Every move is rewritten in the orientation the algorithm started from, exactly like
+        `remove_rotations` does, and pushed straight onto the reduced moves, exactly like
+        `cancel_moves` does, so the result is the same as calling the two in that order.
+
+        Example: `R y F U U'` becomes `R2`.
+
+        :return: None
+        """
+
+        self.__check_not_frozen()
+
+        # The layer each move names, expressed in the orientation the algorithm started from
+        orientation: dict[Layer, Layer] = {layer: layer for layer in Layer}
+        moves: list[Move] = []
+
+        for move in self.__moves:
+            if isinstance(move.layer, Rotation):
+                translation = MOVE_TRANSLATION_MAP[(move.layer, move.direction)]
+                orientation = {layer: orientation[translation[layer]] for layer in Layer}
+            else:
+                push_move(moves, Move(orientation[move.layer], move.direction, move.layer_amount))
+
+        self.__moves = moves
+        self.__reduced_length = len(moves)
 
     def merge(self, other: "Algorithm") -> None:
         """
         Merges another algorithm into this one, then cancels moves across the whole result.
 
         `other` is left untouched; the concatenated and cancelled moves are stored on this
-        algorithm.
+        algorithm. The moves of this algorithm are kept reduced, so only the moves of `other` are
+        pushed onto them and cancelling happens only where the two meet. Merging many algorithms one
+        after the other therefore takes time linear in their total length.
 
-        Example: `R U U' R2` merged with `L` becomes `R' L`.
+        Example: `R U U' R2` merged with `U` becomes `R' U`.
 
         :param other: The algorithm to merge into this one
         :return: None
         """
 
-        self.__moves = self.__moves + other.moves
-        self.cancel_moves()
+        self.__check_not_frozen()
+        other_moves = tuple(other.moves) if other is self else other.moves
+        moves = self.__moves
+
+        # Unless all the moves are already reduced in a list of its own, reduce them into a new list,
+        # so a list handed to the constructor or the setter is never changed
+        if self.__reduced_length == 0 or self.__reduced_length != len(moves):
+            reduced_length = min(self.__reduced_length, len(moves))
+            moves = moves[:reduced_length]
+            for move in self.__moves[reduced_length:]:
+                push_move(moves, move)
+            self.__moves = moves
+
+        for move in other_moves:
+            push_move(moves, move)
+
+        self.__reduced_length = len(moves)
 
     @classmethod
-    def from_str(cls, algorithm_string: str) -> Self:
+    def from_str(cls, algorithm_string: str, cube_size: int | None = None, frozen: bool = False) -> Self:
         """
         Create an Algorithm from string.
 
         Moves are separated by any amount of whitespace. An empty or whitespace-only string
-        produces an algorithm with no moves.
+        produces an algorithm with no moves. Parsing goes through `parse_moves`, so a string that
+        was parsed recently is not parsed again.
 
         :param algorithm_string: The string representation of an algorithm
+        :param cube_size: The size of the cube the moves are meant for, if any
+        :param frozen: Whether the algorithm cannot be changed
         :return: A new Algorithm object
         """
 
-        return cls([Move.from_str(move_string) for move_string in algorithm_string.split()])
+        return cls(list(parse_moves(algorithm_string, cube_size)), frozen)
+
+
+class AlgorithmTable(Mapping[K, Algorithm]):
+    """
+    A read-only table of frozen algorithms, built from a table of algorithm strings.
+
+    Every algorithm is parsed the first time it is looked up and the same instance is returned from
+    then on, so a solver that applies it over and over neither parses nor compiles it again.
+    """
+
+    def __init__(self, algorithm_strings: Mapping[K, str], cube_size: int) -> None:
+        """
+        Constructor for the `AlgorithmTable` class.
+
+        :param algorithm_strings: The string representation of every algorithm, by its key
+        :param cube_size: The size of the cube the algorithms are meant for
+        :return: None
+        """
+
+        self.__algorithm_strings = algorithm_strings
+        self.__cube_size = cube_size
+        self.__algorithms: dict[K, Algorithm] = {}
+
+    def __getitem__(self, key: K) -> Algorithm:
+        """
+        Returns the algorithm of a key, parsing it on first use.
+
+        :param key: The key
+        :return: The frozen algorithm
+        """
+
+        algorithm = self.__algorithms.get(key)
+        if algorithm is None:
+            algorithm = self.__algorithms[key] = Algorithm.from_str(
+                self.__algorithm_strings[key], self.__cube_size, frozen=True
+            )
+
+        return algorithm
+
+    def __contains__(self, key: object) -> bool:
+        """
+        Checks whether the table has an algorithm for a key, without parsing it.
+
+        :param key: The key
+        :return: True if the table has an algorithm for the key, False otherwise
+        """
+
+        return key in self.__algorithm_strings
+
+    def __iter__(self) -> Iterator[K]:
+        """
+        Iterates over the keys of the table.
+
+        :return: The keys
+        """
+
+        return iter(self.__algorithm_strings)
+
+    def __len__(self) -> int:
+        """
+        Returns the amount of algorithms in the table.
+
+        :return: The amount of algorithms
+        """
+
+        return len(self.__algorithm_strings)
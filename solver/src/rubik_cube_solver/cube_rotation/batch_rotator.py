@@ -0,0 +1,160 @@
+# Python imports
+from typing import Sequence
+
+# Third-party imports
+import numpy as np
+
+# Project imports
+from rubik_cube_solver.array_cube import ArrayCube, get_index_array
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.move import Move
+from rubik_cube_solver.cube_rotation.move_table import get_move_table
+
+
+class BatchRotator:
+    """
+    The `BatchRotator` class performs turns on many cubes of the same size at once.
+
+    It holds the stickers of M cubes as one array of shape (M, 6 * N^2), a row per cube, every row laid
+    out like the stickers of an `ArrayCube` flattened. A move or an algorithm is applied to every cube
+    with a single gather over the whole array.
+    """
+
+    def __init__(self, stickers: np.ndarray, cube_size: int) -> None:
+        """
+        Constructor for the `BatchRotator` class.
+
+        :param stickers: The color codes of the stickers of every cube, as an array of shape (M, 6 * N^2)
+        :param cube_size: The size of the cubes
+        :return: None
+        """
+
+        if stickers.ndim != 2 or stickers.shape[1] != 6 * cube_size * cube_size:
+            raise ValueError(f"Expected stickers of shape (M, {6 * cube_size * cube_size}), got {stickers.shape}.")
+
+        self.__stickers = stickers.astype(np.uint8, copy=False)
+        self.__size = cube_size
+
+    @classmethod
+    def from_cubes(cls, cubes: Sequence[Cube]) -> "BatchRotator":
+        """
+        Creates a batch from the stickers of a sequence of cubes. The cubes themselves are not bound to
+        the batch and are not changed by it.
+
+        :param cubes: The cubes, all of the same size
+        :return: The batch rotator
+        """
+
+        if not cubes:
+            raise ValueError("Cannot create a batch without any cubes.")
+
+        cube_size = cubes[0].size
+        if any(cube.size != cube_size for cube in cubes):
+            raise ValueError("All cubes of a batch must be of the same size.")
+
+        stickers = np.stack([ArrayCube.from_cube(cube).stickers.ravel() for cube in cubes])
+        return cls(stickers, cube_size)
+
+    @property
+    def stickers(self) -> np.ndarray:
+        """
+        Stickers getter
+
+        :return: The color codes of the stickers of every cube, as an array of shape (M, 6 * N^2)
+        """
+
+        return self.__stickers
+
+    @property
+    def size(self) -> int:
+        """
+        Cube size getter
+
+        :return: The size of the cubes
+        """
+
+        return self.__size
+
+    def to_cubes(self) -> list[ArrayCube]:
+        """
+        Creates a cube from every row of the batch.
+
+        :return: The cubes, in the order of the rows
+        """
+
+        cubes: list[ArrayCube] = []
+        for row in self.__stickers:
+            cube = ArrayCube(self.__size)
+            cube.stickers = row.reshape(6, self.__size, self.__size).copy()
+            cubes.append(cube)
+
+        return cubes
+
+    def turn(self, move: Move) -> None:
+        """
+        Performs a move, a layer turn or a whole-cube rotation, on every cube of the batch.
+
+        :param move: The move to perform
+        :return: None
+        """
+
+        self.__stickers = self.__stickers[:, get_index_array(get_move_table(self.__size).move(move))]
+
+    def apply(self, algorithm: Algorithm) -> None:
+        """
+        Applies an algorithm to every cube of the batch. The algorithm is compiled into a single
+        permutation, so this costs the same as a single turn.
+
+        :param algorithm: The algorithm to perform
+        :return: None
+        """
+
+        self.__stickers = self.__stickers[:, get_index_array(algorithm.compile(self.__size))]
+
+    def apply_each(self, algorithms: Sequence[Algorithm]) -> None:
+        """
+        Applies a different algorithm to every cube of the batch, the first algorithm to the first row and
+        so on.
+
+        The algorithms are performed side by side, one move at a time. At every step the rows are grouped
+        by the move they perform next, and each group is turned with a single gather, so a step costs one
+        gather per distinct move rather than one per cube. If any move cannot be performed on the cubes,
+        a `ValueError` is raised and the batch is left untouched.
+
+        :param algorithms: The algorithm for every cube of the batch
+        :return: None
+        """
+
+        if len(algorithms) != len(self.__stickers):
+            raise ValueError(f"Expected {len(self.__stickers)} algorithms, got {len(algorithms)}.")
+
+        table = get_move_table(self.__size)
+
+        # Number every distinct move, and write down the number of the move every row performs at every step
+        codes: dict[Move, int] = {}
+        index_arrays: list[np.ndarray] = []
+        rows_of_codes: list[list[int]] = []
+        for algorithm in algorithms:
+            row_of_codes: list[int] = []
+            for move in algorithm.moves:
+                code = codes.get(move)
+                if code is None:
+                    code = codes[move] = len(index_arrays)
+                    index_arrays.append(get_index_array(table.move(move)))
+                row_of_codes.append(code)
+            rows_of_codes.append(row_of_codes)
+
+        # Rows with a shorter algorithm perform no move at the steps past its end
+        length = max((len(row_of_codes) for row_of_codes in rows_of_codes), default=0)
+        steps = np.array([row_of_codes + [-1] * (length - len(row_of_codes)) for row_of_codes in rows_of_codes])
+
+        stickers = self.__stickers.copy()
+        for step in range(length):
+            column = steps[:, step]
+            for code in np.unique(column):
+                if code >= 0:
+                    rows = np.flatnonzero(column == code)
+                    stickers[rows] = stickers[rows[:, np.newaxis], index_arrays[code]]
+
+        self.__stickers = stickers
@@ -1,4 +1,7 @@
 # Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.face_stickers_rotation import rotate_face
+from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.Direction import Direction
 from rubik_cube_solver.enums.Layer import Layer
 from rubik_cube_solver.enums.Rotation import Rotation
@@ -141,3 +144,29 @@ MOVE_TRANSLATION_MAP: dict[tuple[Rotation, Direction], dict[Layer, Layer]] = {}
 for rotation_key, (rotation_order, _) in CUBE_ROTATION_MAP.items():
     inverted_order: dict[Layer, Layer] = {new: old for old, new in rotation_order.items()}
     MOVE_TRANSLATION_MAP[rotation_key] = {layer: inverted_order.get(layer, layer) for layer in Layer}
+
+
+def rotate_cube(cube: Cube, rotation: Rotation, direction: Direction) -> None:
+    """
+    Rotates the whole cube around an axis, sticker by sticker.
+
+    The faces are moved to their new positions according to `CUBE_ROTATION_MAP` and the faces whose
+    stickers end up turned in place are rotated with `rotate_face`. This is the reference implementation
+    the compiled rotation permutations are derived from.
+
+    :param cube: The cube
+    :param rotation: The axis to rotate around
+    :param direction: The direction of the rotation
+    :return: None
+    """
+
+    order, faces = CUBE_ROTATION_MAP[(rotation, direction)]
+
+    # Swap around the faces
+    old_layers: list[list[Color]] = [cube.layers[layer] for layer in order.keys()]
+    for index, new_layer in enumerate(order.values()):
+        cube.layers[new_layer] = old_layers[index]
+
+    # Fix orientation
+    for layer, layer_direction in faces.items():
+        rotate_face(cube, layer, layer_direction)
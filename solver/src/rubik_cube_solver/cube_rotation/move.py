@@ -1,5 +1,7 @@
 # Python imports
 import re
+import threading
+from functools import cache
 from typing import Self
 
 # Project imports
@@ -7,6 +9,18 @@ from rubik_cube_solver.enums.Direction import Direction
 from rubik_cube_solver.enums.Layer import Layer
 from rubik_cube_solver.enums.Rotation import Rotation
 
+# Maps a Direction to the Direction that undoes it.
+INVERSE_DIRECTION_MAP: dict[Direction, Direction] = {
+    Direction.CW: Direction.CCW,
+    Direction.CCW: Direction.CW,
+    Direction.DOUBLE: Direction.DOUBLE,
+}
+
+# The order of the axes, layers and directions within the move ids.
+ROTATIONS: tuple[Rotation, ...] = tuple(Rotation)
+LAYERS: tuple[Layer, ...] = tuple(Layer)
+DIRECTIONS: tuple[Direction, ...] = tuple(Direction)
+
 
 class Move:
     """
@@ -14,41 +28,93 @@ class Move:
 
     A move is either a layer turn (`R`, `Rw'`, `3Fw2`) or a whole-cube rotation (`x`, `y'`, `z2`).
     A whole-cube rotation turns every layer at once, so its layer amount is always 1.
+
+    Moves are immutable and interned: every distinct layer, direction and layer amount is created once,
+    and constructing it again returns the same object. The rotations are created all at once, and so are
+    the turns of a layer amount, the first time any of them is asked for, so the moves held are bounded
+    by the layer amounts in use. A move therefore compares and hashes by
+    identity, works as a dictionary key, and carries a dense integer `id` — the rotations take ids 0 to
+    8, and the turns of a single layer follow them, 18 per layer amount.
     """
 
-    def __init__(self, layer: Layer | Rotation, direction: Direction, layer_amount: int):
+    __slots__ = ("__layer", "__direction", "__layer_amount", "__id", "__inverse")
+
+    # Every move created so far, by its layer, direction and layer amount, and the lock that keeps two
+    # threads from creating the moves of a layer amount twice
+    __moves: dict[tuple[Layer | Rotation, Direction, int], "Move"] = {}
+    __lock = threading.Lock()
+
+    def __new__(cls, layer: Layer | Rotation, direction: Direction, layer_amount: int) -> "Move":
         """
-        Constructor for the `Move` class.
+        Returns the move of a layer, direction and layer amount, creating it and the moves of every other
+        layer and direction of its layer amount on first use.
 
         :param layer: The layer to turn or the axis to rotate the whole cube around
         :param direction: The direction to rotate
         :param layer_amount: The amount of layers to rotate
+        :return: The move
         """
 
-        self.__layer = layer
-        self.__direction = direction
-        self.__layer_amount = layer_amount
+        move = cls.__moves.get((layer, direction, layer_amount))
+        if move is not None:
+            return move
 
-    @property
-    def layer(self) -> Layer | Rotation:
+        if isinstance(layer, Rotation):
+            if layer_amount != 1:
+                raise ValueError(f"Invalid layer amount for a rotation: {layer_amount}")
+            layers, first_id = ROTATIONS, 0
+        else:
+            if layer_amount < 1:
+                raise ValueError(f"Invalid layer amount: {layer_amount}")
+            layers, first_id = LAYERS, 9 + (layer_amount - 1) * 18
+
+        with cls.__lock:
+            if (layers[0], DIRECTIONS[0], layer_amount) not in cls.__moves:
+                cls.__intern(layers, layer_amount, first_id)
+
+        move = cls.__moves.get((layer, direction, layer_amount))
+        if move is None:
+            raise ValueError(f"Invalid move: {layer}, {direction}, {layer_amount}")
+
+        return move
+
+    @classmethod
+    def __intern(cls, layers: tuple[Layer, ...] | tuple[Rotation, ...], layer_amount: int, first_id: int) -> None:
         """
-        Layer getter.
+        Creates the moves of every layer and direction of a layer amount, and registers them.
 
-        :return: The layer
+        :param layers: The layers to turn, or the axes to rotate the whole cube around
+        :param layer_amount: The amount of layers to rotate
+        :param first_id: The id of the first move, followed by the others in the order of the layers
+            and directions
+        :return: None
         """
 
-        return self.__layer
+        moves = {}
+        for layer_index, layer in enumerate(layers):
+            for direction_index, direction in enumerate(DIRECTIONS):
+                move = super().__new__(cls)
+                move.__layer = layer
+                move.__direction = direction
+                move.__layer_amount = layer_amount
+                move.__id = first_id + layer_index * 3 + direction_index
+                moves[(layer, direction, layer_amount)] = move
 
-    @layer.setter
-    def layer(self, layer: Layer | Rotation):
+        for (layer, direction, _), move in moves.items():
+            move.__inverse = moves[(layer, INVERSE_DIRECTION_MAP[direction], layer_amount)]
+
+        # Registered once complete, so that no other thread finds a move without its inverse
+        cls.__moves.update(moves)
+
+    @property
+    def layer(self) -> Layer | Rotation:
         """
-        Layer setter.
+        Layer getter.
 
-        :param layer: The layer
-        :return: None
+        :return: The layer
         """
 
-        self.__layer = layer
+        return self.__layer
 
     @property
     def direction(self) -> Direction:
@@ -60,37 +126,37 @@ class Move:
 
         return self.__direction
 
-    @direction.setter
-    def direction(self, direction: Direction):
+    @property
+    def layer_amount(self) -> int:
         """
-        Direction setter.
+        Layer amount getter.
 
-        :param direction: The direction
-        :return: None
+        :return: The layer amount
         """
 
-        self.__direction = direction
+        return self.__layer_amount
 
     @property
-    def layer_amount(self) -> int:
+    def id(self) -> int:
         """
-        Layer amount getter.
+        Id getter.
 
-        :return: The layer amount
+        :return: The dense integer id of the move
         """
 
-        return self.__layer_amount
+        return self.__id
 
-    @layer_amount.setter
-    def layer_amount(self, layer_amount: int):
+    def inverse(self) -> "Move":
         """
-        Layer amount setter.
+        Returns the move that undoes this one: the same layer (or rotation axis) and layer amount,
+        turned the other way.
 
-        :param layer_amount: The layer amount
-        :return: None
+        Example: the inverse of `Rw` is `Rw'`, and `F2` is its own inverse.
+
+        :return: The inverse move
         """
 
-        self.__layer_amount = layer_amount
+        return self.__inverse
 
     def __str__(self) -> str:
         """
@@ -112,18 +178,31 @@ class Move:
 
     def __eq__(self, other) -> bool:
         """
-        Equality comparison for Move objects.
+        Equality comparison for Move objects. Moves are interned, so equal moves are the same object.
 
         :param other: The other Move object to compare with
         :return: True if equal, False otherwise
         """
 
-        if not isinstance(other, Move):
-            return False
+        return self is other
+
+    def __hash__(self) -> int:
+        """
+        Hash of the Move.
+
+        :return: The id of the move
+        """
+
+        return self.__id
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickles the move by its fields, so that unpickling returns the interned move.
 
-        return (
-            self.layer == other.layer and self.direction == other.direction and self.layer_amount == other.layer_amount
-        )
+        :return: The constructor and its arguments
+        """
+
+        return Move, (self.__layer, self.__direction, self.__layer_amount)
 
     @classmethod
     def from_str(cls, move_string: str) -> Self:
@@ -142,8 +221,11 @@ class Move:
         Group 3 - Wide Move - (w?) - Optional "w" indicating a wide move
         Group 4 - Direction - (['2]?) - Optional one of "'" (CCW) or "2" (Double)
 
+        Moves are interned, so the move returned is the one every other way of creating it returns. The
+        strings of whole algorithms are remembered by `parse_moves`.
+
         :param move_string: The string representation of a move
-        :return: A new Move object
+        :return: The Move object
         """
 
         rotation_pattern = r"^([xyz])(['2]?)$"
@@ -172,3 +254,26 @@ class Move:
             layer_amount = 1
 
         return cls(layer, direction, layer_amount)
+
+
+@cache
+def get_move_strings(cube_size: int) -> dict[str, Move]:
+    """
+    Returns every move that can be performed on a cube of the given size, by its string, building the
+    dictionary on first use.
+
+    That is every whole-cube rotation, and every layer turn of as many layers as still leave at least
+    as many layers unturned, just like `rotate_sides` allows.
+
+    :param cube_size: The size of the cube
+    :return: The moves, by their string representation
+    """
+
+    moves = [Move(rotation, direction, 1) for rotation in Rotation for direction in Direction] + [
+        Move(layer, direction, layer_amount)
+        for layer_amount in range(1, cube_size // 2 + 1)
+        for layer in Layer
+        for direction in Direction
+    ]
+
+    return {str(move): move for move in moves}
@@ -1,6 +1,8 @@
 # Project imports
 from rubik_cube_solver.cube_rotation.move import Move
 from rubik_cube_solver.enums.Direction import Direction
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.enums.Rotation import Rotation
 
 # Maps a Direction to the number of quarter turns it represents.
 QUARTER_TURNS_MAP: dict[Direction, int] = {
@@ -16,6 +18,21 @@ DIRECTION_MAP: dict[int, Direction] = {
 }
 
 
+# Maps every layer, and every rotation axis, to the axis it turns around. Turns and rotations around
+# the same axis commute, whatever face they name and however many layers they take.
+AXIS_MAP: dict[Layer | Rotation, Rotation] = {
+    Layer.RIGHT: Rotation.X,
+    Layer.LEFT: Rotation.X,
+    Rotation.X: Rotation.X,
+    Layer.UP: Rotation.Y,
+    Layer.DOWN: Rotation.Y,
+    Rotation.Y: Rotation.Y,
+    Layer.FRONT: Rotation.Z,
+    Layer.BACK: Rotation.Z,
+    Rotation.Z: Rotation.Z,
+}
+
+
 def can_combine(first: Move, second: Move) -> bool:
     """
     Checks whether two moves can be combined into a single move.
@@ -51,3 +68,44 @@ def combine(first: Move, second: Move) -> Move | None:
         return None
 
     return Move(first.layer, DIRECTION_MAP[quarter_turns], first.layer_amount)
+
+
+def push_move(moves: list[Move], move: Move) -> None:
+    """
+    Pushes a move onto a reduced list of moves, keeping it reduced.
+
+    Moves around the same axis commute, so a reduced list is made of blocks of moves around one axis
+    each, no two adjacent blocks sharing an axis. Within a block every layer (or rotation axis) and
+    layer amount appears at most once, and the moves are kept in a canonical order: the rotation
+    first, then the turns by layer amount and then by layer, in `Layer` order.
+
+    The new move can only change the block on top. It is combined with the move of that block that
+    turns the same layers, if there is one, which makes `R L R'` become `L` and `U D U2 D'` become
+    `U'`; otherwise it joins the block in its place, or starts a new block if it turns around
+    another axis. Pushing the moves of an algorithm one by one onto an empty list reduces it.
+
+    :param moves: The reduced moves, changed in place
+    :param move: The move to push
+    :return: None
+    """
+
+    axis = AXIS_MAP[move.layer]
+
+    # Find the start of the block on top, the moves that turn around the same axis as the new one
+    start = len(moves)
+    while start > 0 and AXIS_MAP[moves[start - 1].layer] is axis:
+        start -= 1
+
+    for index in range(start, len(moves)):
+        if can_combine(moves[index], move):
+            combined = combine(moves.pop(index), move)
+            if combined is not None:
+                moves.insert(index, combined)
+            return
+
+    # The ids of the moves of a layer and layer amount are 3 in a row, rotations before turns and
+    # turns by layer amount and then by layer, so dividing by 3 gives their place in the block
+    index = start
+    while index < len(moves) and moves[index].id // 3 < move.id // 3:
+        index += 1
+    moves.insert(index, move)
@@ -0,0 +1,203 @@
+# Python imports
+from functools import cache
+from operator import itemgetter
+from typing import Sequence
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.cube_rotation import MOVE_TRANSLATION_MAP, rotate_cube
+from rubik_cube_solver.cube_rotation.face_stickers_rotation import rotate_face
+from rubik_cube_solver.cube_rotation.move import Move
+from rubik_cube_solver.cube_rotation.side_stickers_rotation import rotate_sides
+from rubik_cube_solver.enums.Direction import Direction
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.enums.Rotation import Rotation
+
+
+def create_index_cube(cube_size: int) -> Cube:
+    """
+    Creates a cube whose stickers are their own flat indices instead of colors.
+
+    The faces are numbered in `Layer` order, so sticker `index` of the face at position `f` holds
+    `f * cube_size * cube_size + index`. Running a move on this cube with the sticker-by-sticker
+    functions and reading it back shows where every sticker came from, which is the move's
+    permutation.
+
+    :param cube_size: The size of the cube
+    :return: The index cube
+    """
+
+    face_size = cube_size * cube_size
+    return Cube(
+        cube_size,
+        {layer: list(range(position * face_size, (position + 1) * face_size)) for position, layer in enumerate(Layer)},
+    )
+
+
+def read_permutation(cube: Cube) -> tuple[int, ...]:
+    """
+    Reads the stickers of an index cube back as a flat permutation, face by face in `Layer` order.
+
+    :param cube: The index cube
+    :return: The flat source index of every flat sticker
+    """
+
+    return tuple(sticker for layer in Layer for sticker in cube.read_layers()[layer])
+
+
+def compose_permutations(first: Sequence[int], second: Sequence[int]) -> tuple[int, ...]:
+    """
+    Composes two permutations into one that has the effect of applying `first` and then `second`.
+
+    Flat sticker `i` after both is flat sticker `second[i]` after `first`, which is flat sticker
+    `first[second[i]]` before either.
+
+    :param first: The permutation applied first
+    :param second: The permutation applied second
+    :return: The composed permutation
+    """
+
+    return itemgetter(*second)(first)
+
+
+class MoveTable:
+    """
+    The compiled sticker permutations of every move on cubes of one size.
+
+    Every layer turn and whole-cube rotation is compiled once, the first time it is asked for, into a
+    single permutation over all 6 * N^2 stickers, which `Cube.permute` applies as one gather. A
+    permutation is derived by running the move on an index cube with `rotate_face`, `rotate_sides` and
+    `rotate_cube`, so the table is exactly as correct as those reference functions and a move they
+    reject is rejected here as well.
+    """
+
+    def __init__(self, cube_size: int) -> None:
+        """
+        Constructor for the `MoveTable` class.
+
+        :param cube_size: The size of the cubes the table is for
+        :return: None
+        """
+
+        self.__size = cube_size
+        self.__turns: dict[tuple[Layer, Direction, int], tuple[int, ...]] = {}
+        self.__rotations: dict[tuple[Rotation, Direction], tuple[int, ...]] = {}
+        self.__moves: dict[Move, tuple[int, ...]] = {}
+        # Every frame reached so far, keyed by the stored face of every layer in `Layer` order, and the
+        # frame every rotation leads to from it
+        self.__frames: dict[tuple[Layer, ...], tuple[dict[Layer, Layer], tuple[int, ...]]] = {
+            tuple(Layer): ({layer: layer for layer in Layer}, tuple(range(6 * cube_size * cube_size)))
+        }
+        self.__reorientations: dict[tuple[tuple[Layer, ...], Rotation, Direction], tuple[Layer, ...]] = {}
+
+    @property
+    def size(self) -> int:
+        """
+        Cube size getter
+
+        :return: The size of the cubes the table is for
+        """
+
+        return self.__size
+
+    def turn(self, layer: Layer, direction: Direction, layer_amount: int) -> tuple[int, ...]:
+        """
+        Returns the permutation of a layer turn, compiling it on first use.
+
+        :param layer: The layer to turn
+        :param direction: The direction of the turn
+        :param layer_amount: The amount of layers to turn
+        :return: The flat source index of every flat sticker after the turn
+        """
+
+        key = (layer, direction, layer_amount)
+        permutation = self.__turns.get(key)
+        if permutation is None:
+            cube = create_index_cube(self.__size)
+            rotate_face(cube, layer, direction)
+            rotate_sides(cube, layer, direction, layer_amount)
+            permutation = self.__turns[key] = read_permutation(cube)
+
+        return permutation
+
+    def rotation(self, rotation: Rotation, direction: Direction) -> tuple[int, ...]:
+        """
+        Returns the permutation of a whole-cube rotation, compiling it on first use.
+
+        :param rotation: The axis to rotate around
+        :param direction: The direction of the rotation
+        :return: The flat source index of every flat sticker after the rotation
+        """
+
+        key = (rotation, direction)
+        permutation = self.__rotations.get(key)
+        if permutation is None:
+            cube = create_index_cube(self.__size)
+            rotate_cube(cube, rotation, direction)
+            permutation = self.__rotations[key] = read_permutation(cube)
+
+        return permutation
+
+    def reorientation(
+        self, frame: dict[Layer, Layer], rotation: Rotation, direction: Direction
+    ) -> tuple[dict[Layer, Layer], tuple[int, ...]]:
+        """
+        Returns the frame a whole-cube rotation leads to from a frame, and the permutation that moves
+        stickers stored in the identity frame into it, working both out on first use.
+
+        A frame names the stored face every face of the cube is read from. Rotating composes it the
+        same way `Algorithm.remove_rotations` composes the orientation of the moves that follow a
+        rotation, and the permutation of the new frame is the permutation of the old frame followed by
+        the rotation. A cube can only be in one of 24 frames, so after they have been reached once a
+        rotation is two dictionary lookups.
+
+        :param frame: The frame the cube is in
+        :param rotation: The axis to rotate around
+        :param direction: The direction of the rotation
+        :return: The frame after the rotation, and the permutation that moves the stickers into it
+        """
+
+        key = (tuple(frame.values()), rotation, direction)
+        frame_key = self.__reorientations.get(key)
+        if frame_key is None:
+            translation = MOVE_TRANSLATION_MAP[(rotation, direction)]
+            new_frame = {layer: frame[translation[layer]] for layer in Layer}
+            frame_key = self.__reorientations[key] = tuple(new_frame.values())
+            if frame_key not in self.__frames:
+                permutation = compose_permutations(self.__frames[key[0]][1], self.rotation(rotation, direction))
+                self.__frames[frame_key] = (new_frame, permutation)
+
+        return self.__frames[frame_key]
+
+    def move(self, move: Move) -> tuple[int, ...]:
+        """
+        Returns the permutation of a move, whether it is a layer turn or a whole-cube rotation.
+
+        :param move: The move
+        :return: The flat source index of every flat sticker after the move
+        """
+
+        permutation = self.__moves.get(move)
+        if permutation is None:
+            if isinstance(move.layer, Rotation):
+                permutation = self.rotation(move.layer, move.direction)
+            else:
+                permutation = self.turn(move.layer, move.direction, move.layer_amount)
+            self.__moves[move] = permutation
+
+        return permutation
+
+
+@cache
+def get_move_table(cube_size: int) -> MoveTable:
+    """
+    Returns the move table for a cube size, creating it on first use.
+
+    There is one table per size for the whole process, so every cube of that size shares the
+    permutations compiled for any of them.
+
+    :param cube_size: The size of the cube
+    :return: The move table for that size
+    """
+
+    return MoveTable(cube_size)
@@ -1,29 +1,96 @@
+# Python imports
+from typing import Any, NamedTuple
+
 # Project imports
 from rubik_cube_solver.cube import Cube
 from rubik_cube_solver.cube_rotation.algorithm import Algorithm
-from rubik_cube_solver.cube_rotation.cube_rotation import CUBE_ROTATION_MAP
-from rubik_cube_solver.cube_rotation.face_stickers_rotation import rotate_face
 from rubik_cube_solver.cube_rotation.move import Move
-from rubik_cube_solver.cube_rotation.side_stickers_rotation import rotate_sides
-from rubik_cube_solver.enums.Color import Color
+from rubik_cube_solver.cube_rotation.move_table import get_move_table
 from rubik_cube_solver.enums.Direction import Direction
-from rubik_cube_solver.enums.Layer import Layer
 from rubik_cube_solver.enums.Rotation import Rotation
 
 
+class Checkpoint(NamedTuple):
+    """
+    A state of the cube that a rotator can be restored to: a snapshot of the sticker storage, the
+    length of the undo journal at the time and the state of the listener, if it keeps one.
+    """
+
+    snapshot: Any
+    journal_length: int
+    listener_state: Any = None
+
+
+class RotatorListener:
+    """
+    Follows every change a rotator makes to its cube, once it is set as the `listener` of the rotator.
+
+    Both methods do nothing, so a subclass overrides only the ones it needs.
+    """
+
+    def on_permute(self, permutation: tuple[int, ...]) -> None:
+        """
+        Called after the rotator moves the stickers of the cube, with the move as a permutation of the
+        stickers in the frame the cube is read in: sticker `i` of the cube now holds the sticker that
+        `permutation[i]` held before. Whole-cube rotations are reported the same way.
+
+        :param permutation: The permutation of the stickers
+        :return: None
+        """
+
+    def on_reset(self, cube: Cube) -> None:
+        """
+        Called when the cube changes without a move, once it is replaced by another cube or restored to
+        a checkpoint without a state of the listener, and when the listener is set.
+
+        :param cube: The cube, as it is now
+        :return: None
+        """
+
+    def on_checkpoint(self) -> Any:
+        """
+        Called as the rotator takes a checkpoint, to keep the state of the listener in it.
+
+        :return: The state of the listener, which must not change afterwards, or None to keep none
+        """
+
+        return None
+
+    def on_restore(self, cube: Cube, state: Any) -> None:
+        """
+        Called after the rotator restores the cube to a checkpoint, with the state the checkpoint kept.
+        Without a state, the listener is reset to the cube instead.
+
+        :param cube: The cube, as it is now
+        :param state: The state of the listener the checkpoint kept, or None
+        :return: None
+        """
+
+        self.on_reset(cube)
+
+
 class Rotator:
     """
     The `Rotator` class is responsible for all turns done on the cube.
     It holds a reference of the cube and performs all turns.
+
+    With the journal enabled, every move performed is recorded, so the latest moves can be undone.
+    With a listener, every change to the cube is reported to it as well. Since every move is a legal
+    one, a trusted cube stays trusted.
     """
 
-    def __init__(self, cube: Cube):
+    def __init__(self, cube: Cube, journal: bool = False, listener: RotatorListener | None = None):
         """
         Constructor for the `Rotator` class.
 
         :param cube: The cube
+        :param journal: Whether to record the moves performed, so they can be undone
+        :param listener: The listener to report every change to the cube to, if any
         """
         self.__cube = cube
+        self.__journal: list[Move] | None = [] if journal else None
+        self.__listener: RotatorListener | None = None
+        self.listener = listener
 
     @property
     def cube(self) -> Cube:
@@ -43,12 +110,46 @@ class Rotator:
         :return: None
         """
         self.__cube = cube
+        if self.__listener is not None:
+            self.__listener.on_reset(cube)
+
+    @property
+    def journal(self) -> list[Move] | None:
+        """
+        Journal getter
+
+        :return: The moves performed since the journal was enabled, oldest first, or None if it is not
+        """
+        return self.__journal
+
+    @property
+    def listener(self) -> RotatorListener | None:
+        """
+        Listener getter
+
+        :return: The listener every change to the cube is reported to, or None
+        """
+        return self.__listener
+
+    @listener.setter
+    def listener(self, listener: RotatorListener | None):
+        """
+        Listener setter. The listener is reset to the cube right away.
+
+        :param listener: The listener, or None to stop reporting
+        :return: None
+        """
+        self.__listener = listener
+        if listener is not None:
+            listener.on_reset(self.__cube)
 
     def turn(self, move: Move) -> None:
         """
         Turns a layer or multiple layers of the cube.
-        Firstly, it generates a map for the rotation of the face stickers and performs the rotation.
-        Secondly, for every layer in `layer_amount` it moves around the sides stickers, depending on the adjacent faces.
+
+        The turn is looked up in the move table for the cube's size, where it is compiled once into a
+        permutation of all the stickers, and applied to the cube as a single gather. If the cube has
+        been reoriented, the stored face its frame names is turned, so the frame stays in place.
 
         A move carrying a whole-cube rotation instead of a layer is forwarded to `rotate`.
 
@@ -64,44 +165,111 @@ class Rotator:
             self.rotate(move.layer, move.direction)
             return
 
-        # Rotate the face stickers
-        rotate_face(self.__cube, move.layer, move.direction)
-
-        # Rotate the side stickers
-        rotate_sides(self.__cube, move.layer, move.direction, move.layer_amount)
+        move_table = get_move_table(self.__cube.size)
+        self.__cube.permute_storage(
+            move_table.turn(self.__cube.frame[move.layer], move.direction, move.layer_amount), move=True
+        )
+        if self.__listener is not None:
+            self.__listener.on_permute(move_table.move(move))
+        if self.__journal is not None:
+            self.__journal.append(move)
 
     def rotate(self, rotation: Rotation, direction: Direction) -> None:
         """
         Applies a whole-cube rotation around the specified axis.
 
         The rotation remaps all 6 faces of the cube according to the axis
-        and also rotates the stickers of the two faces perpendicular to the axis.
+        and also rotates the stickers of the faces it turns in place. No sticker is moved right away:
+        the rotation only updates the frame the cube is read in, looked up in the move table for the
+        cube's size, and the stickers follow the next time they are read.
 
         :param rotation: The axis to rotate around (Rotation.X, Rotation.Y, or Rotation.Z)
         :param direction: The direction of the rotation (Direction.CW, Direction.CCW, Direction.DOUBLE)
         :return: None
         """
 
-        order: dict[Layer, Layer] = {}
-        faces: dict[Layer, Direction] = {}
-        order, faces = CUBE_ROTATION_MAP.get((rotation, direction))
-
-        # Swap around the faces
-        old_layers: list[list[Color]] = [self.__cube.layers[layer] for layer in order.keys()]
-        for index, new_layer in enumerate(order.values()):
-            self.__cube.layers[new_layer] = old_layers[index]
-
-        # Fix orientation
-        for layer, layer_direction in faces.items():
-            rotate_face(self.__cube, layer, layer_direction)
+        move_table = get_move_table(self.__cube.size)
+        self.__cube.reorient(*move_table.reorientation(self.__cube.frame, rotation, direction))
+        if self.__listener is not None:
+            self.__listener.on_permute(move_table.move(Move(rotation, direction, 1)))
+        if self.__journal is not None:
+            self.__journal.append(Move(rotation, direction, 1))
 
     def apply(self, algorithm: Algorithm) -> None:
         """
         Applies every move of an algorithm to the cube, in order.
 
+        The algorithm is compiled into a single permutation for the cube's size and applied as one
+        gather, so a compiled algorithm costs the same as a single turn. If any of its moves cannot be
+        performed on the cube, a `ValueError` is raised and the cube is left untouched. An algorithm of
+        whole-cube rotations only just reorients the cube, like `rotate` does.
+
         :param algorithm: The algorithm to perform
         :return: None
         """
 
-        for move in algorithm.moves:
-            self.turn(move)
+        if all(isinstance(move.layer, Rotation) for move in algorithm.moves):
+            for move in algorithm.moves:
+                self.rotate(move.layer, move.direction)
+            return
+
+        permutation = algorithm.compile(self.__cube.size)
+        self.__cube.permute(permutation, move=True)
+        if self.__listener is not None:
+            self.__listener.on_permute(permutation)
+        if self.__journal is not None:
+            self.__journal.extend(algorithm.moves)
+
+    def undo(self, move_count: int = 1) -> None:
+        """
+        Undoes the latest moves recorded in the journal by performing their inverses, newest first.
+        The undone moves are removed from the journal.
+
+        :param move_count: The amount of moves to undo
+        :return: None
+        """
+
+        if self.__journal is None:
+            raise ValueError("Cannot undo moves without a journal.")
+        if not 0 <= move_count <= len(self.__journal):
+            raise ValueError(f"Cannot undo {move_count} moves, the journal holds {len(self.__journal)}.")
+
+        undone = self.__journal[len(self.__journal) - move_count :]
+        inverse = Algorithm([move.inverse() for move in reversed(undone)])
+        permutation = inverse.compile(self.__cube.size)
+        self.__cube.permute(permutation, move=True)
+        if self.__listener is not None:
+            self.__listener.on_permute(permutation)
+        del self.__journal[len(self.__journal) - move_count :]
+
+    def checkpoint(self) -> Checkpoint:
+        """
+        Takes a checkpoint of the cube that `restore` can return it to.
+
+        The checkpoint shares the sticker storage with the cube instead of copying it, so it costs the
+        same on every cube size, which lets a search try a branch and back out without copying the cube.
+
+        :return: The checkpoint
+        """
+
+        return Checkpoint(
+            self.__cube.snapshot(),
+            len(self.__journal) if self.__journal is not None else 0,
+            self.__listener.on_checkpoint() if self.__listener is not None else None,
+        )
+
+    def restore(self, checkpoint: Checkpoint) -> None:
+        """
+        Returns the cube to a checkpoint taken by `checkpoint`, and drops the moves performed since
+        from the journal. The cube stays trusted if it was trusted at the checkpoint and has only been
+        moved since.
+
+        :param checkpoint: The checkpoint
+        :return: None
+        """
+
+        self.__cube.restore(checkpoint.snapshot)
+        if self.__listener is not None:
+            self.__listener.on_restore(self.__cube, checkpoint.listener_state)
+        if self.__journal is not None:
+            del self.__journal[checkpoint.journal_length :]
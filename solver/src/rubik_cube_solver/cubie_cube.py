@@ -0,0 +1,369 @@
+# Python imports
+from functools import cache
+from typing import Self
+
+# Project imports
+from rubik_cube_solver.cube import SOLVED_COLORS, Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.move import Move
+from rubik_cube_solver.cube_rotation.move_table import create_index_cube, get_move_table
+from rubik_cube_solver.enums.Color import Color
+from rubik_cube_solver.enums.Direction import Direction
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.enums.Rotation import Rotation
+from rubik_cube_solver.solve.corner_search import CORNER_SLOTS, UP_DOWN_COLORS, CornerSearchResult
+from rubik_cube_solver.solve.edge_search import EDGE_SLOTS, EdgeSearchResult
+from rubik_cube_solver.validator.validator_utils import get_corners, get_edges
+
+# The flat sticker indices of every corner and edge slot of a 3x3, in the slot and sticker order of
+# `get_corners` and `get_edges`, read off an index cube
+CORNER_STICKERS: tuple[tuple[int, int, int], ...] = tuple(get_corners(create_index_cube(3)))
+EDGE_STICKERS: tuple[tuple[int, int], ...] = tuple(get_edges(create_index_cube(3)))
+# The flat sticker index of every center, in `Layer` order
+CENTER_STICKERS: tuple[int, ...] = tuple(position * 9 + 4 for position in range(len(Layer)))
+
+# Piece `i` is the piece that sits in slot `i` of a solved cube, with its colors in the slot's sticker
+# order. That puts the UP/DOWN color of every corner first, followed by the rest clockwise, and the
+# primary color of every edge first.
+SOLVED_CENTERS: tuple[Color, ...] = tuple(SOLVED_COLORS[layer] for layer in Layer)
+CORNER_PIECES: tuple[tuple[Color, Color, Color], ...] = tuple(
+    (SOLVED_CENTERS[first // 9], SOLVED_CENTERS[second // 9], SOLVED_CENTERS[third // 9])
+    for first, second, third in CORNER_STICKERS
+)
+EDGE_PIECES: tuple[tuple[Color, Color], ...] = tuple(
+    (SOLVED_CENTERS[first // 9], SOLVED_CENTERS[second // 9]) for first, second in EDGE_STICKERS
+)
+
+# The piece with each set of colors
+CORNER_PIECE_INDICES: dict[frozenset[Color], int] = {
+    frozenset(piece): index for index, piece in enumerate(CORNER_PIECES)
+}
+EDGE_PIECE_INDICES: dict[frozenset[Color], int] = {frozenset(piece): index for index, piece in enumerate(EDGE_PIECES)}
+
+
+def read_corners(cube: Cube) -> tuple[tuple[int, ...], tuple[int, ...]]:
+    """
+    Reads the corner pieces of a cube of any size, in the numbering and orientation of `CubieCube`.
+
+    Every corner must be a piece of the standard color scheme, present exactly once, with its colors in
+    clockwise order, otherwise a `ValueError` is raised.
+
+    :param cube: The cube
+    :return: The piece in every corner slot and its orientation
+    """
+
+    corner_permutation: list[int] = []
+    corner_orientation: list[int] = []
+    for corner in get_corners(cube):
+        piece = CORNER_PIECE_INDICES.get(frozenset(corner))
+        if piece is None:
+            raise ValueError(f"Invalid corner piece: {corner}.")
+        orientation = next(index for index, color in enumerate(corner) if color in UP_DOWN_COLORS)
+        if corner[orientation:] + corner[:orientation] != CORNER_PIECES[piece]:
+            raise ValueError(f"Invalid corner chirality for piece {corner}.")
+        corner_permutation.append(piece)
+        corner_orientation.append(orientation)
+
+    if len(set(corner_permutation)) != 8:
+        raise ValueError("Every corner piece must be present exactly once.")
+
+    return tuple(corner_permutation), tuple(corner_orientation)
+
+
+def invert_permutation(permutation: tuple[int, ...]) -> tuple[int, ...]:
+    """
+    Returns the inverse of a permutation of pieces over slots, the slot of every piece.
+
+    :param permutation: The piece in every slot
+    :return: The slot every piece is in
+    """
+
+    slots = [0] * len(permutation)
+    for slot, piece in enumerate(permutation):
+        slots[piece] = slot
+
+    return tuple(slots)
+
+
+class CubieCube:
+    """
+    A 3x3 cube described by its pieces instead of its stickers.
+
+    For every corner slot, in the order of `CORNER_SLOTS`, the cube holds the piece in it and its
+    orientation, and for every edge slot, in the order of `EDGE_SLOTS`, the same for edges. Pieces are
+    numbered after the slot they occupy on a solved cube. Orientations follow `search_corner` and
+    `search_edge`: a corner's orientation is the position of its UP/DOWN color among the slot's
+    stickers, and an edge's orientation is 0 when its primary color lies on the slot's reference face
+    and 1 otherwise. The colors of the six centers are kept as well, so converting to and from `Cube`
+    loses nothing even after whole-cube rotations.
+
+    Moves are applied as a product with the cubie cube of the move, so where a piece is and how it is
+    oriented can be read straight off the state. The slot of every piece is worked out once per state,
+    the first time a piece is searched for, so every further search is a lookup.
+    """
+
+    def __init__(
+        self,
+        corner_permutation: tuple[int, ...] = tuple(range(8)),
+        corner_orientation: tuple[int, ...] = (0,) * 8,
+        edge_permutation: tuple[int, ...] = tuple(range(12)),
+        edge_orientation: tuple[int, ...] = (0,) * 12,
+        centers: tuple[Color, ...] = SOLVED_CENTERS,
+    ) -> None:
+        """
+        Constructor for the `CubieCube` class. Without arguments, the cube is solved.
+
+        :param corner_permutation: The piece in every corner slot
+        :param corner_orientation: The orientation of the piece in every corner slot
+        :param edge_permutation: The piece in every edge slot
+        :param edge_orientation: The orientation of the piece in every edge slot
+        :param centers: The color of every center, in `Layer` order
+        :return: None
+        """
+
+        self.__corner_permutation = corner_permutation
+        self.__corner_orientation = corner_orientation
+        self.__edge_permutation = edge_permutation
+        self.__edge_orientation = edge_orientation
+        self.__centers = centers
+        self.__corner_slots: tuple[int, ...] | None = None
+        self.__edge_slots: tuple[int, ...] | None = None
+
+    @property
+    def corner_permutation(self) -> tuple[int, ...]:
+        """
+        Corner permutation getter
+
+        :return: The piece in every corner slot
+        """
+
+        return self.__corner_permutation
+
+    @property
+    def corner_orientation(self) -> tuple[int, ...]:
+        """
+        Corner orientation getter
+
+        :return: The orientation of the piece in every corner slot
+        """
+
+        return self.__corner_orientation
+
+    @property
+    def edge_permutation(self) -> tuple[int, ...]:
+        """
+        Edge permutation getter
+
+        :return: The piece in every edge slot
+        """
+
+        return self.__edge_permutation
+
+    @property
+    def edge_orientation(self) -> tuple[int, ...]:
+        """
+        Edge orientation getter
+
+        :return: The orientation of the piece in every edge slot
+        """
+
+        return self.__edge_orientation
+
+    @property
+    def centers(self) -> tuple[Color, ...]:
+        """
+        Centers getter
+
+        :return: The color of every center, in `Layer` order
+        """
+
+        return self.__centers
+
+    @classmethod
+    def from_cube(cls, cube: Cube) -> Self:
+        """
+        Creates a cubie cube from the stickers of a 3x3 cube.
+
+        Every corner and edge must be a piece of the standard color scheme, present exactly once, and
+        every corner must have its colors in clockwise order, otherwise a `ValueError` is raised.
+
+        :param cube: The cube
+        :return: The cubie cube
+        """
+
+        if cube.size != 3:
+            raise ValueError(f"A cubie cube can only be created from a 3x3 cube, got size {cube.size}.")
+
+        corner_permutation, corner_orientation = read_corners(cube)
+
+        edge_permutation: list[int] = []
+        edge_orientation: list[int] = []
+        for edge in get_edges(cube):
+            piece = EDGE_PIECE_INDICES.get(frozenset(edge))
+            if piece is None:
+                raise ValueError(f"Invalid edge piece: {edge}.")
+            edge_permutation.append(piece)
+            edge_orientation.append(0 if edge[0] == EDGE_PIECES[piece][0] else 1)
+
+        if len(set(edge_permutation)) != 12:
+            raise ValueError("Every edge piece must be present exactly once.")
+
+        layers = cube.read_layers()
+        return cls(
+            corner_permutation,
+            corner_orientation,
+            tuple(edge_permutation),
+            tuple(edge_orientation),
+            tuple(layers[layer][4] for layer in Layer),
+        )
+
+    def to_cube(self) -> Cube:
+        """
+        Creates a 3x3 cube with the stickers of the cubie cube.
+
+        :return: The cube
+        """
+
+        stickers: list[Color | None] = [None] * 54
+        for index, center in zip(CENTER_STICKERS, self.__centers):
+            stickers[index] = center
+        for positions, piece, orientation in zip(CORNER_STICKERS, self.__corner_permutation, self.__corner_orientation):
+            for offset, color in enumerate(CORNER_PIECES[piece]):
+                stickers[positions[(orientation + offset) % 3]] = color
+        for positions, piece, orientation in zip(EDGE_STICKERS, self.__edge_permutation, self.__edge_orientation):
+            for offset, color in enumerate(EDGE_PIECES[piece]):
+                stickers[positions[(orientation + offset) % 2]] = color
+
+        return Cube(3, {layer: stickers[position * 9 : (position + 1) * 9] for position, layer in enumerate(Layer)})
+
+    def multiply(self, other: "CubieCube") -> "CubieCube":
+        """
+        Returns the state reached by performing `other`, taken as the state it leaves a solved cube in,
+        on this cube.
+
+        The piece that ends up in slot `i` is the one this cube has in the slot `other` takes its piece
+        `i` from, and the orientations add up along the way.
+
+        :param other: The cubie cube to perform
+        :return: The product
+        """
+
+        corner_permutation = tuple(self.__corner_permutation[slot] for slot in other.corner_permutation)
+        corner_orientation = tuple(
+            (self.__corner_orientation[slot] + orientation) % 3
+            for slot, orientation in zip(other.corner_permutation, other.corner_orientation)
+        )
+        edge_permutation = tuple(self.__edge_permutation[slot] for slot in other.edge_permutation)
+        edge_orientation = tuple(
+            (self.__edge_orientation[slot] + orientation) % 2
+            for slot, orientation in zip(other.edge_permutation, other.edge_orientation)
+        )
+        centers = tuple(self.__centers[SOLVED_CENTERS.index(center)] for center in other.centers)
+
+        return CubieCube(corner_permutation, corner_orientation, edge_permutation, edge_orientation, centers)
+
+    def turn(self, move: Move) -> None:
+        """
+        Performs a move, a layer turn or a whole-cube rotation, on the cube.
+
+        :param move: The move to perform
+        :return: None
+        """
+
+        if move.layer_amount != 1:
+            raise ValueError(f"Cube size 3 is too small to rotate {move.layer_amount} layers")
+
+        product = self.multiply(get_cubie_move(move.layer, move.direction))
+        self.__corner_permutation = product.corner_permutation
+        self.__corner_orientation = product.corner_orientation
+        self.__edge_permutation = product.edge_permutation
+        self.__edge_orientation = product.edge_orientation
+        self.__centers = product.centers
+        self.__corner_slots = self.__edge_slots = None
+
+    def apply(self, algorithm: Algorithm) -> None:
+        """
+        Applies every move of an algorithm to the cube, in order.
+
+        :param algorithm: The algorithm to perform
+        :return: None
+        """
+
+        for move in algorithm.moves:
+            self.turn(move)
+
+    def search_corner(self, first_color: Color, second_color: Color, third_color: Color) -> CornerSearchResult:
+        """
+        Finds the corner piece with the given three colors, like `search_corner` does on a `Cube`.
+
+        :param first_color: The first color of the corner piece
+        :param second_color: The second color of the corner piece
+        :param third_color: The third color of the corner piece
+        :return: The slot of the corner piece and its orientation
+        """
+
+        piece = CORNER_PIECE_INDICES.get(frozenset({first_color, second_color, third_color}))
+        if piece is None:
+            raise ValueError(f"Invalid corner piece: {frozenset({first_color, second_color, third_color})}.")
+
+        if self.__corner_slots is None:
+            self.__corner_slots = invert_permutation(self.__corner_permutation)
+
+        slot = self.__corner_slots[piece]
+        return CornerSearchResult(CORNER_SLOTS[slot], self.__corner_orientation[slot])
+
+    def search_edge(self, first_color: Color, second_color: Color) -> EdgeSearchResult:
+        """
+        Finds the edge piece with the given two colors, like `search_edge` does on a `Cube`.
+
+        :param first_color: The first color of the edge piece
+        :param second_color: The second color of the edge piece
+        :return: The slot of the edge piece and whether it is oriented
+        """
+
+        piece = EDGE_PIECE_INDICES.get(frozenset({first_color, second_color}))
+        if piece is None:
+            raise ValueError(f"Invalid edge piece: {frozenset({first_color, second_color})}.")
+
+        if self.__edge_slots is None:
+            self.__edge_slots = invert_permutation(self.__edge_permutation)
+
+        slot = self.__edge_slots[piece]
+        return EdgeSearchResult(EDGE_SLOTS[slot], self.__edge_orientation[slot] == 0)
+
+    def __eq__(self, other) -> bool:
+        """
+        Equality comparison for CubieCube objects.
+
+        :param other: The other CubieCube object to compare with
+        :return: True if equal, False otherwise
+        """
+
+        if not isinstance(other, CubieCube):
+            return False
+
+        return (
+            self.__corner_permutation == other.corner_permutation
+            and self.__corner_orientation == other.corner_orientation
+            and self.__edge_permutation == other.edge_permutation
+            and self.__edge_orientation == other.edge_orientation
+            and self.__centers == other.centers
+        )
+
+
+@cache
+def get_cubie_move(layer: Layer | Rotation, direction: Direction) -> CubieCube:
+    """
+    Returns the cubie cube of a 3x3 move, the state it leaves a solved cube in, creating it on first use.
+
+    The move is performed on a solved cube with its sticker permutation and read back as pieces, so
+    the cubie moves agree with the sticker moves by construction.
+
+    :param layer: The layer to turn or the axis to rotate the whole cube around
+    :param direction: The direction of the move
+    :return: The cubie cube of the move
+    """
+
+    cube = Cube(3)
+    cube.permute(get_move_table(3).move(Move(layer, direction, 1)))
+    return CubieCube.from_cube(cube)
@@ -0,0 +1,38 @@
+# Python imports
+from enum import Enum
+from typing import Self
+
+
+class SolveMethod(Enum):
+    """
+    Enum representing the methods a cube can be solved with.
+
+    Each value names a way of solving that `create_solver` can pick a solver by:
+    - HUMAN: layer by layer, through lookup tables of algorithms, the way a person solves
+    - KOCIEMBA: Kociemba's two-phase search, which finds short 3x3 solutions
+    - OPTIMAL: a search that finds shortest solutions, through a table of every 2x2 state, or Korf's
+      pattern databases for the 3x3
+    """
+
+    HUMAN = "human"
+    KOCIEMBA = "kociemba"
+    OPTIMAL = "optimal"
+
+    @classmethod
+    def from_value(cls, value: str) -> Self:
+        """
+        Return an enumeration value from string.
+
+        :param value: The string value
+        :return: The enumeration value
+        """
+
+        match value:
+            case "human":
+                return SolveMethod.HUMAN
+            case "kociemba":
+                return SolveMethod.KOCIEMBA
+            case "optimal":
+                return SolveMethod.OPTIMAL
+            case _:
+                raise ValueError(f"Invalid value {value} for the SolveMethod enumeration")
@@ -0,0 +1,36 @@
+# Python imports
+from enum import IntEnum
+
+
+class ValidationCode(IntEnum):
+    """
+    Enum representing the outcome of validating a cube state with `Validator.validate_many`.
+
+    Every code but VALID names the first check of `Validator.validate` the state fails, and the codes
+    are numbered in the order the checks run:
+    - VALID: the state passes every check
+    - COLOR_COUNT: a color does not appear exactly N^2 times
+    - CORNER_IDENTITY: a corner has an invalid combination of colors, or appears twice
+    - CORNER_ORIENTATION: the corner orientations do not add up to a multiple of 3
+    - CORNER_CHIRALITY: a corner has its colors in mirrored order
+    - CENTER_UNIQUENESS: two fixed centers share a color
+    - CENTER_OPPOSITES: a fixed center is not opposite its complementary color
+    - EDGE_IDENTITY: an edge has an invalid combination of colors, or appears twice
+    - EDGE_FLIP: the edge orientations do not add up to a multiple of 2
+    - PERMUTATION_PARITY: the corner and edge permutations have different parities
+    - CENTER_COUNT: a center piece of a big cube does not appear exactly 4 times
+    - WING_EDGE_IDENTITY: a wing edge has an invalid combination of colors, or appears twice
+    """
+
+    VALID = 0
+    COLOR_COUNT = 1
+    CORNER_IDENTITY = 2
+    CORNER_ORIENTATION = 3
+    CORNER_CHIRALITY = 4
+    CENTER_UNIQUENESS = 5
+    CENTER_OPPOSITES = 6
+    EDGE_IDENTITY = 7
+    EDGE_FLIP = 8
+    PERMUTATION_PARITY = 9
+    CENTER_COUNT = 10
+    WING_EDGE_IDENTITY = 11
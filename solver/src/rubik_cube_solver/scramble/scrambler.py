@@ -12,10 +12,13 @@ class Scrambler:
     Scrambler class that can generate scrambles for different cubes.
     """
 
-    def __init__(self):
+    def __init__(self, rng: random.Random | None = None):
         """
         Initializes the Scrambler class.
+
+        :param rng: Random number generator the moves are drawn from, the shared one of `random` if None
         """
+        self.rng = random if rng is None else rng
         self.faces = [Layer.UP, Layer.DOWN, Layer.FRONT, Layer.BACK, Layer.LEFT, Layer.RIGHT]
         self.directions = [Direction.CW, Direction.CCW, Direction.DOUBLE]
 
@@ -98,20 +101,20 @@ class Scrambler:
 
         # If the cube is 2x2, use only UP, FRONT, RIGHT faces
         if cube_size == 2:
-            face = random.choice([Layer.UP, Layer.FRONT, Layer.RIGHT])
+            face = self.rng.choice([Layer.UP, Layer.FRONT, Layer.RIGHT])
         # Choose a random face
         else:
-            face = random.choice([f for f in self.faces])
+            face = self.rng.choice([f for f in self.faces])
 
         # Choose a random direction
-        direction = random.choice(self.directions)
+        direction = self.rng.choice(self.directions)
 
         # If the cube is 2x2 or 3x3, layer amount is always 1
         if cube_size == 2 or cube_size == 3:
             layer_amount = 1
         # Choose a random layer amount
         else:
-            layer_amount = random.randint(1, cube_size // 2)
+            layer_amount = self.rng.randint(1, cube_size // 2)
 
         return Move(layer=face, direction=direction, layer_amount=layer_amount)
 
@@ -0,0 +1,21 @@
+# Python imports
+from typing import Any
+
+__all__ = ["solve_async"]
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports `solve_async` on first use, since importing it here would import every solver, and with
+    them `cubie_cube`, which itself imports modules of this package.
+
+    :param name: The name of the attribute
+    :return: The attribute
+    """
+
+    if name == "solve_async":
+        from rubik_cube_solver.solve.asynchronous import solve_async
+
+        return solve_async
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,82 @@
+# Python imports
+import asyncio
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.rotator import Rotator
+from rubik_cube_solver.enums.SolveMethod import SolveMethod
+from rubik_cube_solver.solve.solver import create_solver
+
+# The executor the solves run in when the caller gives none, started on first use and shared by every
+# caller in the process, and the lock that keeps two threads from starting one each
+_default_executor: ProcessPoolExecutor | None = None
+_default_executor_lock = threading.Lock()
+
+
+def get_default_executor() -> ProcessPoolExecutor:
+    """
+    Returns the executor `solve_async` runs solves in by default: a process pool with a worker per CPU,
+    started on first use.
+
+    A process pool rather than a thread pool, since a solve is pure Python and would hold the GIL, and
+    with it the event loop, for most of its time in a thread.
+
+    :return: The default executor
+    """
+
+    global _default_executor
+
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = ProcessPoolExecutor(os.cpu_count() or 1)
+
+        return _default_executor
+
+
+def solve_packed(packed: bytes, method: SolveMethod) -> str:
+    """
+    Solves a packed cube, in a worker of the executor.
+
+    :param packed: The packed state of the cube, from `Cube.to_bytes`
+    :param method: The solving method
+    :return: The solution in notation
+    """
+
+    return str(create_solver(Cube.from_bytes(packed), method).solve())
+
+
+async def solve_async(
+    cube: Cube,
+    executor: Executor | None = None,
+    method: SolveMethod = SolveMethod.HUMAN,
+) -> Algorithm:
+    """
+    Solves a cube in an executor, without blocking the event loop.
+
+    The cube is packed with `Cube.to_bytes` and solved as a copy in the executor, the shared default one
+    unless another is given, and the solution is then applied to the cube itself, which is left solved.
+    Since every solve works on its own copy, any amount of coroutines can solve at once: the solves queue
+    up in the executor, and the event loop only ever packs a cube and applies a solution. The cube must
+    not be turned by anything else until the solve is done.
+
+    Cancelling the coroutine leaves the cube untouched. A solve that has not started yet is dropped from
+    the executor, while one already running finishes in its worker and its solution is discarded.
+
+    :param cube: The cube to solve
+    :param executor: The executor to solve in, the default one of `get_default_executor` if None
+    :param method: The solving method
+    :return: The solution
+    """
+
+    loop = asyncio.get_running_loop()
+    packed = cube.to_bytes()
+    solution = Algorithm.from_str(
+        await loop.run_in_executor(executor or get_default_executor(), solve_packed, packed, method)
+    )
+
+    Rotator(cube).apply(solution)
+    return solution
@@ -0,0 +1,212 @@
+# Python imports
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from contextlib import ExitStack
+from itertools import islice
+from typing import Iterable, Iterator, NamedTuple
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.enums.SolveMethod import SolveMethod
+from rubik_cube_solver.solve.solve import Solve
+from rubik_cube_solver.solve.solver import create_solver, import_numpy_module
+
+# How many chunks per worker are handed to the pool ahead of the results, which keeps every worker
+# busy while bounding how much of the batch is held in memory at once
+CHUNKS_IN_FLIGHT_PER_WORKER: int = 2
+
+
+class BatchResult(NamedTuple):
+    """
+    The outcome of solving one cube of a batch: its index in the batch, and either its solution or the
+    error that solving it raised.
+    """
+
+    index: int
+    solution: Algorithm | None
+    error: Exception | None
+
+
+def create_batch_solver(cube: Cube, method: SolveMethod) -> Solve:
+    """
+    Creates the solver of a cube of a batch, like `create_solver`, except that the optimal 3x3 search
+    runs in the process solving the cube instead of in a pool of its own. A batch keeps its own workers
+    busy already, and a pool in every one of them would start workers times CPUs processes.
+
+    :param cube: The cube to solve
+    :param method: The solving method
+    :return: The solver for the cube's size and the method
+    """
+
+    if cube.size == 3 and method is SolveMethod.OPTIMAL:
+        return import_numpy_module("cube_3x3.solve_3x3_optimal").Solve3x3Optimal(cube, processes=1)
+
+    return create_solver(cube, method)
+
+
+def solve_chunk(method: SolveMethod, items: list[tuple[int, bytes]]) -> list[tuple[int, str | None, Exception | None]]:
+    """
+    Solves a chunk of packed cubes, in a worker of the pool or in this process.
+
+    The solutions are sent back as notation, which is several times smaller than a pickled `Algorithm`.
+    An error solving one cube is returned in its place instead of raised, so the rest of the chunk is
+    still solved.
+
+    :param method: The solving method
+    :param items: The index in the batch and the packed state, from `Cube.to_bytes`, of every cube
+    :return: The index of every cube with its solution in notation, or with the error solving it raised
+    """
+
+    results: list[tuple[int, str | None, Exception | None]] = []
+    for index, packed in items:
+        try:
+            solution = create_batch_solver(Cube.from_bytes(packed), method).solve()
+        except Exception as error:
+            results.append((index, None, error))
+        else:
+            results.append((index, str(solution), None))
+
+    return results
+
+
+def start_pool(method: SolveMethod, workers: int, stack: ExitStack) -> ProcessPoolExecutor:
+    """
+    Starts the process pool of a batch, whose shutdown is left to an exit stack.
+
+    The tables of the two-phase search, or the pattern databases of the optimal 3x3 search, are published
+    into shared memory first, for the workers to attach to instead of loading or building a copy each.
+    The pattern databases are loaded or built here even when the batch holds no 3x3, since the cubes are
+    only seen as the pool takes them. The other methods have no tables worth sharing this way: the table
+    of the optimal 2x2 solver is a file every worker maps anyway, and the human solvers have none.
+
+    :param method: The solving method
+    :param workers: The amount of worker processes
+    :param stack: The exit stack that shuts the pool down and releases the shared tables
+    :return: The pool
+    """
+
+    initializer, initargs = None, ()
+    if method is SolveMethod.KOCIEMBA:
+        shared_tables_module = import_numpy_module("shared_tables")
+        shared_tables = stack.enter_context(shared_tables_module.SharedTables())
+        import_numpy_module("cube_3x3.kociemba").share_two_phase_tables(shared_tables)
+        initializer, initargs = shared_tables_module.attach_shared_tables, (shared_tables.manifest,)
+    elif method is SolveMethod.OPTIMAL:
+        korf_patterns = import_numpy_module("cube_3x3.pattern_database").KORF_PATTERNS
+        manifest = import_numpy_module("cube_3x3.optimal").share_pattern_databases(korf_patterns)
+        initializer, initargs = import_numpy_module("shared_tables").attach_shared_tables, (manifest,)
+
+    pool = ProcessPoolExecutor(workers, initializer=initializer, initargs=initargs)
+    stack.callback(pool.shutdown, cancel_futures=True)
+    return pool
+
+
+def solve_many(
+    cubes: Iterable[Cube],
+    workers: int | None = None,
+    chunksize: int = 64,
+    method: SolveMethod = SolveMethod.HUMAN,
+) -> Iterator[BatchResult]:
+    """
+    Solves a batch of cubes in a process pool, yielding every result as soon as it is ready.
+
+    The cubes are taken from the iterable as the pool needs them, packed with `Cube.to_bytes` and sent
+    to the workers a chunk at a time, so a batch of any length is never held in memory at once. The
+    results come in the order the chunks finish, not the order of the batch, which is what the index of
+    every result is for. A cube that cannot be solved, or even packed, yields a result with the error
+    instead of stopping the batch. The cubes themselves are left as they are: every worker solves a copy.
+
+    With a single worker the batch is solved in this process, with no pool. Either way, every cube is
+    solved in a single process, the optimal 3x3 search included. Closing the generator early cancels the
+    chunks that have not started.
+
+    :param cubes: The cubes to solve
+    :param workers: The amount of worker processes, the amount of CPUs by default
+    :param chunksize: The amount of cubes sent to a worker at a time
+    :param method: The solving method
+    :return: The result of every cube, in the order they finish
+    """
+
+    if chunksize < 1:
+        raise ValueError(f"The chunk size must be at least 1, got {chunksize}")
+
+    workers = workers or os.cpu_count() or 1
+    chunks = pack_chunks(cubes, chunksize)
+
+    if workers == 1:
+        for items, failures in chunks:
+            yield from failures
+            yield from unpack_results(solve_chunk(method, items))
+        return
+
+    with ExitStack() as stack:
+        pool = start_pool(method, workers, stack)
+        pending: dict[Future, list[int]] = {}
+        for items, failures in chunks:
+            yield from failures
+            if items:
+                pending[pool.submit(solve_chunk, method, items)] = [index for index, _ in items]
+            if len(pending) >= workers * CHUNKS_IN_FLIGHT_PER_WORKER:
+                yield from collect_chunks(pending)
+
+        while pending:
+            yield from collect_chunks(pending)
+
+
+def pack_chunks(cubes: Iterable[Cube], chunksize: int) -> Iterator[tuple[list[tuple[int, bytes]], list[BatchResult]]]:
+    """
+    Packs the cubes of a batch a chunk at a time.
+
+    :param cubes: The cubes
+    :param chunksize: The amount of cubes in a chunk
+    :return: The index and packed state of every cube of a chunk, with the results of the cubes that
+        could not be packed
+    """
+
+    iterator = enumerate(cubes)
+    while chunk := list(islice(iterator, chunksize)):
+        items: list[tuple[int, bytes]] = []
+        failures: list[BatchResult] = []
+        for index, cube in chunk:
+            try:
+                items.append((index, cube.to_bytes()))
+            except Exception as error:
+                failures.append(BatchResult(index, None, error))
+
+        yield items, failures
+
+
+def collect_chunks(pending: dict[Future, list[int]]) -> Iterator[BatchResult]:
+    """
+    Waits for at least one chunk in the pool to finish, and turns the finished chunks into results.
+
+    A chunk whose worker failed as a whole, such as by dying or by raising an error that cannot be
+    pickled, yields that failure as the error of each of its cubes.
+
+    :param pending: The chunks in the pool and the indices of their cubes, from which the finished
+        chunks are removed
+    :return: The results of the finished chunks
+    """
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        indices = pending.pop(future)
+        try:
+            results = future.result()
+        except Exception as error:
+            yield from (BatchResult(index, None, error) for index in indices)
+        else:
+            yield from unpack_results(results)
+
+
+def unpack_results(results: list[tuple[int, str | None, Exception | None]]) -> Iterator[BatchResult]:
+    """
+    Turns the results of `solve_chunk` back into algorithms.
+
+    :param results: The results of a chunk
+    :return: The results
+    """
+
+    for index, solution, error in results:
+        yield BatchResult(index, None if solution is None else Algorithm.from_str(solution), error)
@@ -5,6 +5,7 @@ from typing import NamedTuple
 from rubik_cube_solver.cube import Cube
 from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.solve.observer import PieceSearchCounter
 from rubik_cube_solver.validator.validator_utils import get_index_formulas
 
 
@@ -18,7 +19,9 @@ class CenterSearchResult(NamedTuple):
     col: int
 
 
-def search_center(cube: Cube, color: Color, row: int, col: int) -> list[CenterSearchResult]:
+def search_center(
+    cube: Cube, color: Color, row: int, col: int, counter: PieceSearchCounter | None = None
+) -> list[CenterSearchResult]:
     """
     Searches a big cube (N >= 4) for every center piece of the given color and position type.
 
@@ -36,9 +39,13 @@ def search_center(cube: Cube, color: Color, row: int, col: int) -> list[CenterSe
     :param color: The color of the center pieces
     :param row: The row of a cell of the searched position type, in range(1, size - 1)
     :param col: The column of a cell of the searched position type, in range(1, size - 1)
+    :param counter: The counter of the piece searches of the solve, or None to count nothing
     :return: The location of every center piece of that color and position type, in face order
     """
 
+    if counter is not None:
+        counter.count += 1
+
     size = cube.size
 
     if size < 4:
@@ -56,5 +63,5 @@ def search_center(cube: Cube, color: Color, row: int, col: int) -> list[CenterSe
         CenterSearchResult(layer, index // size, index % size)
         for layer in Layer
         for index in indices
-        if cube.layers[layer][index] == color
+        if cube.read_layers()[layer][index] == color
     ]
@@ -0,0 +1,170 @@
+# Python imports
+from itertools import permutations
+from math import factorial
+
+# Third-party imports
+import numpy as np
+
+# Project imports
+from rubik_cube_solver.solve.tables import breadth_first_search, get_table, pack_table, table_version
+
+
+def encode_orientations(orientations: np.ndarray, base: int) -> np.ndarray:
+    """
+    Returns the coordinate of every row of orientations: all but the last orientation read as the
+    digits of a number in the base. The last one follows from the rest, since they add up to a
+    multiple of the base.
+
+    :param orientations: The orientations, one row per state
+    :param base: The amount of orientations a piece can have
+    :return: The coordinate of every row
+    """
+
+    coordinates = np.zeros(len(orientations), dtype=np.int64)
+    for column in range(orientations.shape[1] - 1):
+        coordinates = coordinates * base + orientations[:, column]
+
+    return coordinates
+
+
+def decode_orientations(piece_amount: int, base: int) -> np.ndarray:
+    """
+    Returns the orientations of every coordinate, the inverse of `encode_orientations`.
+
+    :param piece_amount: The amount of pieces
+    :param base: The amount of orientations a piece can have
+    :return: The orientations, one row per coordinate
+    """
+
+    coordinates = np.arange(base ** (piece_amount - 1))
+    orientations = np.zeros((len(coordinates), piece_amount), dtype=np.int64)
+    for column in range(piece_amount - 2, -1, -1):
+        coordinates, orientations[:, column] = np.divmod(coordinates, base)
+    orientations[:, -1] = -orientations[:, :-1].sum(axis=1) % base
+
+    return orientations
+
+
+def encode_permutations(permutations_: np.ndarray) -> np.ndarray:
+    """
+    Returns the coordinate of every row of a permutation: its index among all permutations of its
+    length in lexicographic order.
+
+    :param permutations_: The permutations, one row per state
+    :return: The coordinate of every row
+    """
+
+    length = permutations_.shape[1]
+    coordinates = np.zeros(len(permutations_), dtype=np.int64)
+    for column in range(length - 1):
+        smaller = (permutations_[:, column + 1 :] < permutations_[:, column : column + 1]).sum(axis=1)
+        coordinates += smaller * factorial(length - 1 - column)
+
+    return coordinates
+
+
+def decode_permutations(length: int) -> np.ndarray:
+    """
+    Returns the permutation of every coordinate, the inverse of `encode_permutations`.
+
+    :param length: The length of the permutations
+    :return: The permutations, one row per coordinate
+    """
+
+    return np.array(list(permutations(range(length))), dtype=np.int64)
+
+
+def encode_permutation(permutation: tuple[int, ...]) -> int:
+    """
+    Returns the coordinate of a single permutation, like `encode_permutations` does for many.
+
+    :param permutation: The permutation
+    :return: The coordinate
+    """
+
+    length = len(permutation)
+    return sum(
+        sum(1 for later in permutation[column + 1 :] if later < value) * factorial(length - 1 - column)
+        for column, value in enumerate(permutation)
+    )
+
+
+def encode_orientation(orientation: tuple[int, ...], base: int) -> int:
+    """
+    Returns the coordinate of a single set of orientations, like `encode_orientations` does for many.
+
+    :param orientation: The orientation of every piece
+    :param base: The amount of orientations a piece can have
+    :return: The coordinate
+    """
+
+    coordinate = 0
+    for value in orientation[:-1]:
+        coordinate = coordinate * base + value
+
+    return coordinate
+
+
+def build_pruning_table(first_moves: np.ndarray, second_moves: np.ndarray, solved: int) -> bytes:
+    """
+    Builds the pruning table of two coordinates with a breadth-first search from the solved pair.
+
+    Every move takes a pair to its neighbor in one step through the move tables of both coordinates,
+    for a whole chunk of pairs at once.
+
+    :param first_moves: The move table of the first coordinate
+    :param second_moves: The move table of the second coordinate
+    :param solved: The index of the solved pair, the first coordinate times the size of the second one
+        plus the second coordinate
+    :return: The distance of every pair, at the first coordinate times the size of the second one plus
+        the second coordinate
+    """
+
+    second_size = len(second_moves)
+
+    def neighbors(pairs: np.ndarray, move: int) -> np.ndarray:
+        """
+        Returns the pairs a move takes every pair to.
+
+        :param pairs: The pairs
+        :param move: The move, as its column in the move tables
+        :return: The pairs after the move
+        """
+
+        first, second = np.divmod(pairs, second_size)
+        return first_moves[first, move] * second_size + second_moves[second, move]
+
+    distances = breadth_first_search(len(first_moves) * second_size, solved, first_moves.shape[1], neighbors)
+    return distances.astype(np.uint8).tobytes()
+
+
+def get_pruning_table(
+    name: str, first_moves: np.ndarray, second_moves: np.ndarray, solved: int, bits: int = 4
+) -> memoryview:
+    """
+    Returns the packed pruning table of two coordinates from the table directory, building it with
+    `build_pruning_table` when its file is missing or was built from other move tables.
+
+    :param name: The name of the table
+    :param first_moves: The move table of the first coordinate
+    :param second_moves: The move table of the second coordinate
+    :param solved: The index of the solved pair
+    :param bits: The bits per entry, 8 or 4 for the distance, or 2 for the distance modulo 3
+    :return: The packed distance of every pair
+    """
+
+    first_moves = np.ascontiguousarray(first_moves, dtype=np.int64)
+    second_moves = np.ascontiguousarray(second_moves, dtype=np.int64)
+    version = table_version(first_moves.tobytes(), second_moves.tobytes(), solved.to_bytes(8, "little"))
+
+    def build() -> bytes:
+        """
+        Builds the packed table.
+
+        :return: The packed table
+        """
+
+        distances = np.frombuffer(build_pruning_table(first_moves, second_moves, solved), dtype=np.uint8)
+        return pack_table(distances, bits)
+
+    return get_table(name, version, bits, len(first_moves) * len(second_moves), build)
@@ -5,6 +5,7 @@ from typing import NamedTuple
 from rubik_cube_solver.cube import Cube
 from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.CornerSlot import CornerSlot
+from rubik_cube_solver.solve.observer import PieceSearchCounter
 from rubik_cube_solver.validator.validator_constants import VALID_CORNER_COLOR_SETS
 from rubik_cube_solver.validator.validator_utils import get_corners
 
@@ -34,7 +35,13 @@ class CornerSearchResult(NamedTuple):
     orientation: int
 
 
-def search_corner(cube: Cube, first_color: Color, second_color: Color, third_color: Color) -> CornerSearchResult:
+def search_corner(
+    cube: Cube,
+    first_color: Color,
+    second_color: Color,
+    third_color: Color,
+    counter: PieceSearchCounter | None = None,
+) -> CornerSearchResult:
     """
     Searches a cube of any size for the corner piece with the given three colors.
 
@@ -47,9 +54,13 @@ def search_corner(cube: Cube, first_color: Color, second_color: Color, third_col
     :param first_color: The first color of the corner piece
     :param second_color: The second color of the corner piece
     :param third_color: The third color of the corner piece
+    :param counter: The counter of the piece searches of the solve, or None to count nothing
     :return: The slot of the corner piece and its orientation
     """
 
+    if counter is not None:
+        counter.count += 1
+
     corner_colors = frozenset({first_color, second_color, third_color})
     if corner_colors not in VALID_CORNER_COLOR_SETS:
         raise ValueError(f"Invalid corner piece: {corner_colors}.")
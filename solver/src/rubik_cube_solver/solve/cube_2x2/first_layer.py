@@ -1,4 +1,5 @@
 # Project imports
+from rubik_cube_solver.cube_rotation.algorithm import AlgorithmTable
 from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.CornerSlot import CornerSlot
 
@@ -25,6 +26,9 @@ FIRST_LAYER_EXTRACTION_TABLE: dict[CornerSlot, str] = {
     CornerSlot.DBL: "L U L'",
 }
 
+# The algorithms of `FIRST_LAYER_EXTRACTION_TABLE`, each parsed the first time it is looked up.
+FIRST_LAYER_EXTRACTION_ALGORITHMS: AlgorithmTable[CornerSlot] = AlgorithmTable(FIRST_LAYER_EXTRACTION_TABLE, 2)
+
 # Algorithm that brings a UP-layer corner to UFR, above the slot being solved.
 FIRST_LAYER_ALIGNMENT_TABLE: dict[CornerSlot, str] = {
     CornerSlot.UFR: "",
@@ -33,6 +37,9 @@ FIRST_LAYER_ALIGNMENT_TABLE: dict[CornerSlot, str] = {
     CornerSlot.UBR: "U",
 }
 
+# The algorithms of `FIRST_LAYER_ALIGNMENT_TABLE`, each parsed the first time it is looked up.
+FIRST_LAYER_ALIGNMENT_ALGORITHMS: AlgorithmTable[CornerSlot] = AlgorithmTable(FIRST_LAYER_ALIGNMENT_TABLE, 2)
+
 # Algorithm that inserts the corner at UFR into DFR with its yellow sticker on DOWN, keyed by the
 # corner's orientation at UFR - the index within its clockwise sticker triple at which the yellow
 # sticker lies, so 0 is yellow on UP, 1 is yellow on RIGHT and 2 is yellow on FRONT. Every entry is
@@ -43,3 +50,6 @@ FIRST_LAYER_INSERTION_TABLE: dict[int, str] = {
     1: "R U R'",
     2: "U R U' R'",
 }
+
+# The algorithms of `FIRST_LAYER_INSERTION_TABLE`, each parsed the first time it is looked up.
+FIRST_LAYER_INSERTION_ALGORITHMS: AlgorithmTable[int] = AlgorithmTable(FIRST_LAYER_INSERTION_TABLE, 2)
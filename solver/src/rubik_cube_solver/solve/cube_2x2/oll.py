@@ -1,5 +1,6 @@
 # Project imports
 from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import AlgorithmTable
 from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.CornerSlot import CornerSlot
 from rubik_cube_solver.enums.Layer import Layer
@@ -51,6 +52,9 @@ OLL_TABLE: dict[tuple[int, ...], str] = {
     (2, 2, 2, 0): "R U R' U R U2 R'",
 }
 
+# The algorithms of `OLL_TABLE`, each parsed the first time it is looked up.
+OLL_ALGORITHMS: AlgorithmTable[tuple[int, ...]] = AlgorithmTable(OLL_TABLE, 2)
+
 
 def up_corner_orientations(cube: Cube) -> tuple[int, ...]:
     """
@@ -66,6 +70,10 @@ def up_corner_orientations(cube: Cube) -> tuple[int, ...]:
     """
 
     return tuple(
-        next(index for index, (layer, sticker) in enumerate(stickers) if cube.layers[layer][sticker] == Color.WHITE)
+        next(
+            index
+            for index, (layer, sticker) in enumerate(stickers)
+            if cube.read_layers()[layer][sticker] == Color.WHITE
+        )
         for stickers in OLL_UP_CORNER_STICKERS.values()
     )
@@ -0,0 +1,206 @@
+# Python imports
+from functools import cache
+from math import factorial
+from typing import NamedTuple, Sequence
+
+# Third-party imports
+import numpy as np
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.move import Move
+from rubik_cube_solver.cubie_cube import CubieCube, get_cubie_move, read_corners
+from rubik_cube_solver.enums.Direction import Direction
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.solve.coordinates import (
+    decode_orientations,
+    decode_permutations,
+    encode_orientation,
+    encode_orientations,
+    encode_permutation,
+    encode_permutations,
+    get_pruning_table,
+)
+from rubik_cube_solver.solve.shared_tables import SharedTables, get_shared_tables
+from rubik_cube_solver.solve.solve import ORIENTATION_ALGORITHMS
+from rubik_cube_solver.solve.tables import get_distance
+
+# The corner slot of `CubieCube` that no move of the search turns, DBL, and the other seven, whose
+# pieces make up the state. Keeping DBL in place takes the whole-cube rotations out of the state space.
+FIXED_CORNER: int = 6
+FREE_CORNERS: tuple[int, ...] = (0, 1, 2, 3, 4, 5, 7)
+
+# The 9 face turns of the search, three for each face that does not touch DBL
+MOVES: tuple[Move, ...] = tuple(
+    Move(layer, direction, 1) for layer in (Layer.UP, Layer.RIGHT, Layer.FRONT) for direction in Direction
+)
+
+# The amount of values of the permutation and orientation coordinates, and of states, 3,674,160
+PERMUTATIONS: int = factorial(7)
+TWISTS: int = 3**6
+STATES: int = PERMUTATIONS * TWISTS
+
+
+class OptimalTables(NamedTuple):
+    """
+    The tables of the optimal 2x2 solver.
+
+    The move tables hold, for every value of a coordinate, the value every move leads to, flat: the
+    value move `m` leads to from value `v` is at `v * len(MOVES) + m`. The distance
+    table holds the least amount of moves that solves every state, two states to a byte: the state
+    `permutation * TWISTS + twist` in the low 4 bits of byte `state // 2` when it is even, and in the
+    high 4 bits when it is odd.
+    """
+
+    permutation_moves: Sequence[int]
+    twist_moves: Sequence[int]
+    distances: memoryview
+
+
+class OptimalState(NamedTuple):
+    """
+    The state of a 2x2 as the optimal solver sees it: the whole-cube rotation that brings the DBL piece
+    home, and the coordinate of the other seven pieces after it.
+    """
+
+    rotation: Algorithm
+    state: int
+
+
+@cache
+def get_fixed_corner_rotations() -> dict[tuple[int, int], Algorithm]:
+    """
+    Returns the whole-cube rotation that brings the DBL piece home, from every slot and orientation it
+    can be in, finding them on first use.
+
+    A rotation moves the piece of slot `corner_permutation[FIXED_CORNER]` of its cubie cube into DBL and
+    adds `corner_orientation[FIXED_CORNER]` to its orientation.
+
+    :return: The rotation for every slot and orientation of the DBL piece
+    """
+
+    rotations: dict[tuple[int, int], Algorithm] = {}
+    for algorithm in ORIENTATION_ALGORITHMS:
+        rotated = CubieCube()
+        rotated.apply(algorithm)
+        slot = rotated.corner_permutation[FIXED_CORNER]
+        rotations[slot, -rotated.corner_orientation[FIXED_CORNER] % 3] = algorithm
+
+    return rotations
+
+
+@cache
+def get_optimal_tables() -> OptimalTables:
+    """
+    Returns the tables of the optimal 2x2 solver, building them on first use.
+
+    The move tables are built by performing the cubie cube of every move on every value of a coordinate
+    at once. The distance table is mapped from its file in the table directory, and built by a
+    breadth-first search over every state only when the file is missing or was built from other move
+    tables. In a worker process attached to the tables `share_optimal_tables` published, they are all
+    taken from shared memory instead. The tables are kept for the rest of the process, so only the
+    first solve pays for them.
+
+    :return: The tables
+    """
+
+    shared = get_shared_tables("2x2-optimal", OptimalTables._fields)
+    if shared is not None:
+        return OptimalTables(*shared)
+
+    cubie_moves = [get_cubie_move(move.layer, move.direction) for move in MOVES]
+    sources = [[FREE_CORNERS.index(move.corner_permutation[slot]) for slot in FREE_CORNERS] for move in cubie_moves]
+    twists_added = [[move.corner_orientation[slot] for slot in FREE_CORNERS] for move in cubie_moves]
+
+    permutations_ = decode_permutations(7)
+    twists = decode_orientations(7, 3)
+    permutation_moves = np.stack([encode_permutations(permutations_[:, source]) for source in sources], axis=1)
+    twist_moves = np.stack(
+        [encode_orientations((twists[:, source] + added) % 3, 3) for source, added in zip(sources, twists_added)],
+        axis=1,
+    )
+
+    return OptimalTables(
+        permutation_moves.ravel().tolist(),
+        twist_moves.ravel().tolist(),
+        get_pruning_table("2x2-optimal", permutation_moves, twist_moves, 0),
+    )
+
+
+def share_optimal_tables(shared_tables: SharedTables) -> None:
+    """
+    Publishes the tables of the optimal 2x2 solver into shared memory, loading or building them first.
+
+    :param shared_tables: The shared tables to publish into
+    :return: None
+    """
+
+    shared_tables.publish_all("2x2-optimal", get_optimal_tables())
+
+
+def read_state(cube: Cube) -> OptimalState:
+    """
+    Reads the state of a 2x2 cube.
+
+    :param cube: The 2x2 cube
+    :return: The rotation that brings the DBL piece home and the state after it
+    """
+
+    if cube.size != 2:
+        raise ValueError(f"Only a 2x2 cube has an optimal state, got size {cube.size}")
+
+    corner_permutation, corner_orientation = read_corners(cube)
+    slot = corner_permutation.index(FIXED_CORNER)
+    rotation = get_fixed_corner_rotations()[slot, corner_orientation[slot]]
+
+    rotated = CubieCube(corner_permutation, corner_orientation)
+    rotated.apply(rotation)
+
+    # The pieces are renumbered past DBL, so that the seven of them make a permutation of 0 to 6
+    pieces = tuple(rotated.corner_permutation[slot] for slot in FREE_CORNERS)
+    permutation = encode_permutation(tuple(piece - (piece > FIXED_CORNER) for piece in pieces))
+    twist = encode_orientation(tuple(rotated.corner_orientation[slot] for slot in FREE_CORNERS), 3)
+
+    return OptimalState(rotation, permutation * TWISTS + twist)
+
+
+def distance(cube: Cube) -> int:
+    """
+    Returns the least amount of face turns that solves a 2x2 cube, counting a half turn as one.
+
+    :param cube: The 2x2 cube
+    :return: The distance of the cube from solved
+    """
+
+    return get_distance(get_optimal_tables().distances, read_state(cube).state)
+
+
+def solve_state(state: int) -> list[Move]:
+    """
+    Returns a shortest solution of a state, by taking from every state a move to one a step closer.
+
+    :param state: The state
+    :return: The moves of the solution
+    """
+
+    permutation_moves, twist_moves, distances = get_optimal_tables()
+    permutation, twist = divmod(state, TWISTS)
+
+    solution: list[Move] = []
+    remaining = get_distance(distances, state)
+    while remaining:
+        permutation_row = permutation * len(MOVES)
+        twist_row = twist * len(MOVES)
+        for index, move in enumerate(MOVES):
+            next_permutation = permutation_moves[permutation_row + index]
+            next_twist = twist_moves[twist_row + index]
+            if get_distance(distances, next_permutation * TWISTS + next_twist) == remaining - 1:
+                permutation, twist = next_permutation, next_twist
+                solution.append(move)
+                remaining -= 1
+                break
+        else:
+            raise ValueError(f"No move brings state {permutation * TWISTS + twist} closer to solved")
+
+    return solution
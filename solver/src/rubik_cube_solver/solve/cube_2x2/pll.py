@@ -1,5 +1,6 @@
 # Project imports
 from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import AlgorithmTable
 from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.CornerSlot import CornerSlot
 from rubik_cube_solver.enums.Layer import Layer
@@ -57,6 +58,9 @@ PLL_TABLE: dict[tuple[int, ...], str] = {
     (3, 2, 1, 0): "R U2 R' U' F U2 R' F' R U' F2",
 }
 
+# The algorithms of `PLL_TABLE`, each parsed the first time it is looked up.
+PLL_ALGORITHMS: AlgorithmTable[tuple[int, ...]] = AlgorithmTable(PLL_TABLE, 2)
+
 
 def up_corner_permutation(cube: Cube) -> tuple[int, ...]:
     """
@@ -74,6 +78,6 @@ def up_corner_permutation(cube: Cube) -> tuple[int, ...]:
     home_colors = list(PLL_UP_CORNER_COLORS.values())
 
     return tuple(
-        home_colors.index(frozenset(cube.layers[layer][sticker] for layer, sticker in stickers))
+        home_colors.index(frozenset(cube.read_layers()[layer][sticker] for layer, sticker in stickers))
         for stickers in PLL_UP_CORNER_STICKERS.values()
     )
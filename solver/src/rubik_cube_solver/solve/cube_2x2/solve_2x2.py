@@ -3,19 +3,18 @@ from typing import Callable
 
 # Project imports
 from rubik_cube_solver.cube import Cube
-from rubik_cube_solver.cube_rotation.algorithm import Algorithm
 from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.CornerSlot import CornerSlot
 from rubik_cube_solver.solve.corner_search import search_corner
 from rubik_cube_solver.solve.cube_2x2.first_layer import (
-    FIRST_LAYER_ALIGNMENT_TABLE,
+    FIRST_LAYER_ALIGNMENT_ALGORITHMS,
     FIRST_LAYER_CORNER_COLORS,
-    FIRST_LAYER_EXTRACTION_TABLE,
-    FIRST_LAYER_INSERTION_TABLE,
+    FIRST_LAYER_EXTRACTION_ALGORITHMS,
+    FIRST_LAYER_INSERTION_ALGORITHMS,
 )
-from rubik_cube_solver.solve.cube_2x2.oll import OLL_TABLE, up_corner_orientations
-from rubik_cube_solver.solve.cube_2x2.pll import PLL_TABLE, up_corner_permutation
-from rubik_cube_solver.solve.solve import Solve
+from rubik_cube_solver.solve.cube_2x2.oll import OLL_ALGORITHMS, up_corner_orientations
+from rubik_cube_solver.solve.cube_2x2.pll import PLL_ALGORITHMS, up_corner_permutation
+from rubik_cube_solver.solve.solve import Y_ROTATION, Solve
 
 
 class Solve2x2(Solve):
@@ -65,7 +64,7 @@ class Solve2x2(Solve):
 
         for front_color, right_color in FIRST_LAYER_CORNER_COLORS:
             self._solve_first_layer_corner(front_color, right_color)
-            self._apply(Algorithm.from_str("y"))
+            self._apply(Y_ROTATION)
 
     def _solve_first_layer_corner(self, front_color: Color, right_color: Color) -> None:
         """
@@ -82,19 +81,19 @@ class Solve2x2(Solve):
         :return: None
         """
 
-        slot, orientation = search_corner(self.cube, Color.YELLOW, front_color, right_color)
+        slot, orientation = search_corner(self.cube, Color.YELLOW, front_color, right_color, self.piece_search_counter)
 
         if slot is CornerSlot.DFR and orientation == 0:
             return
 
-        if slot in FIRST_LAYER_EXTRACTION_TABLE:
-            self._apply(Algorithm.from_str(FIRST_LAYER_EXTRACTION_TABLE[slot]))
+        if slot in FIRST_LAYER_EXTRACTION_ALGORITHMS:
+            self._apply(FIRST_LAYER_EXTRACTION_ALGORITHMS[slot])
 
-        slot, _ = search_corner(self.cube, Color.YELLOW, front_color, right_color)
-        self._apply(Algorithm.from_str(FIRST_LAYER_ALIGNMENT_TABLE[slot]))
+        slot, _ = search_corner(self.cube, Color.YELLOW, front_color, right_color, self.piece_search_counter)
+        self._apply(FIRST_LAYER_ALIGNMENT_ALGORITHMS[slot])
 
-        _, orientation = search_corner(self.cube, Color.YELLOW, front_color, right_color)
-        self._apply(Algorithm.from_str(FIRST_LAYER_INSERTION_TABLE[orientation]))
+        _, orientation = search_corner(self.cube, Color.YELLOW, front_color, right_color, self.piece_search_counter)
+        self._apply(FIRST_LAYER_INSERTION_ALGORITHMS[orientation])
 
     def _oll(self) -> None:
         """
@@ -107,7 +106,7 @@ class Solve2x2(Solve):
         :return: None
         """
 
-        self._apply(Algorithm.from_str(OLL_TABLE[up_corner_orientations(self.cube)]))
+        self._apply(OLL_ALGORITHMS[up_corner_orientations(self.cube)])
 
     def _pll(self) -> None:
         """
@@ -121,4 +120,4 @@ class Solve2x2(Solve):
         :return: None
         """
 
-        self._apply(Algorithm.from_str(PLL_TABLE[up_corner_permutation(self.cube)]))
+        self._apply(PLL_ALGORITHMS[up_corner_permutation(self.cube)])
@@ -0,0 +1,60 @@
+# Python imports
+from typing import Callable
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.solve.cube_2x2.optimal import read_state, solve_state
+from rubik_cube_solver.solve.solve import Solve
+
+
+class Solve2x2Optimal(Solve):
+    """
+    Optimal solver for the 2x2 cube.
+
+    The cube is first rotated so that the yellow, blue and orange piece sits in DBL, then solved with
+    turns of UP, RIGHT and FRONT only, which leave that piece in place. Every move is read off a table
+    of the distance of every state from solved, so the solution is always a shortest one in face
+    turns. The table is built on first use and shared by every solver in the process, and like
+    `Solve2x2`, the cube ends up equal to a default `Cube(2)`.
+    """
+
+    def __init__(self, cube: Cube) -> None:
+        """
+        Constructor for the `Solve2x2Optimal` class.
+
+        :param cube: The 2x2 cube to solve
+        :return: None
+        """
+
+        if cube.size != 2:
+            raise ValueError(f"Solve2x2Optimal supports only 2x2 cubes, got size {cube.size}")
+
+        super().__init__(cube)
+
+    def _steps(self) -> list[Callable[[], None]]:
+        """
+        The ordered solving steps for a 2x2 cube.
+
+        :return: The ordered solving steps
+        """
+
+        return [self._orientation, self._optimal]
+
+    def _orientation(self) -> None:
+        """
+        Rotates the whole cube so that the yellow, blue and orange piece sits in DBL, yellow down.
+
+        :return: None
+        """
+
+        self._apply(read_state(self.cube).rotation)
+
+    def _optimal(self) -> None:
+        """
+        Solves the oriented cube with a shortest solution.
+
+        :return: None
+        """
+
+        self._apply(Algorithm(solve_state(read_state(self.cube).state)))
@@ -1,5 +1,6 @@
 # Project imports
 from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import AlgorithmTable
 from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.EdgeSlot import EdgeSlot
 from rubik_cube_solver.enums.Layer import Layer
@@ -15,6 +16,9 @@ CROSS_ORIENTATION_TABLE: dict[Layer, str] = {
     Layer.RIGHT: "z",
 }
 
+# The algorithms of `CROSS_ORIENTATION_TABLE`, each parsed the first time it is looked up.
+CROSS_ORIENTATION_ALGORITHMS: AlgorithmTable[Layer] = AlgorithmTable(CROSS_ORIENTATION_TABLE, 3)
+
 # Algorithm that extracts a cross edge out of the DOWN layer or the equatorial layer and into the
 # UP layer, without disturbing any other DOWN-layer edge. The four UP slots have no entry: an edge
 # already in the UP layer needs no extraction.
@@ -29,6 +33,9 @@ CROSS_EXTRACTION_TABLE: dict[EdgeSlot, str] = {
     EdgeSlot.BL: "L U' L'",
 }
 
+# The algorithms of `CROSS_EXTRACTION_TABLE`, each parsed the first time it is looked up.
+CROSS_EXTRACTION_ALGORITHMS: AlgorithmTable[EdgeSlot] = AlgorithmTable(CROSS_EXTRACTION_TABLE, 3)
+
 # Algorithm that brings a UP-layer edge to UF.
 CROSS_ALIGNMENT_TABLE: dict[EdgeSlot, str] = {
     EdgeSlot.UF: "",
@@ -37,6 +44,9 @@ CROSS_ALIGNMENT_TABLE: dict[EdgeSlot, str] = {
     EdgeSlot.UL: "U'",
 }
 
+# The algorithms of `CROSS_ALIGNMENT_TABLE`, each parsed the first time it is looked up.
+CROSS_ALIGNMENT_ALGORITHMS: AlgorithmTable[EdgeSlot] = AlgorithmTable(CROSS_ALIGNMENT_TABLE, 3)
+
 # Algorithm that inserts a UF edge into DF, keyed by whether it is already oriented (yellow on UP)
 # or flipped (yellow on FRONT).
 CROSS_INSERTION_TABLE: dict[bool, str] = {
@@ -44,6 +54,9 @@ CROSS_INSERTION_TABLE: dict[bool, str] = {
     False: "U' R' F R",
 }
 
+# The algorithms of `CROSS_INSERTION_TABLE`, each parsed the first time it is looked up.
+CROSS_INSERTION_ALGORITHMS: AlgorithmTable[bool] = AlgorithmTable(CROSS_INSERTION_TABLE, 3)
+
 
 def face_center_color(cube: Cube, layer: Layer) -> Color:
     """
@@ -54,7 +67,7 @@ def face_center_color(cube: Cube, layer: Layer) -> Color:
     :return: The center sticker's color
     """
 
-    return cube.layers[layer][cube.size * cube.size // 2]
+    return cube.read_layers()[layer][cube.size * cube.size // 2]
 
 
 def find_yellow_center_layer(cube: Cube) -> Layer:
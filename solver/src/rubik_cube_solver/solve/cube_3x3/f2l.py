@@ -1,5 +1,6 @@
 # Project imports
 from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import AlgorithmTable
 from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.CornerSlot import CornerSlot
 from rubik_cube_solver.enums.EdgeSlot import EdgeSlot
@@ -7,6 +8,7 @@ from rubik_cube_solver.enums.Layer import Layer
 from rubik_cube_solver.solve.corner_search import search_corner
 from rubik_cube_solver.solve.cube_3x3.cross import face_center_color
 from rubik_cube_solver.solve.edge_search import search_edge
+from rubik_cube_solver.solve.observer import PieceSearchCounter
 
 # The index of a UP-layer edge's sticker on the UP face of a 3x3.
 F2L_UP_EDGE_STICKERS: dict[EdgeSlot, int] = {
@@ -30,6 +32,9 @@ F2L_CORNER_EXTRACTION_TABLE: dict[CornerSlot, str] = {
     CornerSlot.DBL: "L U L'",
 }
 
+# The algorithms of `F2L_CORNER_EXTRACTION_TABLE`, each parsed the first time it is looked up.
+F2L_CORNER_EXTRACTION_ALGORITHMS: AlgorithmTable[CornerSlot] = AlgorithmTable(F2L_CORNER_EXTRACTION_TABLE, 3)
+
 # Algorithm that brings a UP-layer corner to UFR, above the slot being solved.
 F2L_CORNER_ALIGNMENT_TABLE: dict[CornerSlot, str] = {
     CornerSlot.UFR: "",
@@ -38,6 +43,9 @@ F2L_CORNER_ALIGNMENT_TABLE: dict[CornerSlot, str] = {
     CornerSlot.UBR: "U",
 }
 
+# The algorithms of `F2L_CORNER_ALIGNMENT_TABLE`, each parsed the first time it is looked up.
+F2L_CORNER_ALIGNMENT_ALGORITHMS: AlgorithmTable[CornerSlot] = AlgorithmTable(F2L_CORNER_ALIGNMENT_TABLE, 3)
+
 # Algorithm that lifts an edge out of the equatorial layer and into the UP layer. Every entry leaves
 # a corner sitting at UFR in the UP layer, which is what lets the corner be aligned there first.
 # The four UP slots have no entry, and the four DOWN slots cannot occur: they hold the cross.
@@ -48,6 +56,9 @@ F2L_EDGE_EXTRACTION_TABLE: dict[EdgeSlot, str] = {
     EdgeSlot.BL: "L U' L'",
 }
 
+# The algorithms of `F2L_EDGE_EXTRACTION_TABLE`, each parsed the first time it is looked up.
+F2L_EDGE_EXTRACTION_ALGORITHMS: AlgorithmTable[EdgeSlot] = AlgorithmTable(F2L_EDGE_EXTRACTION_TABLE, 3)
+
 # Algorithm that inserts the pair into the front-right slot, keyed by the corner's orientation at
 # UFR, the UP slot holding the edge, and whether the edge's UP sticker is the FRONT color. Every
 # entry is a shortest <U, R, F> solution, so it can only disturb the UP layer on the way.
@@ -78,6 +89,21 @@ F2L_PAIR_INSERTION_TABLE: dict[tuple[int, EdgeSlot, bool], str] = {
     (2, EdgeSlot.UL, False): "F' U' F",
 }
 
+# The algorithms of `F2L_PAIR_INSERTION_TABLE`, each parsed the first time it is looked up.
+F2L_PAIR_INSERTION_ALGORITHMS: AlgorithmTable[tuple[int, EdgeSlot, bool]] = AlgorithmTable(F2L_PAIR_INSERTION_TABLE, 3)
+
+# Whole-cube rotation that brings the slot the given amount of `y` turns away to the front-right, which
+# lets the pairs be solved in any order.
+F2L_SLOT_ROTATION_TABLE: dict[int, str] = {
+    0: "",
+    1: "y",
+    2: "y2",
+    3: "y'",
+}
+
+# The algorithms of `F2L_SLOT_ROTATION_TABLE`, each parsed the first time it is looked up.
+F2L_SLOT_ROTATION_ALGORITHMS: AlgorithmTable[int] = AlgorithmTable(F2L_SLOT_ROTATION_TABLE, 3)
+
 
 def front_color_on_up(cube: Cube, slot: EdgeSlot) -> bool:
     """
@@ -92,25 +118,28 @@ def front_color_on_up(cube: Cube, slot: EdgeSlot) -> bool:
     :return: Whether the edge's UP sticker has the FRONT center's color
     """
 
-    return cube.layers[Layer.UP][F2L_UP_EDGE_STICKERS[slot]] == face_center_color(cube, Layer.FRONT)
+    return cube.read_layers()[Layer.UP][F2L_UP_EDGE_STICKERS[slot]] == face_center_color(cube, Layer.FRONT)
 
 
-def is_pair_solved(cube: Cube, front_color: Color, right_color: Color) -> bool:
+def is_pair_solved(
+    cube: Cube, front_color: Color, right_color: Color, counter: PieceSearchCounter | None = None
+) -> bool:
     """
     Returns whether the pair of the given two colors already fills the front-right slot.
 
     :param cube: The Cube instance to search
     :param front_color: The color of the FRONT center
     :param right_color: The color of the RIGHT center
+    :param counter: The counter of the piece searches of the solve, or None to count nothing
     :return: Whether the corner sits oriented in DFR and the edge sits oriented in FR
     """
 
-    corner_slot, orientation = search_corner(cube, Color.YELLOW, front_color, right_color)
-    edge_slot, _ = search_edge(cube, front_color, right_color)
+    corner_slot, orientation = search_corner(cube, Color.YELLOW, front_color, right_color, counter)
+    edge_slot, _ = search_edge(cube, front_color, right_color, counter)
 
     return (
         corner_slot is CornerSlot.DFR
         and orientation == 0
         and edge_slot is EdgeSlot.FR
-        and cube.layers[Layer.FRONT][F2L_FRONT_RIGHT_EDGE_STICKER] == front_color
+        and cube.read_layers()[Layer.FRONT][F2L_FRONT_RIGHT_EDGE_STICKER] == front_color
     )
@@ -0,0 +1,435 @@
+# Python imports
+from functools import cache
+from itertools import combinations
+from math import comb, factorial
+from typing import NamedTuple, Sequence
+
+# Third-party imports
+import numpy as np
+
+# Project imports
+from rubik_cube_solver.cube_rotation.move import Move
+from rubik_cube_solver.cubie_cube import CubieCube, get_cubie_move
+from rubik_cube_solver.enums.Direction import Direction
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.enums.Rotation import Rotation
+from rubik_cube_solver.solve.coordinates import (
+    decode_orientations,
+    decode_permutations,
+    encode_orientation,
+    encode_orientations,
+    encode_permutation,
+    encode_permutations,
+    get_pruning_table,
+)
+from rubik_cube_solver.solve.shared_tables import SharedTables, get_shared_tables
+
+# The 18 face turns the search is made of, three per face in `Layer` order, so that the face of move
+# `m` is `m // 3` and the face opposite face `f` is `f ^ 1`
+MOVES: tuple[Move, ...] = tuple(Move(layer, direction, 1) for layer in Layer for direction in Direction)
+
+# The moves that keep a cube within the subgroup phase 1 leads to: any turn of UP and DOWN, and half
+# turns of the other faces. They are the moves of phase 2, numbered by their position here.
+PHASE_2_MOVES: tuple[int, ...] = tuple(
+    index
+    for index, move in enumerate(MOVES)
+    if move.layer in (Layer.UP, Layer.DOWN) or move.direction is Direction.DOUBLE
+)
+
+# The moves that may follow a move of every face, at the index of the face plus one, and every move at
+# index 0 for the first move. Turning the same face twice in a row, or opposite faces in both orders,
+# leads nowhere a single turn or the other order does not, so neither is searched.
+FOLLOWING_MOVES: tuple[tuple[int, ...], ...] = tuple(
+    tuple(
+        move
+        for move in range(len(MOVES))
+        if move // 3 != last_face and not (move // 3 ^ 1 == last_face and move // 3 < last_face)
+    )
+    for last_face in range(-1, len(Layer))
+)
+
+# The same for phase 2, as the number of every phase 2 move along with the move
+FOLLOWING_PHASE_2_MOVES: tuple[tuple[tuple[int, int], ...], ...] = tuple(
+    tuple((phase_2_move, move) for phase_2_move, move in enumerate(PHASE_2_MOVES) if move in following_moves)
+    for following_moves in FOLLOWING_MOVES
+)
+
+# The whole-cube rotations that turn every axis of the cube into the one between UP and DOWN, the
+# first leaving the cube as it is. Phase 1 leads to a subgroup of that axis, so a cube can be searched
+# along each of them.
+AXIS_ROTATIONS: tuple[Rotation | None, ...] = (None, Rotation.X, Rotation.Z)
+
+# The most moves phase 2 is searched for while a solution is looked for the first time. A longer phase 2
+# is expensive to search and seldom needed, since a longer phase 1 usually leaves a shorter one, so it
+# is searched for only when no solution turns up otherwise.
+PHASE_2_LIMIT: int = 12
+
+# The edges of the slice between UP and DOWN are the last 4 edge slots of a `CubieCube`, and the
+# coordinate of their positions on a solved cube
+SLICE_EDGES: tuple[int, ...] = (8, 9, 10, 11)
+SOLVED_SLICE: int = sum(comb(position, index + 1) for index, position in enumerate(SLICE_EDGES))
+
+# The binomial coefficients `n` choose `k` for the edge slots and the slice edges seen so far
+BINOMIALS: np.ndarray = np.array([[comb(n, k) for k in range(5)] for n in range(12)], dtype=np.int64)
+
+# The amount of values of every coordinate
+TWISTS: int = 3**7
+FLIPS: int = 2**11
+SLICES: int = comb(12, 4)
+CORNER_PERMUTATIONS: int = factorial(8)
+EDGE_PERMUTATIONS: int = factorial(8)
+SLICE_PERMUTATIONS: int = factorial(4)
+
+
+class TwoPhaseTables(NamedTuple):
+    """
+    The move and pruning tables of the two-phase search.
+
+    A move table holds, for every value of a coordinate, the value every move leads to, flat: the
+    value move `m` leads to from value `v` is at `v * len(MOVES) + m`, or at
+    `v * len(PHASE_2_MOVES) + m` for the moves of phase 2. A pruning table holds, for every pair of
+    values of two coordinates, the least amount of moves that solves both, which never overestimates
+    the moves left.
+    """
+
+    twist_moves: Sequence[int]
+    flip_moves: Sequence[int]
+    slice_moves: Sequence[int]
+    twist_slice_pruning: memoryview
+    flip_slice_pruning: memoryview
+    twist_flip_pruning: memoryview
+    corner_permutation_moves: Sequence[int]
+    edge_permutation_moves: Sequence[int]
+    slice_permutation_moves: Sequence[int]
+    corner_slice_pruning: memoryview
+    edge_slice_pruning: memoryview
+
+
+def encode_slices(occupied: np.ndarray) -> np.ndarray:
+    """
+    Returns the coordinate of every row of slice edge positions: the index of the set of edge slots
+    that hold a slice edge, in the combinatorial number system.
+
+    :param occupied: Whether every edge slot holds a slice edge, one row per state
+    :return: The coordinate of every row
+    """
+
+    coordinates = np.zeros(len(occupied), dtype=np.int64)
+    seen = np.zeros(len(occupied), dtype=np.int64)
+    for slot in range(occupied.shape[1]):
+        seen += occupied[:, slot]
+        coordinates += np.where(occupied[:, slot], BINOMIALS[slot, seen], 0)
+
+    return coordinates
+
+
+def decode_slices() -> np.ndarray:
+    """
+    Returns the slice edge positions of every coordinate, the inverse of `encode_slices`.
+
+    :return: Whether every edge slot holds a slice edge, one row per coordinate
+    """
+
+    occupied = np.zeros((SLICES, 12), dtype=np.int64)
+    for slots in combinations(range(12), 4):
+        occupied[sum(comb(slot, index + 1) for index, slot in enumerate(slots)), list(slots)] = 1
+
+    return occupied
+
+
+@cache
+def get_two_phase_tables() -> TwoPhaseTables:
+    """
+    Returns the tables of the two-phase search, building them on first use.
+
+    The move tables are built by performing the cubie cube of every move on every value of a
+    coordinate at once. The pruning tables are mapped from their files in the table directory, and built
+    by a breadth-first search over the move tables only when a file is missing or was built from other
+    move tables. They are small and read in the innermost loops, so they keep a whole byte per entry.
+    In a worker process attached to the tables `share_two_phase_tables` published, they are all taken
+    from shared memory instead. The tables are kept for the rest of the process, so only the first
+    search pays for them.
+
+    :return: The tables
+    """
+
+    shared = get_shared_tables("kociemba", TwoPhaseTables._fields)
+    if shared is not None:
+        return TwoPhaseTables(*shared)
+
+    cubie_moves = [get_cubie_move(move.layer, move.direction) for move in MOVES]
+    phase_2_cubie_moves = [cubie_moves[move] for move in PHASE_2_MOVES]
+
+    twists = decode_orientations(8, 3)
+    flips = decode_orientations(12, 2)
+    slices = decode_slices()
+    twist_moves = np.stack(
+        [
+            encode_orientations((twists[:, move.corner_permutation] + move.corner_orientation) % 3, 3)
+            for move in cubie_moves
+        ],
+        axis=1,
+    )
+    flip_moves = np.stack(
+        [encode_orientations((flips[:, move.edge_permutation] + move.edge_orientation) % 2, 2) for move in cubie_moves],
+        axis=1,
+    )
+    slice_moves = np.stack([encode_slices(slices[:, move.edge_permutation]) for move in cubie_moves], axis=1)
+
+    corner_permutations = decode_permutations(8)
+    edge_permutations = decode_permutations(8)
+    slice_permutations = decode_permutations(4)
+    corner_permutation_moves = np.stack(
+        [encode_permutations(corner_permutations[:, move.corner_permutation]) for move in phase_2_cubie_moves], axis=1
+    )
+    edge_permutation_moves = np.stack(
+        [encode_permutations(edge_permutations[:, move.edge_permutation[:8]]) for move in phase_2_cubie_moves], axis=1
+    )
+    slice_permutation_moves = np.stack(
+        [
+            encode_permutations(slice_permutations[:, [slot - 8 for slot in move.edge_permutation[8:]]])
+            for move in phase_2_cubie_moves
+        ],
+        axis=1,
+    )
+
+    return TwoPhaseTables(
+        twist_moves.ravel().tolist(),
+        flip_moves.ravel().tolist(),
+        slice_moves.ravel().tolist(),
+        get_pruning_table("kociemba-twist-slice", twist_moves, slice_moves, SOLVED_SLICE, bits=8),
+        get_pruning_table("kociemba-flip-slice", flip_moves, slice_moves, SOLVED_SLICE, bits=8),
+        get_pruning_table("kociemba-twist-flip", twist_moves, flip_moves, 0, bits=8),
+        corner_permutation_moves.ravel().tolist(),
+        edge_permutation_moves.ravel().tolist(),
+        slice_permutation_moves.ravel().tolist(),
+        get_pruning_table("kociemba-corner-slice", corner_permutation_moves, slice_permutation_moves, 0, bits=8),
+        get_pruning_table("kociemba-edge-slice", edge_permutation_moves, slice_permutation_moves, 0, bits=8),
+    )
+
+
+class AxisConjugation(NamedTuple):
+    """
+    A whole-cube rotation a cube is searched under: the cubie cubes of the rotation and of its inverse,
+    and the move every move of the rotated cube stands for on the cube itself, by number.
+    """
+
+    rotation: CubieCube
+    inverse: CubieCube
+    moves: tuple[int, ...]
+
+
+@cache
+def get_axis_conjugation(rotation: Rotation | None) -> AxisConjugation:
+    """
+    Returns the conjugation by a whole-cube rotation, creating it on first use.
+
+    :param rotation: The rotation, or None to leave the cube as it is
+    :return: The conjugation
+    """
+
+    cubie_moves = [get_cubie_move(move.layer, move.direction) for move in MOVES]
+    if rotation is None:
+        return AxisConjugation(CubieCube(), CubieCube(), tuple(range(len(MOVES))))
+
+    rotation_move = get_cubie_move(rotation, Direction.CW)
+    inverse = get_cubie_move(rotation, Direction.CCW)
+    moves = tuple(cubie_moves.index(rotation_move.multiply(move).multiply(inverse)) for move in cubie_moves)
+    return AxisConjugation(rotation_move, inverse, moves)
+
+
+def share_two_phase_tables(shared_tables: SharedTables) -> None:
+    """
+    Publishes the tables of the two-phase search into shared memory, loading or building them first.
+
+    :param shared_tables: The shared tables to publish into
+    :return: None
+    """
+
+    shared_tables.publish_all("kociemba", get_two_phase_tables())
+
+
+class TwoPhaseSearch:
+    """
+    Kociemba's two-phase search for a short solution of a 3x3 cube.
+
+    Phase 1 brings the cube into the subgroup generated by `PHASE_2_MOVES`: every corner and edge
+    oriented and the slice edges in the slice. Phase 2 solves the cube with those moves only. Both
+    phases are iterative deepening searches over coordinates, cut off as soon as a pruning table
+    shows that the moves left cannot be enough. Phase 1 solutions are tried in order of length, each
+    followed by the shortest phase 2 that fits in the moves left, until a whole solution is short
+    enough.
+
+    The cube is searched along each of its three axes in turn, as rotated by `AXIS_ROTATIONS`, one
+    phase 1 length at a time. How deep phase 1 has to go before a short enough solution turns up
+    differs a lot from one axis to the next, so the first axis to find one saves the search of the
+    others from going deeper. Phase 2 is kept to `PHASE_2_LIMIT` moves, unless no solution is found
+    that way.
+
+    Only the corners and edges take part, so the cube must have its centers in the solved color
+    scheme.
+    """
+
+    def __init__(self, cubie_cube: CubieCube, max_length: int) -> None:
+        """
+        Constructor for the `TwoPhaseSearch` class.
+
+        :param cubie_cube: The cube to solve
+        :param max_length: The most moves the solution may have
+        :return: None
+        """
+
+        self.__cubie_cube = cubie_cube
+        self.__max_length = max_length
+        self.__tables = get_two_phase_tables()
+        self.__path: list[int] = []
+        # The cube along the axis being searched, and the most moves phase 2 is searched for
+        self.__axis_cube = cubie_cube
+        self.__phase_2_limit = max_length
+
+    def search(self) -> list[Move]:
+        """
+        Searches for a solution of at most the maximum length.
+
+        :return: The moves of the solution
+        """
+
+        axes = []
+        for rotation in AXIS_ROTATIONS:
+            conjugation = get_axis_conjugation(rotation)
+            cubie_cube = conjugation.inverse.multiply(self.__cubie_cube).multiply(conjugation.rotation)
+            twist = encode_orientation(cubie_cube.corner_orientation, 3)
+            flip = encode_orientation(cubie_cube.edge_orientation, 2)
+            slice_ = int(encode_slices(np.array([[piece in SLICE_EDGES for piece in cubie_cube.edge_permutation]]))[0])
+            axes.append((cubie_cube, conjugation.moves, twist, flip, slice_))
+
+        for phase_2_limit in sorted({min(PHASE_2_LIMIT, self.__max_length), self.__max_length}):
+            self.__phase_2_limit = phase_2_limit
+            for depth in range(self.__max_length + 1):
+                for cubie_cube, moves, twist, flip, slice_ in axes:
+                    self.__axis_cube = cubie_cube
+                    solution = self.__phase_1(twist, flip, slice_, depth)
+                    if solution is not None:
+                        return [MOVES[moves[move]] for move in solution]
+
+        raise ValueError(f"No solution of at most {self.__max_length} moves was found.")
+
+    def __phase_1(self, twist: int, flip: int, slice_: int, moves_left: int) -> list[int] | None:
+        """
+        Searches the phase 1 solutions of exactly the moves left from a state, trying phase 2 after
+        each one.
+
+        :param twist: The corner orientation coordinate
+        :param flip: The edge orientation coordinate
+        :param slice_: The slice edge position coordinate
+        :param moves_left: The amount of phase 1 moves left
+        :return: The moves of the whole solution, or None if there is none along this path
+        """
+
+        path = self.__path
+        if moves_left == 0:
+            if twist or flip or slice_ != SOLVED_SLICE:
+                return None
+            # A phase 1 that ends with a phase 2 move has a shorter version that was tried already
+            if path and path[-1] in PHASE_2_MOVES:
+                return None
+            return self.__start_phase_2()
+
+        tables = self.__tables
+        twist_moves, flip_moves, slice_moves = tables.twist_moves, tables.flip_moves, tables.slice_moves
+        twist_row, flip_row, slice_row = twist * len(MOVES), flip * len(MOVES), slice_ * len(MOVES)
+        for move in FOLLOWING_MOVES[path[-1] // 3 + 1 if path else 0]:
+            next_slice = slice_moves[slice_row + move]
+            next_twist = twist_moves[twist_row + move]
+            if tables.twist_slice_pruning[next_twist * SLICES + next_slice] >= moves_left:
+                continue
+            next_flip = flip_moves[flip_row + move]
+            if tables.flip_slice_pruning[next_flip * SLICES + next_slice] >= moves_left:
+                continue
+            if tables.twist_flip_pruning[next_twist * FLIPS + next_flip] >= moves_left:
+                continue
+
+            path.append(move)
+            solution = self.__phase_1(next_twist, next_flip, next_slice, moves_left - 1)
+            path.pop()
+            if solution is not None:
+                return solution
+
+        return None
+
+    def __start_phase_2(self) -> list[int] | None:
+        """
+        Searches the shortest phase 2 that fits in the moves left after the current phase 1, and in
+        the current limit of phase 2.
+
+        :return: The moves of the whole solution, or None if no phase 2 fits
+        """
+
+        cubie_cube = self.__axis_cube
+        for move in self.__path:
+            cubie_cube = cubie_cube.multiply(get_cubie_move(MOVES[move].layer, MOVES[move].direction))
+
+        corner_permutation = encode_permutation(cubie_cube.corner_permutation)
+        edge_permutation = encode_permutation(cubie_cube.edge_permutation[:8])
+        slice_permutation = encode_permutation(tuple(piece - 8 for piece in cubie_cube.edge_permutation[8:]))
+
+        tables = self.__tables
+        least_moves = max(
+            tables.corner_slice_pruning[corner_permutation * SLICE_PERMUTATIONS + slice_permutation],
+            tables.edge_slice_pruning[edge_permutation * SLICE_PERMUTATIONS + slice_permutation],
+        )
+        for depth in range(least_moves, min(self.__phase_2_limit, self.__max_length - len(self.__path)) + 1):
+            solution = self.__phase_2(corner_permutation, edge_permutation, slice_permutation, depth)
+            if solution is not None:
+                return solution
+
+        return None
+
+    def __phase_2(
+        self, corner_permutation: int, edge_permutation: int, slice_permutation: int, moves_left: int
+    ) -> list[int] | None:
+        """
+        Searches the phase 2 solutions of exactly the moves left from a state.
+
+        :param corner_permutation: The corner permutation coordinate
+        :param edge_permutation: The permutation coordinate of the edges outside the slice
+        :param slice_permutation: The permutation coordinate of the slice edges
+        :param moves_left: The amount of phase 2 moves left
+        :return: The moves of the whole solution, or None if there is none along this path
+        """
+
+        path = self.__path
+        if moves_left == 0:
+            if corner_permutation or edge_permutation or slice_permutation:
+                return None
+            return list(path)
+
+        tables = self.__tables
+        corner_permutation_moves = tables.corner_permutation_moves
+        edge_permutation_moves = tables.edge_permutation_moves
+        slice_permutation_moves = tables.slice_permutation_moves
+        corner_row = corner_permutation * len(PHASE_2_MOVES)
+        edge_row = edge_permutation * len(PHASE_2_MOVES)
+        slice_row = slice_permutation * len(PHASE_2_MOVES)
+        for phase_2_move, move in FOLLOWING_PHASE_2_MOVES[path[-1] // 3 + 1 if path else 0]:
+            next_slice_permutation = slice_permutation_moves[slice_row + phase_2_move]
+            next_corner_permutation = corner_permutation_moves[corner_row + phase_2_move]
+            if tables.corner_slice_pruning[next_corner_permutation * SLICE_PERMUTATIONS + next_slice_permutation] >= (
+                moves_left
+            ):
+                continue
+            next_edge_permutation = edge_permutation_moves[edge_row + phase_2_move]
+            if tables.edge_slice_pruning[next_edge_permutation * SLICE_PERMUTATIONS + next_slice_permutation] >= (
+                moves_left
+            ):
+                continue
+
+            path.append(move)
+            solution = self.__phase_2(
+                next_corner_permutation, next_edge_permutation, next_slice_permutation, moves_left - 1
+            )
+            path.pop()
+            if solution is not None:
+                return solution
+
+        return None
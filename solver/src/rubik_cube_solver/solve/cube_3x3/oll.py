@@ -1,5 +1,6 @@
 # Project imports
 from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import AlgorithmTable
 from rubik_cube_solver.enums.CornerSlot import CornerSlot
 from rubik_cube_solver.enums.EdgeSlot import EdgeSlot
 from rubik_cube_solver.enums.Layer import Layer
@@ -248,6 +249,9 @@ OLL_TABLE: dict[tuple[tuple[int, ...], tuple[bool, ...]], str] = {
     ((2, 2, 2, 0), (True, True, True, True)): "R U R' U R U2 R'",
 }
 
+# The algorithms of `OLL_TABLE`, each parsed the first time it is looked up.
+OLL_ALGORITHMS: AlgorithmTable[tuple[tuple[int, ...], tuple[bool, ...]]] = AlgorithmTable(OLL_TABLE, 3)
+
 
 def up_corner_orientations(cube: Cube) -> tuple[int, ...]:
     """
@@ -264,7 +268,7 @@ def up_corner_orientations(cube: Cube) -> tuple[int, ...]:
     up_color = face_center_color(cube, Layer.UP)
 
     return tuple(
-        next(index for index, (layer, sticker) in enumerate(stickers) if cube.layers[layer][sticker] == up_color)
+        next(index for index, (layer, sticker) in enumerate(stickers) if cube.read_layers()[layer][sticker] == up_color)
         for stickers in OLL_UP_CORNER_STICKERS.values()
     )
 
@@ -281,4 +285,4 @@ def up_edge_orientations(cube: Cube) -> tuple[bool, ...]:
 
     up_color = face_center_color(cube, Layer.UP)
 
-    return tuple(cube.layers[Layer.UP][sticker] == up_color for sticker in OLL_UP_EDGE_STICKERS.values())
+    return tuple(cube.read_layers()[Layer.UP][sticker] == up_color for sticker in OLL_UP_EDGE_STICKERS.values())
@@ -0,0 +1,374 @@
+# Python imports
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from multiprocessing.synchronize import Event
+
+# Project imports
+from rubik_cube_solver.cube_rotation.move import Move
+from rubik_cube_solver.cubie_cube import CubieCube, get_cubie_move
+from rubik_cube_solver.enums.CornerSlot import CornerSlot
+from rubik_cube_solver.enums.EdgeSlot import EdgeSlot
+from rubik_cube_solver.solve.cube_3x3.kociemba import FOLLOWING_MOVES, MOVES
+from rubik_cube_solver.solve.cube_3x3.pattern_database import KORF_PATTERNS, SHARED_PARTS, get_pattern_database
+from rubik_cube_solver.solve.shared_tables import SharedTable, SharedTables, attach_shared_tables
+
+# How many nodes a search visits between looks at the clock and at whether another worker has finished
+CHECK_INTERVAL: int = 1 << 12
+
+# Set in the workers of a pool once any of them has found a solution, so that the others stop
+_solution_found: Event | None = None
+
+# The pattern databases published into shared memory for the pools of every search in the process,
+# created on first use and kept until exit, and the lock that keeps two threads from publishing them
+_shared_databases: SharedTables | None = None
+_shared_databases_lock = threading.Lock()
+
+
+def is_solved(cubie_cube: CubieCube) -> bool:
+    """
+    Checks whether every corner and edge of a cube is in its slot and oriented.
+
+    :param cubie_cube: The cube
+    :return: Whether the cube is solved
+    """
+
+    solved = CubieCube()
+    return (
+        cubie_cube.corner_permutation == solved.corner_permutation
+        and cubie_cube.corner_orientation == solved.corner_orientation
+        and cubie_cube.edge_permutation == solved.edge_permutation
+        and cubie_cube.edge_orientation == solved.edge_orientation
+    )
+
+
+class BranchSearch:
+    """
+    Depth-first search of the solutions of a 3x3 that start with a given move and have a given length.
+
+    The search is pruned by pattern databases: a move is followed only when none of them puts the state
+    it leads to further from solved than the moves left. Turning the same face twice in a row, or
+    opposite faces in both orders, is skipped, as in `TwoPhaseSearch`.
+    """
+
+    def __init__(
+        self,
+        cubie_cube: CubieCube,
+        patterns: tuple[tuple[CornerSlot, ...] | tuple[EdgeSlot, ...], ...],
+        deadline: float | None = None,
+        stop: Event | None = None,
+    ) -> None:
+        """
+        Constructor for the `BranchSearch` class.
+
+        :param cubie_cube: The cube to solve, in the color scheme of a default `Cube(3)`
+        :param patterns: The sets of pieces whose pattern databases prune the search
+        :param deadline: The `time.monotonic()` value to give up at, if any
+        :param stop: An event that stops the search once it is set, if any
+        :return: None
+        """
+
+        self.__cubie_cube = cubie_cube
+        self.__databases = [get_pattern_database(pattern) for pattern in patterns]
+        self.__deadline = deadline
+        self.__stop = stop
+        self.__path: list[int] = []
+        self.__nodes = 0
+        self.__stopped = False
+
+    def search(self, first_move: int, length: int) -> list[int] | None:
+        """
+        Searches for a solution of exactly the length that starts with the first move.
+
+        Raises a `TimeoutError` once the deadline passes.
+
+        :param first_move: The first move, as its index in `MOVES`
+        :param length: The length of the solution
+        :return: The moves of the solution, as their indices in `MOVES`, or None if there is none or the
+            search was stopped
+        """
+
+        indices = []
+        for database in self.__databases:
+            index = database.move(database.index(self.__cubie_cube), first_move)
+            if database.distance(index) >= length:
+                return None
+            indices.append(index)
+
+        self.__path = [first_move]
+        if self.__search(indices, length - 1) and not self.__stopped:
+            return self.__path
+
+        return None
+
+    def __search(self, indices: list[int], moves_left: int) -> bool:
+        """
+        Searches the paths of exactly the moves left from a state.
+
+        :param indices: The index of the state in every pattern database
+        :param moves_left: The amount of moves left
+        :return: Whether a solution was found along this path, or the search was stopped
+        """
+
+        path = self.__path
+        if moves_left == 0:
+            return self.__is_solved()
+
+        for move in FOLLOWING_MOVES[path[-1] // 3 + 1]:
+            self.__nodes += 1
+            if not self.__nodes % CHECK_INTERVAL and self.__should_stop():
+                self.__stopped = True
+                return True
+
+            next_indices = []
+            for database, index in zip(self.__databases, indices):
+                next_index = database.move(index, move)
+                if database.distance(next_index) >= moves_left:
+                    break
+                next_indices.append(next_index)
+            else:
+                path.append(move)
+                if self.__search(next_indices, moves_left - 1):
+                    return True
+                path.pop()
+
+        return False
+
+    def __is_solved(self) -> bool:
+        """
+        Checks whether the current path solves the cube.
+
+        The pattern databases all being at distance 0 only means their pieces are solved, which is
+        every piece for Korf's patterns, but not for every set of patterns.
+
+        :return: Whether the path solves the cube
+        """
+
+        cubie_cube = self.__cubie_cube
+        for move in self.__path:
+            cubie_cube = cubie_cube.multiply(get_cubie_move(MOVES[move].layer, MOVES[move].direction))
+
+        return is_solved(cubie_cube)
+
+    def __should_stop(self) -> bool:
+        """
+        Checks whether the search should stop, raising a `TimeoutError` once the deadline passes.
+
+        :return: Whether another search has already found a solution
+        """
+
+        if self.__deadline is not None and time.monotonic() > self.__deadline:
+            raise TimeoutError("The time budget ran out before an optimal solution was found.")
+
+        return self.__stop is not None and self.__stop.is_set()
+
+
+def share_pattern_databases(
+    patterns: tuple[tuple[CornerSlot, ...] | tuple[EdgeSlot, ...], ...],
+) -> tuple[SharedTable, ...]:
+    """
+    Publishes the pattern databases of a set of patterns into shared memory, loading or building them
+    first, unless an earlier search of the process published them already.
+
+    The databases stay published until the process exits, so every search after the first hands its
+    workers the same segments instead of copying the databases again.
+
+    :param patterns: The sets of pieces whose pattern databases are published
+    :return: The manifest of the tables of those databases, which the workers attach with
+    """
+
+    global _shared_databases
+
+    with _shared_databases_lock:
+        if _shared_databases is None:
+            _shared_databases = SharedTables()
+
+        published = {table.name for table in _shared_databases.manifest}
+        names = set()
+        for pattern in patterns:
+            database = get_pattern_database(pattern)
+            if f"{database.name}/{SHARED_PARTS[0]}" not in published:
+                database.share(_shared_databases)
+            names.update(f"{database.name}/{part}" for part in SHARED_PARTS)
+
+        return tuple(table for table in _shared_databases.manifest if table.name in names)
+
+
+def init_worker(solution_found: Event, manifest: tuple[SharedTable, ...]) -> None:
+    """
+    Initializes a worker of the pool with the event that tells it to stop, and attaches it to the
+    pattern databases in shared memory.
+
+    :param solution_found: The event set once any worker has found a solution
+    :param manifest: The shared tables of the pattern databases
+    :return: None
+    """
+
+    global _solution_found
+    _solution_found = solution_found
+    attach_shared_tables(manifest)
+
+
+def search_branch(
+    cubie_cube: CubieCube,
+    patterns: tuple[tuple[CornerSlot, ...] | tuple[EdgeSlot, ...], ...],
+    first_move: int,
+    length: int,
+    deadline: float | None,
+) -> list[int] | None:
+    """
+    Searches one branch of the root in a worker of the pool, stopping once another worker finds a solution.
+
+    :param cubie_cube: The cube to solve
+    :param patterns: The sets of pieces whose pattern databases prune the search
+    :param first_move: The first move, as its index in `MOVES`
+    :param length: The length of the solution
+    :param deadline: The `time.monotonic()` value to give up at, if any
+    :return: The moves of the solution, as their indices in `MOVES`, or None if there is none
+    """
+
+    return BranchSearch(cubie_cube, patterns, deadline, _solution_found).search(first_move, length)
+
+
+class OptimalSearch:
+    """
+    Korf's iterative deepening A* search for a shortest solution of a 3x3 cube, in face turns.
+
+    Every length from the largest distance the pattern databases give the cube is tried in turn, so the
+    first solution found is a shortest one. For every length the search is split at the root, one branch
+    per first move, and the branches run in a process pool. The pattern databases are loaded or built
+    in this process and published into shared memory before the first pool starts, and stay published
+    for the searches after it. The workers attach to them read-only, so they are in memory once however
+    many workers and searches there are. As soon as one branch finds a solution, an event tells the
+    other workers to stop.
+
+    Only the corners and edges take part, so the cube must have its centers in the solved color scheme.
+    """
+
+    def __init__(
+        self,
+        cubie_cube: CubieCube,
+        max_length: int = 20,
+        time_limit: float | None = None,
+        processes: int | None = None,
+        patterns: tuple[tuple[CornerSlot, ...] | tuple[EdgeSlot, ...], ...] = KORF_PATTERNS,
+    ) -> None:
+        """
+        Constructor for the `OptimalSearch` class.
+
+        :param cubie_cube: The cube to solve
+        :param max_length: The most moves the solution may have
+        :param time_limit: The most seconds the search may take, not counting building the pattern
+            databases, or None for no limit
+        :param processes: The amount of worker processes, the amount of CPUs by default. With 1, the
+            search runs in this process.
+        :param patterns: The sets of pieces whose pattern databases prune the search, at least one
+        :return: None
+        """
+
+        if not patterns:
+            raise ValueError("An optimal search needs at least one pattern database to prune with")
+
+        self.__cubie_cube = cubie_cube
+        self.__max_length = max_length
+        self.__time_limit = time_limit
+        self.__processes = processes or os.cpu_count() or 1
+        self.__patterns = patterns
+
+    def search(self) -> list[Move]:
+        """
+        Searches for a shortest solution.
+
+        Raises a `ValueError` if every solution is longer than the maximum length, and a `TimeoutError`
+        if the time budget runs out first.
+
+        :return: The moves of the solution
+        """
+
+        cubie_cube = self.__cubie_cube
+        databases = [get_pattern_database(pattern) for pattern in self.__patterns]
+        if is_solved(cubie_cube):
+            return []
+
+        lower_bound = max(1, max(database.distance(database.index(cubie_cube)) for database in databases))
+        deadline = None if self.__time_limit is None else time.monotonic() + self.__time_limit
+        lengths = range(lower_bound, self.__max_length + 1)
+
+        if self.__processes == 1:
+            solution = self.__search_here(lengths, deadline)
+        else:
+            solution = self.__search_in_pool(lengths, deadline)
+
+        if solution is None:
+            raise ValueError(f"No solution of at most {self.__max_length} moves was found.")
+
+        return [MOVES[move] for move in solution]
+
+    def __search_here(self, lengths: range, deadline: float | None) -> list[int] | None:
+        """
+        Searches every length in turn in this process, one branch after another.
+
+        :param lengths: The lengths to try, in order
+        :param deadline: The `time.monotonic()` value to give up at, if any
+        :return: The moves of the solution, as their indices in `MOVES`, or None if there is none
+        """
+
+        for length in lengths:
+            for first_move in range(len(MOVES)):
+                solution = BranchSearch(self.__cubie_cube, self.__patterns, deadline).search(first_move, length)
+                if solution is not None:
+                    return solution
+
+        return None
+
+    def __search_in_pool(self, lengths: range, deadline: float | None) -> list[int] | None:
+        """
+        Searches every length in turn, with the branches spread over a process pool.
+
+        :param lengths: The lengths to try, in order
+        :param deadline: The `time.monotonic()` value to give up at, if any
+        :return: The moves of the solution, as their indices in `MOVES`, or None if there is none
+        """
+
+        context = multiprocessing.get_context()
+        solution_found = context.Event()
+
+        with ProcessPoolExecutor(
+            self.__processes,
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(solution_found, share_pattern_databases(self.__patterns)),
+        ) as pool:
+            for length in lengths:
+                futures = [
+                    pool.submit(search_branch, self.__cubie_cube, self.__patterns, first_move, length, deadline)
+                    for first_move in range(len(MOVES))
+                ]
+                for future in as_completed(futures):
+                    try:
+                        solution = future.result()
+                    except TimeoutError:
+                        self.__stop_workers(solution_found, futures)
+                        raise
+
+                    if solution is not None:
+                        self.__stop_workers(solution_found, futures)
+                        return solution
+
+        return None
+
+    @staticmethod
+    def __stop_workers(solution_found: Event, futures: list[Future]) -> None:
+        """
+        Cancels the branches that have not started and tells the running ones to stop.
+
+        :param solution_found: The event the workers stop at
+        :param futures: The branches of the current length
+        :return: None
+        """
+
+        solution_found.set()
+        for future in futures:
+            future.cancel()
@@ -0,0 +1,322 @@
+# Python imports
+from functools import cache
+from math import perm
+
+# Third-party imports
+import numpy as np
+
+# Project imports
+from rubik_cube_solver.cubie_cube import CubieCube, get_cubie_move
+from rubik_cube_solver.enums.CornerSlot import CornerSlot
+from rubik_cube_solver.enums.EdgeSlot import EdgeSlot
+from rubik_cube_solver.solve.corner_search import CORNER_SLOTS
+from rubik_cube_solver.solve.cube_3x3.kociemba import MOVES
+from rubik_cube_solver.solve.edge_search import EDGE_SLOTS
+from rubik_cube_solver.solve.shared_tables import SharedTables, get_shared_table
+from rubik_cube_solver.solve.tables import breadth_first_search, get_table, pack_table, table_version
+
+# Korf's pattern databases: every corner, and the edges in two sets of six
+KORF_PATTERNS: tuple[tuple[CornerSlot, ...] | tuple[EdgeSlot, ...], ...] = (
+    CORNER_SLOTS,
+    EDGE_SLOTS[:6],
+    EDGE_SLOTS[6:],
+)
+
+# The tables of a database that `PatternDatabase.share` publishes, in the order of its constructor
+SHARED_PARTS: tuple[str, ...] = ("arrangement-moves", "orientation-moves", "orientation-sums", "distances")
+
+
+class PatternDatabase:
+    """
+    The least amount of moves that brings a set of corners, or a set of edges, of a 3x3 home.
+
+    A state of the database is where every piece of the set is and how it is oriented, in the numbering
+    and orientations of `CubieCube`. Its index is made of two coordinates, `arrangement * ORIENTATIONS +
+    orientation`: the arrangement is the rank of the slots of the pieces among all arrangements of that
+    many slots in lexicographic order, and the orientation holds the orientations of the pieces as
+    digits, in base 3 for corners and 2 for edges. When the set holds every corner, the orientation of
+    the last one follows from the rest and is left out.
+
+    A move takes an arrangement to another one through a move table, and adds to every piece the
+    orientation the move gives the slot it lands in. What it adds therefore depends on the arrangement
+    alone, so it is kept as an orientation coordinate of its own, and the sum of two orientation
+    coordinates is looked up in a table as well.
+
+    The distances are found by a breadth-first search over every state and kept at 4 bits each in a file
+    of the table directory, which later processes map instead of searching again, and every table of the
+    database can be published into shared memory for worker processes to attach to. Solving the whole
+    cube takes at least as many moves as solving any set of its pieces, so a database never
+    overestimates the moves left and can prune a search for the shortest solution.
+    """
+
+    def __init__(self, pieces: tuple[CornerSlot, ...] | tuple[EdgeSlot, ...]) -> None:
+        """
+        Constructor for the `PatternDatabase` class, which attaches to the database in shared memory,
+        loads it or builds it.
+
+        :param pieces: The pieces of the set, each named after the slot it sits in on a solved cube
+        :return: None
+        """
+
+        if all(isinstance(piece, CornerSlot) for piece in pieces):
+            slots, self.__base = CORNER_SLOTS, 3
+        elif all(isinstance(piece, EdgeSlot) for piece in pieces):
+            slots, self.__base = EDGE_SLOTS, 2
+        else:
+            raise ValueError(f"A pattern must be a set of corners or a set of edges, got {pieces}")
+
+        if not pieces or len(set(pieces)) != len(pieces):
+            raise ValueError(f"A pattern must hold at least one piece, each once, got {pieces}")
+
+        self.__pieces = pieces
+        self.__piece_indices = tuple(slots.index(piece) for piece in pieces)
+        self.__slot_amount = len(slots)
+        self.__orientation_digits = len(pieces) - (len(pieces) == len(slots))
+        self.__arrangements = perm(self.__slot_amount, len(pieces))
+        self.__orientations = self.__base**self.__orientation_digits
+
+        self.__name = "pattern-" + "-".join(piece.value for piece in pieces)
+
+        shared = [get_shared_table(f"{self.__name}/{part}") for part in SHARED_PARTS]
+        if all(table is not None for table in shared):
+            self.__arrangement_moves, self.__orientation_moves, self.__orientation_sums, distances = shared
+            self.__distances = memoryview(distances)
+        else:
+            self.__arrangement_moves, self.__orientation_moves = self.__build_move_tables()
+            self.__orientation_sums = self.__build_orientation_sums()
+            version = table_version(
+                self.__name.encode(), self.__arrangement_moves.tobytes(), self.__orientation_moves.tobytes()
+            )
+            self.__distances = get_table(self.__name, version, 4, self.size, self.__build)
+
+        # Flat views of the tables, whose items are read as plain integers during a search
+        self.__arrangement_move_items = memoryview(self.__arrangement_moves.ravel())
+        self.__orientation_move_items = memoryview(self.__orientation_moves.ravel())
+        self.__orientation_sum_items = memoryview(self.__orientation_sums.ravel())
+
+    @property
+    def name(self) -> str:
+        """
+        Name getter
+
+        :return: The name of the database, which names its file and its shared tables
+        """
+
+        return self.__name
+
+    @property
+    def pieces(self) -> tuple[CornerSlot, ...] | tuple[EdgeSlot, ...]:
+        """
+        Pieces getter
+
+        :return: The pieces of the set
+        """
+
+        return self.__pieces
+
+    @property
+    def size(self) -> int:
+        """
+        Size getter
+
+        :return: The amount of states
+        """
+
+        return self.__arrangements * self.__orientations
+
+    @property
+    def distances(self) -> memoryview:
+        """
+        Distances getter
+
+        :return: The distance of every state, two to a byte, the even index in the low 4 bits
+        """
+
+        return self.__distances
+
+    def share(self, shared_tables: SharedTables) -> None:
+        """
+        Publishes the tables of the database, so that the processes that attach to them find the
+        database there instead of loading or building it.
+
+        :param shared_tables: The shared tables to publish into
+        :return: None
+        """
+
+        tables = (self.__arrangement_moves, self.__orientation_moves, self.__orientation_sums, self.__distances)
+        for part, table in zip(SHARED_PARTS, tables):
+            shared_tables.publish(f"{self.__name}/{part}", table)
+
+    def index(self, cubie_cube: CubieCube) -> int:
+        """
+        Returns the index of the state of the set on a cube.
+
+        :param cubie_cube: The cube
+        :return: The index
+        """
+
+        if self.__base == 3:
+            permutation, orientations = cubie_cube.corner_permutation, cubie_cube.corner_orientation
+        else:
+            permutation, orientations = cubie_cube.edge_permutation, cubie_cube.edge_orientation
+
+        slots = [permutation.index(piece) for piece in self.__piece_indices]
+        arrangement = int(self.__encode_arrangements(np.array(slots)[:, None])[0])
+        orientation = 0
+        for slot in slots[: self.__orientation_digits]:
+            orientation = orientation * self.__base + orientations[slot]
+
+        return arrangement * self.__orientations + orientation
+
+    def move(self, index: int, move: int) -> int:
+        """
+        Returns the index a move takes a state to.
+
+        :param index: The index of the state
+        :param move: The move, as its index in `MOVES`
+        :return: The index of the state after the move
+        """
+
+        arrangement, orientation = divmod(index, self.__orientations)
+        item = arrangement * len(MOVES) + move
+        added = self.__orientation_move_items[item]
+        return (
+            self.__arrangement_move_items[item] * self.__orientations
+            + self.__orientation_sum_items[orientation * self.__orientations + added]
+        )
+
+    def distance(self, index: int) -> int:
+        """
+        Returns the least amount of moves that solves a state.
+
+        :param index: The index of the state
+        :return: The distance of the state
+        """
+
+        return self.__distances[index >> 1] >> ((index & 1) << 2) & 15
+
+    def __encode_arrangements(self, slots: np.ndarray) -> np.ndarray:
+        """
+        Returns the arrangement coordinate of every column of slots.
+
+        :param slots: The slot of every piece, one row per piece and one column per arrangement
+        :return: The coordinate of every column
+        """
+
+        arrangements = np.zeros(slots.shape[1], dtype=np.int64)
+        for position, row in enumerate(slots):
+            smaller = (slots[:position] < row).sum(axis=0)
+            arrangements = arrangements * (self.__slot_amount - position) + row - smaller
+
+        return arrangements
+
+    def __decode_arrangements(self) -> np.ndarray:
+        """
+        Returns the slots of every arrangement coordinate, the inverse of `__encode_arrangements`.
+
+        :return: The slot of every piece, one row per piece and one column per arrangement
+        """
+
+        piece_amount = len(self.__pieces)
+        ranks = np.arange(self.__arrangements)
+        digits = np.zeros((piece_amount, self.__arrangements), dtype=np.int64)
+        for position in range(piece_amount - 1, -1, -1):
+            ranks, digits[position] = np.divmod(ranks, self.__slot_amount - position)
+
+        # Digit `d` of a position is the slot after the first `d` slots not taken by an earlier piece
+        columns = np.arange(self.__arrangements)
+        free = np.ones((self.__slot_amount, self.__arrangements), dtype=bool)
+        slots = np.zeros((piece_amount, self.__arrangements), dtype=np.int64)
+        for position in range(piece_amount):
+            slots[position] = np.argmax(np.cumsum(free, axis=0) > digits[position], axis=0)
+            free[slots[position], columns] = False
+
+        return slots
+
+    def __build_move_tables(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Builds the arrangement every move takes every arrangement to, and the orientation coordinate the
+        move adds to the pieces on the way.
+
+        :return: The arrangement and orientation move tables, one row per arrangement
+        """
+
+        slots = self.__decode_arrangements()
+        arrangement_moves = np.zeros((self.__arrangements, len(MOVES)), dtype=np.int32)
+        orientation_moves = np.zeros((self.__arrangements, len(MOVES)), dtype=np.int32)
+        for index, move in enumerate(MOVES):
+            cubie_move = get_cubie_move(move.layer, move.direction)
+            if self.__base == 3:
+                sources, added = cubie_move.corner_permutation, cubie_move.corner_orientation
+            else:
+                sources, added = cubie_move.edge_permutation, cubie_move.edge_orientation
+
+            # The slot the piece in every slot lands in, and the orientation it gains there
+            destinations = np.zeros(self.__slot_amount, dtype=np.int64)
+            destinations[list(sources)] = range(self.__slot_amount)
+            landed = destinations[slots]
+            gained = np.array(added)[landed]
+
+            arrangement_moves[:, index] = self.__encode_arrangements(landed)
+            codes = np.zeros(self.__arrangements, dtype=np.int64)
+            for row in gained[: self.__orientation_digits]:
+                codes = codes * self.__base + row
+            orientation_moves[:, index] = codes
+
+        return arrangement_moves, orientation_moves
+
+    def __build_orientation_sums(self) -> np.ndarray:
+        """
+        Builds the sum of every two orientation coordinates, digit by digit.
+
+        :return: The sums, one row per first and one column per second coordinate
+        """
+
+        codes = np.arange(self.__orientations)
+        sums = np.zeros((self.__orientations, self.__orientations), dtype=np.int32)
+        weight = 1
+        for _ in range(self.__orientation_digits):
+            codes, digits = np.divmod(codes, self.__base)
+            sums += (digits[:, None] + digits[None, :]) % self.__base * weight
+            weight *= self.__base
+
+        return sums
+
+    def __neighbors(self, indices: np.ndarray, move: int) -> np.ndarray:
+        """
+        Returns the states a move takes every one of the states to, for the breadth-first search.
+
+        :param indices: The indices of the states
+        :param move: The move, as its index in `MOVES`
+        :return: The indices of the states after the move
+        """
+
+        arrangements, orientations = np.divmod(indices, self.__orientations)
+        neighbors = self.__arrangement_moves[arrangements, move].astype(np.int64) * self.__orientations
+        return neighbors + self.__orientation_sums[orientations, self.__orientation_moves[arrangements, move]]
+
+    def __build(self) -> bytes:
+        """
+        Finds the distance of every state with a breadth-first search from the solved state.
+
+        :return: The distances, two to a byte
+        """
+
+        solved = int(self.__encode_arrangements(np.array(self.__piece_indices)[:, None])[0])
+        distances = breadth_first_search(self.size, solved * self.__orientations, len(MOVES), self.__neighbors)
+        return pack_table(distances, 4)
+
+
+@cache
+def get_pattern_database(pieces: tuple[CornerSlot, ...] | tuple[EdgeSlot, ...]) -> PatternDatabase:
+    """
+    Returns the pattern database of a set of pieces, loading or building it on first use.
+
+    The database is kept for the rest of the process, so only the first search that needs it pays for
+    it. A worker process attached to the tables `PatternDatabase.share` published finds it there.
+
+    :param pieces: The pieces of the set
+    :return: The pattern database
+    """
+
+    return PatternDatabase(pieces)
@@ -1,5 +1,6 @@
 # Project imports
 from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import AlgorithmTable
 from rubik_cube_solver.enums.CornerSlot import CornerSlot
 from rubik_cube_solver.enums.EdgeSlot import EdgeSlot
 from rubik_cube_solver.enums.Layer import Layer
@@ -324,6 +325,9 @@ PLL_TABLE: dict[tuple[tuple[int, ...], tuple[int, ...]], str] = {
     ((3, 2, 1, 0), (3, 2, 1, 0)): "R U R' U R U R' F' R U R' U' R' F R2 U' R' U2 R U' R' U",
 }
 
+# The algorithms of `PLL_TABLE`, each parsed the first time it is looked up.
+PLL_ALGORITHMS: AlgorithmTable[tuple[tuple[int, ...], tuple[int, ...]]] = AlgorithmTable(PLL_TABLE, 3)
+
 
 def up_corner_permutation(cube: Cube) -> tuple[int, ...]:
     """
@@ -344,7 +348,7 @@ def up_corner_permutation(cube: Cube) -> tuple[int, ...]:
     ]
 
     return tuple(
-        home_colors.index(frozenset(cube.layers[layer][sticker] for layer, sticker in stickers))
+        home_colors.index(frozenset(cube.read_layers()[layer][sticker] for layer, sticker in stickers))
         for stickers in PLL_UP_CORNER_STICKERS.values()
     )
 
@@ -363,4 +367,6 @@ def up_edge_permutation(cube: Cube) -> tuple[int, ...]:
 
     home_colors = [face_center_color(cube, layer) for layer, _ in PLL_UP_EDGE_STICKERS.values()]
 
-    return tuple(home_colors.index(cube.layers[layer][sticker]) for layer, sticker in PLL_UP_EDGE_STICKERS.values())
+    return tuple(
+        home_colors.index(cube.read_layers()[layer][sticker]) for layer, sticker in PLL_UP_EDGE_STICKERS.values()
+    )
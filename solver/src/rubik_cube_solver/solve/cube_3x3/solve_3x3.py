@@ -3,31 +3,35 @@ from typing import Callable
 
 # Project imports
 from rubik_cube_solver.cube import Cube
-from rubik_cube_solver.cube_rotation.algorithm import Algorithm
 from rubik_cube_solver.enums.Color import Color
+from rubik_cube_solver.enums.CornerSlot import CornerSlot
 from rubik_cube_solver.enums.EdgeSlot import EdgeSlot
 from rubik_cube_solver.enums.Layer import Layer
-from rubik_cube_solver.solve.corner_search import search_corner
+from rubik_cube_solver.enums.Rotation import Rotation
+from rubik_cube_solver.solve.corner_search import CornerSearchResult, search_corner
 from rubik_cube_solver.solve.cube_3x3.cross import (
-    CROSS_ALIGNMENT_TABLE,
-    CROSS_EXTRACTION_TABLE,
-    CROSS_INSERTION_TABLE,
-    CROSS_ORIENTATION_TABLE,
+    CROSS_ALIGNMENT_ALGORITHMS,
+    CROSS_EXTRACTION_ALGORITHMS,
+    CROSS_INSERTION_ALGORITHMS,
+    CROSS_ORIENTATION_ALGORITHMS,
     face_center_color,
     find_yellow_center_layer,
 )
 from rubik_cube_solver.solve.cube_3x3.f2l import (
-    F2L_CORNER_ALIGNMENT_TABLE,
-    F2L_CORNER_EXTRACTION_TABLE,
-    F2L_EDGE_EXTRACTION_TABLE,
-    F2L_PAIR_INSERTION_TABLE,
+    F2L_CORNER_ALIGNMENT_ALGORITHMS,
+    F2L_CORNER_EXTRACTION_ALGORITHMS,
+    F2L_EDGE_EXTRACTION_ALGORITHMS,
+    F2L_FRONT_RIGHT_EDGE_STICKER,
+    F2L_PAIR_INSERTION_ALGORITHMS,
+    F2L_SLOT_ROTATION_ALGORITHMS,
     front_color_on_up,
     is_pair_solved,
 )
-from rubik_cube_solver.solve.cube_3x3.oll import OLL_TABLE, up_corner_orientations, up_edge_orientations
-from rubik_cube_solver.solve.cube_3x3.pll import PLL_TABLE, up_corner_permutation, up_edge_permutation
-from rubik_cube_solver.solve.edge_search import search_edge
-from rubik_cube_solver.solve.solve import Solve
+from rubik_cube_solver.solve.cube_3x3.oll import OLL_ALGORITHMS, up_corner_orientations, up_edge_orientations
+from rubik_cube_solver.solve.cube_3x3.pll import PLL_ALGORITHMS, up_corner_permutation, up_edge_permutation
+from rubik_cube_solver.solve.edge_search import EdgeSearchResult, search_edge
+from rubik_cube_solver.solve.piece_tracker import PieceTracker
+from rubik_cube_solver.solve.solve import Y_ROTATION, Solve, SolveCheckpoint
 
 
 class Solve3x3(Solve):
@@ -41,13 +45,20 @@ class Solve3x3(Solve):
     white-up / yellow-down. A cube that started in another orientation is solved in the orientation
     the cross rotated it into, so every face ends up showing one color but not necessarily the one
     it started with.
+
+    With `f2l_lookahead`, the first two layers are solved in whichever order of the four pairs leads
+    to the fewest moves, instead of always going around the cube with `y`. With `track_pieces`, a
+    `PieceTracker` follows the moves of the solver, and the cross and the first two layers find their
+    pieces by looking them up in it instead of reading the whole cube every time.
     """
 
-    def __init__(self, cube: Cube) -> None:
+    def __init__(self, cube: Cube, f2l_lookahead: bool = False, track_pieces: bool = False) -> None:
         """
         Constructor for the `Solve3x3` class.
 
         :param cube: The 3x3 cube to solve
+        :param f2l_lookahead: Whether to try every order of the F2L pairs and keep the shortest
+        :param track_pieces: Whether to keep track of the pieces as the cube moves, to find them faster
         :return: None
         """
 
@@ -55,6 +66,42 @@ class Solve3x3(Solve):
             raise ValueError(f"Solve3x3 supports only 3x3 cubes, got size {cube.size}")
 
         super().__init__(cube)
+        self.__f2l_lookahead = f2l_lookahead
+        # The fewest layer turns an order of the F2L pairs has led to so far, and where it left off
+        self.__best_f2l: tuple[int, SolveCheckpoint] | None = None
+        self.__track_pieces = track_pieces
+        # Set as the listener of the rotator on the first search, once the cube has been validated
+        self.__tracker: PieceTracker | None = None
+
+    @property
+    def f2l_lookahead(self) -> bool:
+        """
+        F2L lookahead getter
+
+        :return: Whether every order of the F2L pairs is tried
+        """
+
+        return self.__f2l_lookahead
+
+    @property
+    def track_pieces(self) -> bool:
+        """
+        Track pieces getter
+
+        :return: Whether the pieces are kept track of as the cube moves
+        """
+
+        return self.__track_pieces
+
+    @property
+    def tracker(self) -> PieceTracker | None:
+        """
+        Tracker getter
+
+        :return: The tracker of the pieces, or None if they are not tracked or not searched for yet
+        """
+
+        return self.__tracker
 
     def _steps(self) -> list[Callable[[], None]]:
         """
@@ -76,11 +123,11 @@ class Solve3x3(Solve):
         :return: None
         """
 
-        self._apply(Algorithm.from_str(CROSS_ORIENTATION_TABLE[find_yellow_center_layer(self.cube)]))
+        self._apply(CROSS_ORIENTATION_ALGORITHMS[find_yellow_center_layer(self.cube)])
 
         for _ in range(4):
             self._solve_cross_edge()
-            self._apply(Algorithm.from_str("y"))
+            self._apply(Y_ROTATION)
 
     def _solve_cross_edge(self) -> None:
         """
@@ -95,33 +142,85 @@ class Solve3x3(Solve):
         """
 
         front_color = face_center_color(self.cube, Layer.FRONT)
-        slot, is_good = search_edge(self.cube, Color.YELLOW, front_color)
+        slot, is_good = self.__search_edge(Color.YELLOW, front_color)
 
         if slot is EdgeSlot.DF and is_good:
             return
 
-        if slot in CROSS_EXTRACTION_TABLE:
-            self._apply(Algorithm.from_str(CROSS_EXTRACTION_TABLE[slot]))
+        if slot in CROSS_EXTRACTION_ALGORITHMS:
+            self._apply(CROSS_EXTRACTION_ALGORITHMS[slot])
 
-        slot, _ = search_edge(self.cube, Color.YELLOW, front_color)
-        self._apply(Algorithm.from_str(CROSS_ALIGNMENT_TABLE[slot]))
+        slot, _ = self.__search_edge(Color.YELLOW, front_color)
+        self._apply(CROSS_ALIGNMENT_ALGORITHMS[slot])
 
-        _, is_good = search_edge(self.cube, Color.YELLOW, front_color)
-        self._apply(Algorithm.from_str(CROSS_INSERTION_TABLE[is_good]))
+        _, is_good = self.__search_edge(Color.YELLOW, front_color)
+        self._apply(CROSS_INSERTION_ALGORITHMS[is_good])
 
     def _f2l(self) -> None:
         """
         Solves the first two layers, on top of the cross the previous step leaves on DOWN.
 
         The four corner and edge pairs are solved in turn, rotating the whole cube with `y` after
-        each one so the next pair comes to the front-right slot.
+        each one so the next pair comes to the front-right slot. With the lookahead, every order of
+        the pairs is tried instead, and the cube and solution are left where the best one ends.
 
         :return: None
         """
 
+        if self.__f2l_lookahead:
+            self.__best_f2l = None
+            self.__search_f2l_orders((0, 1, 2, 3), 0)
+            self._restore(self.__best_f2l[1])
+            return
+
         for _ in range(4):
             self._solve_f2l_pair()
-            self._apply(Algorithm.from_str("y"))
+            self._apply(Y_ROTATION)
+
+    def __search_f2l_orders(self, slots: tuple[int, ...], rotation: int) -> None:
+        """
+        Tries every order of the F2L pairs left, depth first, keeping the one whose whole solution has
+        the fewest layer turns in `__best_f2l`.
+
+        Each pair is solved with the table-driven `_solve_f2l_pair`, on the cube itself, and undone by
+        restoring a checkpoint, which shares the cube's storage instead of copying it. An order is
+        abandoned as soon as its turns reach the best whole solution found so far. Once all four pairs
+        are solved, the cube is turned back to the orientation the step started in, and the last layer
+        is solved as well to count the turns of the whole solution, since the order of the pairs
+        decides the last layer case too.
+
+        :param slots: The slots left, as the amount of `y` turns from the front-right slot the step
+            started with
+        :param rotation: The amount of `y` turns the cube is rotated by since the step started
+        :return: None
+        """
+
+        if not slots:
+            self._apply(F2L_SLOT_ROTATION_ALGORITHMS[-rotation % 4])
+            checkpoint = self._checkpoint()
+            self._oll()
+            self._pll()
+            turn_count = self.__turn_count()
+            if self.__best_f2l is None or turn_count < self.__best_f2l[0]:
+                self.__best_f2l = (turn_count, checkpoint)
+            return
+
+        for slot in slots:
+            checkpoint = self._checkpoint()
+            self._apply(F2L_SLOT_ROTATION_ALGORITHMS[(slot - rotation) % 4])
+            self._solve_f2l_pair()
+            if self.__best_f2l is None or self.__turn_count() < self.__best_f2l[0]:
+                self.__search_f2l_orders(tuple(left for left in slots if left != slot), slot)
+            self._restore(checkpoint)
+
+    def __turn_count(self) -> int:
+        """
+        Counts the layer turns of the solution so far, leaving out whole-cube rotations.
+
+        :return: The amount of layer turns
+        """
+
+        return sum(not isinstance(move.layer, Rotation) for move in self.solution.moves)
 
     def _solve_f2l_pair(self) -> None:
         """
@@ -139,31 +238,92 @@ class Solve3x3(Solve):
         front_color = face_center_color(self.cube, Layer.FRONT)
         right_color = face_center_color(self.cube, Layer.RIGHT)
 
-        if is_pair_solved(self.cube, front_color, right_color):
+        if self.__is_pair_solved(front_color, right_color):
             return
 
-        corner_slot, _ = search_corner(self.cube, Color.YELLOW, front_color, right_color)
-        if corner_slot in F2L_CORNER_EXTRACTION_TABLE:
-            self._apply(Algorithm.from_str(F2L_CORNER_EXTRACTION_TABLE[corner_slot]))
+        corner_slot, _ = self.__search_corner(Color.YELLOW, front_color, right_color)
+        if corner_slot in F2L_CORNER_EXTRACTION_ALGORITHMS:
+            self._apply(F2L_CORNER_EXTRACTION_ALGORITHMS[corner_slot])
+
+        corner_slot, _ = self.__search_corner(Color.YELLOW, front_color, right_color)
+        self._apply(F2L_CORNER_ALIGNMENT_ALGORITHMS[corner_slot])
+
+        edge_slot, _ = self.__search_edge(front_color, right_color)
+        if edge_slot in F2L_EDGE_EXTRACTION_ALGORITHMS:
+            self._apply(F2L_EDGE_EXTRACTION_ALGORITHMS[edge_slot])
+
+        corner_slot, _ = self.__search_corner(Color.YELLOW, front_color, right_color)
+        self._apply(F2L_CORNER_ALIGNMENT_ALGORITHMS[corner_slot])
+
+        _, orientation = self.__search_corner(Color.YELLOW, front_color, right_color)
+        edge_slot, _ = self.__search_edge(front_color, right_color)
+        self._apply(F2L_PAIR_INSERTION_ALGORITHMS[(orientation, edge_slot, front_color_on_up(self.cube, edge_slot))])
+
+    def __search_corner(self, first_color: Color, second_color: Color, third_color: Color) -> CornerSearchResult:
+        """
+        Finds a corner piece, in the tracker if the pieces are tracked and on the cube otherwise.
+
+        :param first_color: The first color of the corner piece
+        :param second_color: The second color of the corner piece
+        :param third_color: The third color of the corner piece
+        :return: The slot of the corner piece and its orientation
+        """
+
+        if not self.__track_pieces:
+            return search_corner(self.cube, first_color, second_color, third_color, self.piece_search_counter)
 
-        corner_slot, _ = search_corner(self.cube, Color.YELLOW, front_color, right_color)
-        self._apply(Algorithm.from_str(F2L_CORNER_ALIGNMENT_TABLE[corner_slot]))
+        return self.__get_tracker().search_corner(first_color, second_color, third_color, self.piece_search_counter)
 
-        edge_slot, _ = search_edge(self.cube, front_color, right_color)
-        if edge_slot in F2L_EDGE_EXTRACTION_TABLE:
-            self._apply(Algorithm.from_str(F2L_EDGE_EXTRACTION_TABLE[edge_slot]))
+    def __search_edge(self, first_color: Color, second_color: Color) -> EdgeSearchResult:
+        """
+        Finds an edge piece, in the tracker if the pieces are tracked and on the cube otherwise.
+
+        :param first_color: The first color of the edge piece
+        :param second_color: The second color of the edge piece
+        :return: The slot of the edge piece and whether it is oriented
+        """
 
-        corner_slot, _ = search_corner(self.cube, Color.YELLOW, front_color, right_color)
-        self._apply(Algorithm.from_str(F2L_CORNER_ALIGNMENT_TABLE[corner_slot]))
+        if not self.__track_pieces:
+            return search_edge(self.cube, first_color, second_color, self.piece_search_counter)
 
-        _, orientation = search_corner(self.cube, Color.YELLOW, front_color, right_color)
-        edge_slot, _ = search_edge(self.cube, front_color, right_color)
-        self._apply(
-            Algorithm.from_str(
-                F2L_PAIR_INSERTION_TABLE[(orientation, edge_slot, front_color_on_up(self.cube, edge_slot))]
-            )
+        return self.__get_tracker().search_edge(first_color, second_color, self.piece_search_counter)
+
+    def __is_pair_solved(self, front_color: Color, right_color: Color) -> bool:
+        """
+        Returns whether the pair of the given two colors already fills the front-right slot, like
+        `is_pair_solved` does.
+
+        :param front_color: The color of the FRONT center
+        :param right_color: The color of the RIGHT center
+        :return: Whether the corner sits oriented in DFR and the edge sits oriented in FR
+        """
+
+        if not self.__track_pieces:
+            return is_pair_solved(self.cube, front_color, right_color, self.piece_search_counter)
+
+        corner_slot, orientation = self.__search_corner(Color.YELLOW, front_color, right_color)
+        edge_slot, _ = self.__search_edge(front_color, right_color)
+
+        return (
+            corner_slot is CornerSlot.DFR
+            and orientation == 0
+            and edge_slot is EdgeSlot.FR
+            and self.cube.read_layers()[Layer.FRONT][F2L_FRONT_RIGHT_EDGE_STICKER] == front_color
         )
 
+    def __get_tracker(self) -> PieceTracker:
+        """
+        Returns the tracker of the pieces, setting it as the listener of the rotator on first use.
+
+        :return: The tracker
+        """
+
+        if self.__tracker is None:
+            self.__tracker = PieceTracker()
+            self.rotator.listener = self.__tracker
+
+        return self.__tracker
+
     def _oll(self) -> None:
         """
         Orients the last layer, so the whole UP face ends up showing the UP center's color.
@@ -177,7 +337,7 @@ class Solve3x3(Solve):
         """
 
         case = (up_corner_orientations(self.cube), up_edge_orientations(self.cube))
-        self._apply(Algorithm.from_str(OLL_TABLE[case]))
+        self._apply(OLL_ALGORITHMS[case])
 
     def _pll(self) -> None:
         """
@@ -192,4 +352,4 @@ class Solve3x3(Solve):
         """
 
         case = (up_corner_permutation(self.cube), up_edge_permutation(self.cube))
-        self._apply(Algorithm.from_str(PLL_TABLE[case]))
+        self._apply(PLL_ALGORITHMS[case])
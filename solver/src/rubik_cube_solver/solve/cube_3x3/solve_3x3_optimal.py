@@ -0,0 +1,109 @@
+# Python imports
+from typing import Callable
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cubie_cube import CubieCube
+from rubik_cube_solver.enums.CornerSlot import CornerSlot
+from rubik_cube_solver.enums.EdgeSlot import EdgeSlot
+from rubik_cube_solver.solve.cube_3x3.optimal import OptimalSearch
+from rubik_cube_solver.solve.cube_3x3.pattern_database import KORF_PATTERNS
+from rubik_cube_solver.solve.solve import Solve, find_orientation
+
+# The most seconds a search may take unless the solver is given another time limit, not counting building
+# the pattern databases. Most scrambles are solved well within it, and the deepest ones fail fast instead of
+# searching for hours.
+DEFAULT_TIME_LIMIT: float = 60.0
+
+
+class Solve3x3Optimal(Solve):
+    """
+    Optimal solver for the 3x3 cube.
+
+    The cube is first rotated into the color scheme of a default `Cube(3)`, like in `Solve3x3Kociemba`,
+    and then solved by `OptimalSearch`, which finds a shortest solution in face turns. The pattern
+    databases of the search are built on first use and shared by every solver in the process. With
+    Korf's patterns they take the better part of a minute and about half a gigabyte to build, and a
+    deep scramble can take far longer than that to solve, so the search gives up with a `TimeoutError`
+    after `DEFAULT_TIME_LIMIT` seconds unless it is given another time limit.
+    """
+
+    def __init__(
+        self,
+        cube: Cube,
+        max_length: int = 20,
+        time_limit: float | None = DEFAULT_TIME_LIMIT,
+        processes: int | None = None,
+        patterns: tuple[tuple[CornerSlot, ...] | tuple[EdgeSlot, ...], ...] = KORF_PATTERNS,
+    ) -> None:
+        """
+        Constructor for the `Solve3x3Optimal` class.
+
+        :param cube: The 3x3 cube to solve
+        :param max_length: The most moves the solution may have, not counting whole-cube rotations
+        :param time_limit: The most seconds the search may take, `DEFAULT_TIME_LIMIT` by default, or None for
+            no limit
+        :param processes: The amount of worker processes, the amount of CPUs by default
+        :param patterns: The sets of pieces whose pattern databases prune the search
+        :return: None
+        """
+
+        if cube.size != 3:
+            raise ValueError(f"Solve3x3Optimal supports only 3x3 cubes, got size {cube.size}")
+
+        super().__init__(cube)
+        self.__max_length = max_length
+        self.__time_limit = time_limit
+        self.__processes = processes
+        self.__patterns = patterns
+
+    @property
+    def max_length(self) -> int:
+        """
+        Max length getter
+
+        :return: The most moves the solution may have
+        """
+
+        return self.__max_length
+
+    @property
+    def time_limit(self) -> float | None:
+        """
+        Time limit getter
+
+        :return: The most seconds the search may take, or None for no limit
+        """
+
+        return self.__time_limit
+
+    def _steps(self) -> list[Callable[[], None]]:
+        """
+        The ordered solving steps for a 3x3 cube.
+
+        :return: The ordered solving steps
+        """
+
+        return [self._orientation, self._optimal]
+
+    def _orientation(self) -> None:
+        """
+        Rotates the whole cube so that every center shows its color on a default `Cube(3)`.
+
+        :return: None
+        """
+
+        self._apply(find_orientation(self.cube))
+
+    def _optimal(self) -> None:
+        """
+        Solves the oriented cube with a shortest solution.
+
+        :return: None
+        """
+
+        moves = OptimalSearch(
+            CubieCube.from_cube(self.cube), self.__max_length, self.__time_limit, self.__processes, self.__patterns
+        ).search()
+        self._apply(Algorithm(moves))
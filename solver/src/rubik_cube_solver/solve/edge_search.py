@@ -5,6 +5,7 @@ from typing import NamedTuple
 from rubik_cube_solver.cube import Cube
 from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.EdgeSlot import EdgeSlot
+from rubik_cube_solver.solve.observer import PieceSearchCounter
 from rubik_cube_solver.validator.validator_constants import EDGE_CANONICAL_ORIENTATION, VALID_EDGE_COLOR_SETS
 from rubik_cube_solver.validator.validator_utils import get_edges
 
@@ -36,7 +37,9 @@ class EdgeSearchResult(NamedTuple):
     is_good: bool
 
 
-def search_edge(cube: Cube, first_color: Color, second_color: Color) -> EdgeSearchResult:
+def search_edge(
+    cube: Cube, first_color: Color, second_color: Color, counter: PieceSearchCounter | None = None
+) -> EdgeSearchResult:
     """
     Searches an odd-sized cube for the middle edge piece with the given two colors.
 
@@ -48,9 +51,13 @@ def search_edge(cube: Cube, first_color: Color, second_color: Color) -> EdgeSear
     :param cube: The Cube instance to search
     :param first_color: The first color of the edge piece
     :param second_color: The second color of the edge piece
+    :param counter: The counter of the piece searches of the solve, or None to count nothing
     :return: The slot of the edge piece and whether it is oriented
     """
 
+    if counter is not None:
+        counter.count += 1
+
     if cube.size % 2 == 0:
         raise ValueError(f"Edge search is supported only on odd-sized cubes, got size {cube.size}")
 
@@ -0,0 +1,102 @@
+# Python imports
+from typing import NamedTuple
+
+
+class PieceSearchCounter:
+    """
+    Counts the piece searches of a solve.
+
+    A solver with an observer creates one as `solve()` starts and hands it to every piece search, which
+    adds one to it. Without an observer the searches are handed None, so they count nothing, and whether
+    to count is decided once per solve rather than on every search.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the `PieceSearchCounter` class.
+
+        :return: None
+        """
+
+        self.count = 0
+
+
+class StepEvent(NamedTuple):
+    """
+    An event of a step of `Solve.solve`: the name of the step, the `time.perf_counter()` value it
+    started at, and what it took.
+
+    The solve is measured in steps: `validate`, every step of the solver named after its method without
+    the leading underscore, such as `cross` or `f2l`, and `simplify`. An event at the start of a step
+    has every measurement at 0. At the end it has the seconds the step took, the amount of moves it
+    added to the solution, which is negative when moves cancel, the `_apply` calls it made, the piece
+    searches it ran, and the moves it performed on the cube, rotations included.
+    """
+
+    step: str
+    start_time: float
+    wall_time: float
+    moves_added: int
+    apply_calls: int
+    piece_searches: int
+    cube_turns: int
+
+
+class SolveObserver:
+    """
+    Receives the events of the steps of `Solve.solve`, once it is set as the `observer` of a solver.
+
+    Both methods do nothing, so a subclass overrides only the ones it needs. A solver without an
+    observer measures nothing and sends no events.
+    """
+
+    def on_step_start(self, event: StepEvent) -> None:
+        """
+        Called as a step starts.
+
+        :param event: The event, with every measurement at 0
+        :return: None
+        """
+
+    def on_step_end(self, event: StepEvent) -> None:
+        """
+        Called as a step ends.
+
+        :param event: The event, with what the step took
+        :return: None
+        """
+
+
+class StepRecorder(SolveObserver):
+    """
+    Observer that keeps the event at the end of every step, in order.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the `StepRecorder` class.
+
+        :return: None
+        """
+
+        self.__events: list[StepEvent] = []
+
+    @property
+    def events(self) -> list[StepEvent]:
+        """
+        Events getter
+
+        :return: The event at the end of every step so far
+        """
+
+        return self.__events
+
+    def on_step_end(self, event: StepEvent) -> None:
+        """
+        Keeps the event at the end of a step.
+
+        :param event: The event
+        :return: None
+        """
+
+        self.__events.append(event)
@@ -0,0 +1,358 @@
+# Python imports
+from functools import cache, lru_cache
+from operator import eq
+from typing import NamedTuple
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.rotator import RotatorListener
+from rubik_cube_solver.cubie_cube import CORNER_PIECE_INDICES, EDGE_PIECE_INDICES, SOLVED_CENTERS, CubieCube
+from rubik_cube_solver.enums.Color import Color
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.solve.corner_search import CORNER_SLOTS, CornerSearchResult
+from rubik_cube_solver.solve.edge_search import EDGE_SLOTS, EdgeSearchResult
+from rubik_cube_solver.solve.observer import PieceSearchCounter
+from rubik_cube_solver.solve.solve import ORIENTATION_ALGORITHMS
+
+# The amount of corner and edge pieces of a 3x3, which are all solved on a solved cube
+PIECE_COUNT = 20
+
+# A piece is kept as a single code: its number times the amount of orientations it has, plus its
+# orientation. The code a twist of each orientation turns every code into, for corners and for edges.
+CORNER_TWISTS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(code - code % 3 + (code % 3 + twist) % 3 for code in range(24)) for twist in range(3)
+)
+EDGE_FLIPS: tuple[tuple[int, ...], ...] = tuple(
+    tuple(code - code % 2 + (code % 2 + flip) % 2 for code in range(24)) for flip in range(2)
+)
+
+
+class PieceMove(NamedTuple):
+    """
+    A move of a 3x3 as a permutation of its pieces: for every corner and edge slot whose piece it
+    changes, the slot, the slot its piece comes from and the twist it takes on the way, and for every
+    center, the position it comes from. A move that turns the whole cube keeps every solved piece solved.
+    """
+
+    corners: tuple[tuple[int, int, int], ...]
+    edges: tuple[tuple[int, int, int], ...]
+    centers: tuple[int, ...]
+    whole_cube: bool
+
+
+class TrackerState(NamedTuple):
+    """
+    The pieces a `PieceTracker` keeps: the code of the piece in every corner and edge slot, the solved
+    color position of every center and the amount of solved pieces.
+    """
+
+    corners: tuple[int, ...]
+    edges: tuple[int, ...]
+    centers: tuple[int, ...]
+    solved_count: int
+
+
+@lru_cache(maxsize=1024)
+def get_piece_move(permutation: tuple[int, ...]) -> PieceMove:
+    """
+    Returns the piece permutation of a 3x3 sticker permutation, creating it on first use.
+
+    The permutation is performed on a solved cube and read back as a cubie cube, like `get_cubie_move`
+    does, so any algorithm a rotator compiles becomes a single permutation of the pieces.
+
+    :param permutation: The permutation of the stickers
+    :return: The piece permutation
+    """
+
+    cube = Cube(3)
+    cube.permute(permutation)
+    cubie_cube = CubieCube.from_cube(cube)
+    centers = tuple(SOLVED_CENTERS.index(center) for center in cubie_cube.centers)
+    return PieceMove(
+        tuple(
+            (slot, source, twist)
+            for slot, (source, twist) in enumerate(zip(cubie_cube.corner_permutation, cubie_cube.corner_orientation))
+            if (source, twist) != (slot, 0)
+        ),
+        tuple(
+            (slot, source, flip)
+            for slot, (source, flip) in enumerate(zip(cubie_cube.edge_permutation, cubie_cube.edge_orientation))
+            if (source, flip) != (slot, 0)
+        ),
+        centers,
+        encode(cubie_cube) == get_solved_states()[centers],
+    )
+
+
+def encode(cubie_cube: CubieCube) -> TrackerState:
+    """
+    Encodes the pieces of a cubie cube as the state of a tracker.
+
+    :param cubie_cube: The cubie cube
+    :return: The state, with no pieces counted as solved
+    """
+
+    return TrackerState(
+        tuple(
+            piece * 3 + orientation
+            for piece, orientation in zip(cubie_cube.corner_permutation, cubie_cube.corner_orientation)
+        ),
+        tuple(
+            piece * 2 + orientation
+            for piece, orientation in zip(cubie_cube.edge_permutation, cubie_cube.edge_orientation)
+        ),
+        tuple(SOLVED_CENTERS.index(center) for center in cubie_cube.centers),
+        0,
+    )
+
+
+@cache
+def get_solved_states() -> dict[tuple[int, ...], TrackerState]:
+    """
+    Returns the state of a solved cube for every orientation of the centers, creating them on first use.
+
+    :return: The solved state, by the solved color position of every center
+    """
+
+    solved_states = {}
+    for algorithm in ORIENTATION_ALGORITHMS:
+        solved = CubieCube()
+        solved.apply(algorithm)
+        state = encode(solved)
+        solved_states[state.centers] = state
+
+    return solved_states
+
+
+class PieceTracker(RotatorListener):
+    """
+    Keeps the slot and orientation of every piece of a 3x3 as a rotator turns it.
+
+    Once it is set as the `listener` of a rotator, it reads the pieces of the cube once, and then
+    follows every move the rotator makes through the piece permutation of the move, which is worked out
+    once per sticker permutation and only touches the slots the move changes. The slot of every piece is
+    kept as well, so a piece is found by looking it up, instead of reading every corner or edge of the
+    cube, and the solved pieces are counted as the cube moves, from the slots a move changes, so whether
+    it is solved is known without reading it. A piece counts as solved when it sits in the slot and
+    orientation it has on a solved cube with the same centers, so whole-cube rotations keep a solved
+    cube solved. The pieces are kept in the checkpoints of the rotator, so restoring one does not read
+    the cube again.
+
+    Only the moves of the rotator are followed: a cube changed in any other way must be handed to
+    `on_reset`.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the `PieceTracker` class. The pieces are those of a solved cube until it is
+        set as the listener of a rotator.
+
+        :return: None
+        """
+
+        solved = get_solved_states()[tuple(range(len(Layer)))]
+        self.__corners = list(solved.corners)
+        self.__edges = list(solved.edges)
+        self.__centers = solved.centers
+        self.__solved_count = PIECE_COUNT
+        self.__corner_slots = list(range(len(self.__corners)))
+        self.__edge_slots = list(range(len(self.__edges)))
+
+    @property
+    def cubie_cube(self) -> CubieCube:
+        """
+        Cubie cube getter
+
+        :return: The pieces of the cube, as a cubie cube
+        """
+
+        return CubieCube(
+            tuple(code // 3 for code in self.__corners),
+            tuple(code % 3 for code in self.__corners),
+            tuple(code // 2 for code in self.__edges),
+            tuple(code % 2 for code in self.__edges),
+            tuple(SOLVED_CENTERS[center] for center in self.__centers),
+        )
+
+    @property
+    def solved_count(self) -> int:
+        """
+        Solved count getter
+
+        :return: The amount of corner and edge pieces in the slot and orientation they are solved in
+        """
+
+        return self.__solved_count
+
+    def is_solved(self) -> bool:
+        """
+        Returns whether the cube is solved, in any orientation.
+
+        :return: Whether every piece is solved
+        """
+
+        return self.__solved_count == PIECE_COUNT
+
+    def search_corner(
+        self,
+        first_color: Color,
+        second_color: Color,
+        third_color: Color,
+        counter: PieceSearchCounter | None = None,
+    ) -> CornerSearchResult:
+        """
+        Finds the corner piece with the given three colors, like `search_corner` does on a `Cube`.
+
+        :param first_color: The first color of the corner piece
+        :param second_color: The second color of the corner piece
+        :param third_color: The third color of the corner piece
+        :param counter: The counter of the piece searches of the solve, or None to count nothing
+        :return: The slot of the corner piece and its orientation
+        """
+
+        if counter is not None:
+            counter.count += 1
+        piece = CORNER_PIECE_INDICES.get(frozenset({first_color, second_color, third_color}))
+        if piece is None:
+            raise ValueError(f"Invalid corner piece: {frozenset({first_color, second_color, third_color})}.")
+
+        slot = self.__corner_slots[piece]
+        return CornerSearchResult(CORNER_SLOTS[slot], self.__corners[slot] % 3)
+
+    def search_edge(
+        self, first_color: Color, second_color: Color, counter: PieceSearchCounter | None = None
+    ) -> EdgeSearchResult:
+        """
+        Finds the edge piece with the given two colors, like `search_edge` does on a `Cube`.
+
+        :param first_color: The first color of the edge piece
+        :param second_color: The second color of the edge piece
+        :param counter: The counter of the piece searches of the solve, or None to count nothing
+        :return: The slot of the edge piece and whether it is oriented
+        """
+
+        if counter is not None:
+            counter.count += 1
+        piece = EDGE_PIECE_INDICES.get(frozenset({first_color, second_color}))
+        if piece is None:
+            raise ValueError(f"Invalid edge piece: {frozenset({first_color, second_color})}.")
+
+        slot = self.__edge_slots[piece]
+        return EdgeSearchResult(EDGE_SLOTS[slot], self.__edges[slot] % 2 == 0)
+
+    def on_permute(self, permutation: tuple[int, ...]) -> None:
+        """
+        Follows a move of the rotator.
+
+        :param permutation: The permutation of the stickers
+        :return: None
+        """
+
+        move = get_piece_move(permutation)
+        corners = self.__corners
+        edges = self.__edges
+        corner_codes = [CORNER_TWISTS[twist][corners[source]] for _, source, twist in move.corners]
+        edge_codes = [EDGE_FLIPS[flip][edges[source]] for _, source, flip in move.edges]
+
+        centers = tuple(self.__centers[position] for position in move.centers)
+        centers_moved = centers != self.__centers
+        solved = None if centers_moved else get_solved_states().get(centers)
+        if solved is not None:
+            # The centers stay, so only the slots the move changes can change the count
+            self.__solved_count += sum(
+                (code == solved.corners[slot]) - (corners[slot] == solved.corners[slot])
+                for (slot, _, _), code in zip(move.corners, corner_codes)
+            ) + sum(
+                (code == solved.edges[slot]) - (edges[slot] == solved.edges[slot])
+                for (slot, _, _), code in zip(move.edges, edge_codes)
+            )
+
+        self.__centers = centers
+        self.__place(move, corner_codes, edge_codes)
+        if centers_moved and not move.whole_cube:
+            self.__solved_count = self.__count_solved()
+
+    def on_reset(self, cube: Cube) -> None:
+        """
+        Reads the pieces of the cube again.
+
+        :param cube: The cube, which must be a 3x3 with valid pieces
+        :return: None
+        """
+
+        state = encode(CubieCube.from_cube(cube))
+        self.__corners = list(state.corners)
+        self.__edges = list(state.edges)
+        self.__centers = state.centers
+        self.__solved_count = self.__count_solved()
+        self.__find_slots()
+
+    def on_checkpoint(self) -> TrackerState:
+        """
+        Keeps the pieces in a checkpoint of the rotator.
+
+        :return: The pieces
+        """
+
+        return TrackerState(tuple(self.__corners), tuple(self.__edges), self.__centers, self.__solved_count)
+
+    def on_restore(self, cube: Cube, state: TrackerState | None) -> None:
+        """
+        Returns to the pieces a checkpoint kept, or reads them again if it kept none.
+
+        :param cube: The cube, as it is now
+        :param state: The pieces the checkpoint kept, or None
+        :return: None
+        """
+
+        if state is None:
+            self.on_reset(cube)
+            return
+
+        self.__corners = list(state.corners)
+        self.__edges = list(state.edges)
+        self.__centers = state.centers
+        self.__solved_count = state.solved_count
+        self.__find_slots()
+
+    def __place(self, move: PieceMove, corner_codes: list[int], edge_codes: list[int]) -> None:
+        """
+        Puts the pieces a move brings into the slots it changes, and keeps the slot of every one of them.
+
+        :param move: The piece permutation of the move
+        :param corner_codes: The code of the corner the move brings into every corner slot it changes
+        :param edge_codes: The code of the edge the move brings into every edge slot it changes
+        :return: None
+        """
+
+        for (slot, _, _), code in zip(move.corners, corner_codes):
+            self.__corners[slot] = code
+            self.__corner_slots[code // 3] = slot
+        for (slot, _, _), code in zip(move.edges, edge_codes):
+            self.__edges[slot] = code
+            self.__edge_slots[code // 2] = slot
+
+    def __find_slots(self) -> None:
+        """
+        Finds the slot of every piece from the pieces in the slots.
+
+        :return: None
+        """
+
+        for slot, code in enumerate(self.__corners):
+            self.__corner_slots[code // 3] = slot
+        for slot, code in enumerate(self.__edges):
+            self.__edge_slots[code // 2] = slot
+
+    def __count_solved(self) -> int:
+        """
+        Counts the solved pieces of the cube.
+
+        :return: The amount of corner and edge pieces in the slot and orientation they are solved in
+        """
+
+        solved = get_solved_states().get(self.__centers)
+        if solved is None:
+            return 0
+
+        return sum(map(eq, self.__corners, solved.corners)) + sum(map(eq, self.__edges, solved.edges))
@@ -0,0 +1,179 @@
+# Python imports
+import atexit
+import sys
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple, Self
+
+# Third-party imports
+import numpy as np
+
+
+class SharedTable(NamedTuple):
+    """
+    A table published in shared memory: the name it is looked up by, the shared memory segment that
+    holds it, and the type and shape of its items.
+    """
+
+    name: str
+    segment: str
+    dtype: str
+    shape: tuple[int, ...]
+
+
+# The tables this process attached to, by name, and the segments that hold them. Both are kept for
+# the rest of the process, since the tables are read until it exits.
+_attached: dict[str, np.ndarray] = {}
+_segments: list[SharedMemory] = []
+
+
+class SharedTables:
+    """
+    Tables published once into shared memory, for worker processes to attach to instead of building or
+    loading a copy of their own.
+
+    The process that publishes the tables owns the segments: they live until `close` is called, which
+    a `with` block does on leaving it, and which runs at exit otherwise. Workers receive the
+    `manifest` and pass it to `attach_shared_tables`, typically as the initializer of a process pool,
+    after which the table getters of the solvers find the tables with `get_shared_table`. However
+    many workers attach, the tables are in memory once.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the `SharedTables` class.
+
+        :return: None
+        """
+
+        self.__segments: list[SharedMemory] = []
+        self.__manifest: list[SharedTable] = []
+        atexit.register(self.close)
+
+    def __enter__(self) -> Self:
+        """
+        Enters a `with` block, at the end of which the segments are released.
+
+        :return: The shared tables
+        """
+
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        """
+        Releases the segments on leaving a `with` block.
+
+        :return: None
+        """
+
+        self.close()
+
+    @property
+    def manifest(self) -> tuple[SharedTable, ...]:
+        """
+        Manifest getter
+
+        :return: Every table published so far
+        """
+
+        return tuple(self.__manifest)
+
+    def publish(self, name: str, table: np.ndarray | memoryview | list[list[int]]) -> None:
+        """
+        Copies a table into a new shared memory segment.
+
+        :param name: The name the table is looked up by
+        :param table: The table, anything numpy turns into an array
+        :return: None
+        """
+
+        if any(shared.name == name for shared in self.__manifest):
+            raise ValueError(f"A table named {name} is published already")
+
+        array = np.asarray(table)
+        segment = SharedMemory(create=True, size=max(array.nbytes, 1))
+        np.ndarray(array.shape, array.dtype, segment.buf)[...] = array
+
+        self.__segments.append(segment)
+        self.__manifest.append(SharedTable(name, segment.name, array.dtype.str, array.shape))
+
+    def publish_all(self, prefix: str, tables: NamedTuple) -> None:
+        """
+        Publishes every table of a named tuple of tables, each named after its field.
+
+        :param prefix: The prefix of the names, followed by a slash and the field
+        :param tables: The tables
+        :return: None
+        """
+
+        for field, table in zip(tables._fields, tables):
+            self.publish(f"{prefix}/{field}", table)
+
+    def close(self) -> None:
+        """
+        Releases and removes every segment. Workers that attached to them keep their mappings until they
+        exit, but no new worker can attach.
+
+        :return: None
+        """
+
+        for segment in self.__segments:
+            segment.close()
+            segment.unlink()
+
+        self.__segments.clear()
+        self.__manifest.clear()
+        atexit.unregister(self.close)
+
+
+def attach_shared_tables(manifest: tuple[SharedTable, ...]) -> None:
+    """
+    Attaches this process to published tables, read-only.
+
+    :param manifest: The tables, from `SharedTables.manifest`
+    :return: None
+    """
+
+    for table in manifest:
+        # From Python 3.13 on, a segment attached to can be kept off the resource tracker, which would
+        # otherwise unlink it when this process exits, while the publishing one still owns it
+        if sys.version_info >= (3, 13):
+            segment = SharedMemory(name=table.segment, track=False)
+        else:
+            segment = SharedMemory(name=table.segment)
+        array = np.ndarray(table.shape, np.dtype(table.dtype), segment.buf)
+        array.flags.writeable = False
+
+        _segments.append(segment)
+        _attached[table.name] = array
+
+
+def get_shared_table(name: str) -> np.ndarray | None:
+    """
+    Returns a table this process attached to.
+
+    :param name: The name of the table
+    :return: The table, or None if this process did not attach to a table of that name
+    """
+
+    return _attached.get(name)
+
+
+def get_shared_tables(prefix: str, fields: tuple[str, ...]) -> list[memoryview] | None:
+    """
+    Returns every table of a named tuple of tables that `SharedTables.publish_all` published, if this
+    process attached to them.
+
+    Every table is read in place, through a flat memoryview of the shared memory, so nothing of it is
+    copied into the process. A move table, which has two dimensions, is read at `row * width + move`,
+    like the flat lists a table getter builds.
+
+    :param prefix: The prefix of the names
+    :param fields: The fields of the named tuple
+    :return: The tables in the order of the fields, or None if any of them is missing
+    """
+
+    tables = [_attached.get(f"{prefix}/{field}") for field in fields]
+    if any(table is None for table in tables):
+        return None
+
+    return [memoryview(table.ravel()) for table in tables]
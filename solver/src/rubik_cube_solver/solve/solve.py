@@ -1,13 +1,61 @@
 # Python imports
+import time
 from abc import ABC, abstractmethod
-from typing import Callable
+from typing import Callable, NamedTuple
 
 # Project imports
 from rubik_cube_solver.cube import Cube
 from rubik_cube_solver.cube_rotation.algorithm import Algorithm
-from rubik_cube_solver.cube_rotation.rotator import Rotator
+from rubik_cube_solver.cube_rotation.move import Move
+from rubik_cube_solver.cube_rotation.rotator import Checkpoint, Rotator
+from rubik_cube_solver.cubie_cube import SOLVED_CENTERS, CubieCube
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.solve.observer import PieceSearchCounter, SolveObserver, StepEvent
 from rubik_cube_solver.validator.validator import Validator
 
+# A whole-cube `y` rotation, which the solvers apply between the slots they solve in turn.
+Y_ROTATION: Algorithm = Algorithm.from_str("y", frozen=True)
+
+# The 24 whole-cube rotations: one for every face that can be brought to UP, each followed by one
+# for every face that can then be brought to FRONT
+ORIENTATION_ALGORITHMS: tuple[Algorithm, ...] = tuple(
+    Algorithm.from_str(f"{up} {front}", frozen=True)
+    for up in ("", "x", "x2", "x'", "z", "z'")
+    for front in ("", "y", "y2", "y'")
+)
+
+
+def find_orientation(cube: Cube) -> Algorithm:
+    """
+    Finds the whole-cube rotation that brings every center of a 3x3 to the face it has on a default
+    `Cube(3)`.
+
+    Only the centers take part in finding the rotation, so it is tried out on a cubie cube that holds
+    nothing but them.
+
+    :param cube: The 3x3 cube
+    :return: The rotation
+    """
+
+    centers = tuple(cube.read_layers()[layer][4] for layer in Layer)
+
+    for algorithm in ORIENTATION_ALGORITHMS:
+        rotated = CubieCube(centers=centers)
+        rotated.apply(algorithm)
+        if rotated.centers == SOLVED_CENTERS:
+            return algorithm
+
+    raise ValueError(f"No rotation brings the centers {centers} to the ones of a default cube")
+
+
+class SolveCheckpoint(NamedTuple):
+    """
+    A point a solver can be returned to: a checkpoint of the cube and the moves of the solution so far.
+    """
+
+    cube: Checkpoint
+    moves: list[Move]
+
 
 class Solve(ABC):
     """
@@ -15,7 +63,8 @@ class Solve(ABC):
 
     It holds the cube being solved, a `Rotator` to perform moves on it and the algorithm
     accumulated so far. Subclasses supply the ordered steps that make up their solving method
-    for their cube type.
+    for their cube type. A `SolveObserver` set as the `observer` receives an event as every step
+    starts and ends.
     """
 
     def __init__(self, cube: Cube) -> None:
@@ -29,6 +78,12 @@ class Solve(ABC):
         self.__cube = cube
         self.__rotator = Rotator(cube)
         self.__solution = Algorithm([])
+        self.__observer: SolveObserver | None = None
+        self.__piece_search_counter: PieceSearchCounter | None = None
+        # The `_apply` calls made and the moves they performed on the cube, which the steps are
+        # measured against
+        self.__apply_calls = 0
+        self.__cube_turns = 0
 
     @property
     def cube(self) -> Cube:
@@ -52,6 +107,16 @@ class Solve(ABC):
         self.__cube = cube
         self.__rotator.cube = cube
 
+    @property
+    def rotator(self) -> Rotator:
+        """
+        Rotator getter
+
+        :return: The rotator performing the moves on the cube
+        """
+
+        return self.__rotator
+
     @property
     def solution(self) -> Algorithm:
         """
@@ -73,27 +138,88 @@ class Solve(ABC):
 
         self.__solution = solution
 
+    @property
+    def observer(self) -> SolveObserver | None:
+        """
+        Observer getter
+
+        :return: The observer of the steps, or None
+        """
+
+        return self.__observer
+
+    @observer.setter
+    def observer(self, observer: SolveObserver | None) -> None:
+        """
+        Observer setter
+
+        :param observer: The observer of the steps, or None to measure nothing
+        :return: None
+        """
+
+        self.__observer = observer
+
+    @property
+    def piece_search_counter(self) -> PieceSearchCounter | None:
+        """
+        Piece search counter getter
+
+        :return: The counter every piece search of the running solve is handed, or None if the solver
+            has no observer
+        """
+
+        return self.__piece_search_counter
+
     def solve(self) -> Algorithm:
         """
         Solves the cube by validating its state and running every step in order.
 
-        Once all steps have run, the accumulated solution has its rotations removed and is then
-        reduced by cancelling adjacent moves, in that order, since rotations are cancellation
-        barriers and must be gone before moves either side of one can collapse into each other.
+        Once all steps have run, the accumulated solution has its rotations removed and is
+        reduced by cancelling moves, both in the single pass of `Algorithm.simplify`,
+        since rotations are cancellation barriers and must be gone before moves either side of one
+        can collapse into each other.
+
+        A trusted cube, one known to be valid since it was created solved or validated and has only
+        been moved by a `Rotator` since, is not validated again.
+
+        With an observer, the validation, every step and the simplification are each measured and
+        reported to it, and the piece searches are counted through the `piece_search_counter` the steps
+        hand them. Without one, they simply run and the piece searches are handed None.
 
         :return: The solution
         """
 
-        Validator().validate(self.__cube)
+        if self.__observer is None:
+            self.__piece_search_counter = None
+            self.__validate()
+
+            for step in self._steps():
+                step()
+
+            self.__solution.simplify()
+
+            return self.__solution
+
+        self.__piece_search_counter = PieceSearchCounter()
+        self.__observe("validate", self.__validate)
 
         for step in self._steps():
-            step()
+            self.__observe(step.__name__.lstrip("_"), step)
 
-        self.__solution.remove_rotations()
-        self.__solution.cancel_moves()
+        self.__observe("simplify", self.__solution.simplify)
 
         return self.__solution
 
+    def __validate(self) -> None:
+        """
+        Validates the cube, unless it is trusted.
+
+        :return: None
+        """
+
+        if not self.__cube.trusted:
+            Validator().validate(self.__cube)
+
     @abstractmethod
     def _steps(self) -> list[Callable[[], None]]:
         """
@@ -112,3 +238,57 @@ class Solve(ABC):
 
         self.__rotator.apply(algorithm)
         self.__solution.merge(algorithm)
+        self.__apply_calls += 1
+        self.__cube_turns += len(algorithm.moves)
+
+    def _checkpoint(self) -> SolveCheckpoint:
+        """
+        Takes a checkpoint of the cube and the solution that `_restore` can return them to, so that a
+        step can try out alternatives and keep the best one. The cube is not copied, only its storage
+        is shared until either side turns, so a checkpoint costs little more than copying the moves.
+
+        :return: The checkpoint
+        """
+
+        return SolveCheckpoint(self.__rotator.checkpoint(), list(self.__solution.moves))
+
+    def _restore(self, checkpoint: SolveCheckpoint) -> None:
+        """
+        Returns the cube and the solution to a checkpoint taken by `_checkpoint`.
+
+        :param checkpoint: The checkpoint
+        :return: None
+        """
+
+        self.__rotator.restore(checkpoint.cube)
+        self.__solution.moves = list(checkpoint.moves)
+
+    def __observe(self, name: str, step: Callable[[], None]) -> None:
+        """
+        Runs a step, reporting its start and its end to the observer.
+
+        :param name: The name of the step
+        :param step: The step
+        :return: None
+        """
+
+        length = len(self.__solution.moves)
+        apply_calls, cube_turns = self.__apply_calls, self.__cube_turns
+        piece_searches = self.__piece_search_counter.count
+
+        start_time = time.perf_counter()
+        self.__observer.on_step_start(StepEvent(name, start_time, 0.0, 0, 0, 0, 0))
+        step()
+        wall_time = time.perf_counter() - start_time
+
+        self.__observer.on_step_end(
+            StepEvent(
+                name,
+                start_time,
+                wall_time,
+                len(self.__solution.moves) - length,
+                self.__apply_calls - apply_calls,
+                self.__piece_search_counter.count - piece_searches,
+                self.__cube_turns - cube_turns,
+            )
+        )
@@ -1,13 +1,32 @@
+# Python imports
+from importlib import import_module
+from types import ModuleType
+
 # Project imports
 from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.enums.SolveMethod import SolveMethod
 from rubik_cube_solver.solve.cube_2x2.solve_2x2 import Solve2x2
 from rubik_cube_solver.solve.cube_3x3.solve_3x3 import Solve3x3
 from rubik_cube_solver.solve.solve import Solve
 
 
-def create_solver(cube: Cube) -> Solve:
+def import_numpy_module(name: str) -> ModuleType:
+    """
+    Imports a module of the solve package that needs the optional numpy extra, once it is asked for.
+
+    The table-based solvers and their tables are imported through here rather than at the top of a
+    module, so solving with the human method never needs NumPy installed.
+
+    :param name: The name of the module, relative to the solve package
+    :return: The module
+    """
+
+    return import_module(f"rubik_cube_solver.solve.{name}")
+
+
+def create_solver(cube: Cube, method: SolveMethod = SolveMethod.HUMAN) -> Solve:
     """
-    Creates the solver for a cube, chosen by its size.
+    Creates the solver for a cube, chosen by its size and the solving method.
 
     This is the single entry point for solving: a caller passes any cube and gets back the concrete
     `Solve` subclass that handles that size, without naming it or checking the size itself. The
@@ -15,13 +34,22 @@ def create_solver(cube: Cube) -> Solve:
     far stay reachable through it, and `solve()` is called on it as usual.
 
     :param cube: The cube to solve
-    :return: The solver for the cube's size
+    :param method: The solving method, the human one by default
+    :return: The solver for the cube's size and the method
     """
 
-    match cube.size:
-        case 2:
+    match cube.size, method:
+        case 2, SolveMethod.HUMAN:
             return Solve2x2(cube)
-        case 3:
+        case 3, SolveMethod.HUMAN:
             return Solve3x3(cube)
+        case 3, SolveMethod.KOCIEMBA:
+            return import_numpy_module("cube_3x3.solve_3x3_kociemba").Solve3x3Kociemba(cube)
+        case 2, SolveMethod.OPTIMAL:
+            return import_numpy_module("cube_2x2.solve_2x2_optimal").Solve2x2Optimal(cube)
+        case 3, SolveMethod.OPTIMAL:
+            return import_numpy_module("cube_3x3.solve_3x3_optimal").Solve3x3Optimal(cube)
+        case 2 | 3, _:
+            raise ValueError(f"No {method.value} solver for cubes of size {cube.size}")
         case _:
             raise ValueError(f"No solver for cubes of size {cube.size}, only 2x2 and 3x3 are supported")
@@ -0,0 +1,330 @@
+# Python imports
+import hashlib
+import mmap
+import multiprocessing
+import os
+import struct
+import tempfile
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+# Third-party imports
+import numpy as np
+
+# The version of the file layout below, part of the version of every table
+TABLE_FORMAT_VERSION: int = 1
+
+# A table file starts with a header of the magic bytes, the format version, the bits per entry, the
+# amount of entries, the version of the table and the CRC-32 of the data, padded to 64 bytes, and
+# the packed entries follow it
+TABLE_MAGIC: bytes = b"RCST"
+TABLE_HEADER: struct.Struct = struct.Struct("<4sHHQ32sI12x")
+
+# The environment variable naming the directory the tables are kept in, and the directory used when
+# it is not set
+TABLE_DIRECTORY_VARIABLE: str = "RUBIK_CUBE_SOLVER_TABLES"
+DEFAULT_TABLE_DIRECTORY: Path = Path.home() / ".cache" / "rubik_cube_solver"
+
+# The environment variable naming how many worker processes build a table. Building in one process is the
+# default, since the workers are forked, and forking a process that runs other threads can deadlock.
+TABLE_PROCESSES_VARIABLE: str = "RUBIK_CUBE_SOLVER_TABLE_PROCESSES"
+
+# The most states handled at once while building a table, which bounds the memory the build needs
+# and is the share of the work a worker process takes at a time
+CHUNK_SIZE: int = 1 << 20
+
+
+class BreadthFirstSearch(NamedTuple):
+    """
+    A breadth-first search in progress, which forked worker processes find in `_search`.
+
+    The distances live in an anonymous shared mapping, so the distances the workers write are seen by
+    every other worker and by the parent.
+    """
+
+    distances: np.ndarray
+    neighbors: Callable[[np.ndarray, int], np.ndarray]
+    move_amount: int
+
+
+# The search the worker processes of `breadth_first_search` take part in, set before they are forked
+_search: BreadthFirstSearch | None = None
+
+
+def get_table_directory() -> Path:
+    """
+    Returns the directory the tables are kept in.
+
+    :return: The directory named by `TABLE_DIRECTORY_VARIABLE`, or `DEFAULT_TABLE_DIRECTORY`
+    """
+
+    return Path(os.environ.get(TABLE_DIRECTORY_VARIABLE) or DEFAULT_TABLE_DIRECTORY)
+
+
+def get_table_processes() -> int:
+    """
+    Returns the amount of worker processes that build a table.
+
+    :return: The amount named by `TABLE_PROCESSES_VARIABLE`, or 1
+    """
+
+    return int(os.environ.get(TABLE_PROCESSES_VARIABLE) or 1)
+
+
+def table_version(*parts: bytes) -> bytes:
+    """
+    Returns the version of a table: a digest of the format version and of everything the table is
+    built from, its move tables in the first place. A table file with any other version is rebuilt.
+
+    :param parts: Everything the table is built from
+    :return: The version
+    """
+
+    digest = hashlib.sha256(TABLE_FORMAT_VERSION.to_bytes(2, "little"))
+    for part in parts:
+        digest.update(len(part).to_bytes(8, "little"))
+        digest.update(part)
+
+    return digest.digest()
+
+
+def pack_table(distances: np.ndarray, bits: int) -> bytes:
+    """
+    Packs a distance for every entry into a table.
+
+    At 4 bits, two entries share a byte, the even one in the low 4 bits. At 2 bits, only the distance
+    modulo 3 is kept and four entries share a byte, the first in the lowest 2 bits. A distance modulo 3
+    is enough to walk to solved: of the neighbors of a state, those one move closer are the ones whose
+    value is one less, modulo 3. At 8 bits, every entry has a byte of its own, which is read fastest.
+
+    :param distances: The distance of every entry
+    :param bits: The bits per entry, 2, 4 or 8
+    :return: The packed table
+    """
+
+    match bits:
+        case 8 | 4:
+            values = distances.astype(np.uint8) & (1 << bits) - 1
+        case 2:
+            values = (distances % 3).astype(np.uint8)
+        case _:
+            raise ValueError(f"A table packs 2, 4 or 8 bits per entry, got {bits}")
+
+    per_byte = 8 // bits
+    values = np.append(values, np.zeros(-len(values) % per_byte, dtype=np.uint8))
+    packed = np.zeros(len(values) // per_byte, dtype=np.uint8)
+    for position in range(per_byte):
+        packed |= values[position::per_byte] << (position * bits)
+
+    return packed.tobytes()
+
+
+def get_distance(table: bytes | memoryview, index: int) -> int:
+    """
+    Returns an entry of a table packed at 4 bits.
+
+    :param table: The packed table
+    :param index: The index of the entry
+    :return: The distance of the entry
+    """
+
+    return table[index >> 1] >> ((index & 1) << 2) & 15
+
+
+def get_distance_mod_3(table: bytes | memoryview, index: int) -> int:
+    """
+    Returns an entry of a table packed at 2 bits.
+
+    :param table: The packed table
+    :param index: The index of the entry
+    :return: The distance of the entry modulo 3
+    """
+
+    return table[index >> 2] >> ((index & 3) << 1) & 3
+
+
+def load_table(path: Path, version: bytes, bits: int, size: int) -> memoryview | None:
+    """
+    Maps a table file into memory, read-only, so that its pages are read as they are used and shared
+    by every process that maps the same file.
+
+    :param path: The table file
+    :param version: The version the table must have
+    :param bits: The bits per entry the table must have
+    :param size: The amount of entries the table must have
+    :return: The packed entries, or None if the file is missing, of another version or shape, or
+        damaged
+    """
+
+    try:
+        with open(path, "rb") as file:
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    if len(mapped) >= TABLE_HEADER.size:
+        header = TABLE_HEADER.unpack_from(mapped)
+        data = memoryview(mapped)[TABLE_HEADER.size :]
+        expected = (TABLE_MAGIC, TABLE_FORMAT_VERSION, bits, size, version)
+        if header[:5] == expected and len(data) == -(-size * bits // 8) and zlib.crc32(data) == header[5]:
+            return data
+        data.release()
+
+    mapped.close()
+    return None
+
+
+def save_table(path: Path, version: bytes, bits: int, size: int, data: bytes) -> None:
+    """
+    Writes a table file. The file is written next to its final path and moved there once complete,
+    so that a process loading the table never sees half of it.
+
+    :param path: The table file
+    :param version: The version of the table
+    :param bits: The bits per entry
+    :param size: The amount of entries
+    :param data: The packed entries
+    :return: None
+    """
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, prefix=path.name, suffix=".tmp", delete=False) as file:
+        try:
+            file.write(TABLE_HEADER.pack(TABLE_MAGIC, TABLE_FORMAT_VERSION, bits, size, version, zlib.crc32(data)))
+            file.write(data)
+        except OSError:
+            file.close()
+            os.remove(file.name)
+            raise
+
+    # Temporary files are private to their owner, but a table is meant to be read by every process
+    os.chmod(file.name, 0o644)
+    os.replace(file.name, path)
+
+
+def get_table(name: str, version: bytes, bits: int, size: int, build: Callable[[], bytes]) -> memoryview:
+    """
+    Returns a table from its file in the table directory, building and saving it first if the file is
+    missing, of another version or damaged.
+
+    When the table directory cannot be written to, the built table is kept in memory instead.
+
+    :param name: The name of the table, which names its file
+    :param version: The version of the table, from `table_version`
+    :param bits: The bits per entry
+    :param size: The amount of entries
+    :param build: Builds the packed entries
+    :return: The packed entries
+    """
+
+    path = get_table_directory() / f"{name}.table"
+    table = load_table(path, version, bits, size)
+    if table is not None:
+        return table
+
+    data = build()
+    try:
+        save_table(path, version, bits, size, data)
+    except OSError:
+        return memoryview(data)
+
+    return load_table(path, version, bits, size) or memoryview(data)
+
+
+def breadth_first_search(
+    size: int,
+    solved: int,
+    move_amount: int,
+    neighbors: Callable[[np.ndarray, int], np.ndarray],
+    processes: int | None = None,
+) -> np.ndarray:
+    """
+    Finds the distance of every state from the solved one with a breadth-first search.
+
+    The search goes one depth at a time, over the states in chunks of `CHUNK_SIZE`. While fewer states
+    are at the current depth than are still unreached, the states at the depth are expanded by every
+    move. Once that turns around, every unreached state is checked for a move that leads to the
+    current depth instead, which touches fewer states, and which needs the inverse of every move to be
+    among the moves.
+
+    Only when more than one process is asked for, tables of more than one chunk are searched by a pool
+    of forked worker processes, one chunk at a time each. Forking a process that runs other threads can
+    deadlock, so that is left to callers that know it does not. Several workers may mark the same
+    state, but always with the same depth, so they need no locks.
+
+    :param size: The amount of states
+    :param solved: The solved state
+    :param move_amount: The amount of moves
+    :param neighbors: Returns the states a move takes every one of the given states to
+    :param processes: The amount of worker processes, `get_table_processes()` by default
+    :return: The distance of every state, or -1 for the states the moves never reach
+    """
+
+    global _search
+
+    distances = np.frombuffer(mmap.mmap(-1, size), dtype=np.int8)
+    distances.fill(-1)
+    distances[solved] = 0
+
+    processes = min(processes or get_table_processes(), -(-size // CHUNK_SIZE))
+    methods = multiprocessing.get_all_start_methods()
+    pool = None
+    if processes > 1 and "fork" in methods:
+        pool = ProcessPoolExecutor(processes, mp_context=multiprocessing.get_context("fork"))
+
+    _search = BreadthFirstSearch(distances, neighbors, move_amount)
+    try:
+        depth = 0
+        while True:
+            frontier_amount = int(np.count_nonzero(distances == depth))
+            unreached_amount = int(np.count_nonzero(distances < 0))
+            if not frontier_amount or not unreached_amount:
+                break
+
+            expand = frontier_amount <= unreached_amount
+            starts = range(0, size, CHUNK_SIZE)
+            if pool is None:
+                for start in starts:
+                    search_chunk(start, depth, expand)
+            else:
+                list(pool.map(search_chunk, starts, repeat(depth), repeat(expand)))
+
+            depth += 1
+    finally:
+        _search = None
+        if pool is not None:
+            pool.shutdown()
+
+    return distances
+
+
+def search_chunk(start: int, depth: int, expand: bool) -> None:
+    """
+    Finds the states of a chunk of the search in `_search` that are one deeper than the depth.
+
+    :param start: The first state of the chunk
+    :param depth: The current depth
+    :param expand: Whether to expand the states of the chunk at the depth, or to check the unreached
+        states of the chunk for a move to the depth
+    :return: None
+    """
+
+    distances, neighbors, move_amount = _search
+    chunk = distances[start : start + CHUNK_SIZE]
+    indices = np.flatnonzero(chunk == depth if expand else chunk < 0) + start
+    if not indices.size:
+        return
+
+    reached = np.zeros(len(indices), dtype=bool)
+    for move in range(move_amount):
+        next_indices = neighbors(indices, move)
+        if expand:
+            distances[next_indices[distances[next_indices] < 0]] = depth + 1
+        else:
+            reached |= distances[next_indices] == depth
+
+    if not expand:
+        distances[indices[reached]] = depth + 1
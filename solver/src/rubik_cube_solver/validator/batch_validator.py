@@ -0,0 +1,273 @@
+# Python imports
+from functools import cache
+from itertools import permutations
+from typing import NamedTuple
+
+# Third-party imports
+import numpy as np
+
+# Project imports
+from rubik_cube_solver.cube import COLOR_CODES, COLORS, Cube
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.enums.ValidationCode import ValidationCode
+from rubik_cube_solver.validator.validator import UP_DOWN_COLORS
+from rubik_cube_solver.validator.validator_constants import (
+    CENTER_COLORS_OPPOSITES,
+    CENTER_LAYER_OPPOSITES,
+    CORNER_CW_ROTATIONS,
+    CORNER_SLOT_LAYERS,
+    EDGE_CANONICAL_ORIENTATION,
+    EDGE_SLOT_LAYERS,
+)
+from rubik_cube_solver.validator.validator_utils import get_centers, get_corners, get_edges, get_wing_edges
+
+# The code every sticker that is not the code of a color is read as, one past the codes in `COLORS`
+INVALID_CODE: int = len(COLORS)
+
+# The position of every face in `Layer` order, which the faces of a row of stickers are laid out in
+LAYER_POSITIONS: dict[Layer, int] = {layer: position for position, layer in enumerate(Layer)}
+
+
+class PieceTables(NamedTuple):
+    """
+    Lookup tables of the pieces, indexed by the color codes of their stickers, `INVALID_CODE` included:
+    the id of the corner or edge with those colors in any order, -1 if there is none, and the twist,
+    chirality and flip of the stickers in that order.
+    """
+
+    corner_ids: np.ndarray
+    corner_twists: np.ndarray
+    corner_chiral: np.ndarray
+    edge_ids: np.ndarray
+    edge_flips: np.ndarray
+    opposite_codes: np.ndarray
+
+
+class StickerIndices(NamedTuple):
+    """
+    The flat sticker indices of the pieces of a cube size, in the order the pieces are read by
+    `validator_utils`: the stickers of every corner, the stickers of every edge, the middle sticker of
+    every face, the stickers of every orbit of center pieces, and the stickers and slot of every
+    directed wing edge. Pieces a size does not have have no indices.
+    """
+
+    corners: np.ndarray
+    edges: np.ndarray
+    centers: np.ndarray
+    center_orbits: np.ndarray
+    wing_edges: np.ndarray
+    wing_slots: np.ndarray
+
+
+@cache
+def get_piece_tables() -> PieceTables:
+    """
+    Returns the lookup tables of the pieces, building them on first use.
+
+    :return: The lookup tables
+    """
+
+    size = INVALID_CODE + 1
+    corner_ids = np.full((size, size, size), -1, dtype=np.int8)
+    corner_twists = np.zeros((size, size, size), dtype=np.int8)
+    corner_chiral = np.zeros((size, size, size), dtype=bool)
+    for piece_id, color_set in enumerate(CORNER_CW_ROTATIONS):
+        for corner in permutations(color_set):
+            index = tuple(COLOR_CODES[color] for color in corner)
+            corner_ids[index] = piece_id
+            corner_twists[index] = next(twist for twist, color in enumerate(corner) if color in UP_DOWN_COLORS)
+            corner_chiral[index] = corner in CORNER_CW_ROTATIONS[color_set]
+
+    edge_ids = np.full((size, size), -1, dtype=np.int8)
+    edge_flips = np.zeros((size, size), dtype=np.int8)
+    for piece_id, color_set in enumerate(EDGE_CANONICAL_ORIENTATION):
+        for first, second in permutations(color_set):
+            index = (COLOR_CODES[first], COLOR_CODES[second])
+            edge_ids[index] = piece_id
+            edge_flips[index] = first != EDGE_CANONICAL_ORIENTATION[color_set]
+
+    opposite_codes = np.full(size, size, dtype=np.int8)
+    for color, opposite in CENTER_COLORS_OPPOSITES.items():
+        opposite_codes[COLOR_CODES[color]] = COLOR_CODES[opposite]
+
+    return PieceTables(corner_ids, corner_twists, corner_chiral, edge_ids, edge_flips, opposite_codes)
+
+
+@cache
+def get_sticker_indices(cube_size: int) -> StickerIndices:
+    """
+    Returns the flat sticker indices of the pieces of a cube size, working them out on first use.
+
+    The pieces are read by the same functions `Validator.validate` reads them with, from a cube whose
+    every sticker holds its own flat index instead of a color.
+
+    :param cube_size: The cube size
+    :return: The sticker indices
+    """
+
+    face_size = cube_size * cube_size
+    index_cube = Cube(
+        cube_size,
+        {
+            layer: list(range(position * face_size, (position + 1) * face_size))
+            for layer, position in LAYER_POSITIONS.items()
+        },
+    )
+
+    odd = cube_size % 2 == 1
+    big = cube_size >= 4
+
+    center_orbits: dict[tuple[int, int], list[int]] = {}
+    for index, row, col in get_centers(index_cube) if big else []:
+        center_orbits.setdefault((row, col), []).append(index)
+    wing_edges = get_wing_edges(index_cube) if big else []
+
+    return StickerIndices(
+        np.array(get_corners(index_cube), dtype=np.intp),
+        np.array(get_edges(index_cube) if odd else [], dtype=np.intp).reshape(-1, 2),
+        np.array([position * face_size + face_size // 2 for position in range(len(Layer))], dtype=np.intp),
+        np.array(list(center_orbits.values()), dtype=np.intp).reshape(-1, 4 * len(Layer)),
+        np.array([(primary, secondary) for _, primary, secondary in wing_edges], dtype=np.intp).reshape(-1, 2),
+        np.array([slot for slot, _, _ in wing_edges], dtype=np.intp),
+    )
+
+
+def has_duplicates(pieces: np.ndarray) -> np.ndarray:
+    """
+    Returns whether any row has a value twice.
+
+    :param pieces: The values, one row per state
+    :return: Whether every row has a duplicate
+    """
+
+    ordered = np.sort(pieces, axis=1)
+    return (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+
+
+def get_permutation_parity(slots: np.ndarray, canonical_slots: np.ndarray) -> np.ndarray:
+    """
+    Returns the parity of the permutation of every row of pieces: the amount of inversions of the slot
+    every piece belongs in, modulo 2.
+
+    :param slots: The id of the piece in every slot, one row per state
+    :param canonical_slots: The id of the piece that belongs in every slot, one row per state
+    :return: The parity of every row
+    """
+
+    rows, piece_amount = slots.shape
+
+    # The slot every piece belongs in, by its id. The ids of a state that failed an earlier check may
+    # be -1, which only needs to stay a valid index
+    home_slots = np.zeros((rows, piece_amount), dtype=np.intp)
+    np.put_along_axis(home_slots, canonical_slots % piece_amount, np.arange(piece_amount)[None, :], axis=1)
+    permutation = np.take_along_axis(home_slots, slots % piece_amount, axis=1)
+
+    later = np.triu(np.ones((piece_amount, piece_amount), dtype=bool), 1)
+    inversions = (permutation[:, :, None] > permutation[:, None, :]) & later
+    return inversions.sum(axis=(1, 2)) % 2
+
+
+def validate_stickers(stickers: np.ndarray, cube_size: int) -> np.ndarray:
+    """
+    Validates many cube states at once, returning the `ValidationCode` of every state.
+
+    Every state is a row of color codes laid out like the stickers of an `ArrayCube` flattened, so the
+    stickers of a `BatchRotator` can be validated as they are. Every check of `Validator.validate` is
+    run over all the rows at once, and every state gets the code of the first check it fails, in the
+    order `Validator.validate` runs them, so a state is VALID exactly when `Validator.validate` passes
+    it. A sticker that is not the code of a color fails the color count.
+
+    :param stickers: The color codes of the stickers of every state, as an array of shape (M, 6 * N^2)
+    :param cube_size: The size of the cubes
+    :return: The code of every state, as an array of shape (M,)
+    """
+
+    if cube_size < 2:
+        raise ValueError("Cube size must be at least 2.")
+
+    stickers = np.asarray(stickers)
+    face_size = cube_size * cube_size
+    if stickers.ndim != 2 or stickers.shape[1] != len(Layer) * face_size:
+        raise ValueError(f"Expected stickers of shape (M, {len(Layer) * face_size}), got {stickers.shape}.")
+
+    tables = get_piece_tables()
+    indices = get_sticker_indices(cube_size)
+    colors = np.where((stickers >= 0) & (stickers < INVALID_CODE), stickers, INVALID_CODE).astype(np.intp)
+    rows = len(colors)
+    codes = np.zeros(rows, dtype=np.uint8)
+
+    def fail(failed: np.ndarray, code: ValidationCode) -> None:
+        """
+        Gives the states that fail a check its code, unless they already failed an earlier one.
+
+        :param failed: Whether every state fails the check
+        :param code: The code of the check
+        :return: None
+        """
+
+        codes[failed & (codes == ValidationCode.VALID)] = code
+
+    # Color count, with a bin per color and per state
+    offsets = np.arange(rows)[:, None] * (INVALID_CODE + 1)
+    counts = np.bincount((colors + offsets).ravel(), minlength=rows * (INVALID_CODE + 1)).reshape(
+        rows, INVALID_CODE + 1
+    )
+    fail((counts[:, :INVALID_CODE] != face_size).any(axis=1), ValidationCode.COLOR_COUNT)
+
+    # Corners
+    corners = colors[:, indices.corners]
+    corner_index = (corners[:, :, 0], corners[:, :, 1], corners[:, :, 2])
+    corner_ids = tables.corner_ids[corner_index]
+    fail((corner_ids < 0).any(axis=1) | has_duplicates(corner_ids), ValidationCode.CORNER_IDENTITY)
+    fail(tables.corner_twists[corner_index].sum(axis=1) % 3 != 0, ValidationCode.CORNER_ORIENTATION)
+    fail(~tables.corner_chiral[corner_index].all(axis=1), ValidationCode.CORNER_CHIRALITY)
+
+    if cube_size % 2 == 1:
+        # Fixed centers
+        centers = colors[:, indices.centers]
+        opposites = [LAYER_POSITIONS[CENTER_LAYER_OPPOSITES[layer]] for layer in Layer]
+        fail(has_duplicates(centers), ValidationCode.CENTER_UNIQUENESS)
+        fail((tables.opposite_codes[centers] != centers[:, opposites]).any(axis=1), ValidationCode.CENTER_OPPOSITES)
+
+        # Edges
+        edges = colors[:, indices.edges]
+        edge_index = (edges[:, :, 0], edges[:, :, 1])
+        edge_ids = tables.edge_ids[edge_index]
+        fail((edge_ids < 0).any(axis=1) | has_duplicates(edge_ids), ValidationCode.EDGE_IDENTITY)
+        fail(tables.edge_flips[edge_index].sum(axis=1) % 2 != 0, ValidationCode.EDGE_FLIP)
+
+        # Permutation parity, against the pieces that belong in every slot given the centers of the state
+        canonical_corners = np.stack(
+            [
+                tables.corner_ids[tuple(centers[:, LAYER_POSITIONS[layer]] for layer in layers)]
+                for layers in CORNER_SLOT_LAYERS
+            ],
+            axis=1,
+        )
+        canonical_edges = np.stack(
+            [
+                tables.edge_ids[tuple(centers[:, LAYER_POSITIONS[layer]] for layer in layers)]
+                for layers in EDGE_SLOT_LAYERS
+            ],
+            axis=1,
+        )
+        fail(
+            get_permutation_parity(corner_ids, canonical_corners) != get_permutation_parity(edge_ids, canonical_edges),
+            ValidationCode.PERMUTATION_PARITY,
+        )
+
+    if cube_size >= 4:
+        # Center pieces, every orbit of which holds 4 of every color
+        orbit_colors = colors[:, indices.center_orbits]
+        orbit_counts = (orbit_colors[..., None] == np.arange(INVALID_CODE)).sum(axis=2)
+        fail((orbit_counts != 4).any(axis=(1, 2)), ValidationCode.CENTER_COUNT)
+
+        # Wing edges, directed and told apart by their slot
+        wing_edges = colors[:, indices.wing_edges]
+        wing_ids = tables.edge_ids[wing_edges[:, :, 0], wing_edges[:, :, 1]]
+        wing_keys = (indices.wing_slots * (INVALID_CODE + 1) + wing_edges[:, :, 0]) * (INVALID_CODE + 1) + wing_edges[
+            :, :, 1
+        ]
+        fail((wing_ids < 0).any(axis=1) | has_duplicates(wing_keys), ValidationCode.WING_EDGE_IDENTITY)
+
+    return codes
@@ -1,5 +1,7 @@
 # Python imports
 from collections import Counter
+from functools import cache
+from typing import TYPE_CHECKING, NamedTuple
 
 # Project imports
 from rubik_cube_solver.cube import Cube
@@ -8,7 +10,7 @@ from rubik_cube_solver.enums.Layer import Layer
 from rubik_cube_solver.validator.validator_constants import (
     CENTER_COLORS_OPPOSITES,
     CENTER_LAYER_OPPOSITES,
-    CORNER_CANONICAL_CW,
+    CORNER_CW_ROTATIONS,
     CORNER_SLOT_LAYERS,
     EDGE_CANONICAL_ORIENTATION,
     EDGE_SLOT_LAYERS,
@@ -16,13 +18,75 @@ from rubik_cube_solver.validator.validator_constants import (
     VALID_EDGE_COLOR_SETS,
 )
 from rubik_cube_solver.validator.validator_utils import (
-    get_canonical_pieces,
     get_centers,
     get_corners,
     get_edges,
     get_wing_edges,
 )
 
+if TYPE_CHECKING:
+    import numpy as np
+
+# The colors of the UP and DOWN centers of a solved cube, one of which every corner has
+UP_DOWN_COLORS: tuple[Color, Color] = (Color.WHITE, Color.YELLOW)
+
+
+class CubePieces(NamedTuple):
+    """
+    The stickers and pieces of a cube, read once for every check of the validator: every sticker, face
+    by face in `Layer` order, the middle sticker of every face in `Layer` order, which is a fixed
+    center on odd cubes, the corners and the color set of each, and the same for the edges, which only
+    odd cubes have.
+    """
+
+    stickers: list[Color]
+    centers: tuple[Color, ...]
+    corners: list[tuple[Color, Color, Color]]
+    corner_sets: list[frozenset[Color]]
+    edges: list[tuple[Color, Color]]
+    edge_sets: list[frozenset[Color]]
+
+
+def get_pieces(cube: Cube) -> CubePieces:
+    """
+    Reads every sticker, corner and edge of a cube at once.
+
+    :param cube: The Cube instance
+    :return: The stickers and pieces of the cube, with no edges if its size is even
+    """
+
+    layers = cube.read_layers()
+    corners = get_corners(cube)
+    edges = get_edges(cube) if cube.size % 2 == 1 else []
+
+    return CubePieces(
+        [sticker for layer in Layer for sticker in layers[layer]],
+        tuple(layers[layer][cube.size * cube.size // 2] for layer in Layer),
+        corners,
+        [frozenset(corner) for corner in corners],
+        edges,
+        [frozenset(edge) for edge in edges],
+    )
+
+
+@cache
+def get_canonical_slots(
+    centers: tuple[Color, ...],
+) -> tuple[tuple[frozenset[Color], ...], tuple[frozenset[Color], ...]]:
+    """
+    Returns, for every corner and every edge slot, the color set of the piece that belongs in it on a
+    cube with the given centers, worked out once for every arrangement of the centers.
+
+    :param centers: The color of every center, in `Layer` order
+    :return: The color sets of the corner slots and of the edge slots
+    """
+
+    layer_centers = dict(zip(Layer, centers))
+    return (
+        tuple(frozenset(layer_centers[layer] for layer in layers) for layers in CORNER_SLOT_LAYERS),
+        tuple(frozenset(layer_centers[layer] for layer in layers) for layers in EDGE_SLOT_LAYERS),
+    )
+
 
 class Validator:
     """
@@ -34,27 +98,53 @@ class Validator:
         Validates the state of a Rubik's Cube.
         Raises ValueError if the cube state is invalid.
 
+        The stickers, corners and edges are read off the cube once and every check runs over that
+        single read, cheapest first, so an invalid cube fails at the first check it breaks. A cube that
+        passes is marked as trusted.
+
         :param cube: The Cube instance to validate
         :return: None
         """
 
         self._check_size(cube)
-        self._check_color_count(cube)
-        self._check_corner_validity(cube)
-        self._check_corner_orientation(cube)
-        self._check_corner_chirality(cube)
+        pieces = get_pieces(cube)
+        self._check_color_count(cube, pieces)
+        self._check_corner_validity(cube, pieces)
+        self._check_corner_orientation(cube, pieces)
+        self._check_corner_chirality(cube, pieces)
 
         if cube.size % 2 == 1:
-            self._check_center_uniqueness(cube)
-            self._check_center_opposites(cube)
-            self._check_edge_validity(cube)
-            self._check_edge_flip_parity(cube)
-            self._check_permutation_parity(cube)
+            self._check_center_uniqueness(cube, pieces)
+            self._check_center_opposites(cube, pieces)
+            self._check_edge_validity(cube, pieces)
+            self._check_edge_flip_parity(cube, pieces)
+            self._check_permutation_parity(cube, pieces)
 
         if cube.size >= 4:
             self._check_center_count_big(cube)
             self._check_wing_edge_validity(cube)
 
+        cube.trusted = True
+
+    def validate_many(self, stickers: "np.ndarray", cube_size: int) -> "np.ndarray":
+        """
+        Validates many cube states of the same size at once, without raising.
+
+        The states are rows of color codes, laid out like the stickers of an `ArrayCube` flattened,
+        such as the stickers of a `BatchRotator`. Every check of `validate` runs over all the rows at
+        once with NumPy, and every state gets the `ValidationCode` of the first check it fails, VALID
+        if it passes them all.
+
+        :param stickers: The color codes of the stickers of every state, as an array of shape (M, 6 * N^2)
+        :param cube_size: The size of the cubes
+        :return: The code of every state, as an array of shape (M,)
+        """
+
+        # Imported here, since it needs the optional numpy extra and validating a single cube does not
+        from rubik_cube_solver.validator.batch_validator import validate_stickers
+
+        return validate_stickers(stickers, cube_size)
+
     @staticmethod
     def _check_size(cube: Cube) -> None:
         """
@@ -68,66 +158,64 @@ class Validator:
             raise ValueError("Cube size must be at least 2.")
 
     @staticmethod
-    def _check_color_count(cube: Cube) -> None:
+    def _check_color_count(cube: Cube, pieces: CubePieces | None = None) -> None:
         """
         Validates that each of the 6 colors appears exactly N^2 times
         across all stickers.
 
         :param cube: The Cube instance to validate
+        :param pieces: The stickers and pieces of the cube, read off it if None
         :return: None
         """
 
         expected_count = cube.size * cube.size
-        all_stickers = [sticker for face in cube.layers.values() for sticker in face]
-        color_counts = Counter(all_stickers)
+        stickers = (pieces or get_pieces(cube)).stickers
 
         for color in Color:
-            actual_count = color_counts.get(color, 0)
+            actual_count = stickers.count(color)
             if actual_count != expected_count:
                 raise ValueError(
                     f"Invalid color count for {color.name}: expected {expected_count}, got {actual_count}."
                 )
 
     @staticmethod
-    def _check_corner_validity(cube: Cube) -> None:
+    def _check_corner_validity(cube: Cube, pieces: CubePieces | None = None) -> None:
         """
         Validates that all 8 corner pieces are present exactly once with valid 3-color combinations.
 
         :param cube: The Cube instance to validate
+        :param pieces: The stickers and pieces of the cube, read off it if None
         :return: None
         """
 
-        corners = get_corners(cube)
-        seen_color_sets: list[frozenset[Color]] = []
+        seen_color_sets: set[frozenset[Color]] = set()
 
-        for corner in corners:
-            colors = frozenset(corner)
+        for colors in (pieces or get_pieces(cube)).corner_sets:
             if colors not in VALID_CORNER_COLOR_SETS:
                 raise ValueError(f"Invalid corner piece: {colors}.")
             if colors in seen_color_sets:
                 raise ValueError(f"Duplicate corner piece: {colors}.")
-            seen_color_sets.append(colors)
+            seen_color_sets.add(colors)
 
     @staticmethod
-    def _check_corner_orientation(cube: Cube) -> None:
+    def _check_corner_orientation(cube: Cube, pieces: CubePieces | None = None) -> None:
         """
         Validates that the sum of all 8 corner orientations is divisible by 3.
 
         :param cube: The Cube instance to validate
+        :param pieces: The stickers and pieces of the cube, read off it if None
         :return: None
         """
 
-        corners = get_corners(cube)
-        ud_colors = {Color.WHITE, Color.YELLOW}
         total = 0
 
-        for corner in corners:
+        for corner in (pieces or get_pieces(cube)).corners:
             c0, c1, c2 = corner
-            if c0 in ud_colors:
+            if c0 in UP_DOWN_COLORS:
                 total += 0
-            elif c1 in ud_colors:
+            elif c1 in UP_DOWN_COLORS:
                 total += 1
-            elif c2 in ud_colors:
+            elif c2 in UP_DOWN_COLORS:
                 total += 2
             else:
                 raise ValueError(f"Corner has no UP/DOWN color: {corner}.")
@@ -138,56 +226,51 @@ class Validator:
             )
 
     @staticmethod
-    def _check_corner_chirality(cube: Cube) -> None:
+    def _check_corner_chirality(cube: Cube, pieces: CubePieces | None = None) -> None:
         """
         Validates that each corner's stickers appear in the correct clockwise cyclic order.
 
         :param cube: The Cube instance to validate
+        :param pieces: The stickers and pieces of the cube, read off it if None
         :return: None
         """
 
-        corners = get_corners(cube)
+        pieces = pieces or get_pieces(cube)
 
-        for corner in corners:
-            c0, c1, c2 = corner
-            color_set = frozenset({c0, c1, c2})
-            canonical = CORNER_CANONICAL_CW[color_set]
-            valid_rotations = {
-                canonical,
-                (canonical[1], canonical[2], canonical[0]),
-                (canonical[2], canonical[0], canonical[1]),
-            }
-            if (c0, c1, c2) not in valid_rotations:
+        for corner, color_set in zip(pieces.corners, pieces.corner_sets):
+            if corner not in CORNER_CW_ROTATIONS[color_set]:
                 raise ValueError(f"Invalid corner chirality for piece {color_set}.")
 
     @staticmethod
-    def _check_center_uniqueness(cube: Cube) -> None:
+    def _check_center_uniqueness(cube: Cube, pieces: CubePieces | None = None) -> None:
         """
         Validates that all 6 center stickers of an odd sized cube are distinct colors.
 
         :param cube: The Cube instance to validate
+        :param pieces: The stickers and pieces of the cube, read off it if None
         :return: None
         """
 
         seen_colors: list[Color] = []
-        for face in Layer:
-            center_color = cube.layers[face][cube.size * cube.size // 2]
+        for center_color in (pieces or get_pieces(cube)).centers:
             if center_color in seen_colors:
                 raise ValueError(f"Duplicate center piece: {center_color}.")
             seen_colors.append(center_color)
 
     @staticmethod
-    def _check_center_opposites(cube: Cube) -> None:
+    def _check_center_opposites(cube: Cube, pieces: CubePieces | None = None) -> None:
         """
         Validates that all 6 center stickers of an odd sized cube have correct opposite colors.
 
         :param cube: The Cube instance to validate
+        :param pieces: The stickers and pieces of the cube, read off it if None
         :return: None
         """
 
+        layer_centers = dict(zip(Layer, (pieces or get_pieces(cube)).centers))
         for face in Layer:
-            center_color = cube.layers[face][cube.size * cube.size // 2]
-            opposite_color = cube.layers[CENTER_LAYER_OPPOSITES[face]][cube.size * cube.size // 2]
+            center_color = layer_centers[face]
+            opposite_color = layer_centers[CENTER_LAYER_OPPOSITES[face]]
             if CENTER_COLORS_OPPOSITES[center_color] != opposite_color:
                 raise ValueError(f"Invalid opposite color of {center_color}: {opposite_color}.")
 
@@ -214,24 +297,23 @@ class Validator:
                 )
 
     @staticmethod
-    def _check_edge_validity(cube: Cube) -> None:
+    def _check_edge_validity(cube: Cube, pieces: CubePieces | None = None) -> None:
         """
         Validates that all 12 edge pieces are present exactly once with valid 2-color combinations.
 
         :param cube: The Cube instance to validate
+        :param pieces: The stickers and pieces of the cube, read off it if None
         :return: None
         """
 
-        edges = get_edges(cube)
-        seen_color_sets: list[frozenset[Color]] = []
+        seen_color_sets: set[frozenset[Color]] = set()
 
-        for edge in edges:
-            colors = frozenset(edge)
+        for colors in (pieces or get_pieces(cube)).edge_sets:
             if colors not in VALID_EDGE_COLOR_SETS:
                 raise ValueError(f"Invalid edge piece: {colors}.")
             if colors in seen_color_sets:
                 raise ValueError(f"Duplicate edge piece: {colors}.")
-            seen_color_sets.append(colors)
+            seen_color_sets.add(colors)
 
     @staticmethod
     def _check_wing_edge_validity(cube: Cube) -> None:
@@ -243,7 +325,7 @@ class Validator:
         """
 
         wing_edges = get_wing_edges(cube)
-        seen_wing_edges: list[tuple[int, Color, Color]] = []
+        seen_wing_edges: set[tuple[int, Color, Color]] = set()
 
         for wing_edge in wing_edges:
             _, primary_color, secondary_color = wing_edge
@@ -252,22 +334,23 @@ class Validator:
                 raise ValueError(f"Invalid wing edge piece: {wing_edge_colors}.")
             if wing_edge in seen_wing_edges:
                 raise ValueError(f"Duplicate wing edge piece: {wing_edge}.")
-            seen_wing_edges.append(wing_edge)
+            seen_wing_edges.add(wing_edge)
 
     @staticmethod
-    def _check_edge_flip_parity(cube: Cube) -> None:
+    def _check_edge_flip_parity(cube: Cube, pieces: CubePieces | None = None) -> None:
         """
         Validates that the sum of all 12 edge orientations is divisible by 2.
 
         :param cube: The Cube instance to validate
+        :param pieces: The stickers and pieces of the cube, read off it if None
         :return: None
         """
 
-        edges = get_edges(cube)
+        pieces = pieces or get_pieces(cube)
         total = 0
 
-        for c1, c2 in edges:
-            primary_color = EDGE_CANONICAL_ORIENTATION[frozenset({c1, c2})]
+        for (c1, _), color_set in zip(pieces.edges, pieces.edge_sets):
+            primary_color = EDGE_CANONICAL_ORIENTATION[color_set]
             if c1 == primary_color:
                 total += 0
             else:
@@ -277,7 +360,7 @@ class Validator:
             raise ValueError(f"Invalid edge flip parity: sum of orientations is {total}, expected a multiple of 2.")
 
     @staticmethod
-    def _check_permutation_parity(cube: Cube) -> None:
+    def _check_permutation_parity(cube: Cube, pieces: CubePieces | None = None) -> None:
         """
         Validates that corner and edge permutations share the same parity (both even or both odd).
 
@@ -286,17 +369,15 @@ class Validator:
         rotation (e.g. `x`, `y'`) still validates correctly.
 
         :param cube: The Cube instance to validate
+        :param pieces: The stickers and pieces of the cube, read off it if None
         :return: None
         """
 
-        canonical_corners = get_canonical_pieces(cube, CORNER_SLOT_LAYERS)
-        canonical_edges = get_canonical_pieces(cube, EDGE_SLOT_LAYERS)
-
-        corners = get_corners(cube)
-        corner_perm = [canonical_corners.index(frozenset(corner)) for corner in corners]
+        pieces = pieces or get_pieces(cube)
+        canonical_corners, canonical_edges = get_canonical_slots(pieces.centers)
 
-        edges = get_edges(cube)
-        edge_perm = [canonical_edges.index(frozenset(edge)) for edge in edges]
+        corner_perm = [canonical_corners.index(corner_set) for corner_set in pieces.corner_sets]
+        edge_perm = [canonical_edges.index(edge_set) for edge_set in pieces.edge_sets]
 
         def count_inversions(perm: list[int]) -> int:
             inversions = 0
@@ -27,6 +27,13 @@ CORNER_CANONICAL_CW: dict[frozenset[Color], tuple[Color, Color, Color]] = {
     frozenset({Color.YELLOW, Color.BLUE, Color.RED}): (Color.YELLOW, Color.RED, Color.BLUE),
 }
 
+# Every clockwise rotation of the canonical sequence of each valid corner color set, which are the
+# three orders a corner of that set may be read in
+CORNER_CW_ROTATIONS: dict[frozenset[Color], tuple[tuple[Color, Color, Color], ...]] = {
+    color_set: (canonical, canonical[1:] + canonical[:1], canonical[2:] + canonical[:2])
+    for color_set, canonical in CORNER_CANONICAL_CW.items()
+}
+
 VALID_EDGE_COLOR_SETS: frozenset[frozenset[Color]] = frozenset(
     {
         frozenset({Color.WHITE, Color.GREEN}),
@@ -16,7 +16,7 @@ def face_center_color(cube: Cube, layer: Layer) -> Color:
     :return: The center sticker color
     """
 
-    return cube.layers[layer][cube.size * cube.size // 2]
+    return cube.read_layers()[layer][cube.size * cube.size // 2]
 
 
 def get_canonical_pieces(cube: Cube, slot_layers: list[tuple[Layer, ...]]) -> list[frozenset[Color]]:
@@ -44,7 +44,7 @@ def get_corners(cube: Cube) -> list[tuple[Color, Color, Color]]:
     """
 
     n = cube.size
-    layers = cube.layers
+    layers = cube.read_layers()
     # Each entry: (face1_color, face2_color, face3_color) in CW order
     return [
         # UFL
@@ -135,7 +135,7 @@ def get_centers(cube: Cube) -> list[tuple[Color, int, int]]:
     """
 
     n = cube.size
-    layers = cube.layers
+    layers = cube.read_layers()
     centers: list[tuple[Color, int, int]] = []
 
     for face in Layer:
@@ -162,7 +162,7 @@ def get_edges(cube: Cube) -> list[tuple[Color, Color]]:
     :return: List of 12 edge color tuples
     """
 
-    layers = cube.layers
+    layers = cube.read_layers()
     size = cube.size
 
     # Define location of middle edges of an odd sized cube
@@ -280,7 +280,7 @@ def get_wing_edges(cube: Cube) -> list[tuple[int, Color, Color]]:
     """
 
     n = cube.size
-    layers = cube.layers
+    layers = cube.read_layers()
     wing_edges: list[tuple[int, Color, Color]] = []
 
     for primary_layer, secondary_layers in WING_EDGES_LAYER_PAIRS:
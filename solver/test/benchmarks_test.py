@@ -0,0 +1,186 @@
+# Python imports
+import copy
+import importlib.util
+import json
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+SOLVER_DIRECTORY = Path(__file__).resolve().parent.parent
+BENCHMARK_SCRIPT = SOLVER_DIRECTORY / "benchmarks" / "benchmark_solvers.py"
+
+
+@pytest.fixture(scope="module")
+def benchmark_solvers() -> ModuleType:
+    """
+    Fixture that imports the benchmark script as a module.
+
+    :return: The benchmark script
+    """
+
+    spec = importlib.util.spec_from_file_location("benchmark_solvers", BENCHMARK_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture(scope="module")
+def results(benchmark_solvers: ModuleType) -> dict:
+    """
+    Fixture that runs the benchmark over a small corpus once.
+
+    :param benchmark_solvers: The benchmark script
+    :return: The results
+    """
+
+    return benchmark_solvers.run(5, 1)
+
+
+class TestBenchmarkSolvers:
+    def test_corpus_is_seeded(self, benchmark_solvers: ModuleType) -> None:
+        """
+        Tests that the corpus is the same for the same seed, and differs for another seed and size.
+
+        :param benchmark_solvers: The benchmark script
+        :return: None
+        """
+
+        # Act
+        corpus = benchmark_solvers.generate_corpus(3, 10, 1)
+
+        # Assert
+        assert corpus == benchmark_solvers.generate_corpus(3, 10, 1)
+        assert corpus != benchmark_solvers.generate_corpus(3, 10, 2)
+        assert corpus != benchmark_solvers.generate_corpus(2, 10, 1)
+
+    def test_results(self, results: dict) -> None:
+        """
+        Tests that the results hold every measurement for both cube sizes, with a step count for every
+        step of the solver.
+
+        :param results: The results
+        :return: None
+        """
+
+        # Assert
+        assert sorted(results["results"]) == ["2x2", "3x3"]
+        assert sorted(results["results"]["2x2"]["step_moves"]) == ["first_layer", "oll", "pll"]
+        assert sorted(results["results"]["3x3"]["step_moves"]) == ["cross", "f2l", "oll", "pll"]
+        for result in results["results"].values():
+            assert result["solves_per_second"] > 0
+            assert 0 < result["latency_p50_ms"] <= result["latency_p99_ms"]
+            assert 0 < result["average_moves"] <= result["max_moves"]
+
+    def test_no_regressions_against_itself(self, benchmark_solvers: ModuleType, results: dict) -> None:
+        """
+        Tests that results have no regressions against themselves as the baseline.
+
+        :param benchmark_solvers: The benchmark script
+        :param results: The results
+        :return: None
+        """
+
+        # Assert
+        assert benchmark_solvers.find_regressions(results, results, 0.0) == []
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "name, factor, regressed", [
+            ("solves_per_second", 1.1, False),
+            ("solves_per_second", 1.5, True),
+            ("latency_p99_ms", 1.1, False),
+            ("latency_p99_ms", 0.5, True),
+        ]
+    )
+    # fmt: on
+    def test_timing_tolerance(
+        self, benchmark_solvers: ModuleType, results: dict, name: str, factor: float, regressed: bool
+    ) -> None:
+        """
+        Tests that a timing is a regression only once it is worse than the baseline by more than the
+        tolerance.
+
+        :param benchmark_solvers: The benchmark script
+        :param results: The results
+        :param name: The timing changed in the baseline
+        :param factor: What the timing of the baseline is multiplied by
+        :param regressed: Whether a regression is expected
+        :return: None
+        """
+
+        # Generate the baseline
+        baseline = copy.deepcopy(results)
+        baseline["results"]["3x3"][name] *= factor
+
+        # Act
+        regressions = benchmark_solvers.find_regressions(results, baseline, 0.25)
+
+        # Assert
+        assert bool(regressions) == regressed
+        assert all(name in regression for regression in regressions)
+
+    def test_any_extra_move_is_a_regression(self, benchmark_solvers: ModuleType, results: dict) -> None:
+        """
+        Tests that a step count above the baseline is a regression, however small the difference.
+
+        :param benchmark_solvers: The benchmark script
+        :param results: The results
+        :return: None
+        """
+
+        # Generate the baseline
+        baseline = copy.deepcopy(results)
+        baseline["results"]["3x3"]["step_moves"]["f2l"] -= 0.01
+
+        # Act
+        regressions = benchmark_solvers.find_regressions(results, baseline, 1.0)
+
+        # Assert
+        assert len(regressions) == 1
+        assert regressions[0].startswith("3x3: step_moves.f2l is")
+
+    def test_other_corpus_is_not_compared(self, benchmark_solvers: ModuleType, results: dict) -> None:
+        """
+        Tests that results of another corpus are reported instead of compared.
+
+        :param benchmark_solvers: The benchmark script
+        :param results: The results
+        :return: None
+        """
+
+        # Generate the baseline
+        baseline = copy.deepcopy(results)
+        baseline["results"]["2x2"]["corpus"] = "another"
+
+        # Act
+        regressions = benchmark_solvers.find_regressions(results, baseline, 0.25)
+
+        # Assert
+        assert regressions == ["2x2: the corpus differs from the baseline, so it cannot be compared"]
+
+    def test_main(self, benchmark_solvers: ModuleType, tmp_path: Path) -> None:
+        """
+        Tests that the script writes a baseline, passes against it, and fails against a baseline with
+        fewer moves.
+
+        :param benchmark_solvers: The benchmark script
+        :param tmp_path: Fixture giving a temporary directory
+        :return: None
+        """
+
+        # Act
+        baseline = tmp_path / "baseline.json"
+        arguments = ["--count", "3", "--baseline", str(baseline), "--tolerance", "100"]
+        updated = benchmark_solvers.main(arguments + ["--update-baseline"])
+        compared = benchmark_solvers.main(arguments + ["--output", str(tmp_path / "results.json")])
+
+        # Regress the move count of the baseline
+        regressed_baseline = json.loads(baseline.read_text())
+        regressed_baseline["results"]["2x2"]["max_moves"] -= 1
+        baseline.write_text(json.dumps(regressed_baseline))
+        regressed = benchmark_solvers.main(arguments)
+
+        # Assert
+        assert (updated, compared, regressed) == (0, 0, 1)
+        assert json.loads((tmp_path / "results.json").read_text())["count"] == 3
@@ -0,0 +1,410 @@
+# Python imports
+import pickle
+from typing import Callable, MutableSequence
+
+import numpy as np
+import pytest
+
+# Project imports
+from rubik_cube_solver.array_cube import COLOR_CODES, COLORS, ArrayCube, get_index_array
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.move_table import get_move_table
+from rubik_cube_solver.cube_rotation.rotator import Rotator
+from rubik_cube_solver.enums.Color import Color
+from rubik_cube_solver.enums.Direction import Direction
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.solve.solver import create_solver
+from rubik_cube_solver.validator.validator import Validator
+
+
+class TestArrayCubeInit:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "size", [2, 3, 7]
+    )
+    # fmt: on
+    def test_solved(self, size: int) -> None:
+        """
+        Tests that a new array cube starts solved, exactly like a new list-backed cube.
+
+        :param size: The size of the cube
+        :return: None
+        """
+
+        # Act
+        cube = ArrayCube(size)
+
+        # Assert
+        assert cube.stickers.shape == (6, size, size)
+        assert cube.stickers.dtype == np.uint8
+        assert cube.layers == Cube(size).layers
+
+    def test_from_layers(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that an array cube built from explicit layers stores every sticker as its color code.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        # Act
+        cube = ArrayCube(3, scrambled_3x3_cube.layers)
+
+        # Assert
+        for position, layer in enumerate(Layer):
+            assert [COLORS[code] for code in cube.stickers[position].ravel()] == scrambled_3x3_cube.layers[layer]
+
+    def test_from_cube_and_back(self, scrambled_4x4_cube: Cube) -> None:
+        """
+        Tests that a cube survives the round trip through an array cube.
+
+        :param scrambled_4x4_cube: A scrambled 4x4 cube
+        :return: None
+        """
+
+        # Act
+        cube = ArrayCube.from_cube(scrambled_4x4_cube).to_cube()
+
+        # Assert
+        assert type(cube) is Cube
+        assert cube.layers == scrambled_4x4_cube.layers
+
+    def test_memory(self) -> None:
+        """
+        Tests that every sticker takes a single byte.
+
+        :return: None
+        """
+
+        # Assert
+        assert ArrayCube(7).stickers.nbytes == 6 * 7 * 7
+
+    def test_equal_to_cube(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that an array cube equals, hashes and packs like the list-backed cube with the same stickers.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        # Act
+        cube = ArrayCube.from_cube(scrambled_3x3_cube)
+
+        # Assert
+        assert cube == scrambled_3x3_cube
+        assert hash(cube) == hash(scrambled_3x3_cube)
+        assert cube.to_bytes() == scrambled_3x3_cube.to_bytes()
+
+    def test_pickle(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that an array cube is unpickled as an array cube.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        # Act
+        cube = pickle.loads(pickle.dumps(ArrayCube.from_cube(scrambled_3x3_cube)))
+
+        # Assert
+        assert type(cube) is ArrayCube
+        assert cube == scrambled_3x3_cube
+
+
+class TestArrayCubeStickers:
+    def test_set(self) -> None:
+        """
+        Tests that assigning the sticker array replaces the state the layers are read from.
+
+        :return: None
+        """
+
+        cube = ArrayCube(2)
+        stickers = np.full((6, 2, 2), COLOR_CODES[Color.RED])
+
+        # Act
+        cube.stickers = stickers
+
+        # Assert
+        assert all(face == [Color.RED] * 4 for face in cube.layers.values())
+
+    def test_invalid_shape(self) -> None:
+        """
+        Tests that a sticker array of the wrong shape is rejected.
+
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            ArrayCube(3).stickers = np.zeros((6, 2, 2), dtype=np.uint8)
+
+    def test_layers_edits_are_kept(self) -> None:
+        """
+        Tests that editing a face of the layers view in place writes the array.
+
+        :return: None
+        """
+
+        cube = ArrayCube(3)
+
+        # Act
+        cube.layers[Layer.UP][4] = Color.BLUE
+
+        # Assert
+        assert cube.stickers[0, 1, 1] == COLOR_CODES[Color.BLUE]
+
+
+class TestArrayCubeLayers:
+    def test_views_follow_the_array(self) -> None:
+        """
+        Tests that reading the layers keeps the sticker array, and that a face read before a move shows
+        the stickers after it.
+
+        :return: None
+        """
+
+        cube = ArrayCube(3)
+        expected = Cube(3)
+        stickers = cube.stickers
+        face = cube.read_layers()[Layer.FRONT]
+
+        # Act
+        Rotator(cube).apply(Algorithm.from_str("R U"))
+        Rotator(expected).apply(Algorithm.from_str("R U"))
+
+        # Assert
+        assert face == expected.read_layers()[Layer.FRONT]
+        assert cube.read_layers() == expected.read_layers()
+        assert not np.shares_memory(cube.stickers, stickers)
+
+    def test_reading_keeps_the_array(self) -> None:
+        """
+        Tests that reading the layers neither replaces the sticker array nor converts it.
+
+        :return: None
+        """
+
+        cube = ArrayCube(3)
+        stickers = cube.stickers
+
+        # Act
+        layers = cube.read_layers()
+        colors = [list(face) for face in layers.values()]
+
+        # Assert
+        assert cube.stickers is stickers
+        assert colors == [face for face in Cube(3).read_layers().values()]
+
+    def test_array_edits_are_read(self) -> None:
+        """
+        Tests that a face read before and after the sticker array is edited in place shows the edit.
+
+        :return: None
+        """
+
+        cube = ArrayCube(3)
+        face = cube.read_layers()[Layer.UP]
+        assert face[0] == Color.WHITE
+
+        # Act
+        cube.stickers[0, 0, 0] = COLOR_CODES[Color.RED]
+
+        # Assert
+        assert face[0] == Color.RED
+
+    def test_writing_drops_trust(self) -> None:
+        """
+        Tests that reading the layers keeps a cube trusted, while writing a sticker through them drops the
+        trust and writes the array.
+
+        :return: None
+        """
+
+        cube = ArrayCube(3)
+        face = cube.layers[Layer.UP]
+
+        # Assert
+        assert cube.trusted
+
+        # Act
+        face[-1] = Color.RED
+
+        # Assert
+        assert not cube.trusted
+        assert cube.stickers[0, 2, 2] == COLOR_CODES[Color.RED]
+
+    def test_face(self) -> None:
+        """
+        Tests that a face reads like a list of colors, that slices are lists, and that whole faces and
+        slices of them can be written.
+
+        :return: None
+        """
+
+        cube = ArrayCube(2)
+        face = cube.layers[Layer.DOWN]
+
+        # Act
+        face[1:3] = [Color.BLUE, Color.GREEN]
+        cube.layers[Layer.UP] = [Color.RED] * 4
+
+        # Assert
+        assert len(face) == 4
+        assert face[:] == [Color.YELLOW, Color.BLUE, Color.GREEN, Color.YELLOW]
+        assert face == (Color.YELLOW, Color.BLUE, Color.GREEN, Color.YELLOW)
+        assert face != [Color.YELLOW] * 4
+        assert repr(face) == repr(face[:])
+        assert Color.BLUE in face and face.index(Color.GREEN) == 2
+        assert cube.layers[Layer.UP] == [Color.RED] * 4
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "edit, error", [
+            (lambda face: face.append(Color.RED),            TypeError),
+            (lambda face: face.pop(),                        TypeError),
+            (lambda face: face.__setitem__(slice(2), []),    ValueError),
+            (lambda face: face.__setitem__(9, Color.RED),    IndexError),
+        ]
+    )
+    # fmt: on
+    def test_fixed_size(self, edit: Callable[[MutableSequence[Color]], None], error: type[Exception]) -> None:
+        """
+        Tests that a face can neither grow nor shrink, nor be written past its end.
+
+        :param edit: The edit to make to the face
+        :param error: The error expected
+        :return: None
+        """
+
+        face = ArrayCube(3).layers[Layer.UP]
+
+        with pytest.raises(error):
+            edit(face)
+
+        assert face == [Color.WHITE] * 9
+
+
+class TestArrayCubeRotator:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "size, algorithm", [
+            (2, "R U R' U' F2 y R' x'"),
+            (3, "R U R' U' L2 D B' z F2 y'"),
+            (4, "Rw U2 2Fw' L D2 B x Uw'"),
+            (7, "3Rw 2Uw' F 3Bw2 y L' D"),
+        ]
+    )
+    # fmt: on
+    def test_matches_cube(self, size: int, algorithm: str) -> None:
+        """
+        Tests that applying moves to an array cube leaves it in the same state as a list-backed cube.
+
+        :param size: The size of the cube
+        :param algorithm: The algorithm to apply
+        :return: None
+        """
+
+        # Mock the cubes
+        cube = ArrayCube(size)
+        expected_cube = Cube(size)
+
+        # Act
+        Rotator(cube).apply(Algorithm.from_str(algorithm))
+        Rotator(expected_cube).apply(Algorithm.from_str(algorithm))
+
+        # Assert
+        assert cube.layers == expected_cube.layers
+        assert cube.state() == expected_cube.state()
+        assert str(cube) == str(expected_cube)
+
+    def test_validate_and_solve(self) -> None:
+        """
+        Tests that the validator and the solvers run on an array cube unchanged.
+
+        :return: None
+        """
+
+        cube = ArrayCube(3)
+        Rotator(cube).apply(Algorithm.from_str("R U2 F' L D B2 R' U F2 D' L2 B"))
+
+        # Act
+        Validator().validate(cube)
+        create_solver(cube).solve()
+
+        # Assert
+        assert cube.layers == Cube(3).layers
+
+
+class TestGetIndexArray:
+    def test_reused_for_the_same_tuple(self) -> None:
+        """
+        Tests that a permutation handed out by the move table is converted only once.
+
+        :return: None
+        """
+
+        permutation = get_move_table(3).turn(Layer.UP, Direction.CW, 1)
+
+        # Act
+        index_array = get_index_array(permutation)
+
+        # Assert
+        assert get_index_array(permutation) is index_array
+        assert index_array.tolist() == list(permutation)
+        assert not index_array.flags.writeable
+
+    def test_lists_are_converted_anew(self) -> None:
+        """
+        Tests that a list is converted on every call, so an edit to it is never missed.
+
+        :return: None
+        """
+
+        permutation = list(range(6 * 2 * 2))
+        get_index_array(permutation)
+
+        # Act
+        permutation[0], permutation[1] = permutation[1], permutation[0]
+
+        # Assert
+        assert get_index_array(permutation).tolist() == permutation
+
+
+class TestArrayCubeSnapshot:
+    def test_writing_leaves_the_snapshot(self) -> None:
+        """
+        Tests that writing a sticker right after a snapshot, which holds the same sticker array, leaves
+        the snapshot as it was.
+
+        :return: None
+        """
+
+        cube = ArrayCube(3)
+
+        # Act
+        snapshot = cube.snapshot()
+        cube.layers[Layer.UP][4] = Color.RED
+        cube.restore(snapshot)
+
+        # Assert
+        assert cube == Cube(3)
+
+    def test_restore(self, scrambled_4x4_cube: Cube) -> None:
+        """
+        Tests that an array cube can be restored to a snapshot, even after its layers were edited.
+
+        :param scrambled_4x4_cube: A scrambled 4x4 cube
+        :return: None
+        """
+
+        cube = ArrayCube.from_cube(scrambled_4x4_cube)
+
+        # Act
+        snapshot = cube.snapshot()
+        Rotator(cube).apply(Algorithm.from_str("Rw U2 F' x"))
+        cube.layers[Layer.UP][0] = Color.RED
+        cube.restore(snapshot)
+
+        # Assert
+        assert cube == scrambled_4x4_cube
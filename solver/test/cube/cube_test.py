@@ -1,11 +1,14 @@
 # Python imports
+import pickle
 import textwrap
-from typing import Any
+from typing import Any, Callable
 
 import pytest
 
 # Project imports
-from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube import SOLVED_COLORS, Cube
+from rubik_cube_solver.enums.Color import Color
+from rubik_cube_solver.enums.Layer import Layer
 
 
 class TestCubeStr:
@@ -387,3 +390,406 @@ class TestCubeState:
         # Assert
         assert actual_dimensions == expected_dimensions
         assert actual_state == expected_state
+
+
+class TestCubePermute:
+    def test_gathers_every_sticker(self, scrambled_2x2_cube: Cube) -> None:
+        """
+        Tests that flat sticker `i` of the permuted cube is taken from flat sticker `permutation[i]`,
+        with the faces flattened in `Layer` order.
+
+        :param scrambled_2x2_cube: Fixture to return a scrambled 2x2 cube
+        :return: None
+        """
+
+        # Mock the permutation - every face is shifted one position along the `Layer` order
+        stickers = [sticker for layer in Layer for sticker in scrambled_2x2_cube.layers[layer]]
+        permutation = [(index + 4) % 24 for index in range(24)]
+
+        # Act
+        scrambled_2x2_cube.permute(permutation)
+
+        # Assert
+        assert [sticker for layer in Layer for sticker in scrambled_2x2_cube.layers[layer]] == [
+            stickers[index] for index in permutation
+        ]
+
+    def test_replaces_the_face_lists(self, solved_3x3_cube: Cube) -> None:
+        """
+        Tests that the face lists are replaced rather than edited in place, so a face read before
+        the call keeps its stickers.
+
+        :param solved_3x3_cube: Fixture to return a solved 3x3 cube
+        :return: None
+        """
+
+        # Mock the permutation - UP and DOWN are swapped
+        up_face = solved_3x3_cube.layers[Layer.UP]
+        permutation = list(range(9, 18)) + list(range(9)) + list(range(18, 54))
+
+        # Act
+        solved_3x3_cube.permute(permutation)
+
+        # Assert
+        assert up_face == [Color.WHITE] * 9
+        assert solved_3x3_cube.layers[Layer.UP] == [Color.YELLOW] * 9
+        assert solved_3x3_cube.layers[Layer.DOWN] == [Color.WHITE] * 9
+
+
+class TestCubeTrusted:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "cube, trusted", [
+            (Cube(2), True),
+            (Cube(3), True),
+            (Cube(1), False),
+            (Cube(2, {layer: [Color.WHITE] * 4 for layer in Layer}), False),
+        ]
+    )
+    # fmt: on
+    def test_created_solved(self, cube: Cube, trusted: bool) -> None:
+        """
+        Tests that a cube created solved is trusted, unless it is too small to be validated, and a cube
+        created from layers is not.
+
+        :param cube: The cube
+        :param trusted: Whether the cube is expected to be trusted
+        :return: None
+        """
+
+        # Assert
+        assert cube.trusted == trusted
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "change", [
+            lambda cube: cube.layers,
+            lambda cube: setattr(cube, "layers", cube.read_layers()),
+            lambda cube: setattr(cube, "size", 3),
+            lambda cube: cube.permute(list(range(53, -1, -1))),
+        ]
+    )
+    # fmt: on
+    def test_changes_drop_trust(self, change: Callable[[Cube], Any]) -> None:
+        """
+        Tests that handing out the layers to be edited, setting the layers or the size, and a
+        permutation that is not a move make the cube untrusted.
+
+        :param change: The change made to the cube
+        :return: None
+        """
+
+        cube = Cube(3)
+
+        # Act
+        change(cube)
+
+        # Assert
+        assert not cube.trusted
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "read", [
+            lambda cube: cube.read_layers(),
+            lambda cube: cube == Cube(3),
+            lambda cube: hash(cube),
+            lambda cube: cube.to_bytes(),
+            lambda cube: str(cube),
+            lambda cube: cube.state(),
+            lambda cube: pickle.dumps(cube),
+            lambda cube: cube.permute(list(range(54)), move=True),
+        ]
+    )
+    # fmt: on
+    def test_reads_and_moves_keep_trust(self, read: Callable[[Cube], Any]) -> None:
+        """
+        Tests that reading the stickers without handing them out to be edited, and a permutation that
+        is a move, keep the cube trusted.
+
+        :param read: The read or move made on the cube
+        :return: None
+        """
+
+        cube = Cube(3)
+
+        # Act
+        read(cube)
+
+        # Assert
+        assert cube.trusted
+
+    def test_layers_handed_out_keep_the_cube_untrusted(self) -> None:
+        """
+        Tests that a cube whose layers were handed out stays untrusted when trusted, since an edit
+        through the layers read earlier still changes the cube.
+
+        :return: None
+        """
+
+        cube = Cube(3)
+        layers = cube.layers
+
+        # Act
+        cube.trusted = True
+        layers[Layer.UP][0], layers[Layer.FRONT][0] = layers[Layer.FRONT][0], layers[Layer.UP][0]
+
+        # Assert
+        assert not cube.trusted
+        assert cube != Cube(3)
+
+    def test_setting_layers_restores_trust(self) -> None:
+        """
+        Tests that setting the layers anew gives the cube storage of its own, so it can be trusted
+        again and the layers read earlier no longer change it.
+
+        :return: None
+        """
+
+        cube = Cube(3)
+        layers = cube.layers
+        cube.layers = cube.read_layers()
+
+        # Act
+        cube.trusted = True
+        layers[Layer.UP][0], layers[Layer.FRONT][0] = layers[Layer.FRONT][0], layers[Layer.UP][0]
+
+        # Assert
+        assert cube.trusted
+        assert cube == Cube(3)
+
+    def test_layers_given_are_copied(self) -> None:
+        """
+        Tests that the layers a cube is created with stay the caller's own.
+
+        :return: None
+        """
+
+        layers = {layer: [color] * 9 for layer, color in SOLVED_COLORS.items()}
+        cube = Cube(3, layers)
+
+        # Act
+        layers[Layer.UP][0] = Color.RED
+
+        # Assert
+        assert cube.read_layers()[Layer.UP][0] == Color.WHITE
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "change, trusted", [
+            (lambda cube: None, True),
+            (lambda cube: cube.permute(list(range(54)), move=True), True),
+            (lambda cube: cube.permute(list(range(54))), False),
+            (lambda cube: cube.layers, False),
+            (lambda cube: setattr(cube, "trusted", False), False),
+        ]
+    )
+    # fmt: on
+    def test_restore(self, change: Callable[[Cube], Any], trusted: bool) -> None:
+        """
+        Tests that restoring a snapshot of a trusted cube keeps it trusted only if its stickers have
+        only been moved since.
+
+        :param change: The change made to the cube after the snapshot
+        :param trusted: Whether the cube is expected to be trusted after the restore
+        :return: None
+        """
+
+        cube = Cube(3)
+        snapshot = cube.snapshot()
+        change(cube)
+
+        # Act
+        cube.restore(snapshot)
+
+        # Assert
+        assert cube.trusted == trusted
+
+    def test_restore_after_trusting_again(self) -> None:
+        """
+        Tests that a snapshot taken before the layers were handed out does not bring back trust, even
+        once the cube is trusted again, since the snapshot shares the face lists handed out.
+
+        :return: None
+        """
+
+        cube = Cube(3)
+        snapshot = cube.snapshot()
+        cube.layers
+        cube.trusted = True
+
+        # Act
+        cube.restore(snapshot)
+
+        # Assert
+        assert not cube.trusted
+
+    def test_untrusted_snapshot(self) -> None:
+        """
+        Tests that restoring a snapshot of an untrusted cube leaves the cube untrusted.
+
+        :return: None
+        """
+
+        cube = Cube(3, {layer: [color] * 9 for layer, color in SOLVED_COLORS.items()})
+        snapshot = cube.snapshot()
+        cube.trusted = True
+
+        # Act
+        cube.restore(snapshot)
+
+        # Assert
+        assert not cube.trusted
+
+
+class TestCubeSnapshot:
+    def test_restore(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that a cube can be restored to a snapshot any number of times, whatever was permuted since.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        expected_layers = {layer: list(stickers) for layer, stickers in scrambled_3x3_cube.layers.items()}
+        permutation = [(index + 1) % 54 for index in range(54)]
+
+        # Act
+        snapshot = scrambled_3x3_cube.snapshot()
+        for _ in range(2):
+            scrambled_3x3_cube.permute(permutation)
+            scrambled_3x3_cube.restore(snapshot)
+
+            # Assert
+            assert scrambled_3x3_cube.layers == expected_layers
+
+    def test_shares_face_lists(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that a snapshot shares the face lists with the cube instead of copying them.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        # Act
+        _, _, layers, _, _ = scrambled_3x3_cube.snapshot()
+
+        # Assert
+        assert all(layers[layer] is scrambled_3x3_cube.layers[layer] for layer in Layer)
+
+
+class TestCubeToBytes:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "cube_generator, expected_length", [
+            ("solved_2x2_cube",     11),
+            ("scrambled_2x2_cube",  11),
+            ("solved_3x3_cube",     23),
+            ("scrambled_3x3_cube",  23),
+            ("scrambled_4x4_cube",  38),
+        ]
+    )
+    # fmt: on
+    def test_round_trip(self, cube_generator: str, expected_length: int, request: pytest.FixtureRequest) -> None:
+        """
+        Tests that a cube packs into 3 bits per sticker plus its size, and unpacks into the same state.
+
+        :param cube_generator: The name of the fixture that generates the cube
+        :param expected_length: The expected length of the packed cube
+        :param request: The pytest fixture request
+        :return: None
+        """
+
+        cube = request.getfixturevalue(cube_generator)
+
+        # Act
+        packed = cube.to_bytes()
+
+        # Assert
+        assert len(packed) == expected_length
+        assert Cube.from_bytes(packed).layers == cube.layers
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "packed", [
+            b"",
+            b"\x00\x03" + bytes(20),
+            b"\x00\x03" + bytes(22),
+            b"\x00\x02" + b"\xff" * 9,
+        ]
+    )
+    # fmt: on
+    def test_invalid(self, packed: bytes) -> None:
+        """
+        Tests that bytes of the wrong length or with a code that is not a color are rejected.
+
+        :param packed: The packed cube
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            Cube.from_bytes(packed)
+
+
+class TestCubeEq:
+    def test_success(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that cubes with the same stickers are equal, and cubes with different ones are not.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        # Mock the cubes
+        same_cube = Cube(3, {layer: list(stickers) for layer, stickers in scrambled_3x3_cube.layers.items()})
+        different_cube = Cube(3, {layer: list(stickers) for layer, stickers in scrambled_3x3_cube.layers.items()})
+        different_cube.layers[Layer.UP][0] = Color.RED
+
+        # Assert
+        assert scrambled_3x3_cube == same_cube
+        assert scrambled_3x3_cube != different_cube
+        assert Cube(2) != Cube(3)
+
+    def test_different_type(self, solved_3x3_cube: Cube) -> None:
+        """
+        Tests that a cube is never equal to something that is not a cube.
+
+        :param solved_3x3_cube: A solved 3x3 cube
+        :return: None
+        """
+
+        # Assert
+        assert solved_3x3_cube != "Not a Cube"
+
+
+class TestCubeHash:
+    def test_dictionary_key(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that equal cubes hash equally, so a cube can be used as a dictionary key.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        # Mock the dictionary
+        solutions = {scrambled_3x3_cube: "solution"}
+
+        # Assert
+        assert solutions[Cube.from_bytes(scrambled_3x3_cube.to_bytes())] == "solution"
+        assert Cube(3) not in solutions
+
+
+class TestCubeReduce:
+    def test_pickle(self, scrambled_4x4_cube: Cube) -> None:
+        """
+        Tests that a cube is pickled through its packed state.
+
+        :param scrambled_4x4_cube: A scrambled 4x4 cube
+        :return: None
+        """
+
+        # Act
+        pickled = pickle.dumps(scrambled_4x4_cube)
+
+        # Assert
+        assert pickle.loads(pickled) == scrambled_4x4_cube
+        assert len(pickled) < len(pickle.dumps(scrambled_4x4_cube.layers)) // 2
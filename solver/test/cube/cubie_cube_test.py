@@ -0,0 +1,293 @@
+# Python imports
+import pytest
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.move import Move
+from rubik_cube_solver.cube_rotation.rotator import Rotator
+from rubik_cube_solver.cubie_cube import CORNER_PIECES, EDGE_PIECES, CubieCube, read_corners
+from rubik_cube_solver.enums.Color import Color
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.solve.corner_search import search_corner
+from rubik_cube_solver.solve.edge_search import search_edge
+
+
+class TestCubieCubeInit:
+    def test_solved(self) -> None:
+        """
+        Tests that a new cubie cube is solved, and converts to a solved cube.
+
+        :return: None
+        """
+
+        # Act
+        cubie_cube = CubieCube()
+
+        # Assert
+        assert cubie_cube == CubieCube.from_cube(Cube(3))
+        assert cubie_cube.to_cube().layers == Cube(3).layers
+
+
+class TestCubieCubeFromCube:
+    def test_round_trip(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that a cube survives the round trip through a cubie cube.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        # Act
+        cubie_cube = CubieCube.from_cube(scrambled_3x3_cube)
+
+        # Assert
+        assert cubie_cube.to_cube().layers == scrambled_3x3_cube.layers
+
+    def test_pieces(self) -> None:
+        """
+        Tests that a single turn moves and orients the pieces as expected.
+
+        :return: None
+        """
+
+        cube = Cube(3)
+        Rotator(cube).turn(Move.from_str("F"))
+
+        # Act
+        cubie_cube = CubieCube.from_cube(cube)
+
+        # Assert
+        assert cubie_cube.corner_permutation == (4, 0, 2, 3, 5, 1, 6, 7)
+        assert cubie_cube.corner_orientation == (2, 1, 0, 0, 1, 2, 0, 0)
+        assert cubie_cube.edge_permutation == (8, 1, 2, 3, 9, 5, 6, 7, 4, 0, 10, 11)
+        assert cubie_cube.edge_orientation == (1, 0, 0, 0, 1, 0, 0, 0, 1, 1, 0, 0)
+
+    def test_invalid_size(self, solved_2x2_cube: Cube) -> None:
+        """
+        Tests that only a 3x3 cube can be converted.
+
+        :param solved_2x2_cube: A solved 2x2 cube
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            CubieCube.from_cube(solved_2x2_cube)
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "layer, index, color", [
+            (Layer.UP, 0, Color.GREEN),
+            (Layer.UP, 1, Color.YELLOW),
+            (Layer.FRONT, 3, Color.RED),
+        ]
+    )
+    # fmt: on
+    def test_invalid_piece(self, layer: Layer, index: int, color: Color) -> None:
+        """
+        Tests that a cube with a piece that does not exist, or exists twice, is rejected.
+
+        :param layer: The layer of the sticker to recolor
+        :param index: The index of the sticker to recolor
+        :param color: The new color of the sticker
+        :return: None
+        """
+
+        cube = Cube(3)
+        cube.layers[layer][index] = color
+
+        with pytest.raises(ValueError):
+            CubieCube.from_cube(cube)
+
+    def test_mirrored_corner(self) -> None:
+        """
+        Tests that a corner with its colors in counter-clockwise order is rejected.
+
+        :return: None
+        """
+
+        cube = Cube(3)
+        cube.layers[Layer.FRONT][0], cube.layers[Layer.LEFT][2] = Color.ORANGE, Color.GREEN
+
+        with pytest.raises(ValueError):
+            CubieCube.from_cube(cube)
+
+
+class TestReadCorners:
+    # fmt: off
+    @pytest.mark.parametrize("cube_size", [2, 4, 5])
+    # fmt: on
+    def test_matches_3x3(self, cube_size: int) -> None:
+        """
+        Tests that the corners of a cube of any size are read the same as those of a 3x3 after the same
+        moves.
+
+        :param cube_size: The cube size
+        :return: None
+        """
+
+        cube = Cube(cube_size)
+        reference = Cube(3)
+        Rotator(cube).apply(Algorithm.from_str("R U' F2 y L D B'"))
+        Rotator(reference).apply(Algorithm.from_str("R U' F2 y L D B'"))
+        cubie_cube = CubieCube.from_cube(reference)
+
+        # Act
+        corner_permutation, corner_orientation = read_corners(cube)
+
+        # Assert
+        assert corner_permutation == cubie_cube.corner_permutation
+        assert corner_orientation == cubie_cube.corner_orientation
+
+    def test_repeated_piece(self) -> None:
+        """
+        Tests that a cube with a corner piece present twice is rejected.
+
+        :return: None
+        """
+
+        cube = Cube(2)
+        cube.layers[Layer.UP][0], cube.layers[Layer.LEFT][0], cube.layers[Layer.BACK][1] = (
+            Color.WHITE,
+            Color.GREEN,
+            Color.ORANGE,
+        )
+
+        with pytest.raises(ValueError):
+            read_corners(cube)
+
+
+class TestCubieCubeTurn:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "algorithm_string", [
+            "R",
+            "U' F2 L B' D2 R'",
+            "x y' z2 R U R' U'",
+            "R U R' U' y L' F2 z' D B2 x2 U",
+        ]
+    )
+    # fmt: on
+    def test_matches_stickers(self, scrambled_3x3_cube: Cube, algorithm_string: str) -> None:
+        """
+        Tests that performing moves on a cubie cube leads to the same state as performing them on
+        the stickers.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :param algorithm_string: The string representation of the algorithm
+        :return: None
+        """
+
+        cubie_cube = CubieCube.from_cube(scrambled_3x3_cube)
+
+        # Act
+        cubie_cube.apply(Algorithm.from_str(algorithm_string))
+        Rotator(scrambled_3x3_cube).apply(Algorithm.from_str(algorithm_string))
+
+        # Assert
+        assert cubie_cube == CubieCube.from_cube(scrambled_3x3_cube)
+        assert cubie_cube.to_cube().layers == scrambled_3x3_cube.layers
+
+    def test_too_many_layers(self) -> None:
+        """
+        Tests that a wide turn is rejected on a 3x3.
+
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            CubieCube().turn(Move.from_str("Rw"))
+
+
+class TestCubieCubeMultiply:
+    def test_identity(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that multiplying by a solved cube, or multiplying a solved cube, changes nothing.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        cubie_cube = CubieCube.from_cube(scrambled_3x3_cube)
+
+        # Assert
+        assert cubie_cube.multiply(CubieCube()) == cubie_cube
+        assert CubieCube().multiply(cubie_cube) == cubie_cube
+
+
+class TestCubieCubeSearch:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "scramble", [
+            "",
+            "R U R' U' F2 D L'",
+            "x F B' U2 y R D' L2",
+        ]
+    )
+    # fmt: on
+    def test_matches_sticker_search(self, scramble: str) -> None:
+        """
+        Tests that finding pieces on a cubie cube gives the same result as searching the stickers.
+
+        :param scramble: The scramble to apply
+        :return: None
+        """
+
+        cube = Cube(3)
+        Rotator(cube).apply(Algorithm.from_str(scramble))
+        cubie_cube = CubieCube.from_cube(cube)
+
+        # Assert
+        for corner in CORNER_PIECES:
+            assert cubie_cube.search_corner(*corner) == search_corner(cube, *corner)
+        for edge in EDGE_PIECES:
+            assert cubie_cube.search_edge(*edge) == search_edge(cube, *edge)
+
+    def test_after_turning(self) -> None:
+        """
+        Tests that pieces are found where they are after the cube was turned, even if they were
+        searched for before.
+
+        :return: None
+        """
+
+        cube = Cube(3)
+        cubie_cube = CubieCube.from_cube(cube)
+        for corner in CORNER_PIECES:
+            cubie_cube.search_corner(*corner)
+        for edge in EDGE_PIECES:
+            cubie_cube.search_edge(*edge)
+
+        # Act
+        Rotator(cube).apply(Algorithm.from_str("R U F' D2"))
+        cubie_cube.apply(Algorithm.from_str("R U F' D2"))
+
+        # Assert
+        for corner in CORNER_PIECES:
+            assert cubie_cube.search_corner(*corner) == search_corner(cube, *corner)
+        for edge in EDGE_PIECES:
+            assert cubie_cube.search_edge(*edge) == search_edge(cube, *edge)
+
+    def test_invalid_piece(self) -> None:
+        """
+        Tests that searching for a piece that does not exist is rejected.
+
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            CubieCube().search_corner(Color.WHITE, Color.YELLOW, Color.RED)
+        with pytest.raises(ValueError):
+            CubieCube().search_edge(Color.GREEN, Color.BLUE)
+
+
+class TestCubieCubeEq:
+    def test_different_type(self) -> None:
+        """
+        Tests that a cubie cube is never equal to something that is not a cubie cube.
+
+        :return: None
+        """
+
+        # Assert
+        assert CubieCube() != "Not a CubieCube"
@@ -5,7 +5,7 @@ import pytest
 
 # Project imports
 from rubik_cube_solver.cube import Cube
-from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm, AlgorithmTable
 from rubik_cube_solver.cube_rotation.move import Move
 from rubik_cube_solver.cube_rotation.rotator import Rotator
 from rubik_cube_solver.enums.Direction import Direction
@@ -186,6 +186,106 @@ class TestAlgorithmEq:
         assert algorithm != other_algorithm
 
 
+class TestAlgorithmCompile:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "size, algorithm_string", [
+            (2, ""),
+            (2, "R U R' U' y F2"),
+            (3, "R U R' U' R' F R2 U' R' U' R U R' F'"),
+            (3, "x R U y R' U' z2"),
+            (6, "Rw U2 3Fw' L D2 B x Uw'"),
+        ]
+    )
+    # fmt: on
+    def test_matches_move_by_move(
+        self,
+        generate_cube: Callable[[int], Cube],
+        generate_rotator: Callable[[Cube], Rotator],
+        size: int,
+        algorithm_string: str,
+    ) -> None:
+        """
+        Tests that the compiled permutation of an algorithm leaves the cube in the same state as
+        performing its moves one by one.
+
+        :param generate_cube: Fixture to generate a cube
+        :param generate_rotator: Fixture to generate a rotator
+        :param size: The size of the cube
+        :param algorithm_string: The string representation of the algorithm
+        :return: None
+        """
+
+        # Mock the cubes
+        compiled_cube = generate_cube(size)
+        expected_cube = generate_cube(size)
+
+        # Mock the algorithm
+        algorithm = Algorithm.from_str(algorithm_string)
+
+        # Act
+        compiled_cube.permute(algorithm.compile(size))
+
+        # Perform the same moves one by one
+        expected_rotator = generate_rotator(expected_cube)
+        for move in algorithm.moves:
+            expected_rotator.turn(move)
+
+        # Assert
+        assert compiled_cube.layers == expected_cube.layers
+
+    def test_compiled_once_per_size(self) -> None:
+        """
+        Tests that compiling the same algorithm again for a size returns the permutation compiled the
+        first time, and that every size has its own.
+
+        :return: None
+        """
+
+        algorithm = Algorithm.from_str("R U R' U'")
+
+        # Assert
+        assert algorithm.compile(3) is algorithm.compile(3)
+        assert len(algorithm.compile(4)) == 6 * 4 * 4
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "change", [
+            lambda algorithm: algorithm.moves.append(R),
+            lambda algorithm: setattr(algorithm, "moves", [U2]),
+            lambda algorithm: algorithm.merge(Algorithm([R])),
+            lambda algorithm: algorithm.cancel_moves(),
+        ]
+    )
+    # fmt: on
+    def test_recompiled_after_change(self, change: Callable[[Algorithm], None]) -> None:
+        """
+        Tests that changing the moves of an algorithm makes it compile again, from the new moves.
+
+        :param change: The change made to the algorithm
+        :return: None
+        """
+
+        algorithm = Algorithm([U, U, R_PRIME])
+        algorithm.compile(3)
+
+        # Act
+        change(algorithm)
+
+        # Assert
+        assert algorithm.compile(3) == Algorithm(list(algorithm.moves)).compile(3)
+
+    def test_invalid_move(self) -> None:
+        """
+        Tests that an algorithm with a move the cube size cannot perform does not compile.
+
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            Algorithm([R, FW2_3_LAYERS]).compile(4)
+
+
 class TestAlgorithmRemoveRotations:
     # fmt: off
     @pytest.mark.parametrize(
@@ -286,16 +386,22 @@ class TestAlgorithmCancelMoves:
             ("R Rw'",           "R Rw'"),        # Different layer amounts do not combine
             ("R x x' R'",       ""),             # Rotations cancel, cascading into layer turns
             ("F x x U",         "F x2 U"),       # Rotations combine
-            ("R x R'",          "R x R'"),       # A surviving rotation blocks cancellation
+            ("R y R'",          "R y R'"),       # A rotation around another axis blocks cancellation
+            ("R x R'",          "x"),            # A rotation commutes with turns around its axis
+            ("R L R'",          "L"),            # Opposite faces commute
+            ("U D U2 D'",       "U'"),           # Opposite faces commute, cascading
+            ("R L",             "L R"),          # Moves around one axis are put in canonical order
+            ("Rw' R Rw",        "R"),            # Different layer amounts commute
+            ("Rw' L R U",       "L R Rw' U"),    # Canonical order is by layer amount, then layer
             ("R U F F' U' R'",  ""),             # Full cascade
         ]
     )
     # fmt: on
     def test_success(self, algorithm_string: str, expected_string: str) -> None:
         """
-        Tests that cancelling the moves of an algorithm reduces adjacent moves that name the same
-        layer (or rotation axis) and layer amount, cascading through moves that become newly
-        adjacent.
+        Tests that cancelling the moves of an algorithm reduces moves that name the same layer (or
+        rotation axis) and layer amount, across moves around the same axis, cascading through moves
+        that become newly adjacent.
 
         :param algorithm_string: The string representation of the algorithm
         :param expected_string: The string representation of the expected reduced algorithm
@@ -311,6 +417,48 @@ class TestAlgorithmCancelMoves:
         # Assert
         assert algorithm == Algorithm.from_str(expected_string)
 
+    # fmt: off
+    @pytest.mark.parametrize(
+        "algorithm_string", [
+            "R L R' L2 U D' U' x L R2 x'",
+            "Uw D 3Uw' U y Dw2 3Uw D' Uw",
+            "Fw B' 3Fw2 z F' B 3Fw2 Fw' z'",
+        ]
+    )
+    # fmt: on
+    def test_equivalent_to_the_original(
+        self,
+        generate_cube: Callable[[int], Cube],
+        generate_rotator: Callable[[Cube], Rotator],
+        algorithm_string: str,
+    ) -> None:
+        """
+        Tests that the reduced algorithm leaves the cube in the same state as the original one, even
+        when moves are combined across other moves around the same axis.
+
+        :param generate_cube: Fixture to generate a cube
+        :param generate_rotator: Fixture to generate a rotator
+        :param algorithm_string: The string representation of the algorithm
+        :return: None
+        """
+
+        # Mock the cubes
+        original_cube = generate_cube(7)
+        reduced_cube = generate_cube(7)
+
+        # Mock the algorithms
+        algorithm = Algorithm.from_str(algorithm_string)
+        reduced = Algorithm.from_str(algorithm_string)
+        reduced.cancel_moves()
+
+        # Act
+        generate_rotator(original_cube).apply(algorithm)
+        generate_rotator(reduced_cube).apply(reduced)
+
+        # Assert
+        assert len(reduced.moves) < len(algorithm.moves)
+        assert original_cube.layers == reduced_cube.layers
+
 
 class TestAlgorithmMerge:
     # fmt: off
@@ -324,13 +472,15 @@ class TestAlgorithmMerge:
             ("R U",               "U R'",       "R U2 R'"),    # Combine at the seam
             ("R",                 "R2",         "R'"),         # Combine at the seam
             ("R2",                "R2",         ""),           # Cancel at the seam
-            ("R U U' R2",         "L",          "R' L"),       # Cancellation already inside an input
+            ("R U U' R2",         "L",          "L R'"),       # Cancellation already inside an input
             ("Rw",                "Rw'",        ""),           # Wide moves cancel
             ("3Rw",               "3Rw",        "3Rw2"),       # Wide moves combine
             ("R",                 "Rw'",        "R Rw'"),      # Different layer amounts do not combine
             ("R x",               "x' R'",      ""),           # Rotations cancel
             ("F x",               "x U",        "F x2 U"),     # Rotations combine
-            ("R x",               "R'",         "R x R'"),     # A surviving rotation blocks cancellation
+            ("R y",               "R'",         "R y R'"),     # A surviving rotation blocks cancellation
+            ("R x",               "R'",         "x"),          # A rotation commutes with its axis
+            ("R L",               "R'",         "L"),          # Opposite faces commute at the seam
             ("R U F",             "F' U' R'",   ""),           # Full cascade
         ]
     )
@@ -421,6 +571,89 @@ class TestAlgorithmMerge:
         # Assert
         assert original_cube.layers == merged_cube.layers
 
+    def test_does_not_mutate_the_given_list(self) -> None:
+        """
+        Tests that merging never changes the list of moves the algorithm was created with.
+
+        :return: None
+        """
+
+        moves = [R, U]
+        algorithm = Algorithm(moves)
+
+        # Act
+        algorithm.merge(Algorithm([U, R]))
+        algorithm.merge(Algorithm([R_PRIME]))
+
+        # Assert
+        assert moves == [R, U]
+        assert algorithm == Algorithm([R, U2])
+
+    def test_moves_appended_in_place(self) -> None:
+        """
+        Tests that moves appended to the moves of an algorithm between merges are cancelled as well.
+
+        :return: None
+        """
+
+        algorithm = Algorithm([])
+        algorithm.merge(Algorithm.from_str("R U"))
+        algorithm.moves.append(U.inverse())
+
+        # Act
+        algorithm.merge(Algorithm.from_str("R'"))
+
+        # Assert
+        assert algorithm == Algorithm([])
+
+    def test_with_itself(self) -> None:
+        """
+        Tests that an algorithm can be merged with itself.
+
+        :return: None
+        """
+
+        algorithm = Algorithm.from_str("R U")
+
+        # Act
+        algorithm.merge(algorithm)
+
+        # Assert
+        assert algorithm == Algorithm.from_str("R U R U")
+
+
+class TestAlgorithmSimplify:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "algorithm_string", [
+            "",
+            "x y z",
+            "R U U' R2",
+            "R y F U U'",
+            "z' y2 x' U L2 Fw R' x R",
+            "Rw x' 3Fw2 y 3Fw2 U' z D",
+        ]
+    )
+    # fmt: on
+    def test_matches_remove_rotations_and_cancel_moves(self, algorithm_string: str) -> None:
+        """
+        Tests that simplifying gives the same moves as removing rotations and then cancelling moves.
+
+        :param algorithm_string: The string representation of the algorithm
+        :return: None
+        """
+
+        algorithm = Algorithm.from_str(algorithm_string)
+        expected = Algorithm.from_str(algorithm_string)
+        expected.remove_rotations()
+        expected.cancel_moves()
+
+        # Act
+        algorithm.simplify()
+
+        # Assert
+        assert algorithm == expected
+
 
 class TestAlgorithmFromStr:
     # fmt: off
@@ -498,3 +731,126 @@ class TestAlgorithmFromStr:
         # Assert
         with pytest.raises(ValueError, match=f"Couldn't parse move notation: {invalid_move}"):
             Algorithm.from_str(algorithm_string)
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "algorithm_string, cube_size", [
+            ("R U R' U'",    2),
+            ("x Rw' 3Fw2 z", 6),
+        ]
+    )
+    # fmt: on
+    def test_for_size(self, algorithm_string: str, cube_size: int) -> None:
+        """
+        Tests that parsing for a cube size gives the same moves as parsing without one.
+
+        :param algorithm_string: The string representation of the algorithm
+        :param cube_size: The size of the cube
+        :return: None
+        """
+
+        # Act
+        algorithm = Algorithm.from_str(algorithm_string, cube_size)
+
+        # Assert
+        assert algorithm == Algorithm.from_str(algorithm_string)
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "algorithm_string, cube_size, invalid_move", [
+            ("R Rw",     3, "Rw"),
+            ("U 3Fw2",   5, "3Fw2"),
+            ("U  R ",    1, "U"),
+        ]
+    )
+    # fmt: on
+    def test_invalid_move_for_size(self, algorithm_string: str, cube_size: int, invalid_move: str) -> None:
+        """
+        Tests that parsing for a cube size rejects a move that cannot be performed on a cube of the size.
+
+        :param algorithm_string: The string representation of the algorithm
+        :param cube_size: The size of the cube
+        :param invalid_move: The move that cannot be performed
+        :return: None
+        """
+
+        # Assert
+        with pytest.raises(ValueError, match=f"cube of size {cube_size}: {invalid_move}"):
+            Algorithm.from_str(algorithm_string, cube_size)
+
+
+class TestAlgorithmFrozen:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "change", [
+            lambda algorithm: setattr(algorithm, "moves", []),
+            lambda algorithm: algorithm.remove_rotations(),
+            lambda algorithm: algorithm.cancel_moves(),
+            lambda algorithm: algorithm.merge(Algorithm.from_str("R")),
+        ]
+    )
+    # fmt: on
+    def test_cannot_change(self, change: Callable[[Algorithm], None]) -> None:
+        """
+        Tests that a frozen algorithm cannot be changed.
+
+        :param change: The change to try on the algorithm
+        :return: None
+        """
+
+        algorithm = Algorithm.from_str("x R R'", frozen=True)
+
+        with pytest.raises(ValueError, match="Cannot change the frozen algorithm"):
+            change(algorithm)
+
+        # Assert
+        assert str(algorithm) == "x R R'"
+
+    def test_equal_to_unfrozen(self) -> None:
+        """
+        Tests that a frozen algorithm equals an unfrozen one with the same moves, and can be merged into one.
+
+        :return: None
+        """
+
+        frozen = Algorithm.from_str("R U", frozen=True)
+        algorithm = Algorithm.from_str("R")
+
+        # Act
+        algorithm.merge(frozen)
+
+        # Assert
+        assert frozen.frozen
+        assert frozen == Algorithm.from_str("R U")
+        assert algorithm == Algorithm.from_str("R2 U")
+
+
+class TestAlgorithmTable:
+    def test_lookup(self) -> None:
+        """
+        Tests that a table parses its algorithms into frozen algorithms, once each.
+
+        :return: None
+        """
+
+        table = AlgorithmTable({"sexy": "R U R' U'", "empty": ""}, 3)
+
+        # Act
+        algorithm = table["sexy"]
+
+        # Assert
+        assert algorithm == Algorithm.from_str("R U R' U'")
+        assert algorithm.frozen
+        assert table["sexy"] is algorithm
+        assert "empty" in table and "missing" not in table
+        assert list(table) == ["sexy", "empty"] and len(table) == 2
+
+    def test_missing_key(self) -> None:
+        """
+        Tests that looking up a key the table does not have raises a KeyError.
+
+        :return: None
+        """
+
+        with pytest.raises(KeyError):
+            AlgorithmTable({}, 3)["missing"]
@@ -0,0 +1,187 @@
+# Python imports
+from typing import Callable
+
+import numpy as np
+import pytest
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.batch_rotator import BatchRotator
+from rubik_cube_solver.cube_rotation.move import Move
+from rubik_cube_solver.cube_rotation.rotator import Rotator
+from rubik_cube_solver.scramble.scrambler import Scrambler
+
+
+def scrambled_cubes(size: int, amount: int) -> list[Cube]:
+    """
+    Builds cubes of the given size, each scrambled with its own random scramble.
+
+    :param size: The size of the cubes
+    :param amount: The amount of cubes
+    :return: The scrambled cubes
+    """
+
+    cubes = [Cube(size) for _ in range(amount)]
+    for cube in cubes:
+        Rotator(cube).apply(Algorithm(Scrambler().generate_scramble(size)))
+
+    return cubes
+
+
+class TestBatchRotatorInit:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "shape, size", [
+            ((4, 54), 2),
+            ((54,), 3),
+            ((2, 6, 9), 3),
+        ]
+    )
+    # fmt: on
+    def test_invalid_shape(self, shape: tuple[int, ...], size: int) -> None:
+        """
+        Tests that a sticker array that does not hold a row of 6 * N^2 stickers per cube is rejected.
+
+        :param shape: The shape of the sticker array
+        :param size: The size of the cubes
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            BatchRotator(np.zeros(shape, dtype=np.uint8), size)
+
+    def test_from_cubes_and_back(self) -> None:
+        """
+        Tests that cubes survive the round trip through a batch, and are not bound to it.
+
+        :return: None
+        """
+
+        cubes = scrambled_cubes(3, 4)
+        expected_layers = [cube.layers for cube in cubes]
+
+        # Act
+        batch = BatchRotator.from_cubes(cubes)
+
+        # Assert
+        assert batch.stickers.shape == (4, 54)
+        assert batch.size == 3
+        assert [cube.layers for cube in batch.to_cubes()] == expected_layers
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "sizes", [
+            [],
+            [2, 3],
+        ]
+    )
+    # fmt: on
+    def test_from_invalid_cubes(self, sizes: list[int]) -> None:
+        """
+        Tests that a batch needs at least one cube, and cubes of a single size.
+
+        :param sizes: The sizes of the cubes
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            BatchRotator.from_cubes([Cube(size) for size in sizes])
+
+
+class TestBatchRotatorTurn:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "size, move_string", [
+            (2, "R"),
+            (3, "U'"),
+            (3, "y2"),
+            (4, "Fw"),
+            (6, "3Lw2"),
+        ]
+    )
+    # fmt: on
+    def test_success(self, size: int, move_string: str) -> None:
+        """
+        Tests that a move turns every cube of the batch exactly like `Rotator.turn` turns a single cube.
+
+        :param size: The size of the cubes
+        :param move_string: The string representation of the move
+        :return: None
+        """
+
+        cubes = scrambled_cubes(size, 3)
+        batch = BatchRotator.from_cubes(cubes)
+
+        # Act
+        batch.turn(Move.from_str(move_string))
+        for cube in cubes:
+            Rotator(cube).turn(Move.from_str(move_string))
+
+        # Assert
+        assert [cube.layers for cube in batch.to_cubes()] == [cube.layers for cube in cubes]
+
+
+class TestBatchRotatorApply:
+    def test_success(self, generate_cube: Callable[[int], Cube]) -> None:
+        """
+        Tests that an algorithm is applied to every cube of the batch exactly like `Rotator.apply`
+        applies it to a single cube.
+
+        :param generate_cube: Fixture to generate a cube
+        :return: None
+        """
+
+        cubes = scrambled_cubes(3, 5)
+        batch = BatchRotator.from_cubes(cubes)
+        algorithm = Algorithm.from_str("R U R' U' x R' F R2 U' R' U' R U R' F'")
+
+        # Act
+        batch.apply(algorithm)
+        for cube in cubes:
+            Rotator(cube).apply(algorithm)
+
+        # Assert
+        assert [cube.layers for cube in batch.to_cubes()] == [cube.layers for cube in cubes]
+
+
+class TestBatchRotatorApplyEach:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "size", [2, 3, 5]
+    )
+    # fmt: on
+    def test_success(self, size: int) -> None:
+        """
+        Tests that every cube of the batch gets its own algorithm.
+
+        :param size: The size of the cubes
+        :return: None
+        """
+
+        shared = Algorithm.from_str("R U2 F'")
+        algorithms = [Algorithm(Scrambler().generate_scramble(size)) for _ in range(4)] + [shared, shared]
+        batch = BatchRotator(np.tile(BatchRotator.from_cubes([Cube(size)]).stickers, (len(algorithms), 1)), size)
+
+        # Act
+        batch.apply_each(algorithms)
+
+        # Perform the same algorithms one cube at a time
+        expected_cubes = [Cube(size) for _ in algorithms]
+        for cube, algorithm in zip(expected_cubes, algorithms):
+            Rotator(cube).apply(algorithm)
+
+        # Assert
+        assert [cube.layers for cube in batch.to_cubes()] == [cube.layers for cube in expected_cubes]
+
+    def test_wrong_amount(self) -> None:
+        """
+        Tests that the algorithms must match the cubes of the batch one to one.
+
+        :return: None
+        """
+
+        batch = BatchRotator.from_cubes([Cube(3), Cube(3)])
+
+        with pytest.raises(ValueError):
+            batch.apply_each([Algorithm.from_str("R")])
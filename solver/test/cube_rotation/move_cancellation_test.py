@@ -3,7 +3,7 @@ import pytest
 
 # Project imports
 from rubik_cube_solver.cube_rotation.move import Move
-from rubik_cube_solver.cube_rotation.move_cancellation import can_combine, combine
+from rubik_cube_solver.cube_rotation.move_cancellation import can_combine, combine, push_move
 from rubik_cube_solver.enums.Direction import Direction
 from rubik_cube_solver.enums.Layer import Layer
 from rubik_cube_solver.enums.Rotation import Rotation
@@ -83,3 +83,36 @@ class TestMoveCancellationCombine:
 
         # Assert
         assert combine(first, second) == expected
+
+
+class TestMoveCancellationPushMove:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "moves, move, expected", [
+            ([],          R,        [R]),        # Onto an empty list
+            ([U],         R,        [U, R]),     # Nothing to combine with
+            ([U, R],      R,        [U, R2]),    # Combines with the top
+            ([U, R],      R_PRIME,  [U]),        # Cancels the top
+            ([R, U, R2],  R2,       [R, U]),     # Only the top is considered
+            ([R, X],      X_PRIME,  [R]),        # Rotations cancel
+            ([U, R],      X,        [U, X, R]),  # A rotation goes first in its block
+            ([U, R, RW],  R_PRIME,  [U, RW]),    # Combines across the block
+            ([R, U],      R,        [R, U, R]),  # Does not reach below the block on top
+        ]
+    )
+    # fmt: on
+    def test_success(self, moves: list[Move], move: Move, expected: list[Move]) -> None:
+        """
+        Tests that pushing a move combines it with the move on top of a reduced list of moves.
+
+        :param moves: The reduced moves
+        :param move: The move to push
+        :param expected: The expected moves after the push
+        :return: None
+        """
+
+        # Act
+        push_move(moves, move)
+
+        # Assert
+        assert moves == expected
@@ -0,0 +1,298 @@
+# Python imports
+import pytest
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.cube_rotation import rotate_cube
+from rubik_cube_solver.cube_rotation.face_stickers_rotation import rotate_face
+from rubik_cube_solver.cube_rotation.move import Move
+from rubik_cube_solver.cube_rotation.move_table import (
+    MoveTable,
+    compose_permutations,
+    create_index_cube,
+    get_move_table,
+    read_permutation,
+)
+from rubik_cube_solver.cube_rotation.side_stickers_rotation import rotate_sides
+from rubik_cube_solver.enums.Color import Color
+from rubik_cube_solver.enums.Direction import Direction
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.enums.Rotation import Rotation
+
+
+def scrambled_cube(size: int) -> Cube:
+    """
+    Builds a cube whose stickers are all told apart by their position, so no two permutations that
+    differ can leave it in the same state.
+
+    :param size: The size of the cube
+    :return: The cube
+    """
+
+    colors = list(Color)
+    return Cube(
+        size,
+        {
+            layer: [colors[(position + index) % len(colors)] for index in range(size * size)]
+            for position, layer in enumerate(Layer)
+        },
+    )
+
+
+class TestCreateIndexCube:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "size", [2, 3, 4]
+    )
+    # fmt: on
+    def test_success(self, size: int) -> None:
+        """
+        Tests that every sticker of the index cube holds its own flat index, face by face in `Layer` order.
+
+        :param size: The size of the cube
+        :return: None
+        """
+
+        # Act
+        cube = create_index_cube(size)
+
+        # Assert
+        assert read_permutation(cube) == tuple(range(6 * size * size))
+        assert cube.layers[Layer.DOWN][0] == size * size
+
+
+class TestComposePermutations:
+    def test_success(self) -> None:
+        """
+        Tests that a composed permutation leaves a cube in the same state as applying both permutations
+        one after the other.
+
+        :return: None
+        """
+
+        table = MoveTable(3)
+        first = table.turn(Layer.RIGHT, Direction.CW, 1)
+        second = table.rotation(Rotation.Y, Direction.CCW)
+
+        # Mock the cubes
+        cube = scrambled_cube(3)
+        expected_cube = scrambled_cube(3)
+
+        # Act
+        cube.permute(compose_permutations(first, second))
+        expected_cube.permute(first)
+        expected_cube.permute(second)
+
+        # Assert
+        assert cube.layers == expected_cube.layers
+
+
+class TestMoveTableTurn:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "size, layer_amount", [
+            (2, 1),
+            (3, 1),
+            (4, 1),
+            (4, 2),
+            (5, 2),
+            (6, 3),
+        ]
+    )
+    # fmt: on
+    def test_matches_reference(self, size: int, layer_amount: int) -> None:
+        """
+        Tests that the compiled permutation of every turn leaves a cube in the same state as the
+        sticker-by-sticker `rotate_face` and `rotate_sides` functions.
+
+        :param size: The size of the cube
+        :param layer_amount: The amount of layers to turn
+        :return: None
+        """
+
+        table = MoveTable(size)
+
+        for layer in Layer:
+            for direction in Direction:
+                # Mock the cubes
+                cube = scrambled_cube(size)
+                expected_cube = scrambled_cube(size)
+
+                # Act
+                cube.permute(table.turn(layer, direction, layer_amount))
+
+                # Perform the same turn sticker by sticker
+                rotate_face(expected_cube, layer, direction)
+                rotate_sides(expected_cube, layer, direction, layer_amount)
+
+                # Assert
+                assert cube.layers == expected_cube.layers
+
+    def test_permutation_is_a_bijection(self) -> None:
+        """
+        Tests that a compiled turn moves every sticker to exactly one place.
+
+        :return: None
+        """
+
+        # Act
+        permutation = MoveTable(4).turn(Layer.FRONT, Direction.CW, 2)
+
+        # Assert
+        assert sorted(permutation) == list(range(6 * 4 * 4))
+
+    def test_compiled_once(self) -> None:
+        """
+        Tests that asking for the same turn twice returns the permutation compiled the first time.
+
+        :return: None
+        """
+
+        table = MoveTable(3)
+
+        # Assert
+        assert table.turn(Layer.UP, Direction.CW, 1) is table.turn(Layer.UP, Direction.CW, 1)
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "size, layer_amount", [
+            (3, 0),
+            (3, 2),
+            (4, 3),
+        ]
+    )
+    # fmt: on
+    def test_invalid_layer_amount(self, size: int, layer_amount: int) -> None:
+        """
+        Tests that a turn the reference functions reject is rejected by the table as well.
+
+        :param size: The size of the cube
+        :param layer_amount: The amount of layers to turn
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            MoveTable(size).turn(Layer.RIGHT, Direction.CW, layer_amount)
+
+
+class TestMoveTableRotation:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "size", [2, 3, 4]
+    )
+    # fmt: on
+    def test_matches_reference(self, size: int) -> None:
+        """
+        Tests that the compiled permutation of every whole-cube rotation leaves a cube in the same state
+        as the sticker-by-sticker `rotate_cube` function.
+
+        :param size: The size of the cube
+        :return: None
+        """
+
+        table = MoveTable(size)
+
+        for rotation in Rotation:
+            for direction in Direction:
+                # Mock the cubes
+                cube = scrambled_cube(size)
+                expected_cube = scrambled_cube(size)
+
+                # Act
+                cube.permute(table.rotation(rotation, direction))
+                rotate_cube(expected_cube, rotation, direction)
+
+                # Assert
+                assert cube.layers == expected_cube.layers
+
+
+class TestMoveTableReorientation:
+    def test_every_frame(self) -> None:
+        """
+        Tests that rotations lead to exactly the 24 orientations of a cube, and that the permutation of
+        every frame leaves a cube in the same state as the rotations that led to it.
+
+        :return: None
+        """
+
+        table = MoveTable(3)
+        identity_frame = {layer: layer for layer in Layer}
+        frames = {tuple(identity_frame.values()): ([], identity_frame)}
+        pending = [([], identity_frame)]
+
+        # Act
+        while pending:
+            rotations, frame = pending.pop()
+            for rotation in Rotation:
+                new_frame, permutation = table.reorientation(frame, rotation, Direction.CW)
+                if tuple(new_frame.values()) not in frames:
+                    new_rotations = rotations + [rotation]
+                    frames[tuple(new_frame.values())] = (new_rotations, new_frame)
+                    pending.append((new_rotations, new_frame))
+
+                    # Assert
+                    cube = scrambled_cube(3)
+                    expected_cube = scrambled_cube(3)
+                    cube.permute(permutation)
+                    for new_rotation in new_rotations:
+                        rotate_cube(expected_cube, new_rotation, Direction.CW)
+                    assert cube.layers == expected_cube.layers
+
+        # Assert
+        assert len(frames) == 24
+
+    def test_compiled_once(self) -> None:
+        """
+        Tests that asking for the same reorientation twice returns what was worked out the first time.
+
+        :return: None
+        """
+
+        table = MoveTable(3)
+        frame = {layer: layer for layer in Layer}
+
+        # Assert
+        assert table.reorientation(frame, Rotation.Y, Direction.CW) is table.reorientation(
+            frame, Rotation.Y, Direction.CW
+        )
+
+
+class TestMoveTableMove:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "move_string", ["R", "Uw'", "3Fw2", "x", "y'", "z2"]
+    )
+    # fmt: on
+    def test_dispatch(self, move_string: str) -> None:
+        """
+        Tests that a move is looked up as a turn or as a rotation, depending on what it carries.
+
+        :param move_string: The string representation of the move
+        :return: None
+        """
+
+        table = MoveTable(6)
+        move = Move.from_str(move_string)
+
+        # Act
+        permutation = table.move(move)
+
+        # Assert
+        if isinstance(move.layer, Rotation):
+            assert permutation == table.rotation(move.layer, move.direction)
+        else:
+            assert permutation == table.turn(move.layer, move.direction, move.layer_amount)
+
+
+class TestGetMoveTable:
+    def test_one_table_per_size(self) -> None:
+        """
+        Tests that every call for a size returns the same table, and that each size has its own.
+
+        :return: None
+        """
+
+        # Assert
+        assert get_move_table(3) is get_move_table(3)
+        assert get_move_table(3) is not get_move_table(4)
+        assert get_move_table(4).size == 4
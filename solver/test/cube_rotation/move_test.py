@@ -1,10 +1,12 @@
 # Python imports
+import pickle
+import threading
 from typing import Callable
 
 import pytest
 
 # Project imports
-from rubik_cube_solver.cube_rotation.move import Move
+from rubik_cube_solver.cube_rotation.move import Move, get_move_strings
 from rubik_cube_solver.enums.Direction import Direction
 from rubik_cube_solver.enums.Layer import Layer
 from rubik_cube_solver.enums.Rotation import Rotation
@@ -125,6 +127,164 @@ class TestMoveEq:
         assert move != other_move
 
 
+class TestMoveIntern:
+    def test_same_object(self) -> None:
+        """
+        Tests that constructing, parsing and inverting lead to the same object for the same move.
+
+        :return: None
+        """
+
+        # Act
+        move = Move(Layer.RIGHT, Direction.CCW, 2)
+
+        # Assert
+        assert Move(Layer.RIGHT, Direction.CCW, 2) is move
+        assert Move.from_str("Rw'") is move
+        assert Move.from_str("Rw").inverse() is move
+        assert pickle.loads(pickle.dumps(move)) is move
+
+    def test_same_object_across_threads(self) -> None:
+        """
+        Tests that threads creating the moves of a new layer amount at the same time all get the same
+        objects.
+
+        :return: None
+        """
+
+        barrier = threading.Barrier(8)
+        created: list[list[Move]] = []
+
+        def create() -> None:
+            """
+            Creates every turn of 11 layers once all the threads are ready.
+
+            :return: None
+            """
+
+            barrier.wait()
+            created.append([Move(layer, direction, 11) for layer in Layer for direction in Direction])
+
+        threads = [threading.Thread(target=create) for _ in range(8)]
+
+        # Act
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        # Assert
+        assert len(created) == 8
+        assert all(all(move is first for move, first in zip(moves, created[0])) for moves in created)
+        assert all(move.inverse().inverse() is move for move in created[0])
+
+    def test_invalid_direction(self) -> None:
+        """
+        Tests that a move of a direction that is not a `Direction` is rejected, and leaves the interned
+        moves as they were.
+
+        :return: None
+        """
+
+        move = Move(Layer.UP, Direction.CW, 1)
+
+        with pytest.raises(ValueError):
+            Move(Layer.UP, "Not a Direction", 1)
+
+        assert Move(Layer.UP, Direction.CW, 1) is move
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "attribute, value", [
+            ("layer",        Layer.LEFT),
+            ("direction",    Direction.CW),
+            ("layer_amount", 3),
+        ]
+    )
+    # fmt: on
+    def test_immutable(self, attribute: str, value: Layer | Direction | int) -> None:
+        """
+        Tests that a move cannot be changed.
+
+        :param attribute: The attribute to set
+        :param value: The value to set it to
+        :return: None
+        """
+
+        move = Move.from_str("R")
+
+        with pytest.raises(AttributeError):
+            setattr(move, attribute, value)
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "layer, layer_amount", [
+            (Layer.UP,   0),
+            (Rotation.X, 2),
+        ]
+    )
+    # fmt: on
+    def test_invalid_layer_amount(self, layer: Layer | Rotation, layer_amount: int) -> None:
+        """
+        Tests that a turn of no layers, and a rotation of more than one layer, are rejected.
+
+        :param layer: The layer to turn or the axis to rotate around
+        :param layer_amount: The amount of layers to turn
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            Move(layer, Direction.CW, layer_amount)
+
+
+class TestMoveId:
+    def test_dense(self) -> None:
+        """
+        Tests that the rotations and the turns of up to 3 layers take the ids from 0 up, one each.
+
+        :return: None
+        """
+
+        # Act
+        moves = [Move(rotation, direction, 1) for rotation in Rotation for direction in Direction] + [
+            Move(layer, direction, layer_amount)
+            for layer_amount in range(1, 4)
+            for layer in Layer
+            for direction in Direction
+        ]
+
+        # Assert
+        assert sorted(move.id for move in moves) == list(range(len(moves)))
+        assert {move: move.id for move in moves}[Move.from_str("x")] == 0
+
+
+class TestMoveInverse:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "move_string, expected_string", [
+            ("R",     "R'"),
+            ("U'",    "U"),
+            ("F2",    "F2"),
+            ("Rw",    "Rw'"),
+            ("3Lw'",  "3Lw"),
+            ("x",     "x'"),
+            ("y2",    "y2"),
+        ]
+    )
+    # fmt: on
+    def test_success(self, move_string: str, expected_string: str) -> None:
+        """
+        Tests that the inverse of a move turns the same layers the other way.
+
+        :param move_string: The string representation of the move
+        :param expected_string: The string representation of the expected inverse
+        :return: None
+        """
+
+        # Assert
+        assert Move.from_str(move_string).inverse() == Move.from_str(expected_string)
+
+
 class TestMoveFromStr:
     # fmt: off
     @pytest.mark.parametrize(
@@ -200,3 +360,32 @@ class TestMoveFromStr:
         # Assert
         with pytest.raises(ValueError, match=f"Couldn't parse move notation: {move_string}"):
             Move.from_str(move_string)
+
+
+class TestGetMoveStrings:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "cube_size, expected_amount", [
+            (1, 9),
+            (2, 27),
+            (3, 27),
+            (4, 45),
+            (7, 63),
+        ]
+    )
+    # fmt: on
+    def test_success(self, cube_size: int, expected_amount: int) -> None:
+        """
+        Tests that every rotation, and every turn the cube size allows, is listed by its string.
+
+        :param cube_size: The size of the cube
+        :param expected_amount: The expected amount of moves
+        :return: None
+        """
+
+        # Act
+        move_strings = get_move_strings(cube_size)
+
+        # Assert
+        assert len(move_strings) == expected_amount
+        assert all(Move.from_str(move_string) is move for move_string, move in move_strings.items())
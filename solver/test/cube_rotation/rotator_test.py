@@ -5,10 +5,14 @@ from unittest.mock import patch
 import pytest
 
 # Project imports
-from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.array_cube import ArrayCube
+from rubik_cube_solver.cube import IDENTITY_FRAME, Cube
 from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.cube_rotation import rotate_cube
+from rubik_cube_solver.cube_rotation.face_stickers_rotation import rotate_face
 from rubik_cube_solver.cube_rotation.move import Move
-from rubik_cube_solver.cube_rotation.rotator import Rotator
+from rubik_cube_solver.cube_rotation.rotator import Rotator, RotatorListener
+from rubik_cube_solver.cube_rotation.side_stickers_rotation import rotate_sides
 from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.Direction import Direction
 from rubik_cube_solver.enums.Layer import Layer
@@ -80,14 +84,15 @@ class TestRotatorTurn:
     @pytest.mark.parametrize(
         "layer, direction, layer_amount", [
             (Layer.UP,    Direction.CW,     1),
-            (Layer.FRONT, Direction.CCW,    2),
-            (Layer.LEFT,  Direction.DOUBLE, 3),
+            (Layer.FRONT, Direction.CCW,    1),
+            (Layer.LEFT,  Direction.DOUBLE, 1),
+            (Layer.BACK,  Direction.CW,     1),
         ]
     )
     # fmt: on
     def test_success(
         self,
-        generate_cube: Callable[[int], Cube],
+        scrambled_3x3_cube: Cube,
         generate_rotator: Callable[[Cube], Rotator],
         generate_move: Callable[[Layer, Direction, int], Move],
         layer: Layer,
@@ -95,9 +100,10 @@ class TestRotatorTurn:
         layer_amount: int,
     ) -> None:
         """
-        Tests the turn method of the Rotator class.
+        Tests that the turn method of the Rotator class moves the stickers exactly like the
+        sticker-by-sticker `rotate_face` and `rotate_sides` functions its move table is compiled from.
 
-        :param generate_cube: Fixture to generate a cube
+        :param scrambled_3x3_cube: Fixture to return a scrambled 3x3 cube
         :param generate_rotator: Fixture to generate a rotator
         :param generate_move: Fixture to generate a move
         :param layer: The layer to turn
@@ -106,28 +112,54 @@ class TestRotatorTurn:
         :return: None
         """
 
-        # Mock the cube
-        cube = generate_cube(3)
-
-        # Mock the rotator class
-        rotator = generate_rotator(cube)
+        # Mock the cubes
+        cube = scrambled_3x3_cube
+        expected_cube = Cube(3, {layer: list(face) for layer, face in cube.layers.items()})
 
         # Mock the move
         move = generate_move(layer, direction, layer_amount)
 
-        with (
-            patch("rubik_cube_solver.cube_rotation.rotator.rotate_face") as mocked_rotate_face,
-            patch("rubik_cube_solver.cube_rotation.rotator.rotate_sides") as mocked_rotate_sides,
-        ):
+        # Perform the turn
+        generate_rotator(cube).turn(move)
 
-            # Perform the turn
-            rotator.turn(move)
+        # Perform the same turn sticker by sticker
+        rotate_face(expected_cube, layer, direction)
+        rotate_sides(expected_cube, layer, direction, layer_amount)
+
+        # Assert
+        assert cube.layers == expected_cube.layers
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "layer_amount", [0, 2, 3]
+    )
+    # fmt: on
+    def test_too_many_layers(
+        self,
+        generate_cube: Callable[[int], Cube],
+        generate_rotator: Callable[[Cube], Rotator],
+        generate_move: Callable[[Layer, Direction, int], Move],
+        layer_amount: int,
+    ) -> None:
+        """
+        Tests that the turn method of the Rotator class rejects a layer amount the cube cannot turn,
+        and leaves the cube untouched.
+
+        :param generate_cube: Fixture to generate a cube
+        :param generate_rotator: Fixture to generate a rotator
+        :param generate_move: Fixture to generate a move
+        :param layer_amount: The amount of layers to turn
+        :return: None
+        """
 
-            # Assert that rotate_face was called once with correct parameters
-            mocked_rotate_face.assert_called_once_with(cube, layer, direction)
+        # Mock the cube
+        cube = generate_cube(3)
 
-            # Assert that rotate_sides was called once with correct parameters
-            mocked_rotate_sides.assert_called_once_with(cube, layer, direction, layer_amount)
+        with pytest.raises(ValueError):
+            generate_rotator(cube).turn(generate_move(Layer.RIGHT, Direction.CW, layer_amount))
+
+        # Assert
+        assert str(cube) == str(generate_cube(3))
 
     # fmt: off
     @pytest.mark.parametrize(
@@ -537,6 +569,111 @@ class TestRotatorRotate:
         assert cube.layers == expected_layers
 
 
+class TestRotatorFrame:
+    def test_rotation_moves_no_stickers(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that a whole-cube rotation only reorients the cube, and the stickers are moved once they
+        are read.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        _, _, stored_layers, _, _ = scrambled_3x3_cube.snapshot()
+        rotator = Rotator(scrambled_3x3_cube)
+
+        # Act
+        rotator.rotate(Rotation.X, Direction.CW)
+
+        # Assert
+        _, _, rotated_layers, _, _ = scrambled_3x3_cube.snapshot()
+        assert rotated_layers == stored_layers
+        assert scrambled_3x3_cube.frame[Layer.UP] == Layer.FRONT
+
+        # Reading the stickers moves them into the frame
+        scrambled_3x3_cube.layers
+        assert scrambled_3x3_cube.frame == IDENTITY_FRAME
+
+    def test_full_turn_returns_to_identity(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that rotating a cube all the way around leaves it in the identity frame, with nothing to move.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        rotator = Rotator(scrambled_3x3_cube)
+
+        # Act
+        rotator.apply(Algorithm.from_str("y y2 y"))
+
+        # Assert
+        assert scrambled_3x3_cube.frame == IDENTITY_FRAME
+        assert scrambled_3x3_cube.frame_permutation is None
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "cube_type, size, algorithm_string", [
+            (Cube,      2, "x R U y' F2 z D' L x2 B"),
+            (Cube,      3, "y R U R' y' x' F L2 z2 D B' y U"),
+            (Cube,      4, "z Rw U x' 2Fw' L2 y2 Dw B"),
+            (ArrayCube, 3, "x y R U2 z' F' L D2 x' B"),
+            (ArrayCube, 5, "y' 2Lw U x 2Bw2 R' z D"),
+        ]
+    )
+    # fmt: on
+    def test_matches_reference(self, cube_type: type[Cube], size: int, algorithm_string: str) -> None:
+        """
+        Tests that turns and rotations performed one at a time in a frame leave the cube in the same state
+        as the sticker-by-sticker reference functions.
+
+        :param cube_type: The type of the cube
+        :param size: The size of the cube
+        :param algorithm_string: The string representation of the algorithm
+        :return: None
+        """
+
+        cube = cube_type(size)
+        expected_cube = Cube(size)
+        rotator = Rotator(cube)
+
+        for move in Algorithm.from_str(algorithm_string).moves:
+            # Act
+            rotator.turn(move)
+
+            # Perform the same move sticker by sticker
+            if isinstance(move.layer, Rotation):
+                rotate_cube(expected_cube, move.layer, move.direction)
+            else:
+                rotate_face(expected_cube, move.layer, move.direction)
+                rotate_sides(expected_cube, move.layer, move.direction, move.layer_amount)
+
+        # Assert
+        assert cube == expected_cube
+
+    def test_undo_and_restore_in_frame(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that undoing moves and restoring checkpoints take the frame into account.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        expected_cube = Cube.from_bytes(scrambled_3x3_cube.to_bytes())
+        rotator = Rotator(scrambled_3x3_cube, journal=True)
+
+        # Act
+        rotator.turn(Move.from_str("x"))
+        checkpoint = rotator.checkpoint()
+        rotator.apply(Algorithm.from_str("R y U'"))
+        rotator.restore(checkpoint)
+        rotator.turn(Move.from_str("F"))
+        rotator.undo(2)
+
+        # Assert
+        assert scrambled_3x3_cube == expected_cube
+
+
 class TestRotatorApply:
     # fmt: off
     @pytest.mark.parametrize(
@@ -580,3 +717,260 @@ class TestRotatorApply:
 
         # Assert
         assert applied_cube.layers == expected_cube.layers
+
+    def test_invalid_move(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that an algorithm with a move the cube cannot perform is rejected before any of its moves
+        is applied.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        expected_layers = {layer: list(stickers) for layer, stickers in scrambled_3x3_cube.layers.items()}
+
+        # Act
+        with pytest.raises(ValueError):
+            Rotator(scrambled_3x3_cube).apply(Algorithm.from_str("R U 2Fw"))
+
+        # Assert
+        assert scrambled_3x3_cube.layers == expected_layers
+
+
+class TestRotatorJournal:
+    def test_disabled_by_default(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that a rotator keeps no journal unless asked to, and cannot undo without one.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        rotator = Rotator(scrambled_3x3_cube)
+        rotator.turn(Move.from_str("R"))
+
+        # Assert
+        assert rotator.journal is None
+        with pytest.raises(ValueError):
+            rotator.undo()
+
+    def test_records_every_move(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that turns, rotations and the moves of applied algorithms are all recorded, in order.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        rotator = Rotator(scrambled_3x3_cube, journal=True)
+
+        # Act
+        rotator.turn(Move.from_str("R"))
+        rotator.turn(Move.from_str("y"))
+        rotator.rotate(Rotation.X, Direction.CCW)
+        rotator.apply(Algorithm.from_str("U F2"))
+
+        # Assert
+        assert rotator.journal == Algorithm.from_str("R y x' U F2").moves
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "move_count", [0, 1, 3, 6]
+    )
+    # fmt: on
+    def test_undo(self, scrambled_3x3_cube: Cube, move_count: int) -> None:
+        """
+        Tests that undoing moves returns the cube to the state it had before them, and removes them
+        from the journal.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :param move_count: The amount of moves to undo
+        :return: None
+        """
+
+        moves = Algorithm.from_str("R U' x F2 L' D").moves
+        expected_cube = Cube.from_bytes(scrambled_3x3_cube.to_bytes())
+        Rotator(expected_cube).apply(Algorithm(moves[: len(moves) - move_count]))
+        rotator = Rotator(scrambled_3x3_cube, journal=True)
+        rotator.apply(Algorithm(moves))
+
+        # Act
+        rotator.undo(move_count)
+
+        # Assert
+        assert scrambled_3x3_cube == expected_cube
+        assert rotator.journal == moves[: len(moves) - move_count]
+
+    def test_undo_too_many(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that undoing more moves than the journal holds is rejected and changes nothing.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        rotator = Rotator(scrambled_3x3_cube, journal=True)
+        rotator.turn(Move.from_str("R"))
+        expected_cube = Cube.from_bytes(scrambled_3x3_cube.to_bytes())
+
+        with pytest.raises(ValueError):
+            rotator.undo(2)
+
+        # Assert
+        assert scrambled_3x3_cube == expected_cube
+        assert len(rotator.journal) == 1
+
+
+class TestRotatorCheckpoint:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "journal", [True, False]
+    )
+    # fmt: on
+    def test_restore(self, scrambled_3x3_cube: Cube, journal: bool) -> None:
+        """
+        Tests that restoring a checkpoint returns the cube to it, any number of times, and drops the
+        moves performed since from the journal.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :param journal: Whether the rotator keeps a journal
+        :return: None
+        """
+
+        rotator = Rotator(scrambled_3x3_cube, journal=journal)
+        rotator.turn(Move.from_str("F"))
+        expected_cube = Cube.from_bytes(scrambled_3x3_cube.to_bytes())
+
+        # Act
+        checkpoint = rotator.checkpoint()
+        for branch in ["R U R'", "x L2 D'"]:
+            rotator.apply(Algorithm.from_str(branch))
+            rotator.restore(checkpoint)
+
+            # Assert
+            assert scrambled_3x3_cube == expected_cube
+            assert rotator.journal == ([Move.from_str("F")] if journal else None)
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "untrust_at_checkpoint, expose_after, trusted", [
+            (False, False, True),
+            (True, False, False),
+            (False, True, False),
+        ]
+    )
+    # fmt: on
+    def test_trust(self, untrust_at_checkpoint: bool, expose_after: bool, trusted: bool) -> None:
+        """
+        Tests that a restored cube is trusted only if it was trusted at the checkpoint and has only been
+        moved since.
+
+        :param untrust_at_checkpoint: Whether the cube is untrusted when the checkpoint is taken
+        :param expose_after: Whether the layers are handed out after the checkpoint
+        :param trusted: Whether the cube is expected to be trusted after the restore
+        :return: None
+        """
+
+        cube = Cube(3)
+        rotator = Rotator(cube, journal=True)
+        cube.trusted = not untrust_at_checkpoint
+
+        # Act
+        checkpoint = rotator.checkpoint()
+        rotator.apply(Algorithm.from_str("R U x F'"))
+        rotator.turn(Move.from_str("D"))
+        rotator.undo(1)
+        if expose_after:
+            cube.layers
+        rotator.restore(checkpoint)
+
+        # Assert
+        assert cube.trusted == trusted
+
+
+class _RecordingListener(RotatorListener):
+    """
+    Listener that records every call it receives.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the `_RecordingListener` class.
+
+        :return: None
+        """
+
+        self.calls: list[tuple] = []
+
+    def on_permute(self, permutation: tuple[int, ...]) -> None:
+        """
+        Records a move.
+
+        :param permutation: The permutation of the stickers
+        :return: None
+        """
+
+        self.calls.append(("permute", permutation))
+
+    def on_reset(self, cube: Cube) -> None:
+        """
+        Records a reset.
+
+        :param cube: The cube
+        :return: None
+        """
+
+        self.calls.append(("reset", cube))
+
+
+class TestRotatorListener:
+    def test_reports_every_move_as_a_permutation(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that every turn, rotation, applied algorithm and undo is reported as the permutation that
+        turns a copy of the cube the same way.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        listener = _RecordingListener()
+        rotator = Rotator(scrambled_3x3_cube, journal=True, listener=listener)
+        copy = Cube.from_bytes(scrambled_3x3_cube.to_bytes())
+
+        # Act
+        rotator.turn(Move.from_str("R"))
+        rotator.rotate(Rotation.Y, Direction.CW)
+        rotator.turn(Move.from_str("x'"))
+        rotator.apply(Algorithm.from_str("U F2 L'"))
+        rotator.undo(2)
+
+        # Follow the reported permutations on the copy
+        for _, permutation in listener.calls[1:]:
+            copy.permute(permutation)
+
+        # Assert
+        assert [name for name, _ in listener.calls] == ["reset"] + ["permute"] * 5
+        assert copy == scrambled_3x3_cube
+
+    def test_resets_without_a_move(self, scrambled_3x3_cube: Cube) -> None:
+        """
+        Tests that the listener is reset to the cube once it is set, the cube is replaced, or a
+        checkpoint without its state is restored.
+
+        :param scrambled_3x3_cube: A scrambled 3x3 cube
+        :return: None
+        """
+
+        rotator = Rotator(scrambled_3x3_cube)
+        checkpoint = rotator.checkpoint()
+        listener = _RecordingListener()
+        other_cube = Cube(3)
+
+        # Act
+        rotator.listener = listener
+        rotator.cube = other_cube
+        rotator.restore(checkpoint)
+
+        # Assert
+        assert listener.calls == [("reset", scrambled_3x3_cube), ("reset", other_cube), ("reset", other_cube)]
+        assert checkpoint.listener_state is None
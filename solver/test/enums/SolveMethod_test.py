@@ -0,0 +1,49 @@
+# Python imports
+import pytest
+
+# Project imports
+from rubik_cube_solver.enums.SolveMethod import SolveMethod
+
+
+class TestSolveMethodFromValue:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "value, expected", [
+            ("human", SolveMethod.HUMAN),
+            ("kociemba", SolveMethod.KOCIEMBA),
+            ("optimal", SolveMethod.OPTIMAL),
+        ]
+    )
+    # fmt: on
+    def test_success(self, value: str, expected: SolveMethod) -> None:
+        """
+        Tests creating a SolveMethod from string.
+
+        :param value: The string value
+        :param expected: The expected SolveMethod enumeration value
+        :return: None
+        """
+
+        # Assert
+        assert SolveMethod.from_value(value) == expected
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "value", [
+            "",
+            "Human",
+            "cfop",
+        ]
+    )
+    # fmt: on
+    def test_invalid_value(self, value: str) -> None:
+        """
+        Tests that creating a SolveMethod from an invalid string raises a ValueError.
+
+        :param value: The string value
+        :return: None
+        """
+
+        # Assert
+        with pytest.raises(ValueError, match=f"Invalid value {value} for the SolveMethod enumeration"):
+            SolveMethod.from_value(value)
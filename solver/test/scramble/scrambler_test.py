@@ -1,4 +1,5 @@
 # Python imports
+import random
 from typing import Callable
 from unittest.mock import patch
 
@@ -410,3 +411,19 @@ class TestScramblerShouldAppendToPreviousMoves:
 
         # Assert
         assert not scrambler._should_append_to_previous_moves(move, [])
+
+
+class TestScramblerRng:
+    def test_seeded(self) -> None:
+        """
+        Tests that scramblers given generators with the same seed generate the same scrambles.
+
+        :return: None
+        """
+
+        # Act
+        scrambles = [Scrambler(random.Random(seed)).generate_scramble(4) for seed in (1, 1, 2)]
+
+        # Assert
+        assert scrambles[0] == scrambles[1]
+        assert scrambles[0] != scrambles[2]
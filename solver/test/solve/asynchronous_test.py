@@ -0,0 +1,159 @@
+# Python imports
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import pytest
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.enums.SolveMethod import SolveMethod
+from rubik_cube_solver.solve import solve_async
+from rubik_cube_solver.solve.asynchronous import get_default_executor
+from rubik_cube_solver.solve.solver import create_solver
+
+SCRAMBLES = [
+    "R U R' U'",
+    "F2 D L' B R2",
+    "U2 R' F L D2 B'",
+    "L B2 U' R F' D",
+]
+
+
+class TestSolveAsync:
+    def test_solves_the_cube(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that `solve_async` returns the solution a synchronous solve finds, and leaves the cube
+        solved in the orientation it started in.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the cubes
+        cube = generate_cube(3, SCRAMBLES[1])
+        expected = create_solver(generate_cube(3, SCRAMBLES[1])).solve()
+
+        # Act
+        solution = asyncio.run(solve_async(cube))
+
+        # Assert
+        assert solution == expected
+        assert str(cube) == str(generate_cube(3, ""))
+
+    def test_solves_many_at_once(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that many coroutines solving at once on a shared executor each get the solution of their
+        own cube.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the cubes, a 2x2 among them
+        cubes = [generate_cube(3, scramble) for scramble in SCRAMBLES] + [generate_cube(2, "R U F'")]
+        expected = [
+            create_solver(generate_cube(cube.size, scramble)).solve()
+            for cube, scramble in zip(cubes, SCRAMBLES + ["R U F'"])
+        ]
+
+        async def solve_all() -> list:
+            """
+            Solves every cube at once.
+
+            :return: The solutions
+            """
+
+            with ThreadPoolExecutor(2) as executor:
+                return await asyncio.gather(*(solve_async(cube, executor) for cube in cubes))
+
+        # Act
+        solutions = asyncio.run(solve_all())
+
+        # Assert
+        assert solutions == expected
+        assert all(str(cube) == str(generate_cube(cube.size, "")) for cube in cubes)
+
+    def test_method(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that `solve_async` solves with the method it is given.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the cubes
+        cube = generate_cube(3, SCRAMBLES[2])
+        expected = create_solver(generate_cube(3, SCRAMBLES[2]), SolveMethod.KOCIEMBA).solve()
+
+        # Act
+        with ThreadPoolExecutor(1) as executor:
+            solution = asyncio.run(solve_async(cube, executor, SolveMethod.KOCIEMBA))
+
+        # Assert
+        assert solution == expected
+        assert str(cube) == str(generate_cube(3, ""))
+
+    def test_raises_the_error_of_the_solve(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that an error solving the cube is raised by the coroutine, and the cube is left as it was.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the cube
+        cube = generate_cube(4, "R")
+        state = str(cube)
+
+        # Assert
+        with pytest.raises(ValueError, match="No solver for cubes of size 4"):
+            asyncio.run(solve_async(cube))
+        assert str(cube) == state
+
+    def test_cancel_leaves_the_cube_untouched(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that cancelling a solve that is still queued in the executor raises `CancelledError`,
+        drops the solve and leaves the cube as it was.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the cube
+        cube = generate_cube(3, SCRAMBLES[0])
+        state = str(cube)
+        release = threading.Event()
+
+        async def cancel() -> None:
+            """
+            Starts a solve behind a blocked worker, and cancels it.
+
+            :return: None
+            """
+
+            with ThreadPoolExecutor(1) as executor:
+                executor.submit(release.wait)
+                task = asyncio.create_task(solve_async(cube, executor))
+                await asyncio.sleep(0)
+                task.cancel()
+                release.set()
+                await task
+
+        # Assert
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(cancel())
+        assert str(cube) == state
+
+
+class TestGetDefaultExecutor:
+    def test_is_shared(self) -> None:
+        """
+        Tests that every call returns the same executor.
+
+        :return: None
+        """
+
+        # Assert
+        assert get_default_executor() is get_default_executor()
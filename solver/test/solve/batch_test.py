@@ -0,0 +1,232 @@
+# Python imports
+from typing import Callable
+
+import pytest
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.move import Move
+from rubik_cube_solver.cubie_cube import CubieCube
+from rubik_cube_solver.enums.SolveMethod import SolveMethod
+from rubik_cube_solver.solve.batch import BatchResult, solve_many
+from rubik_cube_solver.solve.cube_3x3 import optimal, solve_3x3_optimal
+from rubik_cube_solver.solve.cube_3x3.pattern_database import KORF_PATTERNS
+from rubik_cube_solver.solve.solver import create_solver
+
+SCRAMBLES = [
+    "R U R' U'",
+    "F2 D L' B R2",
+    "U2 R' F L D2 B'",
+    "L B2 U' R F' D",
+    "D' F R2 U B L'",
+    "",
+    "B' L2 D R' U2 F",
+]
+
+
+def _expected_solution(cube: Cube, method: SolveMethod) -> str:
+    """
+    Solves a copy of a cube one at a time, the way a batch should.
+
+    :param cube: The cube
+    :param method: The solving method
+    :return: The solution in notation
+    """
+
+    return str(create_solver(Cube.from_bytes(cube.to_bytes()), method).solve())
+
+
+class TestSolveMany:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "workers, chunksize", [
+            (1, 64),
+            (1, 2),
+            (2, 1),
+            (2, 3),
+        ]
+    )
+    # fmt: on
+    def test_solves_every_cube(self, generate_cube: Callable[[int, str], Cube], workers: int, chunksize: int) -> None:
+        """
+        Tests that `solve_many` yields the solution of every cube once, under its index, the same as
+        solving the cubes one at a time, and leaves the cubes themselves as they are.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param workers: The amount of worker processes
+        :param chunksize: The amount of cubes sent to a worker at a time
+        :return: None
+        """
+
+        # Generate the cubes, a 2x2 among them
+        cubes = [generate_cube(3, scramble) for scramble in SCRAMBLES] + [generate_cube(2, "R U F'")]
+        states = [str(cube) for cube in cubes]
+
+        # Act
+        results = sorted(solve_many(cubes, workers=workers, chunksize=chunksize))
+
+        # Assert
+        assert [result.index for result in results] == list(range(len(cubes)))
+        assert all(result.error is None for result in results)
+        assert [str(result.solution) for result in results] == [
+            _expected_solution(cube, SolveMethod.HUMAN) for cube in cubes
+        ]
+        assert [str(cube) for cube in cubes] == states
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "workers", [
+            1,
+            2,
+        ]
+    )
+    # fmt: on
+    def test_reports_errors_without_stopping(self, generate_cube: Callable[[int, str], Cube], workers: int) -> None:
+        """
+        Tests that a cube no solver handles, and an item that is not a cube at all, each yield a result
+        with the error, and that the cubes around them are still solved.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param workers: The amount of worker processes
+        :return: None
+        """
+
+        # Generate the batch
+        cubes = [generate_cube(3, "R U"), generate_cube(4, "R"), "not a cube", generate_cube(3, "F")]
+
+        # Act
+        results = {result.index: result for result in solve_many(cubes, workers=workers, chunksize=2)}
+
+        # Assert
+        assert sorted(results) == [0, 1, 2, 3]
+        assert results[0].error is None and results[3].error is None
+        assert results[0].solution is not None and results[3].solution is not None
+        assert isinstance(results[1].error, ValueError) and results[1].solution is None
+        assert "size 4" in str(results[1].error)
+        assert isinstance(results[2].error, AttributeError) and results[2].solution is None
+
+    def test_streams_results(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that `solve_many` takes the cubes from an iterable only as it needs them, so the first
+        result comes before the batch is exhausted.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the batch lazily, counting the cubes taken
+        taken = []
+
+        def cubes():
+            """
+            Generates the cubes of the batch, recording every one that is taken.
+
+            :return: The cubes
+            """
+
+            for scramble in SCRAMBLES * 10:
+                taken.append(scramble)
+                yield generate_cube(3, scramble)
+
+        # Act
+        first = next(solve_many(cubes(), workers=1, chunksize=2))
+
+        # Assert
+        assert isinstance(first, BatchResult)
+        assert len(taken) == 2
+
+    def test_shares_two_phase_tables(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that a batch solved with the two-phase search in a pool gives the same solutions as
+        solving the cubes one at a time.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the cubes
+        cubes = [generate_cube(3, scramble) for scramble in SCRAMBLES[:3]]
+
+        # Act
+        results = sorted(solve_many(cubes, workers=2, chunksize=1, method=SolveMethod.KOCIEMBA))
+
+        # Assert
+        assert [str(result.solution) for result in results] == [
+            _expected_solution(cube, SolveMethod.KOCIEMBA) for cube in cubes
+        ]
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "workers", [
+            1,
+            2,
+        ]
+    )
+    # fmt: on
+    def test_no_nested_pools(
+        self, generate_cube: Callable[[int, str], Cube], monkeypatch: pytest.MonkeyPatch, workers: int
+    ) -> None:
+        """
+        Tests that a batch solved with the optimal 3x3 search publishes the pattern databases once for its
+        pool, and runs every search in the process solving the cube instead of in a pool of its own.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param monkeypatch: Fixture replacing the search and the publishing of the pattern databases
+        :param workers: The amount of worker processes
+        :return: None
+        """
+
+        shared = []
+
+        class Search:
+            """
+            Stands in for `OptimalSearch`, refusing to search in a pool.
+            """
+
+            def __init__(
+                self, cubie_cube: CubieCube, max_length: int, time_limit: float, processes: int, patterns: tuple
+            ) -> None:
+                """
+                Constructor for the `Search` class.
+
+                :param cubie_cube: The cube to solve
+                :param max_length: The most moves the solution may have
+                :param time_limit: The most seconds the search may take
+                :param processes: The amount of worker processes
+                :param patterns: The sets of pieces of the pattern databases
+                :return: None
+                """
+
+                if processes != 1:
+                    raise AssertionError(f"The search was given {processes} processes")
+
+            def search(self) -> list[Move]:
+                """
+                Searches for nothing.
+
+                :return: No moves
+                """
+
+                return []
+
+        monkeypatch.setattr(solve_3x3_optimal, "OptimalSearch", Search)
+        monkeypatch.setattr(optimal, "share_pattern_databases", lambda patterns: shared.append(patterns) or ())
+        cubes = [generate_cube(3, scramble) for scramble in SCRAMBLES[:3]]
+
+        # Act
+        results = list(solve_many(cubes, workers=workers, chunksize=1, method=SolveMethod.OPTIMAL))
+
+        # Assert
+        assert [result.error for result in results] == [None] * len(cubes)
+        assert shared == ([] if workers == 1 else [KORF_PATTERNS])
+
+    def test_invalid_chunksize(self) -> None:
+        """
+        Tests that a chunk size below 1 raises a ValueError naming it.
+
+        :return: None
+        """
+
+        # Assert
+        with pytest.raises(ValueError, match="The chunk size must be at least 1, got 0"):
+            list(solve_many([], chunksize=0))
@@ -1,5 +1,6 @@
 # Python imports
-from typing import Callable
+from pathlib import Path
+from typing import Callable, Iterator
 
 import pytest
 
@@ -7,6 +8,23 @@ import pytest
 from rubik_cube_solver.cube import Cube
 from rubik_cube_solver.cube_rotation.algorithm import Algorithm
 from rubik_cube_solver.cube_rotation.rotator import Rotator
+from rubik_cube_solver.solve.tables import TABLE_DIRECTORY_VARIABLE
+
+
+@pytest.fixture(scope="session", autouse=True)
+def table_directory(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """
+    Fixture that keeps the tables the solvers build in a temporary directory, rather than in the cache
+    of the user running the tests.
+
+    :param tmp_path_factory: Fixture creating temporary directories for the session
+    :return: The table directory
+    """
+
+    directory = tmp_path_factory.mktemp("tables")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv(TABLE_DIRECTORY_VARIABLE, str(directory))
+        yield directory
 
 
 @pytest.fixture
@@ -0,0 +1,82 @@
+# Python imports
+import numpy as np
+import pytest
+
+# Project imports
+from rubik_cube_solver.solve.coordinates import (
+    build_pruning_table,
+    decode_orientations,
+    decode_permutations,
+    encode_orientation,
+    encode_orientations,
+    encode_permutation,
+    encode_permutations,
+)
+
+
+class TestCoordinatesOrientations:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "piece_amount, base", [
+            (8, 3),
+            (12, 2),
+        ]
+    )
+    # fmt: on
+    def test_orientations_round_trip(self, piece_amount: int, base: int) -> None:
+        """
+        Tests that decoding every orientation coordinate and encoding it again gives the coordinate back.
+
+        :param piece_amount: The amount of pieces
+        :param base: The amount of orientations a piece can have
+        :return: None
+        """
+
+        # Act
+        orientations = decode_orientations(piece_amount, base)
+
+        # Assert
+        assert (encode_orientations(orientations, base) == np.arange(len(orientations))).all()
+        assert (orientations.sum(axis=1) % base == 0).all()
+        assert encode_orientation(tuple(orientations[-1].tolist()), base) == len(orientations) - 1
+
+
+class TestCoordinatesPermutations:
+    # fmt: off
+    @pytest.mark.parametrize("length", [4, 8])
+    # fmt: on
+    def test_permutations_round_trip(self, length: int) -> None:
+        """
+        Tests that decoding every permutation coordinate and encoding it again gives the coordinate back,
+        for many permutations at once and for a single one.
+
+        :param length: The length of the permutations
+        :return: None
+        """
+
+        # Act
+        permutations_ = decode_permutations(length)
+
+        # Assert
+        assert (encode_permutations(permutations_) == np.arange(len(permutations_))).all()
+        assert encode_permutation(tuple(permutations_[-1].tolist())) == len(permutations_) - 1
+
+
+class TestCoordinatesBuildPruningTable:
+    def test_cycle(self) -> None:
+        """
+        Tests the distances of two coordinates that count up and down cycles of 4 and 3 values at once,
+        so that the pairs form a single cycle of 12 and every pair is as far as the shorter way around
+        it.
+
+        :return: None
+        """
+
+        first_moves = np.array([[(value + 1) % 4, (value - 1) % 4] for value in range(4)])
+        second_moves = np.array([[(value + 1) % 3, (value - 1) % 3] for value in range(3)])
+
+        # Act
+        distances = build_pruning_table(first_moves, second_moves, 0)
+
+        # Assert
+        assert list(distances) == [0, 4, 4, 3, 1, 5, 6, 2, 2, 3, 5, 1]
@@ -0,0 +1,195 @@
+# Python imports
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.rotator import Rotator
+
+# Project imports
+from rubik_cube_solver.solve import shared_tables
+from rubik_cube_solver.solve.coordinates import build_pruning_table
+from rubik_cube_solver.solve.cube_2x2 import optimal
+from rubik_cube_solver.solve.cube_2x2.optimal import (
+    MOVES,
+    STATES,
+    distance,
+    get_optimal_tables,
+    read_state,
+    share_optimal_tables,
+    solve_state,
+)
+from rubik_cube_solver.solve.shared_tables import SharedTables, attach_shared_tables
+from rubik_cube_solver.solve.tables import get_distance
+
+
+class TestOptimalTables:
+    def test_distances(self) -> None:
+        """
+        Tests that the breadth-first search over the move tables finds the known amount of states at
+        every distance: 11 face turns solve any 2x2.
+
+        :return: None
+        """
+
+        permutation_moves, twist_moves, _ = get_optimal_tables()
+
+        # Act
+        distances = build_pruning_table(
+            np.reshape(permutation_moves, (-1, len(MOVES))), np.reshape(twist_moves, (-1, len(MOVES))), 0
+        )
+        counts = np.bincount(np.frombuffer(distances, dtype=np.uint8))
+
+        # Assert
+        # fmt: off
+        assert counts.tolist() == [
+            1, 9, 54, 321, 1847, 9992, 50136, 227536, 870072, 1887748, 623800, 2644,
+        ]
+        # fmt: on
+
+    def test_packed_distances(self) -> None:
+        """
+        Tests that the distance table packs the distance of every state at 4 bits.
+
+        :return: None
+        """
+
+        # Act
+        distances = np.frombuffer(get_optimal_tables().distances, dtype=np.uint8)
+        counts = np.bincount(np.concatenate([distances & 15, distances >> 4]))
+
+        # Assert
+        assert len(distances) == STATES // 2
+        # fmt: off
+        assert counts.tolist() == [
+            1, 9, 54, 321, 1847, 9992, 50136, 227536, 870072, 1887748, 623800, 2644,
+        ]
+        # fmt: on
+
+    def test_built_once(self) -> None:
+        """
+        Tests that the tables are built once and shared.
+
+        :return: None
+        """
+
+        # Assert
+        assert get_optimal_tables() is get_optimal_tables()
+
+    def test_shared(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that after attaching to the shared tables, the tables are read from shared memory, equal
+        to the ones shared.
+
+        :param monkeypatch: Fixture isolating the attached tables
+        :return: None
+        """
+
+        monkeypatch.setattr(shared_tables, "_attached", {})
+        monkeypatch.setattr(shared_tables, "_segments", [])
+
+        with SharedTables() as tables:
+            share_optimal_tables(tables)
+            attach_shared_tables(tables.manifest)
+
+            # Act
+            shared = get_optimal_tables.__wrapped__()
+
+            # Assert
+            for table, shared_table in zip(get_optimal_tables(), shared):
+                if isinstance(table, list):
+                    assert list(shared_table) == table
+                else:
+                    assert table == shared_table
+
+
+class TestOptimalDistance:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "scramble, expected", [
+            ("", 0),
+            ("y", 0),
+            ("x z'", 0),
+            ("R", 1),
+            ("L", 1),
+            ("R U", 2),
+            ("R U R' U'", 4),
+            ("y F2 L' D2 B", 4),
+            ("R U2 R' U' R U' R'", 7),
+        ]
+    )
+    # fmt: on
+    def test_success(self, generate_cube: Callable[[int, str], Cube], scramble: str, expected: int) -> None:
+        """
+        Tests the distance of cubes whose shortest solution is known, in any orientation.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param scramble: The scramble to apply
+        :param expected: The expected distance
+        :return: None
+        """
+
+        # Assert
+        assert distance(generate_cube(2, scramble)) == expected
+
+    def test_invalid_size(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that only a 2x2 cube has a distance.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            distance(generate_cube(3, ""))
+
+
+class TestOptimalSolveState:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "scramble", [
+            "",
+            "R U R' U'",
+            "R U2 R' U' R U' R'",
+            "F R U' R' U' R U R' F' R U R' U' R' F R F'",
+        ]
+    )
+    # fmt: on
+    def test_success(self, generate_cube: Callable[[int, str], Cube], scramble: str) -> None:
+        """
+        Tests that the solution of a state solves it, in as many moves as its distance.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param scramble: The scramble to apply
+        :return: None
+        """
+
+        cube = generate_cube(2, scramble)
+        state = read_state(cube).state
+
+        # Act
+        solution = solve_state(state)
+        Rotator(cube).apply(Algorithm(solution))
+
+        # Assert
+        assert len(solution) == get_distance(get_optimal_tables().distances, state)
+        assert cube.layers == Cube(2).layers
+
+    def test_no_closer_state(self, generate_cube: Callable[[int, str], Cube], monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that a distance table in which no move brings a state closer to solved is rejected, instead
+        of being walked forever.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param monkeypatch: Fixture replacing the tables
+        :return: None
+        """
+
+        permutation_moves, twist_moves, _ = get_optimal_tables()
+        tables = optimal.OptimalTables(permutation_moves, twist_moves, memoryview(b"\x11" * (STATES // 2)))
+        monkeypatch.setattr(optimal, "get_optimal_tables", lambda: tables)
+
+        with pytest.raises(ValueError):
+            solve_state(read_state(generate_cube(2, "R U")).state)
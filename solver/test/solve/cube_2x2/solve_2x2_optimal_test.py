@@ -0,0 +1,60 @@
+# Python imports
+from typing import Callable
+
+import pytest
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.solve.cube_2x2.optimal import distance
+from rubik_cube_solver.solve.cube_2x2.solve_2x2_optimal import Solve2x2Optimal
+
+
+class TestSolve2x2Optimal:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "scramble", [
+            "",
+            "y",
+            "x2 z",
+            "R U R' U'",
+            "R U' F2 R' U R2 F' U2 R",
+            "x y' L2 B' D R2 F U2 L' D2 B2 R F' U z",
+        ]
+    )
+    # fmt: on
+    def test_solve(self, generate_cube: Callable[[int, str], Cube], scramble: str) -> None:
+        """
+        Tests that a scrambled, possibly rotated, cube ends up equal to a default cube, by a solution as
+        long as its distance with no whole-cube rotations left in it.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param scramble: The scramble to apply before solving
+        :return: None
+        """
+
+        cube = generate_cube(2, scramble)
+        expected_length = distance(cube)
+
+        # Act
+        solution = Solve2x2Optimal(cube).solve()
+
+        # Assert
+        assert cube.layers == Cube(2).layers
+        assert len(solution.moves) == expected_length
+        assert all(isinstance(move.layer, Layer) for move in solution.moves)
+
+    # fmt: off
+    @pytest.mark.parametrize("cube_size", [3, 4])
+    # fmt: on
+    def test_invalid_size(self, generate_cube: Callable[[int, str], Cube], cube_size: int) -> None:
+        """
+        Tests that a cube of any size other than 2 is rejected.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param cube_size: The cube size
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            Solve2x2Optimal(generate_cube(cube_size, ""))
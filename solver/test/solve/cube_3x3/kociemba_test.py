@@ -0,0 +1,199 @@
+# Python imports
+import numpy as np
+import pytest
+
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.rotator import Rotator
+from rubik_cube_solver.cubie_cube import CubieCube, get_cubie_move
+
+# Project imports
+from rubik_cube_solver.enums.Rotation import Rotation
+from rubik_cube_solver.solve import shared_tables
+from rubik_cube_solver.solve.cube_3x3 import kociemba
+from rubik_cube_solver.solve.cube_3x3.kociemba import (
+    MOVES,
+    SLICES,
+    SOLVED_SLICE,
+    TwoPhaseSearch,
+    decode_slices,
+    encode_slices,
+    get_axis_conjugation,
+    get_two_phase_tables,
+    share_two_phase_tables,
+)
+from rubik_cube_solver.solve.shared_tables import SharedTables, attach_shared_tables
+
+
+class TestKociembaCoordinates:
+    def test_slices_round_trip(self) -> None:
+        """
+        Tests that decoding every slice coordinate and encoding it again gives the coordinate back.
+
+        :return: None
+        """
+
+        # Act
+        occupied = decode_slices()
+
+        # Assert
+        assert (encode_slices(occupied) == np.arange(SLICES)).all()
+        assert (occupied.sum(axis=1) == 4).all()
+        assert occupied[SOLVED_SLICE].tolist() == [0] * 8 + [1] * 4
+
+
+class TestKociembaTables:
+    def test_solved_distance(self) -> None:
+        """
+        Tests that every pruning table puts the solved state at distance 0 and nothing else.
+
+        :return: None
+        """
+
+        # Act
+        tables = get_two_phase_tables()
+
+        # Assert
+        assert tables.twist_slice_pruning[SOLVED_SLICE] == 0
+        assert tables.flip_slice_pruning[SOLVED_SLICE] == 0
+        assert tables.twist_flip_pruning[0] == 0
+        assert tables.corner_slice_pruning[0] == 0
+        assert tables.edge_slice_pruning[0] == 0
+        assert bytes(tables.twist_slice_pruning).count(0) == 1
+        assert bytes(tables.corner_slice_pruning).count(0) == 1
+
+    def test_built_once(self) -> None:
+        """
+        Tests that the tables are built once and shared.
+
+        :return: None
+        """
+
+        # Assert
+        assert get_two_phase_tables() is get_two_phase_tables()
+
+    def test_shared(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that after attaching to the shared tables, the tables are read from shared memory, equal
+        to the ones shared.
+
+        :param monkeypatch: Fixture isolating the attached tables
+        :return: None
+        """
+
+        monkeypatch.setattr(shared_tables, "_attached", {})
+        monkeypatch.setattr(shared_tables, "_segments", [])
+
+        with SharedTables() as tables:
+            share_two_phase_tables(tables)
+            attach_shared_tables(tables.manifest)
+
+            # Act
+            shared = get_two_phase_tables.__wrapped__()
+
+            # Assert
+            for table, shared_table in zip(get_two_phase_tables(), shared):
+                if isinstance(table, list):
+                    assert list(shared_table) == table
+                else:
+                    assert table == shared_table
+
+
+class TestAxisConjugation:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "rotation, move, expected_move", [
+            (None,       "R",  "R"),
+            (Rotation.X, "U",  "F"),
+            (Rotation.X, "R2", "R2"),
+            (Rotation.Z, "U'", "L'"),
+            (Rotation.Z, "F",  "F"),
+        ]
+    )
+    # fmt: on
+    def test_moves(self, rotation: Rotation | None, move: str, expected_move: str) -> None:
+        """
+        Tests that a move of the rotated cube stands for the move of the face the rotation brings to its
+        place, and that rotating that move gives the move back.
+
+        :param rotation: The rotation
+        :param move: The move of the rotated cube
+        :param expected_move: The move it stands for
+        :return: None
+        """
+
+        # Act
+        conjugation = get_axis_conjugation(rotation)
+        rotated_move = Algorithm.from_str(move).moves[0]
+        cube_move = MOVES[conjugation.moves[MOVES.index(rotated_move)]]
+
+        # Assert
+        assert sorted(conjugation.moves) == list(range(len(MOVES)))
+        assert str(cube_move) == expected_move
+        assert conjugation.inverse.multiply(get_cubie_move(cube_move.layer, cube_move.direction)).multiply(
+            conjugation.rotation
+        ) == get_cubie_move(rotated_move.layer, rotated_move.direction)
+
+
+class TestTwoPhaseSearch:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "scramble", [
+            "",
+            "R",
+            "U2 D2",
+            "R U R' U' F2 D L'",
+            "D2 F2 D B' L2 B R F U L2 B2 F' L' D2 L2 F' R2 L' B' R2",
+        ]
+    )
+    # fmt: on
+    def test_solves(self, scramble: str) -> None:
+        """
+        Tests that the solution found solves the cube in at most the maximum length.
+
+        :param scramble: The scramble to apply
+        :return: None
+        """
+
+        cube = Cube(3)
+        Rotator(cube).apply(Algorithm.from_str(scramble))
+
+        # Act
+        moves = TwoPhaseSearch(CubieCube.from_cube(cube), 21).search()
+        Rotator(cube).apply(Algorithm(moves))
+
+        # Assert
+        assert len(moves) <= 21
+        assert cube.layers == Cube(3).layers
+
+    def test_longer_phase_2(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that a solution with a longer phase 2 than the limit is still found, when there is no
+        other one.
+
+        :param monkeypatch: Fixture lowering the phase 2 limit
+        :return: None
+        """
+
+        monkeypatch.setattr(kociemba, "PHASE_2_LIMIT", 0)
+        cube = Cube(3)
+        Rotator(cube).apply(Algorithm.from_str("R2"))
+
+        # Act
+        moves = TwoPhaseSearch(CubieCube.from_cube(cube), 1).search()
+
+        # Assert
+        assert [str(move) for move in moves] == ["R2"]
+
+    def test_too_short(self) -> None:
+        """
+        Tests that a cube with no solution of the maximum length is rejected.
+
+        :return: None
+        """
+
+        cube = Cube(3)
+        Rotator(cube).apply(Algorithm.from_str("R U F"))
+
+        with pytest.raises(ValueError):
+            TwoPhaseSearch(CubieCube.from_cube(cube), 2).search()
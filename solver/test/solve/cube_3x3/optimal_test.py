@@ -0,0 +1,126 @@
+# Python imports
+import pytest
+
+# Project imports
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cubie_cube import CubieCube
+from rubik_cube_solver.solve.corner_search import CORNER_SLOTS
+from rubik_cube_solver.solve.cube_3x3.optimal import OptimalSearch, is_solved, share_pattern_databases
+from rubik_cube_solver.solve.edge_search import EDGE_SLOTS
+
+# Small pattern databases, which build in a fraction of a second, unlike Korf's
+PATTERNS = (CORNER_SLOTS[:4], EDGE_SLOTS[:4], EDGE_SLOTS[4:8], EDGE_SLOTS[8:])
+
+
+def scrambled(scramble: str) -> CubieCube:
+    """
+    Returns a cubie cube with a scramble applied.
+
+    :param scramble: The scramble
+    :return: The cubie cube
+    """
+
+    cubie_cube = CubieCube()
+    cubie_cube.apply(Algorithm.from_str(scramble))
+    return cubie_cube
+
+
+class TestOptimalSearch:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "scramble, length, processes",
+        [
+            ("", 0, 1),
+            ("R", 1, 1),
+            ("R U", 2, 1),
+            ("R U R' U'", 4, 1),
+            ("R U R' U' R U R' U'", 8, 1),
+            ("F2 L' D B R2 U'", 6, 1),
+            ("R U R' U'", 4, 2),
+            ("F2 L' D B R2 U'", 6, 2),
+        ],
+    )
+    # fmt: on
+    def test_search(self, scramble: str, length: int, processes: int) -> None:
+        """
+        Tests that the solution found solves the cube and is as short as a known shortest one.
+
+        :param scramble: The scramble
+        :param length: The length of a shortest solution
+        :param processes: The amount of worker processes
+        :return: None
+        """
+
+        cubie_cube = scrambled(scramble)
+
+        # Act
+        moves = OptimalSearch(cubie_cube, processes=processes, patterns=PATTERNS).search()
+        cubie_cube.apply(Algorithm(moves))
+
+        # Assert
+        assert len(moves) == length
+        assert is_solved(cubie_cube)
+
+    # fmt: off
+    @pytest.mark.parametrize("processes", [1, 2])
+    # fmt: on
+    def test_max_length(self, processes: int) -> None:
+        """
+        Tests that a cube with no solution within the maximum length is rejected.
+
+        :param processes: The amount of worker processes
+        :return: None
+        """
+
+        search = OptimalSearch(scrambled("R U F"), max_length=2, processes=processes, patterns=PATTERNS)
+
+        # Assert
+        with pytest.raises(ValueError):
+            search.search()
+
+    # fmt: off
+    @pytest.mark.parametrize("processes", [1, 2])
+    # fmt: on
+    def test_time_limit(self, processes: int) -> None:
+        """
+        Tests that a search that outlasts its time budget raises a TimeoutError.
+
+        :param processes: The amount of worker processes
+        :return: None
+        """
+
+        cubie_cube = scrambled("D2 F2 D B' R2 U' L F U2 R' B2 D' F2 U R2 F2")
+        search = OptimalSearch(cubie_cube, time_limit=0, processes=processes, patterns=PATTERNS)
+
+        # Assert
+        with pytest.raises(TimeoutError):
+            search.search()
+
+    def test_no_patterns(self) -> None:
+        """
+        Tests that a search with no pattern database to prune with is rejected.
+
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            OptimalSearch(scrambled("R U"), patterns=())
+
+
+class TestSharePatternDatabases:
+    def test_published_once(self) -> None:
+        """
+        Tests that the pattern databases are published once, and every later search of the same patterns,
+        or of some of them, gets the tables already published.
+
+        :return: None
+        """
+
+        # Act
+        manifest = share_pattern_databases(PATTERNS)
+        OptimalSearch(scrambled("R U"), processes=2, patterns=PATTERNS).search()
+
+        # Assert
+        assert share_pattern_databases(PATTERNS) == manifest
+        assert set(share_pattern_databases(PATTERNS[:1])) < set(manifest)
+        assert len(manifest) == len({table.segment for table in manifest}) == 4 * len(PATTERNS)
@@ -0,0 +1,131 @@
+# Python imports
+import pytest
+
+# Project imports
+from rubik_cube_solver.cubie_cube import CubieCube, get_cubie_move
+from rubik_cube_solver.solve import shared_tables
+from rubik_cube_solver.solve.corner_search import CORNER_SLOTS
+from rubik_cube_solver.solve.cube_3x3.kociemba import MOVES
+from rubik_cube_solver.solve.cube_3x3.pattern_database import PatternDatabase, get_pattern_database
+from rubik_cube_solver.solve.edge_search import EDGE_SLOTS
+from rubik_cube_solver.solve.shared_tables import SharedTables, attach_shared_tables
+
+CUBIE_MOVES = [get_cubie_move(move.layer, move.direction) for move in MOVES]
+
+
+class TestPatternDatabase:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "pieces, size",
+        [
+            (CORNER_SLOTS[:1], 8 * 3),
+            (CORNER_SLOTS[2:4], 8 * 7 * 9),
+            (EDGE_SLOTS[:2], 12 * 11 * 4),
+            (EDGE_SLOTS[7:10], 12 * 11 * 10 * 8),
+        ],
+    )
+    # fmt: on
+    def test_distances(self, pieces: tuple, size: int) -> None:
+        """
+        Tests that the distances match a breadth-first search over cubie cubes, which tells states apart
+        by the slots and orientations of the pieces of the set alone.
+
+        :param pieces: The pieces of the set
+        :param size: The expected amount of states
+        :return: None
+        """
+
+        database = PatternDatabase(pieces)
+        frontier = [CubieCube()]
+        seen = {database.index(CubieCube()): 0}
+        depth = 0
+        while frontier:
+            depth += 1
+            next_frontier = []
+            for cubie_cube in frontier:
+                for cubie_move in CUBIE_MOVES:
+                    moved = cubie_cube.multiply(cubie_move)
+                    index = database.index(moved)
+                    if index not in seen:
+                        seen[index] = depth
+                        next_frontier.append(moved)
+            frontier = next_frontier
+
+        # Assert
+        assert database.size == size
+        assert len(seen) == size
+        assert all(database.distance(index) == distance for index, distance in seen.items())
+
+    def test_move(self) -> None:
+        """
+        Tests that moving an index agrees with turning the cube and taking the index afterwards.
+
+        :return: None
+        """
+
+        database = get_pattern_database(CORNER_SLOTS[:4])
+        cubie_cube = CubieCube()
+        index = database.index(cubie_cube)
+        for move in [0, 4, 8, 13, 17, 2, 7, 11, 15, 3]:
+            # Act
+            cubie_cube = cubie_cube.multiply(CUBIE_MOVES[move])
+            index = database.move(index, move)
+
+            # Assert
+            assert index == database.index(cubie_cube)
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "pieces",
+        [
+            (),
+            (CORNER_SLOTS[0], EDGE_SLOTS[0]),
+            (EDGE_SLOTS[0], EDGE_SLOTS[0]),
+        ],
+    )
+    # fmt: on
+    def test_invalid_pieces(self, pieces: tuple) -> None:
+        """
+        Tests that a set that is empty, mixes corners and edges or repeats a piece is rejected.
+
+        :param pieces: The pieces of the set
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            PatternDatabase(pieces)
+
+    def test_shared(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that a database made after attaching to the tables another one shared reads them from
+        shared memory, with the same distances.
+
+        :param monkeypatch: Fixture isolating the attached tables
+        :return: None
+        """
+
+        monkeypatch.setattr(shared_tables, "_attached", {})
+        monkeypatch.setattr(shared_tables, "_segments", [])
+        database = get_pattern_database(EDGE_SLOTS[:2])
+
+        with SharedTables() as tables:
+            database.share(tables)
+            attach_shared_tables(tables.manifest)
+
+            # Act
+            shared = PatternDatabase(EDGE_SLOTS[:2])
+
+            # Assert
+            assert shared.distances.obj is shared_tables.get_shared_table("pattern-UF-UB/distances")
+            assert bytes(shared.distances) == bytes(database.distances)
+            assert shared.move(shared.index(CubieCube()), 4) == database.move(database.index(CubieCube()), 4)
+
+    def test_built_once(self) -> None:
+        """
+        Tests that a database is built once and shared.
+
+        :return: None
+        """
+
+        # Assert
+        assert get_pattern_database(EDGE_SLOTS[:2]) is get_pattern_database(EDGE_SLOTS[:2])
@@ -0,0 +1,74 @@
+# Python imports
+from typing import Callable
+
+import pytest
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.solve.cube_3x3.solve_3x3_kociemba import Solve3x3Kociemba
+
+
+class TestSolve3x3Kociemba:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "scramble", [
+            "",
+            "y",
+            "x2 z",
+            "R U R' U'",
+            "D2 F2 D B' R2 U' L F U2 R' B2 D' F2 U R2 F2",
+            "x y' L2 B' D R2 F U2 L' D2 B2 R F' U z",
+        ]
+    )
+    # fmt: on
+    def test_solve(self, generate_cube: Callable[[int, str], Cube], scramble: str) -> None:
+        """
+        Tests that a scrambled, possibly rotated, cube ends up solved in the default orientation, by a
+        solution of at most 21 moves with no whole-cube rotations left in it.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param scramble: The scramble to apply before solving
+        :return: None
+        """
+
+        cube = generate_cube(3, scramble)
+
+        # Act
+        solution = Solve3x3Kociemba(cube).solve()
+
+        # Assert
+        assert cube.layers == Cube(3).layers
+        assert len(solution.moves) <= 21
+        assert all(isinstance(move.layer, Layer) for move in solution.moves)
+
+    def test_max_length(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that the maximum length is kept, and that a cube with no solution that short is rejected.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        cube = generate_cube(3, "R U F")
+        solver = Solve3x3Kociemba(cube, max_length=2)
+
+        # Assert
+        assert solver.max_length == 2
+        with pytest.raises(ValueError):
+            solver.solve()
+
+    # fmt: off
+    @pytest.mark.parametrize("cube_size", [2, 4])
+    # fmt: on
+    def test_invalid_size(self, generate_cube: Callable[[int, str], Cube], cube_size: int) -> None:
+        """
+        Tests that a cube of any size other than 3 is rejected.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param cube_size: The cube size
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            Solve3x3Kociemba(generate_cube(cube_size, ""))
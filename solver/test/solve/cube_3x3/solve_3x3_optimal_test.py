@@ -0,0 +1,80 @@
+# Python imports
+from typing import Callable
+
+import pytest
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.enums.Layer import Layer
+from rubik_cube_solver.solve.corner_search import CORNER_SLOTS
+from rubik_cube_solver.solve.cube_3x3.solve_3x3_optimal import Solve3x3Optimal
+from rubik_cube_solver.solve.edge_search import EDGE_SLOTS
+
+# Small pattern databases, which build in a fraction of a second, unlike Korf's
+PATTERNS = (CORNER_SLOTS[:4], EDGE_SLOTS[:4], EDGE_SLOTS[4:8], EDGE_SLOTS[8:])
+
+
+class TestSolve3x3Optimal:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "scramble, length",
+        [
+            ("", 0),
+            ("y", 0),
+            ("R U R' U'", 4),
+            ("x2 z F2 L' D B R2 U'", 6),
+        ]
+    )
+    # fmt: on
+    def test_solve(self, generate_cube: Callable[[int, str], Cube], scramble: str, length: int) -> None:
+        """
+        Tests that a scrambled, possibly rotated, cube ends up solved in the default orientation by a
+        shortest solution.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param scramble: The scramble to apply before solving
+        :param length: The length of a shortest solution, not counting whole-cube rotations
+        :return: None
+        """
+
+        cube = generate_cube(3, scramble)
+
+        # Act
+        solution = Solve3x3Optimal(cube, processes=1, patterns=PATTERNS).solve()
+
+        # Assert
+        assert cube.layers == Cube(3).layers
+        assert len([move for move in solution.moves if isinstance(move.layer, Layer)]) == length
+
+    def test_limits(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that the maximum length and time limit are kept, and that a cube with no solution that
+        short is rejected.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        cube = generate_cube(3, "R U F")
+        solver = Solve3x3Optimal(cube, max_length=2, time_limit=10, processes=1, patterns=PATTERNS)
+
+        # Assert
+        assert solver.max_length == 2
+        assert solver.time_limit == 10
+        with pytest.raises(ValueError):
+            solver.solve()
+
+    # fmt: off
+    @pytest.mark.parametrize("cube_size", [2, 4])
+    # fmt: on
+    def test_invalid_size(self, generate_cube: Callable[[int, str], Cube], cube_size: int) -> None:
+        """
+        Tests that a cube of any size other than 3 is rejected.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param cube_size: The cube size
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            Solve3x3Optimal(generate_cube(cube_size, ""))
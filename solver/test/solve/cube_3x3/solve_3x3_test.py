@@ -20,6 +20,7 @@ from rubik_cube_solver.solve.cube_3x3.oll import OLL_TABLE
 from rubik_cube_solver.solve.cube_3x3.pll import PLL_TABLE
 from rubik_cube_solver.solve.cube_3x3.solve_3x3 import Solve3x3
 from rubik_cube_solver.solve.edge_search import search_edge
+from rubik_cube_solver.solve.observer import StepRecorder
 
 
 def _cross_is_solved(cube: Cube) -> bool:
@@ -228,6 +229,11 @@ class TestSolve3x3Init:
 
         # Assert
         assert Solve3x3(cube).cube is cube
+        assert not Solve3x3(cube).f2l_lookahead
+        assert Solve3x3(cube, f2l_lookahead=True).f2l_lookahead
+        assert not Solve3x3(cube).track_pieces
+        assert Solve3x3(cube, track_pieces=True).track_pieces
+        assert Solve3x3(cube, track_pieces=True).tracker is None
 
     # fmt: off
     @pytest.mark.parametrize(
@@ -486,6 +492,37 @@ class TestSolve3x3F2L:
         assert _first_two_layers_are_solved(cube)
         assert solve.solution == Algorithm([])
 
+    # fmt: off
+    @pytest.mark.parametrize("algorithm", F2L_SCRAMBLES)
+    # fmt: on
+    def test_lookahead_solves_first_two_layers_in_the_same_orientation(
+        self, generate_cube: Callable[[int, str], Cube], algorithm: str
+    ) -> None:
+        """
+        Tests that `_f2l` with the lookahead solves all four pairs, and leaves the cube turned the same
+        way as solving the pairs in the fixed order does, whichever order it picked.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param algorithm: The scramble applied before solving
+        :return: None
+        """
+
+        # Generate the cubes and solve the first two layers with and without the lookahead
+        cube = generate_cube(3, algorithm)
+        solve = Solve3x3(cube, f2l_lookahead=True)
+        solve._cross()
+        solve._f2l()
+        fixed_cube = generate_cube(3, algorithm)
+        fixed_solve = Solve3x3(fixed_cube)
+        fixed_solve._cross()
+        fixed_solve._f2l()
+
+        # Assert
+        assert _first_two_layers_are_solved(cube)
+        assert [face_center_color(cube, layer) for layer in Layer] == [
+            face_center_color(fixed_cube, layer) for layer in Layer
+        ]
+
 
 class TestSolve3x3Oll:
     @pytest.mark.parametrize("case, algorithm", list(OLL_TABLE.items()))
@@ -685,3 +722,88 @@ class TestSolve3x3Solve:
 
             # Assert
             assert _cube_is_solved(cube)
+
+    def test_lookahead_shortens_random_solutions(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that `solve` with the F2L lookahead finishes randomly scrambled cubes with fewer moves
+        between them than solving the pairs in the fixed order. The random number generator is seeded,
+        so a failing run can be reproduced exactly.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Solve twenty scrambled cubes both ways
+        random.seed(0)
+        fixed_length, lookahead_length = 0, 0
+        for _ in range(20):
+            scramble = str(Algorithm(Scrambler().generate_scramble(3)))
+            fixed_length += len(Solve3x3(generate_cube(3, scramble)).solve().moves)
+            cube = generate_cube(3, scramble)
+            lookahead_length += len(Solve3x3(cube, f2l_lookahead=True).solve().moves)
+
+            # Assert
+            assert _cube_is_solved(cube)
+
+        # Assert
+        assert lookahead_length < fixed_length
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "f2l_lookahead", [False, True]
+    )
+    # fmt: on
+    def test_tracking_pieces_finds_the_same_solutions(
+        self, generate_cube: Callable[[int, str], Cube], f2l_lookahead: bool
+    ) -> None:
+        """
+        Tests that `solve` finds the same solutions for randomly scrambled cubes whether it tracks the
+        pieces or searches the cube for them, and that the tracker counts the cube solved once it is.
+        The random number generator is seeded, so a failing run can be reproduced exactly.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param f2l_lookahead: Whether every order of the F2L pairs is tried
+        :return: None
+        """
+
+        # Solve ten scrambled cubes both ways
+        random.seed(0)
+        for _ in range(10):
+            scramble = str(Algorithm(Scrambler().generate_scramble(3)))
+            expected = Solve3x3(generate_cube(3, scramble), f2l_lookahead).solve()
+            cube = generate_cube(3, scramble)
+            solve = Solve3x3(cube, f2l_lookahead, track_pieces=True)
+
+            # Act
+            result = solve.solve()
+
+            # Assert
+            assert result == expected
+            assert _cube_is_solved(cube)
+            assert solve.tracker.is_solved()
+            assert solve.rotator.listener is solve.tracker
+
+    def test_observer_sees_every_step(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that an observer of `solve` sees the four CFOP steps between the validation and the
+        simplification, that the steps found by piece searches run them while the table lookups of the
+        last layer do not, and that the moves the steps add make up the solution.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the cube and solve it with a recorder
+        cube = generate_cube(3, F2L_SCRAMBLES[0])
+        solve = Solve3x3(cube)
+        recorder = StepRecorder()
+        solve.observer = recorder
+        result = solve.solve()
+        events = {event.step: event for event in recorder.events}
+
+        # Assert
+        assert [event.step for event in recorder.events] == ["validate", "cross", "f2l", "oll", "pll", "simplify"]
+        assert events["cross"].piece_searches > 0 and events["f2l"].piece_searches > 0
+        assert events["oll"].piece_searches == events["pll"].piece_searches == 0
+        assert events["oll"].apply_calls == events["pll"].apply_calls == 1
+        assert sum(event.moves_added for event in recorder.events) == len(result.moves)
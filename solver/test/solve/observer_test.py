@@ -0,0 +1,124 @@
+# Python imports
+from typing import Callable
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.enums.Color import Color
+from rubik_cube_solver.solve.corner_search import search_corner
+from rubik_cube_solver.solve.cube_3x3.solve_3x3 import Solve3x3
+from rubik_cube_solver.solve.edge_search import search_edge
+from rubik_cube_solver.solve.observer import (
+    PieceSearchCounter,
+    SolveObserver,
+    StepEvent,
+    StepRecorder,
+)
+from rubik_cube_solver.solve.piece_tracker import PieceTracker
+
+EVENT = StepEvent("cross", 1.0, 0.5, 10, 4, 6, 12)
+
+
+class TestPieceSearchCounter:
+    def test_searches_are_counted(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that every corner and edge search handed a counter is counted once, and that a search
+        handed none counts nothing.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the cube
+        cube = generate_cube(3, "R U")
+        counter = PieceSearchCounter()
+
+        # Act
+        search_corner(cube, Color.YELLOW, Color.GREEN, Color.RED, counter)
+        search_edge(cube, Color.GREEN, Color.RED, counter)
+        search_corner(cube, Color.YELLOW, Color.GREEN, Color.RED)
+
+        # Assert
+        assert counter.count == 2
+
+    def test_tracker_searches_are_counted(self) -> None:
+        """
+        Tests that the searches of a piece tracker are counted like those on a cube.
+
+        :return: None
+        """
+
+        tracker = PieceTracker()
+        counter = PieceSearchCounter()
+
+        # Act
+        tracker.search_corner(Color.YELLOW, Color.GREEN, Color.RED, counter)
+        tracker.search_edge(Color.GREEN, Color.RED, counter)
+        tracker.search_edge(Color.GREEN, Color.RED)
+
+        # Assert
+        assert counter.count == 2
+
+    def test_solves_are_counted_apart(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that every solve counts its piece searches from zero, and that a solve without an
+        observer has no counter.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        solver = Solve3x3(generate_cube(3, "R U F' L2"))
+        solver.observer = StepRecorder()
+        solver.solve()
+        first_count = solver.piece_search_counter.count
+
+        # Act
+        solver.cube = generate_cube(3, "R U F' L2")
+        solver.solution = Algorithm([])
+        solver.solve()
+        second_count = solver.piece_search_counter.count
+        solver.observer = None
+        solver.solve()
+
+        # Assert
+        assert first_count == second_count > 0
+        assert solver.piece_search_counter is None
+
+
+class TestSolveObserver:
+    def test_methods_do_nothing(self) -> None:
+        """
+        Tests that the methods of the base observer accept an event and do nothing.
+
+        :return: None
+        """
+
+        # Generate the observer
+        observer = SolveObserver()
+
+        # Assert
+        assert observer.on_step_start(EVENT) is None
+        assert observer.on_step_end(EVENT) is None
+
+
+class TestStepRecorder:
+    def test_keeps_the_end_events(self) -> None:
+        """
+        Tests that the recorder keeps the events at the end of the steps, in order, and ignores the
+        ones at their start.
+
+        :return: None
+        """
+
+        # Generate the recorder
+        recorder = StepRecorder()
+        other = EVENT._replace(step="f2l")
+
+        # Act
+        recorder.on_step_start(EVENT)
+        recorder.on_step_end(EVENT)
+        recorder.on_step_end(other)
+
+        # Assert
+        assert recorder.events == [EVENT, other]
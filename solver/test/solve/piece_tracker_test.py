@@ -0,0 +1,170 @@
+# Python imports
+import random
+from typing import Callable
+
+import pytest
+
+# Project imports
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.rotator import Rotator
+from rubik_cube_solver.cubie_cube import CORNER_PIECES, EDGE_PIECES, CubieCube
+from rubik_cube_solver.scramble.scrambler import Scrambler
+from rubik_cube_solver.solve.corner_search import search_corner
+from rubik_cube_solver.solve.edge_search import search_edge
+from rubik_cube_solver.solve.piece_tracker import PIECE_COUNT, PieceTracker
+
+
+def _assert_tracks(tracker: PieceTracker, cube: Cube) -> None:
+    """
+    Asserts that a tracker holds the pieces of a cube, finds every piece where the searches of the cube
+    do, and counts as many solved pieces as a tracker that reads the cube afresh.
+
+    :param tracker: The tracker
+    :param cube: The cube
+    :return: None
+    """
+
+    fresh = PieceTracker()
+    fresh.on_reset(cube)
+
+    assert tracker.cubie_cube == CubieCube.from_cube(cube)
+    assert tracker.solved_count == fresh.solved_count
+    for colors in CORNER_PIECES:
+        assert tracker.search_corner(*colors) == search_corner(cube, *colors)
+    for colors in EDGE_PIECES:
+        assert tracker.search_edge(*colors) == search_edge(cube, *colors)
+
+
+class TestPieceTracker:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "algorithm", [
+            "",
+            "R U R' U'",
+            "x F2 y' L D' z2 B",
+            "F R' U2 L B' D R2 F' U L2",
+        ]
+    )
+    # fmt: on
+    def test_follows_every_move(self, generate_cube: Callable[[int, str], Cube], algorithm: str) -> None:
+        """
+        Tests that a tracker set on a rotator follows every turn, rotation and applied algorithm.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param algorithm: The algorithm to perform move by move, and then as a whole
+        :return: None
+        """
+
+        cube = generate_cube(3, "L' B2 U")
+        tracker = PieceTracker()
+        rotator = Rotator(cube, listener=tracker)
+
+        # Act
+        for move in Algorithm.from_str(algorithm).moves:
+            rotator.turn(move)
+
+            # Assert
+            _assert_tracks(tracker, cube)
+
+        # Act
+        rotator.apply(Algorithm.from_str(algorithm))
+
+        # Assert
+        _assert_tracks(tracker, cube)
+
+    def test_follows_undo_and_restore(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that a tracker follows undone moves, and returns to the pieces of a checkpoint once the
+        rotator restores it.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        cube = generate_cube(3, "R U2 F'")
+        tracker = PieceTracker()
+        rotator = Rotator(cube, journal=True, listener=tracker)
+        checkpoint = rotator.checkpoint()
+
+        # Act
+        rotator.apply(Algorithm.from_str("D L' y B2"))
+        rotator.undo(2)
+
+        # Assert
+        _assert_tracks(tracker, cube)
+
+        # Act
+        rotator.restore(checkpoint)
+
+        # Assert
+        _assert_tracks(tracker, cube)
+        assert tracker.on_checkpoint() == checkpoint.listener_state
+
+    def test_counts_solved_pieces(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that the solved pieces are counted against the centers, so whole-cube rotations keep a
+        solved cube solved, while a single turn unsolves the pieces it moves.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        tracker = PieceTracker()
+        rotator = Rotator(generate_cube(3, ""), listener=tracker)
+
+        # Act
+        rotator.apply(Algorithm.from_str("x y2 z'"))
+        rotated_count = tracker.solved_count
+        rotator.apply(Algorithm.from_str("R"))
+
+        # Assert
+        assert rotated_count == PIECE_COUNT
+        assert tracker.solved_count == PIECE_COUNT - 8
+        assert not tracker.is_solved()
+
+        # Act
+        rotator.apply(Algorithm.from_str("R'"))
+
+        # Assert
+        assert tracker.is_solved()
+
+    def test_random_scrambles(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that a tracker follows randomly scrambled cubes, and counts them solved only once they are.
+        The random number generator is seeded, so a failing run can be reproduced exactly.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        random.seed(0)
+        for _ in range(20):
+            scramble = Algorithm(Scrambler().generate_scramble(3))
+            tracker = PieceTracker()
+            rotator = Rotator(generate_cube(3, ""), journal=True, listener=tracker)
+
+            # Act
+            rotator.apply(scramble)
+
+            # Assert
+            _assert_tracks(tracker, rotator.cube)
+            assert not tracker.is_solved()
+
+            # Act
+            rotator.undo(len(scramble.moves))
+
+            # Assert
+            assert tracker.is_solved()
+
+    def test_invalid_size(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that a tracker cannot follow a cube that is not a 3x3.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Assert
+        with pytest.raises(ValueError, match="only be created from a 3x3 cube"):
+            Rotator(generate_cube(2, ""), listener=PieceTracker())
@@ -0,0 +1,143 @@
+# Python imports
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+
+import numpy as np
+import pytest
+
+# Project imports
+from rubik_cube_solver.solve import shared_tables
+from rubik_cube_solver.solve.shared_tables import (
+    SharedTables,
+    attach_shared_tables,
+    get_shared_table,
+    get_shared_tables,
+)
+
+TABLE = np.arange(24, dtype=np.int32).reshape(4, 6)
+PACKED = memoryview(bytes(range(10)))
+
+
+class Tables(NamedTuple):
+    """
+    The tables of a solver: a move table and a packed table.
+    """
+
+    moves: list[list[int]]
+    packed: memoryview
+
+
+@pytest.fixture
+def attached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """
+    Fixture that gives the test tables of its own to attach to, so that none are left attached
+    afterwards.
+
+    :param monkeypatch: Fixture patching the module
+    :return: None
+    """
+
+    monkeypatch.setattr(shared_tables, "_attached", {})
+    monkeypatch.setattr(shared_tables, "_segments", [])
+
+
+class TestSharedTables:
+    def test_attach(self, attached: None) -> None:
+        """
+        Tests that a published table is found after attaching, equal to the original and read-only.
+
+        :param attached: Fixture isolating the attached tables
+        :return: None
+        """
+
+        with SharedTables() as tables:
+            tables.publish("table", TABLE)
+            tables.publish("packed", PACKED)
+
+            # Act
+            attach_shared_tables(tables.manifest)
+
+            # Assert
+            assert (get_shared_table("table") == TABLE).all()
+            assert bytes(get_shared_table("packed")) == bytes(PACKED)
+            assert not get_shared_table("table").flags.writeable
+            assert get_shared_table("missing") is None
+
+    def test_publish_all(self, attached: None) -> None:
+        """
+        Tests that a named tuple of tables comes back as flat memoryviews, read in place from shared
+        memory, a move table row after row.
+
+        :param attached: Fixture isolating the attached tables
+        :return: None
+        """
+
+        with SharedTables() as tables:
+            tables.publish_all("prefix", Tables(TABLE.tolist(), PACKED))
+
+            # Act
+            attach_shared_tables(tables.manifest)
+            shared = get_shared_tables("prefix", Tables._fields)
+
+            # Assert
+            assert list(shared[0]) == TABLE.ravel().tolist()
+            assert all(isinstance(table, memoryview) and table.readonly for table in shared)
+            assert bytes(shared[1]) == bytes(PACKED)
+            assert get_shared_tables("other", Tables._fields) is None
+
+    def test_duplicate(self) -> None:
+        """
+        Tests that two tables of the same name are rejected.
+
+        :return: None
+        """
+
+        with SharedTables() as tables:
+            tables.publish("table", TABLE)
+
+            # Assert
+            with pytest.raises(ValueError):
+                tables.publish("table", TABLE)
+
+    def test_close(self) -> None:
+        """
+        Tests that closing the tables removes their segments.
+
+        :return: None
+        """
+
+        tables = SharedTables()
+        tables.publish("table", TABLE)
+        segment = tables.manifest[0].segment
+
+        # Act
+        tables.close()
+
+        # Assert
+        assert tables.manifest == ()
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=segment)
+
+    def test_spawned_workers(self) -> None:
+        """
+        Tests that workers started from scratch, which inherit nothing from this process, find the
+        tables after attaching to them in the initializer of their pool.
+
+        :return: None
+        """
+
+        with SharedTables() as tables:
+            tables.publish("table", TABLE)
+            with ProcessPoolExecutor(
+                2,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=attach_shared_tables,
+                initargs=(tables.manifest,),
+            ) as pool:
+                # Act
+                results = list(pool.map(get_shared_table, ["table", "table"]))
+
+        # Assert
+        assert all((result == TABLE).all() for result in results)
@@ -1,11 +1,13 @@
 # Python imports
 from typing import Callable
+from unittest.mock import patch
 
 import pytest
 
 # Project imports
 from rubik_cube_solver.cube import Cube
 from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.solve.observer import SolveObserver, StepEvent, StepRecorder
 from rubik_cube_solver.solve.solve import Solve
 
 
@@ -55,6 +57,41 @@ class _StubSolve(Solve):
         return step
 
 
+class _OrderObserver(SolveObserver):
+    """
+    Observer that records the start and the end of every step, in the order they arrive.
+    """
+
+    def __init__(self) -> None:
+        """
+        Constructor for the `_OrderObserver` class.
+
+        :return: None
+        """
+
+        self.calls: list[tuple[str, StepEvent]] = []
+
+    def on_step_start(self, event: StepEvent) -> None:
+        """
+        Records the start of a step.
+
+        :param event: The event
+        :return: None
+        """
+
+        self.calls.append(("start", event))
+
+    def on_step_end(self, event: StepEvent) -> None:
+        """
+        Records the end of a step.
+
+        :param event: The event
+        :return: None
+        """
+
+        self.calls.append(("end", event))
+
+
 class _IncompleteSolve(Solve):
     """
     `Solve` subclass that does not implement `_steps`, used to prove that abstractness is
@@ -78,6 +115,7 @@ class TestSolveInit:
         # Assert
         assert solve.cube is cube
         assert solve.solution == Algorithm([])
+        assert solve.rotator.cube is cube
 
     def test_solve_cannot_be_instantiated_directly(self, generate_cube: Callable[[int, str], Cube]) -> None:
         """
@@ -244,6 +282,34 @@ class TestSolveApply:
         assert solve.solution == Algorithm([])
 
 
+class TestSolveCheckpoint:
+    def test_restore_returns_cube_and_solution(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that `_restore` returns both the cube and the solution to a checkpoint taken by
+        `_checkpoint`, and that the solution stays the same object.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the cubes
+        cube = generate_cube(3, "")
+        expected_cube = generate_cube(3, "R")
+        solve = _StubSolve(cube, [])
+        solution = solve.solution
+        solve._apply(Algorithm.from_str("R"))
+
+        # Act
+        checkpoint = solve._checkpoint()
+        solve._apply(Algorithm.from_str("U F"))
+        solve._restore(checkpoint)
+
+        # Assert
+        assert str(cube) == str(expected_cube)
+        assert solve.solution is solution
+        assert solve.solution == Algorithm.from_str("R")
+
+
 class TestSolveSolve:
     def test_runs_every_step_in_order_and_returns_the_solution(self, generate_cube: Callable[[int, str], Cube]) -> None:
         """
@@ -279,6 +345,38 @@ class TestSolveSolve:
             solve.solve()
         assert solve.calls == []
 
+    # fmt: off
+    @pytest.mark.parametrize(
+        "trusted, validated", [
+            (True, False),
+            (False, True),
+        ]
+    )
+    # fmt: on
+    def test_trusted_cube_is_not_validated(
+        self, generate_cube: Callable[[int, str], Cube], trusted: bool, validated: bool
+    ) -> None:
+        """
+        Tests that a trusted cube is solved without being validated again, and an untrusted one is
+        validated.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param trusted: Whether the cube is trusted
+        :param validated: Whether the cube is expected to be validated
+        :return: None
+        """
+
+        cube = generate_cube(3, "R U")
+        cube.trusted = trusted
+        solve = _StubSolve(cube, ["U'", "R'"])
+
+        # Act
+        with patch("rubik_cube_solver.solve.solve.Validator") as mock_validator:
+            solve.solve()
+
+        # Assert
+        assert mock_validator.called == validated
+
     def test_returned_solution_has_no_rotations(self, generate_cube: Callable[[int, str], Cube]) -> None:
         """
         Tests that rotations applied by a step are removed from the returned solution, with the
@@ -332,3 +430,61 @@ class TestSolveSolve:
 
         # Assert
         assert result == Algorithm([])
+
+
+class TestSolveObserver:
+    def test_no_observer_by_default(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that a solver has no observer until one is set.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the solver and set an observer
+        solve = _StubSolve(generate_cube(3, ""), [])
+        observer = StepRecorder()
+        had_observer = solve.observer is not None
+        solve.observer = observer
+
+        # Assert
+        assert not had_observer
+        assert solve.observer is observer
+
+    def test_events_of_every_step(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that the observer receives a start and an end event for the validation, every step and the
+        simplification, in order, and that each end event holds what its step took.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the solver, whose steps are named after the method that builds them
+        solve = _StubSolve(generate_cube(3, ""), ["R U", "U' R2 y"])
+        observer = _OrderObserver()
+        solve.observer = observer
+
+        # Act
+        solve.solve()
+
+        # Assert the order of the events
+        assert [(kind, event.step) for kind, event in observer.calls] == [
+            (kind, step) for step in ("validate", "step", "step", "simplify") for kind in ("start", "end")
+        ]
+
+        # Assert the start events measure nothing, and every end event starts when its start event did
+        starts = [event for kind, event in observer.calls if kind == "start"]
+        ends = [event for kind, event in observer.calls if kind == "end"]
+        assert all(event[2:] == (0.0, 0, 0, 0, 0) for event in starts)
+        assert [event.start_time for event in ends] == [event.start_time for event in starts]
+        assert all(event.wall_time >= 0 for event in ends)
+
+        # Assert what every step took: "U' R2 y" cancels the U and turns R into R' y, so it adds no move
+        assert [(event.moves_added, event.apply_calls, event.cube_turns) for event in ends] == [
+            (0, 0, 0),
+            (2, 1, 2),
+            (0, 1, 3),
+            (-1, 0, 0),
+        ]
+        assert all(event.piece_searches == 0 for event in ends)
@@ -5,8 +5,12 @@ import pytest
 
 # Project imports
 from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.enums.SolveMethod import SolveMethod
 from rubik_cube_solver.solve.cube_2x2.solve_2x2 import Solve2x2
+from rubik_cube_solver.solve.cube_2x2.solve_2x2_optimal import Solve2x2Optimal
 from rubik_cube_solver.solve.cube_3x3.solve_3x3 import Solve3x3
+from rubik_cube_solver.solve.cube_3x3.solve_3x3_kociemba import Solve3x3Kociemba
+from rubik_cube_solver.solve.cube_3x3.solve_3x3_optimal import DEFAULT_TIME_LIMIT, Solve3x3Optimal
 from rubik_cube_solver.solve.solve import Solve
 from rubik_cube_solver.solve.solver import create_solver
 
@@ -96,3 +100,87 @@ class TestCreateSolver:
         # Assert
         with pytest.raises(ValueError, match=f"No solver for cubes of size {cube_size}"):
             create_solver(cube)
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "cube_size, method, expected_type",
+        [
+            (2, SolveMethod.HUMAN, Solve2x2),
+            (2, SolveMethod.OPTIMAL, Solve2x2Optimal),
+            (3, SolveMethod.HUMAN, Solve3x3),
+            (3, SolveMethod.KOCIEMBA, Solve3x3Kociemba),
+        ],
+    )
+    # fmt: on
+    def test_method(
+        self,
+        generate_cube: Callable[[int, str], Cube],
+        cube_size: int,
+        method: SolveMethod,
+        expected_type: type[Solve],
+    ) -> None:
+        """
+        Tests that the method picks the solver among the ones for the cube's size, and that the returned
+        solver solves the cube.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param cube_size: The cube size
+        :param method: The solving method
+        :param expected_type: The solver class expected for that size and method
+        :return: None
+        """
+
+        # Generate the cube
+        cube = generate_cube(cube_size, SCRAMBLE_2X2 if cube_size == 2 else SCRAMBLE_3X3)
+        solver = create_solver(cube, method)
+        solver.solve()
+
+        # Assert
+        assert isinstance(solver, expected_type)
+        assert str(cube) == str(Cube(cube_size))
+
+    def test_optimal_3x3(self, generate_cube: Callable[[int, str], Cube]) -> None:
+        """
+        Tests that the optimal method picks the optimal 3x3 solver, with the finite default time limit.
+        The cube is not solved here, since Korf's pattern databases take the better part of a minute to
+        build.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :return: None
+        """
+
+        # Generate the cube
+        cube = generate_cube(3, "")
+        solver = create_solver(cube, SolveMethod.OPTIMAL)
+
+        # Assert
+        assert isinstance(solver, Solve3x3Optimal)
+        assert solver.cube is cube
+        assert solver.time_limit == DEFAULT_TIME_LIMIT
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "cube_size, method",
+        [
+            (2, SolveMethod.KOCIEMBA),
+        ],
+    )
+    # fmt: on
+    def test_invalid_method(
+        self, generate_cube: Callable[[int, str], Cube], cube_size: int, method: SolveMethod
+    ) -> None:
+        """
+        Tests that a method with no solver for the cube's size raises a ValueError naming both.
+
+        :param generate_cube: Fixture generating a cube with an algorithm applied
+        :param cube_size: The cube size
+        :param method: The solving method
+        :return: None
+        """
+
+        # Generate the cube
+        cube = generate_cube(cube_size, "")
+
+        # Assert
+        with pytest.raises(ValueError, match=f"No {method.value} solver for cubes of size {cube_size}"):
+            create_solver(cube, method)
@@ -0,0 +1,258 @@
+# Python imports
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Project imports
+from rubik_cube_solver.solve import tables
+from rubik_cube_solver.solve.tables import (
+    TABLE_DIRECTORY_VARIABLE,
+    TABLE_HEADER,
+    TABLE_PROCESSES_VARIABLE,
+    breadth_first_search,
+    get_distance,
+    get_distance_mod_3,
+    get_table,
+    get_table_processes,
+    load_table,
+    pack_table,
+    save_table,
+    table_version,
+)
+
+DISTANCES = np.array([0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12])
+
+
+def cycle_neighbors(states: np.ndarray, move: int) -> np.ndarray:
+    """
+    Returns the neighbors of states on a cycle of 200, one step either way.
+
+    :param states: The states
+    :param move: 0 for a step up and 1 for a step down
+    :return: The states after the move
+    """
+
+    return (states + (1 if move == 0 else -1)) % 200
+
+
+class TestTablesPack:
+    def test_4_bits(self) -> None:
+        """
+        Tests that every distance is read back from a table packed at 4 bits, two to a byte.
+
+        :return: None
+        """
+
+        # Act
+        table = pack_table(DISTANCES, 4)
+
+        # Assert
+        assert len(table) == 7
+        assert [get_distance(table, index) for index in range(len(DISTANCES))] == DISTANCES.tolist()
+
+    def test_2_bits(self) -> None:
+        """
+        Tests that every distance modulo 3 is read back from a table packed at 2 bits, four to a byte.
+
+        :return: None
+        """
+
+        # Act
+        table = pack_table(DISTANCES, 2)
+
+        # Assert
+        assert len(table) == 4
+        assert [get_distance_mod_3(table, index) for index in range(len(DISTANCES))] == (DISTANCES % 3).tolist()
+
+    def test_8_bits(self) -> None:
+        """
+        Tests that every distance gets a byte of its own in a table packed at 8 bits.
+
+        :return: None
+        """
+
+        # Act
+        table = pack_table(DISTANCES, 8)
+
+        # Assert
+        assert list(table) == DISTANCES.tolist()
+
+    def test_invalid_bits(self) -> None:
+        """
+        Tests that any width other than 2, 4 or 8 bits is rejected.
+
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            pack_table(DISTANCES, 3)
+
+
+class TestTablesFiles:
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """
+        Tests that a saved table is mapped back with the same entries.
+
+        :param tmp_path: A temporary directory
+        :return: None
+        """
+
+        path = tmp_path / "table.table"
+        version = table_version(b"moves")
+        data = pack_table(DISTANCES, 4)
+
+        # Act
+        save_table(path, version, 4, len(DISTANCES), data)
+        table = load_table(path, version, 4, len(DISTANCES))
+
+        # Assert
+        assert table is not None
+        assert bytes(table) == data
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "version, bits, size",
+        [
+            (table_version(b"other moves"), 4, 13),
+            (table_version(b"moves"), 2, 13),
+            (table_version(b"moves"), 4, 12),
+        ],
+    )
+    # fmt: on
+    def test_mismatch(self, tmp_path: Path, version: bytes, bits: int, size: int) -> None:
+        """
+        Tests that a table of another version, width or size is not loaded.
+
+        :param tmp_path: A temporary directory
+        :param version: The version asked for
+        :param bits: The bits per entry asked for
+        :param size: The amount of entries asked for
+        :return: None
+        """
+
+        path = tmp_path / "table.table"
+        save_table(path, table_version(b"moves"), 4, 13, pack_table(DISTANCES, 4))
+
+        # Assert
+        assert load_table(path, version, bits, size) is None
+
+    def test_damaged(self, tmp_path: Path) -> None:
+        """
+        Tests that a table whose data does not match its checksum, or that is missing, is not loaded.
+
+        :param tmp_path: A temporary directory
+        :return: None
+        """
+
+        path = tmp_path / "table.table"
+        version = table_version(b"moves")
+        save_table(path, version, 4, len(DISTANCES), pack_table(DISTANCES, 4))
+        content = bytearray(path.read_bytes())
+        content[TABLE_HEADER.size] ^= 1
+        path.write_bytes(content)
+
+        # Assert
+        assert load_table(path, version, 4, len(DISTANCES)) is None
+        assert load_table(tmp_path / "missing.table", version, 4, len(DISTANCES)) is None
+
+    def test_get_table(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that a table is built once and loaded from its file afterwards, and rebuilt when its
+        version changes.
+
+        :param tmp_path: A temporary directory
+        :param monkeypatch: Fixture setting environment variables
+        :return: None
+        """
+
+        monkeypatch.setenv(TABLE_DIRECTORY_VARIABLE, str(tmp_path))
+        builds = []
+
+        def build() -> bytes:
+            """
+            Builds the table, counting the builds.
+
+            :return: The packed table
+            """
+
+            builds.append(1)
+            return pack_table(DISTANCES, 4)
+
+        # Act
+        first = get_table("test", table_version(b"moves"), 4, len(DISTANCES), build)
+        second = get_table("test", table_version(b"moves"), 4, len(DISTANCES), build)
+        get_table("test", table_version(b"other moves"), 4, len(DISTANCES), build)
+
+        # Assert
+        assert bytes(first) == bytes(second) == pack_table(DISTANCES, 4)
+        assert (tmp_path / "test.table").exists()
+        assert len(builds) == 2
+
+
+class TestTablesBreadthFirstSearch:
+    # fmt: off
+    @pytest.mark.parametrize(
+        "value, expected", [
+            (None, 1),
+            ("",   1),
+            ("4",  4),
+        ]
+    )
+    # fmt: on
+    def test_processes(self, monkeypatch: pytest.MonkeyPatch, value: str | None, expected: int) -> None:
+        """
+        Tests that tables are built in one process unless the environment variable asks for more.
+
+        :param monkeypatch: Fixture setting the environment variable
+        :param value: The value of the environment variable, or None to leave it unset
+        :param expected: The amount of worker processes expected
+        :return: None
+        """
+
+        if value is None:
+            monkeypatch.delenv(TABLE_PROCESSES_VARIABLE, raising=False)
+        else:
+            monkeypatch.setenv(TABLE_PROCESSES_VARIABLE, value)
+
+        # Assert
+        assert get_table_processes() == expected
+
+    def test_one_process_by_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Tests that a table of many chunks is searched without a pool by default.
+
+        :param monkeypatch: Fixture patching the chunk size and the pool
+        :return: None
+        """
+
+        monkeypatch.delenv(TABLE_PROCESSES_VARIABLE, raising=False)
+        monkeypatch.setattr(tables, "CHUNK_SIZE", 16)
+        monkeypatch.setattr(tables, "ProcessPoolExecutor", None)
+
+        # Act
+        distances = breadth_first_search(200, 0, 2, cycle_neighbors)
+
+        # Assert
+        assert distances.tolist() == [min(state, 200 - state) for state in range(200)]
+
+    # fmt: off
+    @pytest.mark.parametrize("processes", [1, 2])
+    # fmt: on
+    def test_cycle(self, monkeypatch: pytest.MonkeyPatch, processes: int) -> None:
+        """
+        Tests that every state of a cycle is as far as the shorter way around it, when the states are
+        split into many chunks and searched by one process or several.
+
+        :param monkeypatch: Fixture patching the chunk size
+        :param processes: The amount of worker processes
+        :return: None
+        """
+
+        monkeypatch.setattr(tables, "CHUNK_SIZE", 16)
+
+        # Act
+        distances = breadth_first_search(200, 0, 2, cycle_neighbors, processes)
+
+        # Assert
+        assert distances.tolist() == [min(state, 200 - state) for state in range(200)]
@@ -0,0 +1,221 @@
+# Python imports
+import random
+from typing import Callable
+
+import numpy as np
+import pytest
+
+# Project imports
+from rubik_cube_solver.array_cube import ArrayCube
+from rubik_cube_solver.cube import Cube
+from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.batch_rotator import BatchRotator
+from rubik_cube_solver.cube_rotation.rotator import Rotator
+from rubik_cube_solver.enums.ValidationCode import ValidationCode
+from rubik_cube_solver.scramble.scrambler import Scrambler
+from rubik_cube_solver.validator.batch_validator import StickerIndices, get_sticker_indices, validate_stickers
+from rubik_cube_solver.validator.validator import Validator
+
+
+def scrambled_stickers(size: int, amount: int) -> np.ndarray:
+    """
+    Builds the stickers of cubes of the given size, each scrambled with its own random scramble and
+    reoriented.
+
+    :param size: The size of the cubes
+    :param amount: The amount of cubes
+    :return: The stickers of the cubes, a row per cube
+    """
+
+    cubes = [Cube(size) for _ in range(amount)]
+    for cube in cubes:
+        rotator = Rotator(cube)
+        rotator.apply(Algorithm(Scrambler().generate_scramble(size)))
+        rotator.apply(Algorithm.from_str(random.choice(["x", "y'", "z2", "x y"])))
+
+    return BatchRotator.from_cubes(cubes).stickers.copy()
+
+
+def swap(stickers: np.ndarray, first: np.ndarray, second: np.ndarray) -> None:
+    """
+    Swaps two groups of stickers of a row in place. Swapping the stickers of a piece with the same
+    stickers rotated twists the piece.
+
+    :param stickers: The stickers of a cube
+    :param first: The indices of the first group
+    :param second: The indices of the second group
+    :return: None
+    """
+
+    stickers[np.r_[first, second]] = stickers[np.r_[second, first]]
+
+
+class TestValidateStickers:
+    # fmt: off
+    @pytest.mark.parametrize("cube_size", [2, 3, 4, 5, 6, 7])
+    # fmt: on
+    def test_scrambled_states_are_valid(self, cube_size: int) -> None:
+        """
+        Tests that scrambled and reoriented states of any valid size are all valid.
+
+        :param cube_size: The size of the cubes
+        :return: None
+        """
+
+        # Act
+        codes = validate_stickers(scrambled_stickers(cube_size, 8), cube_size)
+
+        # Assert
+        assert codes.tolist() == [ValidationCode.VALID] * 8
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "cube_size, sticker, color", [
+            (3, 0, 5),
+            (2, 0, 9),
+        ]
+    )
+    # fmt: on
+    def test_color_count(self, cube_size: int, sticker: int, color: int) -> None:
+        """
+        Tests that a state with a sticker of another color, or of a code that is no color, fails the
+        color count.
+
+        :param cube_size: The size of the cubes
+        :param sticker: The flat index of the sticker changed
+        :param color: The code the sticker is changed to
+        :return: None
+        """
+
+        stickers = np.tile(ArrayCube(cube_size).stickers.ravel(), (2, 1))
+        stickers[1, sticker] = color
+
+        # Act
+        codes = validate_stickers(stickers, cube_size)
+
+        # Assert
+        assert codes.tolist() == [ValidationCode.VALID, ValidationCode.COLOR_COUNT]
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "cube_size, select, expected_code", [
+            (3, lambda i: (i.corners[0, :1], i.corners[1, 2:]), ValidationCode.CORNER_IDENTITY),
+            (2, lambda i: (i.corners[0], np.roll(i.corners[0], 1)), ValidationCode.CORNER_ORIENTATION),
+            (3, lambda i: (i.corners[0, 1:2], i.corners[0, 2:]), ValidationCode.CORNER_CHIRALITY),
+            (3, lambda i: (i.centers[:1], i.edges[0, 1:]), ValidationCode.CENTER_UNIQUENESS),
+            (5, lambda i: (i.centers[:1], i.centers[2:3]), ValidationCode.CENTER_OPPOSITES),
+            (3, lambda i: (i.edges[0, 1:], i.edges[1, :1]), ValidationCode.EDGE_IDENTITY),
+            (5, lambda i: (i.edges[0, :1], i.edges[0, 1:]), ValidationCode.EDGE_FLIP),
+            (3, lambda i: (i.edges[0], i.edges[1]), ValidationCode.PERMUTATION_PARITY),
+            (5, lambda i: (i.center_orbits[0, :1], i.center_orbits[1, -1:]), ValidationCode.CENTER_COUNT),
+            (4, lambda i: (i.wing_edges[0, :1], i.wing_edges[0, 1:]), ValidationCode.WING_EDGE_IDENTITY),
+        ]
+    )
+    # fmt: on
+    def test_code_of_the_first_failed_check(
+        self,
+        cube_size: int,
+        select: Callable[[StickerIndices], tuple[np.ndarray, np.ndarray]],
+        expected_code: ValidationCode,
+    ) -> None:
+        """
+        Tests that a solved state with two groups of stickers swapped gets the code of the first check
+        it fails, and a solved state next to it stays valid.
+
+        :param cube_size: The size of the cubes
+        :param select: Function selecting the two groups of stickers swapped from the sticker indices
+        :param expected_code: The expected code of the corrupted state
+        :return: None
+        """
+
+        stickers = np.tile(ArrayCube(cube_size).stickers.ravel(), (2, 1))
+        swap(stickers[1], *select(get_sticker_indices(cube_size)))
+
+        # Act
+        codes = validate_stickers(stickers, cube_size)
+
+        # Assert
+        assert codes.tolist() == [ValidationCode.VALID, expected_code]
+
+    # fmt: off
+    @pytest.mark.parametrize("cube_size", [2, 3, 4, 5, 6, 7])
+    # fmt: on
+    def test_matches_validate(self, cube_size: int) -> None:
+        """
+        Tests that a state is valid exactly when `Validator.validate` passes it, over scrambled states
+        with random stickers swapped and whole corners and edges twisted, flipped and swapped.
+
+        :param cube_size: The size of the cubes
+        :return: None
+        """
+
+        random.seed(cube_size)
+        stickers = scrambled_stickers(cube_size, 60)
+        indices = get_sticker_indices(cube_size)
+        pieces = [indices.corners] + ([indices.edges] if cube_size % 2 == 1 else [])
+        for row in stickers[1:]:
+            piece_stickers = random.choice(pieces)
+            first, second = random.sample(range(len(piece_stickers)), 2)
+            match random.randrange(4):
+                case 0:
+                    swap(row, *random.sample(range(len(row)), 2))
+                case 1:
+                    swap(row, piece_stickers[first], np.roll(piece_stickers[first], 1))
+                case 2:
+                    swap(row, piece_stickers[first, :1], piece_stickers[first, 1:2])
+                case 3:
+                    swap(row, piece_stickers[first], piece_stickers[second])
+
+        expected = []
+        for row in stickers:
+            cube = ArrayCube(cube_size)
+            cube.stickers = row.reshape(6, cube_size, cube_size)
+            try:
+                Validator().validate(cube)
+            except ValueError:
+                expected.append(False)
+            else:
+                expected.append(True)
+
+        # Act
+        codes = validate_stickers(stickers, cube_size)
+
+        # Assert
+        assert (codes == ValidationCode.VALID).tolist() == expected
+        assert not all(expected)
+
+    # fmt: off
+    @pytest.mark.parametrize(
+        "shape, cube_size", [
+            ((4, 54), 1),
+            ((4, 54), 2),
+            ((54,), 3),
+            ((2, 6, 9), 3),
+        ]
+    )
+    # fmt: on
+    def test_invalid_shape(self, shape: tuple[int, ...], cube_size: int) -> None:
+        """
+        Tests that a cube size that cannot be validated, or a sticker array that does not hold a row of
+        6 * N^2 stickers per state, is rejected.
+
+        :param shape: The shape of the sticker array
+        :param cube_size: The size of the cubes
+        :return: None
+        """
+
+        with pytest.raises(ValueError):
+            validate_stickers(np.zeros(shape, dtype=np.uint8), cube_size)
+
+    def test_no_states(self) -> None:
+        """
+        Tests that validating no states returns no codes.
+
+        :return: None
+        """
+
+        # Act
+        codes = validate_stickers(np.zeros((0, 54), dtype=np.uint8), 3)
+
+        # Assert
+        assert codes.shape == (0,)
@@ -5,6 +5,7 @@ import pytest
 from rubik_cube_solver.cube import Cube
 from rubik_cube_solver.cube_rotation.algorithm import Algorithm
 from rubik_cube_solver.cube_rotation.rotator import Rotator
+from rubik_cube_solver.enums.Layer import Layer
 from rubik_cube_solver.scramble.scrambler import Scrambler
 from rubik_cube_solver.validator.validator import Validator
 
@@ -25,6 +26,48 @@ class TestValidatorIntegration:
         cube = Cube(cube_size)
         validator.validate(cube)
 
+    def test_marks_the_cube_trusted(self, validator: Validator) -> None:
+        """
+        Test that a cube that passes validation is trusted afterwards.
+
+        :param validator: Fixture of a Validator instance
+        :return: None
+        """
+
+        cube = Cube(3)
+        Rotator(cube).apply(Algorithm.from_str("R U F'"))
+        cube.layers = cube.layers
+
+        # Act
+        validator.validate(cube)
+
+        # Assert
+        assert cube.trusted
+
+    def test_edits_through_layers_read_before_validation(self, validator: Validator) -> None:
+        """
+        Test that a cube whose layers were read before validation is not trusted after it, so swapping
+        stickers through those layers is caught when the cube is validated again.
+
+        :param validator: Fixture of a Validator instance
+        :return: None
+        """
+
+        cube = Cube(3)
+        Rotator(cube).apply(Algorithm.from_str("R U F'"))
+        layers = cube.layers
+        validator.validate(cube)
+        expected_cube = Cube.from_bytes(cube.to_bytes())
+
+        # Act
+        layers[Layer.UP][0], layers[Layer.UP][7] = layers[Layer.UP][7], layers[Layer.UP][0]
+
+        # Assert
+        assert not cube.trusted
+        assert cube != expected_cube
+        with pytest.raises(ValueError):
+            validator.validate(cube)
+
     # fmt: off
     @pytest.mark.parametrize(
         "cube_fixture", [
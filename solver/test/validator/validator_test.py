@@ -6,23 +6,27 @@ import pytest
 # Project imports
 from rubik_cube_solver.cube import Cube
 from rubik_cube_solver.cube_rotation.algorithm import Algorithm
+from rubik_cube_solver.cube_rotation.batch_rotator import BatchRotator
 from rubik_cube_solver.cube_rotation.rotator import Rotator
 from rubik_cube_solver.enums.Color import Color
 from rubik_cube_solver.enums.Layer import Layer
-from rubik_cube_solver.validator.validator import Validator
+from rubik_cube_solver.enums.ValidationCode import ValidationCode
+from rubik_cube_solver.validator.validator import Validator, get_pieces
 from rubik_cube_solver.validator.validator_utils import get_corners
 
 
 class TestValidatorValidate:
     def test_success_small_odd(self, validator: Validator) -> None:
         """
-        Test that validate calls the correct check methods for a small odd sized cube (size 3).
+        Test that validate calls the correct check methods for a small odd sized cube (size 3),
+        reading its pieces once.
 
         :param validator: Fixture of a Validator instance
         :return: None
         """
 
         cube = Cube(3)
+        pieces = get_pieces(cube)
         with (
             patch.object(validator, "_check_size") as mock_check_size,
             patch.object(validator, "_check_color_count") as mock_check_color_count,
@@ -39,22 +43,23 @@ class TestValidatorValidate:
         ):
             validator.validate(cube)
             mock_check_size.assert_called_once_with(cube)
-            mock_check_color_count.assert_called_once_with(cube)
-            mock_check_corner_validity.assert_called_once_with(cube)
-            mock_check_corner_orientation.assert_called_once_with(cube)
-            mock_check_corner_chirality.assert_called_once_with(cube)
-            mock_check_center_uniqueness.assert_called_once_with(cube)
-            mock_check_center_opposites.assert_called_once_with(cube)
+            mock_check_color_count.assert_called_once_with(cube, pieces)
+            mock_check_corner_validity.assert_called_once_with(cube, pieces)
+            mock_check_corner_orientation.assert_called_once_with(cube, pieces)
+            mock_check_corner_chirality.assert_called_once_with(cube, pieces)
+            mock_check_center_uniqueness.assert_called_once_with(cube, pieces)
+            mock_check_center_opposites.assert_called_once_with(cube, pieces)
             mock_check_center_count_big.assert_not_called()
-            mock_check_edge_validity.assert_called_once_with(cube)
+            mock_check_edge_validity.assert_called_once_with(cube, pieces)
             mock_check_wing_edge_validity.assert_not_called()
-            mock_check_edge_flip_parity.assert_called_once_with(cube)
-            mock_check_permutation_parity.assert_called_once_with(cube)
+            mock_check_edge_flip_parity.assert_called_once_with(cube, pieces)
+            mock_check_permutation_parity.assert_called_once_with(cube, pieces)
 
     @pytest.mark.parametrize("cube_size", [5, 7])
     def test_success_big_odd(self, validator: Validator, cube_size: int) -> None:
         """
-        Test that validate calls the correct check methods for a big odd sized cube (sizes 5, 7).
+        Test that validate calls the correct check methods for a big odd sized cube (sizes 5, 7),
+        reading its pieces once.
 
         :param validator: Fixture of a Validator instance
         :param cube_size: The size of the cube to validate
@@ -62,6 +67,7 @@ class TestValidatorValidate:
         """
 
         cube = Cube(cube_size)
+        pieces = get_pieces(cube)
         with (
             patch.object(validator, "_check_size") as mock_check_size,
             patch.object(validator, "_check_color_count") as mock_check_color_count,
@@ -78,27 +84,29 @@ class TestValidatorValidate:
         ):
             validator.validate(cube)
             mock_check_size.assert_called_once_with(cube)
-            mock_check_color_count.assert_called_once_with(cube)
-            mock_check_corner_validity.assert_called_once_with(cube)
-            mock_check_corner_orientation.assert_called_once_with(cube)
-            mock_check_corner_chirality.assert_called_once_with(cube)
-            mock_check_center_uniqueness.assert_called_once_with(cube)
-            mock_check_center_opposites.assert_called_once_with(cube)
+            mock_check_color_count.assert_called_once_with(cube, pieces)
+            mock_check_corner_validity.assert_called_once_with(cube, pieces)
+            mock_check_corner_orientation.assert_called_once_with(cube, pieces)
+            mock_check_corner_chirality.assert_called_once_with(cube, pieces)
+            mock_check_center_uniqueness.assert_called_once_with(cube, pieces)
+            mock_check_center_opposites.assert_called_once_with(cube, pieces)
             mock_check_center_count_big.assert_called_once_with(cube)
-            mock_check_edge_validity.assert_called_once_with(cube)
+            mock_check_edge_validity.assert_called_once_with(cube, pieces)
             mock_check_wing_edge_validity.assert_called_once_with(cube)
-            mock_check_edge_flip_parity.assert_called_once_with(cube)
-            mock_check_permutation_parity.assert_called_once_with(cube)
+            mock_check_edge_flip_parity.assert_called_once_with(cube, pieces)
+            mock_check_permutation_parity.assert_called_once_with(cube, pieces)
 
     def test_success_small_even(self, validator: Validator) -> None:
         """
-        Test that validate calls the correct check methods for a small even sized cube (size 2).
+        Test that validate calls the correct check methods for a small even sized cube (size 2),
+        reading its pieces once.
 
         :param validator: Fixture of a Validator instance
         :return: None
         """
 
         cube = Cube(2)
+        pieces = get_pieces(cube)
         with (
             patch.object(validator, "_check_size") as mock_check_size,
             patch.object(validator, "_check_color_count") as mock_check_color_count,
@@ -115,10 +123,10 @@ class TestValidatorValidate:
         ):
             validator.validate(cube)
             mock_check_size.assert_called_once_with(cube)
-            mock_check_color_count.assert_called_once_with(cube)
-            mock_check_corner_validity.assert_called_once_with(cube)
-            mock_check_corner_orientation.assert_called_once_with(cube)
-            mock_check_corner_chirality.assert_called_once_with(cube)
+            mock_check_color_count.assert_called_once_with(cube, pieces)
+            mock_check_corner_validity.assert_called_once_with(cube, pieces)
+            mock_check_corner_orientation.assert_called_once_with(cube, pieces)
+            mock_check_corner_chirality.assert_called_once_with(cube, pieces)
             mock_check_center_uniqueness.assert_not_called()
             mock_check_center_opposites.assert_not_called()
             mock_check_center_count_big.assert_not_called()
@@ -130,7 +138,8 @@ class TestValidatorValidate:
     @pytest.mark.parametrize("cube_size", [4, 6])
     def test_success_big_even(self, validator: Validator, cube_size: int) -> None:
         """
-        Test that validate calls the correct check methods for a big even sized cube (sizes 4, 6).
+        Test that validate calls the correct check methods for a big even sized cube (sizes 4, 6),
+        reading its pieces once.
 
         :param validator: Fixture of a Validator instance
         :param cube_size: The size of the cube to validate
@@ -138,6 +147,7 @@ class TestValidatorValidate:
         """
 
         cube = Cube(cube_size)
+        pieces = get_pieces(cube)
         with (
             patch.object(validator, "_check_size") as mock_check_size,
             patch.object(validator, "_check_color_count") as mock_check_color_count,
@@ -154,10 +164,10 @@ class TestValidatorValidate:
         ):
             validator.validate(cube)
             mock_check_size.assert_called_once_with(cube)
-            mock_check_color_count.assert_called_once_with(cube)
-            mock_check_corner_validity.assert_called_once_with(cube)
-            mock_check_corner_orientation.assert_called_once_with(cube)
-            mock_check_corner_chirality.assert_called_once_with(cube)
+            mock_check_color_count.assert_called_once_with(cube, pieces)
+            mock_check_corner_validity.assert_called_once_with(cube, pieces)
+            mock_check_corner_orientation.assert_called_once_with(cube, pieces)
+            mock_check_corner_chirality.assert_called_once_with(cube, pieces)
             mock_check_center_uniqueness.assert_not_called()
             mock_check_center_opposites.assert_not_called()
             mock_check_center_count_big.assert_called_once_with(cube)
@@ -1142,3 +1152,26 @@ class TestValidatorCheckPermutationParity:
         ):
             with pytest.raises(ValueError, match="Invalid permutation parity"):
                 validator._check_permutation_parity(cube)
+
+
+class TestValidatorValidateMany:
+    def test_codes(self, validator: Validator) -> None:
+        """
+        Tests that every state of a batch gets its own code, the states being left as they are.
+
+        :param validator: Fixture of a Validator instance
+        :return: None
+        """
+
+        cubes = [Cube(3), Cube(3), Cube(3)]
+        Rotator(cubes[1]).apply(Algorithm.from_str("R U F' D2"))
+        stickers = BatchRotator.from_cubes(cubes).stickers.copy()
+        stickers[2, 0] = stickers[2, 9]
+        expected_stickers = stickers.copy()
+
+        # Act
+        codes = validator.validate_many(stickers, 3)
+
+        # Assert
+        assert codes.tolist() == [ValidationCode.VALID, ValidationCode.VALID, ValidationCode.COLOR_COUNT]
+        assert (stickers == expected_stickers).all()